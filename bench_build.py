@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+client 构建延迟对比：每个用例都要构建一次 client，这里模拟"client.cpp 变了、其余不变"的情形。
+
+- full: make SAN=<san>         （client.o 重新编译，完整模板前导每次都要解析，再和运行时 .o 链接）
+- fast: make SAN=<san> fast    （client_prelude.h 用 PCH，链接预编译的 libpair_runtime.a）
+
+每轮先 touch client.cpp 再计时，两种模式先各预热一次（运行时库 / PCH / server 只在预热时构建）。
+
+用法：
+    python bench_build.py               # 默认 SAN=asan，各 5 轮
+    python bench_build.py -n 10 --san ""
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+MODES = {
+    "full": [],
+    "fast": ["fast"],
+}
+
+
+def _make(san: str, extra: List[str]) -> float:
+    cmd = ["make", f"SAN={san}"] + extra
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    dt = (time.perf_counter() - t0) * 1000.0
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed:\n{proc.stderr[-2000:]}")
+    return dt
+
+
+def bench(rounds: int = 5, san: str = "asan") -> Dict[str, List[float]]:
+    src = os.path.join(ROOT, "client.cpp")
+    if not os.path.exists(src):
+        raise FileNotFoundError("client.cpp not found; render one first (e.g. python fuzz_test.py)")
+    results: Dict[str, List[float]] = {}
+    for name, extra in MODES.items():
+        _make(san, extra)  # 预热
+        times = []
+        for _ in range(rounds):
+            os.utime(src)
+            times.append(_make(san, extra))
+        results[name] = times
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="per-exec client build latency: full make vs fast (PCH + static runtime)")
+    ap.add_argument("-n", "--rounds", type=int, default=5)
+    ap.add_argument("--san", default="asan", help="sanitizer profile passed as make SAN=...")
+    args = ap.parse_args()
+    try:
+        results = bench(args.rounds, args.san)
+    except (RuntimeError, FileNotFoundError) as e:
+        print(f"[bench] {e}", file=sys.stderr)
+        sys.exit(1)
+    for name, times in results.items():
+        print(f"{name:<5} median {statistics.median(times):8.1f} ms  min {min(times):8.1f} ms  ({len(times)} runs)")
+    full, fast = statistics.median(results["full"]), statistics.median(results["fast"])
+    print(f"speedup {full / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
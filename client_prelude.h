@@ -0,0 +1,80 @@
+// client_prelude.h
+// 生成的 client.cpp 中与程序无关的固定部分（头文件、守卫宏、die）。
+// 每个 sanitizer 配置预编译成 build/<SAN>/pch/client_prelude.h.gch（make pch），
+// 快速构建（make fast）时每个用例只需编译 verb 主体所在的那个翻译单元。
+// 生成代码必须把 #include <client_prelude.h> 放在第一条 C 语句之前，PCH 才会生效。
+
+#ifndef CLIENT_PRELUDE_H
+#define CLIENT_PRELUDE_H
+
+#include <infiniband/verbs.h>
+#include <errno.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+#include <stdlib.h>
+#include <thread>
+#include <vector>
+#include <string>
+#include <algorithm>
+#include <unistd.h>
+
+#include "pair_runtime.h"
+#include "runtime_resolver.h"
+
+using std::string;
+using std::vector;
+
+/* ---- 每个 verb 的结果标记（lib/capture.py 边读边解析） ----
+ * "@b <i> <verb id>"          verb id 是 lib/exec_schema.py 的类编号（rdma_exec 用的同一套）
+ * "@b <i> -1 <类名>"          不在 schema 里的 verb（CM 等）
+ * "@e <i> <rc> <errno>"       rc: 0 成功 / 1 跳过（资源缺失）/ 2 失败；errno 只在失败时有意义，其余为 0
+ * 有 "@b" 没有 "@e" 的 verb 就是中途崩溃或 die() 的那个。
+ * 生成器在每个失败分支的第一句放 RR_SET_FAIL()（在 fprintf / perror 之前，errno 还是 verb 留下的），
+ * 缺资源的跳过由 res_ok_ptr 记下；CodegenCache.iter_body 在 verb 之后输出 RR_VERB_END(i, rr_rc)。
+ * 失败后直接退出 main 的分支用 RR_FAIL_RETURN()：先补上当前 verb 的 "@e"，否则会被当成崩溃。 */
+#define RR_OK   0
+#define RR_SKIP 1
+#define RR_FAIL 2
+static int rr_rc;
+static int rr_errno;
+static int rr_idx; /* 当前 verb 的序号，没有结果标记时为 0 */
+
+#define RR_SET_FAIL() (rr_errno = errno, rr_rc = RR_FAIL)
+#define RR_SET_SKIP() (rr_rc = rr_rc > RR_SKIP ? rr_rc : RR_SKIP)
+
+#define RR_VERB_BEGIN(i, cls) \
+    do { printf("@b %d %d\n", (i), (cls)); rr_idx = (i); rr_rc = RR_OK; rr_errno = 0; } while (0)
+#define RR_VERB_BEGIN_NAMED(i, name) \
+    do { printf("@b %d -1 %s\n", (i), (name)); rr_idx = (i); rr_rc = RR_OK; rr_errno = 0; } while (0)
+#define RR_VERB_END(i, rc) \
+    printf("@e %d %d %d\n", (i), (rc), (rc) == RR_FAIL ? rr_errno : 0)
+#define RR_FAIL_RETURN() \
+    do { if (rr_idx > 0) RR_VERB_END(rr_idx, rr_rc); return -1; } while (0)
+
+/* ---- fuzz-friendly guards ---- */
+static inline int res_ok_ptr(const void *p, const char *what) {
+    if (!p) {
+        RR_SET_SKIP();
+        fprintf(stderr, "[skip] missing resource: %s\n", what);
+        return 0;
+    }
+    return 1;
+}
+
+#define IF_OK_PTR(p, ...)                            \
+    do {                                             \
+        if (res_ok_ptr((p), #p)) {                   \
+            __VA_ARGS__                              \
+        }                                            \
+    } while (0)
+
+/* 布尔哨兵变量帮助宏：声明、置位 */
+#define DECL_OK(name)   int ok_##name = 0
+#define SET_OK(name,v)  do { ok_##name = ((v) != NULL); } while (0)
+#define IF_OK(name, CODE_BLOCK) \
+    do { if (ok_##name) { CODE_BLOCK } } while (0)
+
+static void die(const char* m){ perror(m); exit(1); }
+
+#endif // CLIENT_PRELUDE_H
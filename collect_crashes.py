@@ -3,23 +3,35 @@
 Script to collect crash-related files based on AddressSanitizer errors in stderr logs.
 
 This script:
-1. Searches for all *stderr* files in the current directory
-2. Finds files containing "Address" keyword
-3. Collects all related files for each crash case (cpp, stdout, stderr, compile, seed, dmesg logs)
-4. Packages them into collect.zip
+1. Reads the crash-bucket index from the corpus DB (seeds/corpus.db, filled by
+   my_fuzz_test via lib/sanitizer_report.py); only when it is empty, or with
+   RDMA_FUZZ_COLLECT_RESCAN=1, searches all *stderr* files (and merged *_client.log captures)
+   under ./repo, flat or sharded, for the "Address" keyword
+2. Collects all related files for each crash case (cpp, stdout, stderr, compile, seed, dmesg logs)
+3. Packages them into collect.zip, plus crash_buckets.json when the index was used
 """
 
+import json
 import os
 import re
 import zipfile
 from pathlib import Path
-from typing import Set, List
+from typing import Dict, Set, List
+
+from lib.repo_layout import find_run_dir, iter_run_dirs
 
 
 def find_stderr_files() -> List[Path]:
-    """Find all stderr log files in the current directory."""
-    current_dir = Path('./repo')
-    stderr_files = list(current_dir.glob('*stderr*'))
+    """Find all stderr log files in the current directory.
+
+    Both repo layouts are searched: files directly under ./repo (flat) and
+    ./repo/<shard>/<case_id>/ run directories (lib/repo_layout.py).
+    Runs captured in merged mode (lib/capture.py) have no separate stderr file;
+    their {case_id}_client.log holds both streams and is scanned instead.
+    """
+    stderr_files = []
+    for run_dir in iter_run_dirs(Path('./repo')):
+        stderr_files += list(run_dir.glob('*stderr*')) + list(run_dir.glob('*_client.log'))
     return stderr_files
 
 
@@ -54,6 +66,7 @@ def collect_related_files(case_id: str, search_dir: Path) -> List[Path]:
     - {case_id}_*.cpp
     - {case_id}_*.stdout.log
     - {case_id}_*.stderr.log
+    - {case_id}_client.log (merged stdout/stderr capture)
     - {case_id}_compile.log
     - {case_id}_seed.log
     - {case_id}_dmesg.log (if exists)
@@ -71,9 +84,25 @@ def collect_related_files(case_id: str, search_dir: Path) -> List[Path]:
     return related_files
 
 
-def create_zip_archive(files_to_archive: Set[Path], output_zip: str = 'collect.zip'):
+def load_crash_index(corpus_root: str = 'seeds') -> List[Dict]:
+    """
+    Crash buckets recorded in the corpus DB, each with the runs that hit it.
+    Returns [] when there is no corpus DB yet.
+    """
+    from lib.corpus import Corpus
+
+    if not os.path.exists(os.path.join(corpus_root, Corpus.DB_NAME)):
+        return []
+    corpus = Corpus(corpus_root)
+    buckets = corpus.crash_buckets()
+    for b in buckets:
+        b["runs"] = corpus.crash_seeds(b["bucket"])
+    return buckets
+
+
+def create_zip_archive(files_to_archive: Set[Path], output_zip: str = 'collect.zip', buckets: List[Dict] = None):
     """Create a zip archive containing all specified files."""
-    if not files_to_archive:
+    if not files_to_archive and not buckets:
         print("No files to archive.")
         return
     
@@ -81,21 +110,31 @@ def create_zip_archive(files_to_archive: Set[Path], output_zip: str = 'collect.z
         for file_path in sorted(files_to_archive):
             print(f"  Adding: {file_path}")
             zipf.write(file_path, arcname=file_path.name)
+        if buckets:
+            zipf.writestr('crash_buckets.json', json.dumps(buckets, ensure_ascii=False, indent=2))
     
     print(f"\nArchive created: {output_zip}")
     print(f"Total files archived: {len(files_to_archive)}")
 
 
-def main():
-    print("=" * 70)
-    print("Crash File Collection Tool")
-    print("=" * 70)
-    
-    # Show current working directory
-    cwd = Path.cwd()
-    print(f"\nCurrent working directory: {cwd}")
-    
-    # Step 1: Find all stderr files
+def collect_from_index(buckets: List[Dict]) -> Set[Path]:
+    """Related files of every run recorded in the crash-bucket index."""
+    files: Set[Path] = set()
+    for b in buckets:
+        print(f"\n  Bucket: {b['bucket']}  ({b['hits']} hits)  {b['site']}")
+        for run in b["runs"]:
+            case_id = run["run_index"]
+            if not case_id:
+                continue
+            related_files = collect_related_files(case_id, find_run_dir(case_id, Path('./repo')))
+            for related_file in related_files:
+                files.add(related_file)
+                print(f"    - {related_file.name}")
+    return files
+
+
+def collect_by_scanning() -> Set[Path]:
+    """Fallback: scan every stderr log under ./repo for 'Address'."""
     print("\nStep 1: Finding stderr files...")
     search_path = Path('./repo').resolve()
     print(f"Searching in: {search_path}")
@@ -112,7 +151,7 @@ def main():
     
     if not matching_files:
         print("\nNo files containing 'Address' keyword found.")
-        return
+        return set()
     
     print(f"\nFound {len(matching_files)} stderr files containing 'Address'")
     
@@ -132,12 +171,33 @@ def main():
             for related_file in related_files:
                 all_files_to_archive.add(related_file)
                 print(f"    - {related_file.name}")
+    return all_files_to_archive
+
+
+def main():
+    print("=" * 70)
+    print("Crash File Collection Tool")
+    print("=" * 70)
+
+    # Show current working directory
+    cwd = Path.cwd()
+    print(f"\nCurrent working directory: {cwd}")
+
+    rescan = os.environ.get("RDMA_FUZZ_COLLECT_RESCAN", "0") != "0"
+    buckets = [] if rescan else load_crash_index()
+    if buckets:
+        print(f"\nUsing crash-bucket index: {len(buckets)} buckets")
+        all_files_to_archive = collect_from_index(buckets)
+    else:
+        all_files_to_archive = collect_by_scanning()
+        if not all_files_to_archive:
+            return
     
-    # Step 4: Create zip archive
+    # Create zip archive
     print("\n" + "=" * 70)
-    print("Step 4: Creating archive...")
+    print("Creating archive...")
     print("=" * 70)
-    create_zip_archive(all_files_to_archive)
+    create_zip_archive(all_files_to_archive, buckets=buckets)
     
     print("\n" + "=" * 70)
     print("Done!")
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # coordinator.py
 # Merge server_update.json and client_update.json into server_view.json and client_view.json.
-# Maintains a simple pairing FSM and per-pair epoch counters. Polls files every 100ms.
+# Maintains a simple pairing FSM and per-pair epoch counters.
+# The merge logic and the inotify event loop live in lib/coordinator.py; this is the command-line wrapper.
+# Views are rewritten (compact JSON) only when their content changes.
 #
 # Usage:
 #   python3 coordinator.py \
@@ -18,126 +20,56 @@
 # Epoch handling:
 # - For each pair id, if the state differs from the previous output view, epoch += 1; else keep previous epoch.
 #
+# Sessions (persistent mode, --session-file):
+# - The runner keeps server and coordinator alive across test cases and bumps {"session": N} in the
+#   session file before each client run. On a new session every pair restarts from INIT with epoch += 1,
+#   and server pair states count as INIT until the server echoes the new session in server_update.json
+#   (it recycles its QPs first). Views carry "session" and _coordinator.remote_session.
+#
 # Remote by-id view:
 # - For each output view V (server_view/client_view), V["remote"].ids.QP[] will list the "id" fields of remote.QP[].
 #   This supports runtime_resolver's rr_*_by_id lookups.
 #
-# This script uses only stdlib.
+# Readiness:
+# - If RDMA_FUZZ_READY_FD is set, "READY coordinator <pid>" is written to that fd (then closed)
+#   right after the first views are written, so the runner can start the server without a fixed sleep.
+#
+# Shared-memory views (--shm, or RDMA_FUZZ_VIEW_SHM=1):
+# - Before each JSON view write, the same view goes to <view>.shm (binary hash table under a seqlock,
+#   format in view_shm.h). runtime_resolver reads it instead of parsing JSON when RDMA_FUZZ_VIEW_SHM=1.
+#
+# This script uses only stdlib (plus lib/coordinator.py).
 
 import argparse
-import json
+import asyncio
 import os
-import socket
 import sys
-import time
-from typing import Any, Dict, Tuple
-
-POLL_INTERVAL = 0.1  # seconds
-
-
-def clean_cached_files(cached_files: list):
-    for f in cached_files:
-        try:
-            os.remove(f)
-        except Exception:
-            pass
-
 
-def load_json(path: str) -> Dict[str, Any]:
+from lib.coordinator import (  # noqa: F401  re-exported for existing importers
+    POLL_INTERVAL,
+    Coordinator,
+    atomic_write_json,
+    build_view,
+    clean_cached_files,
+    extract_pairs,
+    load_json,
+    max_state,
+    merge_states,
+)
+from lib.shm_view import shm_path
+
+
+def signal_ready():
+    fd = os.environ.pop("RDMA_FUZZ_READY_FD", "")
+    if not fd:
+        return
     try:
-        with open(path, "r") as f:
-            return json.load(f)
-    except Exception:
-        return {}
-
-
-def atomic_write_json(path: str, obj: Dict[str, Any]):
-    tmp = f"{path}.tmp"
-    with open(tmp, "w") as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, path)
-
-
-def extract_pairs(obj: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    out = {}
-    pairs = obj.get("local", {}).get("pairs", [])
-    # Also accept top-level "pairs" for client demo
-    if not pairs and "pairs" in obj:
-        pairs = obj.get("pairs", [])
-    for p in pairs or []:
-        pid = p.get("id")
-        if pid:
-            out[pid] = p
-    return out
-
-
-def max_state(state_a: str, state_b: str) -> str:
-    order = {"INIT": 0, "CLAIMED": 1, "PARAMS_BOUND": 2, "BOTH_RTS": 3, "READY": 4}
-    a = order.get((state_a or "INIT"), 0)
-    b = order.get((state_b or "INIT"), 0)
-    # Choose the higher (more advanced) state
-    inv = {v: k for k, v in order.items()}
-    return inv[max(a, b)]
+        os.write(int(fd), f"READY coordinator {os.getpid()}\n".encode())
+        os.close(int(fd))
+    except (OSError, ValueError):
+        pass
 
 
-def merge_states(
-    cli_pairs: Dict[str, Any], srv_pairs: Dict[str, Any], prev_view: Dict[str, Any]
-) -> Dict[str, Dict[str, Any]]:
-    # previous epochs from last output to preserve epoch unless state changes
-    prev_epochs = {}
-    prev_state = {}
-    for p in prev_view.get("pairs") or []:
-        prev_epochs[p.get("id", "")] = p.get("epoch", 0)
-        prev_state[p.get("id", "")] = p.get("state", "INIT")
-
-    all_ids = set(cli_pairs.keys()) | set(srv_pairs.keys())
-    merged = {}
-    for pid in sorted(all_ids):
-        c = cli_pairs.get(pid, {})
-        s = srv_pairs.get(pid, {})
-        st = max_state(c.get("state", "INIT"), s.get("state", "INIT"))
-        epoch = prev_epochs.get(pid, 0) + (1 if st != prev_state.get(pid, "INIT") else 0)
-        merged[pid] = {
-            "id": pid,
-            "cli_id": c.get("cli_id", ""),
-            "srv_id": c.get("srv_id", s.get("srv_id", "")),  # client may hint srv_id
-            "state": st,
-            "epoch": epoch,
-            "ts": max(c.get("ts", 0), s.get("ts", 0)),
-        }
-    return merged
-
-
-def build_view(
-    local_update: Dict[str, Any],
-    remote_update: Dict[str, Any],
-    merged_pairs: Dict[str, Dict[str, Any]],
-    prev_view: Dict[str, Any],
-    # server_pairs: Dict[str, Dict[str, Any]] = None,
-    client_pairs: Dict[str, Dict[str, Any]] = {},
-) -> Dict[str, Any]:
-    view = {}
-    # local
-    view["local"] = local_update.get("local", {})
-    # remote
-    view["remote"] = remote_update.get("local", {})
-    if "QP" not in view["remote"]:
-        view["remote"]["QP"] = []
-    # derive remote.ids.QP[]
-    rid_list = [q.get("id", "") for q in (view["remote"].get("QP") or []) if q.get("id")]
-    pairid_list = list(client_pairs.keys())
-    view["remote"]["ids"] = {"QP": rid_list, "pairs": pairid_list}
-    # pairs (list)
-    view["pairs"] = list(merged_pairs.values())
-    # carry build info
-    view["_coordinator"] = {
-        "generated_at_ms": int(time.time() * 1000),
-        "local_qp_count": len(view["local"].get("QP", [])),
-        "remote_qp_count": len(view["remote"].get("QP", [])),
-        "pair_count": len(view["pairs"]),
-    }
-    return view
-
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--server-update", required=True)
@@ -145,60 +77,36 @@ def main():
     ap.add_argument("--server-view", required=True)
     ap.add_argument("--client-view", required=True)
     ap.add_argument("--once", action="store_true", help="Run once and exit (no polling loop).")
+    ap.add_argument(
+        "--session-file", default=None, help="Persistent mode: JSON {\"session\": N} bumped per client run."
+    )
+    ap.add_argument(
+        "--shm",
+        action="store_true",
+        default=os.environ.get("RDMA_FUZZ_VIEW_SHM", "0") == "1",
+        help="Also write <view>.shm binary views (see view_shm.h).",
+    )
     # ap.add_argument("--clean", action="store_false", help="Clean cached filesexit.")
     args = ap.parse_args()
     # if args.clean:
 
-    clean_cached_files([args.server_update, args.client_update, args.server_view, args.client_view])
-
-    prev_server_view = load_json(args.server_view)
-    prev_client_view = load_json(args.client_view)
-
-    def one_round(prev_sv, prev_cv) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-        srv_u = load_json(args.server_update)
-        cli_u = load_json(args.client_update)
-
-        # extract pairs from both sides
-        cli_pairs = extract_pairs(cli_u)
-        srv_pairs = extract_pairs(srv_u)
-
-        # merge states with previous epochs
-        # For server view, use prev_sv to preserve epochs; for client view, use prev_cv
-        merged_for_server = merge_states(cli_pairs, srv_pairs, prev_sv or {})
-        merged_for_client = merge_states(cli_pairs, srv_pairs, prev_cv or {})
-
-        # server view: local=srv_u.local, remote=cli_u.local
-        server_view = build_view(srv_u, cli_u, merged_for_server, prev_sv or {}, client_pairs=cli_pairs)
-        # client view: local=cli_u.local, remote=srv_u.local
-        client_view = build_view(cli_u, srv_u, merged_for_client, prev_cv or {})
-
-        # atomic write
-        atomic_write_json(args.server_view, server_view)
-        atomic_write_json(args.client_view, client_view)
-        return server_view, client_view
-
-    sv, cv = one_round(prev_server_view, prev_client_view)
+    views = [args.server_view, args.client_view]
+    clean_cached_files([args.server_update, args.client_update] + views + [shm_path(v) for v in views])
+
+    coord = Coordinator(
+        args.server_update,
+        args.client_update,
+        args.server_view,
+        args.client_view,
+        session_file=args.session_file,
+        shm=args.shm,
+    )
     if args.once:
+        coord.round()
+        signal_ready()
         return
 
-    # Polling loop with mtime checks
-    def mtime(path):
-        try:
-            return os.stat(path).st_mtime_ns
-        except Exception:
-            return 0
-
-    last_srv_m = mtime(args.server_update)
-    last_cli_m = mtime(args.client_update)
-
-    while True:
-        time.sleep(POLL_INTERVAL)
-        srv_m = mtime(args.server_update)
-        cli_m = mtime(args.client_update)
-        if srv_m != last_srv_m or cli_m != last_cli_m:
-            last_srv_m, last_cli_m = srv_m, cli_m
-            prev_server_view, prev_client_view = sv, cv
-            sv, cv = one_round(prev_server_view, prev_client_view)
+    asyncio.run(coord.run(on_ready=signal_ready))
 
 
 if __name__ == "__main__":
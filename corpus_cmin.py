@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+语料蒸馏（cmin）：从一个 Corpus 目录挑出保住全部覆盖和全部崩溃桶的最小子集，写成新的 Corpus 目录。
+选择算法见 lib/distill.py。
+
+- 默认用 corpus 里存的每种子覆盖（seed_cov），不需要 RDMA 设备
+- --rerun：用 fork-server 把每个种子重新跑一遍再选（gcov 计数是全局的，只能串行）
+- --dry：用假执行器重跑（覆盖由程序结构决定），-j 个线程并行，用来演练流程
+
+用法：
+    python corpus_cmin.py seeds seeds.min
+    python corpus_cmin.py seeds seeds.min --rerun --device mlx5_0
+    python corpus_cmin.py seeds /tmp/cmin --dry -j 8
+"""
+
+import argparse
+import logging
+import sys
+
+from lib.distill import StubRunner, distill
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="distill a corpus to a minimal subset keeping all coverage and crash buckets"
+    )
+    ap.add_argument("src", help="source corpus directory (e.g. seeds)")
+    ap.add_argument("out", help="new corpus directory to create")
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--rerun", action="store_true", help="re-execute every seed through the fork-server")
+    mode.add_argument("--dry", action="store_true", help="re-execute with the stub executor (no hardware)")
+    ap.add_argument("-j", "--jobs", type=int, default=4, help="parallel workers for --dry")
+    ap.add_argument("--device", default=None, help="RDMA device passed to the fork-server with --rerun")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    runner = None
+    if args.dry:
+        runner = StubRunner()
+    elif args.rerun:
+        from lib.forkserver import ForkServerRunner
+
+        runner = ForkServerRunner(device=args.device, workdir="./repo/cmin").start()
+    try:
+        res = distill(args.src, args.out, runner=runner, jobs=args.jobs)
+    except (ValueError, FileExistsError) as e:
+        print(f"[cmin] {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if hasattr(runner, "close"):
+            runner.close()
+    print(
+        f"kept {len(res.kept)}/{res.seeds} seeds, {res.edges} edges, {res.buckets} crash buckets"
+        f" ({len(res.unknown)} without coverage kept as-is, {len(res.failed)} unloadable) in {res.ms:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,6 @@ from logging.handlers import RotatingFileHandler
 from typing import Dict, List
 
 import dill
-from jinja2 import Environment, FileSystemLoader
 from termcolor import colored
 
 from lib import fuzz_mutate
@@ -32,6 +31,7 @@ from lib.ibv_all import (
     IbvSrqAttr,
     IbvSrqInitAttr,
 )
+from lib.renderer import RENDERER, apply_program
 from lib.verbs import (
     AllocDM,
     AllocPD,
@@ -283,37 +283,8 @@ def run(args):
 
 
 def render(verbs):
-    ctx = CodeGenContext()
-    verbs = [
-        GetDeviceList("dev_list"),
-        OpenDevice("dev_list"),
-        FreeDeviceList(),
-        QueryDeviceAttr(),
-        QueryPortAttr(),
-        QueryGID(),
-    ] + verbs
-    for v in verbs:
-        v.apply(ctx)
-    body = "".join(v.generate_c(ctx) for v in verbs)
-    template_dir = "./templates"
-    template_name = "client.cpp.j2"
-    env = Environment(loader=FileSystemLoader(template_dir), trim_blocks=True, lstrip_blocks=True)
-    tpl = env.get_template(template_name)
-    rendered = tpl.render(
-        compile_units="pair_runtime.cpp runtime_resolver.c -lcjson",
-        output_name="rdma_client_autogen",
-        ib_port=1,
-        msg_size=1024,
-        bundle_env="RDMA_FUZZ_RUNTIME",
-        client_update="client_update.json",
-        length=1000,
-        setup_region="/* setup generated by verbs (alloc/reg/create) moved here if你把这些也用 generate_c 产出 */",
-        early_verbs_region="".join([]),
-        verbs_region="".join(body),
-        epilog_region="/* optional CQ polling & cleanup */",
-        prolog_extra=ctx.generate_variable_definitions_all(),  # 如果你想注入额外 helper，这里填
-    )
-    return rendered
+    verbs, ctx = apply_program(verbs)
+    return RENDERER.render(verbs, ctx)
 
 
 if __name__ == "__main__":
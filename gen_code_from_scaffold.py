@@ -1,14 +1,12 @@
 import copy
-import json
 import logging
 import sys
-from pathlib import Path
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader
-
 from lib.codegen_context import CodeGenContext
 from lib.debug_dump import summarize_verb
+from lib.renderer import RENDERER, apply_program
+from lib.repo_layout import SEED_IDS, seed_dir
 from lib.verbs import (
     FreeDeviceList,
     GetDeviceList,
@@ -143,81 +141,20 @@ from lib.verbs import (
 INITIAL_VERBS: List[VerbCall] = []
 
 
-def escape_c_string(s: str) -> str:
-    """
-    转义字符串为合法的 C 字符串常量内容。
-    会转义双引号、反斜杠、换行等特殊字符。
-    """
-    # json.dumps 会自动做 C 风格转义
-    escaped = json.dumps(s)
-    # 去掉最外层的引号
-    return escaped[1:-1]
-
-
 def render(verbs: List[VerbCall]) -> str:
-    ctx = CodeGenContext()
-    verbs = [
-        GetDeviceList("dev_list"),
-        OpenDevice("dev_list"),
-        FreeDeviceList(),
-        QueryDeviceAttr(),
-        QueryPortAttr(),
-        QueryGID(),
-    ] + verbs
-    for v in verbs:
-        v.apply(ctx)
-    body = ""
-    for i, v in enumerate(verbs):
-        summary = escape_c_string(summarize_verb(v, deep=True, max_items=1000))
-        body += f'    printf("[{i + 1}] {summary} start.\\n");\n'
-        body += v.generate_c(ctx)
-        body += f'    printf("[{i + 1}] done.\\n");\n\n'
-    # body = "".join(v.generate_c(ctx) for v in verbs)
-    template_dir = "./templates"
-    template_name = "client.cpp.j2"
-    env = Environment(loader=FileSystemLoader(template_dir), trim_blocks=True, lstrip_blocks=True)
-    tpl = env.get_template(template_name)
-    rendered = tpl.render(
-        compile_units="pair_runtime.cpp runtime_resolver.c -lcjson",
-        output_name="rdma_client_autogen",
-        ib_port=1,
-        msg_size=1024,
-        bundle_env="RDMA_FUZZ_RUNTIME",
-        client_update="client_update.json",
-        length=1000,
-        setup_region="/* setup generated by verbs (alloc/reg/create) moved here if你把这些也用 generate_c 产出 */",
-        early_verbs_region="".join([]),
-        verbs_region="".join(body),
-        epilog_region="/* optional CQ polling & cleanup */",
-        prolog_extra=ctx.generate_variable_definitions_all(),  # 如果你想注入额外 helper，这里填
-    )
-    return rendered
+    verbs, ctx = apply_program(verbs)
+    # 模板只编译一次；未变化的 verb 直接复用上一次生成的代码和横幅
+    return RENDERER.render(verbs, ctx, banners=True)
 
 
 def next_seed_index() -> str:
-    """Generate next seed index based on existing files in repo directory"""
-    repo_dir = Path("./repo")
-    repo_dir.mkdir(parents=True, exist_ok=True)
-
-    existing = []
-    for p in repo_dir.iterdir():
-        if p.is_file() and p.name.endswith("_seed.log"):
-            digits = ""
-            for c in p.name:
-                if c.isdigit():
-                    digits += c
-                else:
-                    break
-            if digits:
-                existing.append(int(digits))
-    n = max(existing) + 1 if existing else 1
-    return f"{n:06d}"
+    """Allocate the next seed index (O(1) lock-protected counter, see lib/repo_layout.py)"""
+    return SEED_IDS.next()
 
 
 def setup_seed_logging(seed_index: str) -> logging.Logger:
     """Setup logging for a specific seed with dedicated log file"""
-    repo_dir = Path("./repo")
-    log_file = repo_dir / f"{seed_index}_seed.log"
+    log_file = seed_dir(seed_index) / f"{seed_index}_seed.log"
 
     logger = logging.getLogger(f"seed_{seed_index}")
     logger.setLevel(logging.DEBUG)
@@ -3,10 +3,9 @@ import json
 import os
 from typing import Dict, List
 
-from jinja2 import Environment, FileSystemLoader
-
 from lib.codegen_context import CodeGenContext
 from lib.ibv_all import IbvAHAttr, IbvGID, IbvGlobalRoute, IbvQPAttr, IbvQPCap, IbvQPInitAttr, IbvSendWR, IbvSge
+from lib.renderer import RENDERER
 from lib.verbs import (
     AllocDM,
     AllocPD,
@@ -31,26 +30,7 @@ def render(verbs):
     for v in verbs:
         v.apply(ctx)
     print(verbs)
-    body = "".join(v.generate_c(ctx) for v in verbs)
-    template_dir = "./templates"
-    template_name = "client.cpp.j2"
-    env = Environment(loader=FileSystemLoader(template_dir), trim_blocks=True, lstrip_blocks=True)
-    tpl = env.get_template(template_name)
-    rendered = tpl.render(
-        compile_units="pair_runtime.cpp runtime_resolver.c -lcjson",
-        output_name="rdma_client_autogen",
-        ib_port=1,
-        msg_size=1024,
-        bundle_env="RDMA_FUZZ_RUNTIME",
-        client_update="client_update.json",
-        length=1000,
-        setup_region="/* setup generated by verbs (alloc/reg/create) moved here if你把这些也用 generate_c 产出 */",
-        early_verbs_region="".join([]),
-        verbs_region="".join(body),
-        epilog_region="/* optional CQ polling & cleanup */",
-        prolog_extra=ctx.generate_variable_definitions_all(),  # 如果你想注入额外 helper，这里填
-    )
-    return rendered
+    return RENDERER.render(verbs, ctx)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动开销预算检查：parallel_fuzz_test.py 一次拉起上百个 Python 进程，导入耗时会被成倍放大。
+
+对每个入口模块在全新的解释器里跑 `python -X importtime -c "import <mod>"`，
+取多次中最小的累计耗时与 BUDGETS_MS 比较；同时检查 HEAVY_MODULES 没有在启动时被导入
+（networkx / openai / httpx / jinja2 等应当在第一次真正使用时才导入）。
+
+用法：
+    python importtime_budget.py               # 检查全部入口，超预算返回 1
+    python importtime_budget.py lib.verbs -r 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 入口模块 -> 导入耗时预算（毫秒，累计）
+BUDGETS_MS: Dict[str, float] = {
+    "lib.verbs": 150,
+    "lib.fuzz_mutate": 200,
+    "lib.runexec": 150,
+    "lib.corpus": 150,
+    "fuzz_test": 250,
+    "my_fuzz_test": 300,
+}
+
+# 启动时不应出现的重量级依赖
+HEAVY_MODULES = ("networkx", "openai", "httpx", "jinja2", "matplotlib")
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """解析 -X importtime 输出，返回 模块名 -> 累计微秒。"""
+    out: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1].strip())
+        except ValueError:
+            continue  # 表头
+        out[parts[2].strip()] = cumulative
+    return out
+
+
+def _scratch_dir() -> str:
+    import tempfile
+
+    d = os.path.join(tempfile.gettempdir(), "importtime_budget")
+    os.makedirs(d, exist_ok=True)
+    return d
+
+
+def measure(module: str, repeat: int = 3, cwd: Optional[str] = None) -> Tuple[float, List[str]]:
+    """返回 (最小累计耗时 ms, 导入过的重量级模块)。cwd 默认是临时目录，避免脚本在仓库里建 ./repo。"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    best = None
+    heavy: List[str] = []
+    for _ in range(max(1, repeat)):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=cwd or _scratch_dir(),
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+        times = parse_importtime(proc.stderr)
+        if module not in times:
+            raise RuntimeError(f"no importtime entry for {module}")
+        ms = times[module] / 1000.0
+        best = ms if best is None else min(best, ms)
+        heavy = sorted(m for m in HEAVY_MODULES if m in times)
+    return best, heavy
+
+
+def check(modules: Optional[List[str]] = None, repeat: int = 3) -> List[str]:
+    """返回违规描述列表；为空表示全部达标。"""
+    problems = []
+    for mod in modules or list(BUDGETS_MS):
+        ms, heavy = measure(mod, repeat=repeat)
+        budget = BUDGETS_MS.get(mod)
+        status = "ok"
+        if budget is not None and ms > budget:
+            status = "OVER"
+            problems.append(f"{mod}: {ms:.1f} ms > budget {budget} ms")
+        if heavy:
+            status = "HEAVY"
+            problems.append(f"{mod}: imports {', '.join(heavy)} at start-up")
+        print(f"{mod:<20} {ms:8.1f} ms  (budget {budget} ms)  {status}")
+    return problems
+
+
+def main():
+    ap = argparse.ArgumentParser(description="python -X importtime start-up budget")
+    ap.add_argument("modules", nargs="*", help="entry modules (default: all in BUDGETS_MS)")
+    ap.add_argument("-r", "--repeat", type=int, default=3, help="runs per module, the minimum is used")
+    args = ap.parse_args()
+    problems = check(args.modules, repeat=args.repeat)
+    for p in problems:
+        print(f"[budget] {p}", file=sys.stderr)
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
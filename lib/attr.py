@@ -10,6 +10,11 @@ try:
 except ImportError:
     from contracts import Contract, InstantiatedContract
 
+try:
+    from .merkle import MerkleNode
+except ImportError:
+    from merkle import MerkleNode
+
 # ===== 在文件开头加一个全局开关和工具函数 =====
 DEBUG = False  # 改成 True 就能打开所有调试信息
 
@@ -20,7 +25,7 @@ def debug_print(*args, **kwargs):
         print(*args, **kwargs)
 
 
-class Attr:
+class Attr(MerkleNode):
     MUTABLE_FIELDS = []
     EXPORT_FIELDS = []
 
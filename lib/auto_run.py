@@ -1,15 +1,22 @@
 from pathlib import Path
 import subprocess
 import threading
+import atexit
+import json
 import logging
 import sys
 import os
 import shutil
 import time
-import filecmp
 import select
+from typing import Optional
 
+from lib.build_cache import BUILD_CACHE, RUNTIME_SOURCES
+from lib.capture import STDERR, STDOUT, MergedCapture, split_view
+from lib.coordinator import Coordinator
 from lib.dmesg_collector import DmesgCollector
+from lib.repo_layout import RUN_IDS, run_dir
+from lib.shm_view import shm_path
 
 CWD = Path.cwd()
 
@@ -30,9 +37,27 @@ CLIENT_SRC = str(CWD / "client.cpp")
 
 REPO_DIR = Path("./repo")
 REPO_DIR.mkdir(parents=True, exist_ok=True)
-CACHE_BIN = REPO_DIR / "client_cached"
+BUILD_SAN = "asan"
+# 快速构建：预编译的运行时静态库 + client_prelude.h 的 PCH，只编译 client.cpp（make fast）；
+# RDMA_FUZZ_FAST_BUILD=0 退回完整的 make SAN=asan
+FAST_BUILD = os.environ.get("RDMA_FUZZ_FAST_BUILD", "1") != "0"
+MAKE_CMD = ["make", f"SAN={BUILD_SAN}"] + (["fast"] if FAST_BUILD else [])
 
 TERMINATE_WAIT = 5
+# coordinator / server 就绪握手的超时（秒）；超时后照旧继续，相当于原来的固定 sleep
+READY_TIMEOUT = float(os.environ.get("RDMA_FUZZ_READY_TIMEOUT", "10"))
+READY_FD_ENV = "RDMA_FUZZ_READY_FD"
+# RDMA_FUZZ_PERSISTENT=1：server / coordinator 常驻，每个用例只重启 client（见 PersistentPeers）
+PERSISTENT = os.environ.get("RDMA_FUZZ_PERSISTENT", "0") == "1"
+SESSION_FILE = str(CWD / "session.json")
+# RDMA_FUZZ_INPROC_COORD=1：coordinator 在本进程后台线程里跑（lib/coordinator.py，inotify 驱动），不再起 coordinator.py
+INPROC_COORD = os.environ.get("RDMA_FUZZ_INPROC_COORD", "0") == "1"
+# RDMA_FUZZ_VIEW_SHM=1：coordinator 额外写 <view>.shm，server / client 继承该变量后由 runtime_resolver 直接读二进制视图
+VIEW_SHM = os.environ.get("RDMA_FUZZ_VIEW_SHM", "0") == "1"
+# client 输出捕获：merged（默认，lib/capture.py，单个 <idx>_client.log）或 lines（原来逐行写四个文件）
+CAPTURE_MODE = os.environ.get("RDMA_FUZZ_CAPTURE", "merged")
+# RDMA_FUZZ_CAPTURE_ECHO=1：merged 模式下仍把每行 client 输出打到 logger（调试用，慢）
+CAPTURE_ECHO = os.environ.get("RDMA_FUZZ_CAPTURE_ECHO", "0") == "1"
 
 logger = logging.getLogger("rdma_loop")
 logger.setLevel(logging.INFO)
@@ -51,19 +76,155 @@ def clean_cached_files(cached_files: list):
 
 
 def next_index() -> str:
-    existing = []
-    for p in REPO_DIR.iterdir():
-        if p.is_file() and p.name.endswith("_client.cpp"):
-            digits = ""
-            for c in p.name:
-                if c.isdigit():
-                    digits += c
-                else:
-                    break
-            if digits:
-                existing.append(int(digits))
-    n = max(existing) + 1 if existing else 1
-    return f"{n:06d}"
+    # 计数器文件 + flock，O(1)，不再扫整个 repo/（见 lib/repo_layout.py）
+    return RUN_IDS.next()
+
+def start_with_ready(cmd: list, name: str, env: Optional[dict] = None, timeout: float = READY_TIMEOUT):
+    """
+    启动 cmd 并等它通过 RDMA_FUZZ_READY_FD 管道写回 "READY ..."（coordinator.py / server 都支持）。
+    返回 (proc, ready)；进程提前退出、EOF 或超时都算未就绪，由调用方决定是否继续。
+    """
+    r, w = os.pipe()
+    env = dict(os.environ if env is None else env)
+    env[READY_FD_ENV] = str(w)
+    t0 = time.perf_counter()
+    try:
+        proc = subprocess.Popen(cmd, env=env, pass_fds=(w,))
+    finally:
+        os.close(w)
+    ready = False
+    buf = b""
+    try:
+        deadline = time.monotonic() + timeout
+        while b"\n" not in buf:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                logger.warning("%s not ready after %.1fs, continuing anyway", name, timeout)
+                break
+            rl, _, _ = select.select([r], [], [], left)
+            if not rl:
+                continue
+            chunk = os.read(r, 256)
+            if not chunk:
+                logger.warning("%s closed ready pipe without READY (exit=%s)", name, proc.poll())
+                break
+            buf += chunk
+        ready = buf.startswith(b"READY")
+    finally:
+        os.close(r)
+    logger.info("%s pid=%s ready=%s in %.0f ms", name, proc.pid, ready, (time.perf_counter() - t0) * 1000)
+    return proc, ready
+
+
+def start_coordinator(session_file: Optional[str] = None):
+    """
+    启动 coordinator 并等它写出第一版视图，返回 (handle, ready)。
+    handle 是 coordinator.py 的 Popen，或 INPROC_COORD 时进程内的 Coordinator；用 stop_coordinator() 停掉。
+    """
+    if INPROC_COORD:
+        # 文件路径和 coordinator.py 用的一致
+        args = dict(zip(COORDINATOR_CMD[2::2], COORDINATOR_CMD[3::2]))
+        paths = [args[k] for k in ("--server-update", "--client-update", "--server-view", "--client-view")]
+        clean_cached_files(paths + [shm_path(p) for p in paths[2:]])
+        coord = Coordinator(*paths, session_file=session_file, shm=VIEW_SHM).start_thread(timeout=READY_TIMEOUT)
+        logger.info("in-process coordinator ready")
+        return coord, True
+    cmd = COORDINATOR_CMD + (["--session-file", session_file] if session_file else []) + (["--shm"] if VIEW_SHM else [])
+    return start_with_ready(cmd, "coordinator")
+
+
+def coordinator_alive(handle) -> bool:
+    if isinstance(handle, Coordinator):
+        return handle.alive()
+    return handle is not None and handle.poll() is None
+
+
+def stop_coordinator(handle):
+    if isinstance(handle, Coordinator):
+        handle.stop()
+    else:
+        safe_terminate(handle, "coordinator")
+
+
+def wait_for_view(
+    path: str, timeout: float = READY_TIMEOUT, poll_s: float = 0.01, session: Optional[int] = None
+) -> bool:
+    """
+    等 coordinator 把对端的 QP 合并进 path（_coordinator.remote_qp_count > 0）。
+    session 不为空时还要求视图和对端都已进入该 session（常驻模式）。
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with open(path, "r") as f:
+                view = json.load(f)
+            meta = view.get("_coordinator", {})
+            if meta.get("remote_qp_count", 0) > 0 and (
+                session is None or (view.get("session") == session and meta.get("remote_session") == session)
+            ):
+                return True
+        except (OSError, ValueError):
+            pass
+        time.sleep(poll_s)
+    logger.warning("%s not ready (session=%s) after %.1fs, continuing anyway", path, session, timeout)
+    return False
+
+
+class PersistentPeers:
+    """
+    常驻的 coordinator + server：每个用例只重启 client。
+    - 每次运行前 begin_session() 把 session.json 里的 session 号加一，并删掉上一个 client 的 client_update.json
+    - coordinator 据此让所有 pair 从 INIT 重新开始（epoch + 1），server 重新加载视图时回收配过对的 QP
+    - 等 client 视图里对端也报告了新 session 再启动 client
+    进程挂掉时（比如被上一个用例搞崩）下次 begin_session() 自动重启。
+    """
+
+    def __init__(self, session_file: str = SESSION_FILE):
+        self.session_file = session_file
+        self.session = 0
+        self.coord_proc = None
+        self.server_proc = None
+
+    def alive(self) -> bool:
+        return coordinator_alive(self.coord_proc) and self.server_proc is not None and self.server_proc.poll() is None
+
+    def _write_session(self):
+        tmp = f"{self.session_file}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"session": self.session}, f)
+        os.replace(tmp, self.session_file)
+
+    def start(self):
+        self.close()
+        clean_cached_files(['server_update.json', 'client_update.json', 'server_view.json', 'client_view.json'])
+        self._write_session()
+        self.coord_proc, _ = start_coordinator(self.session_file)
+        env_s = os.environ.copy()
+        env_s["RDMA_FUZZ_RUNTIME"] = SERVER_VIEW
+        logger.info("Starting persistent server: %s RDMA_FUZZ_RUNTIME=%s", SERVER_BIN, SERVER_VIEW)
+        self.server_proc, _ = start_with_ready([SERVER_BIN], "server", env=env_s)
+
+    def begin_session(self) -> int:
+        if not self.alive():
+            logger.info("Persistent server/coordinator not running, (re)starting")
+            self.start()
+        self.session += 1
+        clean_cached_files(['client_update.json'])
+        self._write_session()
+        t0 = time.perf_counter()
+        wait_for_view(CLIENT_VIEW, session=self.session)
+        logger.info("Session %d ready in %.0f ms", self.session, (time.perf_counter() - t0) * 1000)
+        return self.session
+
+    def close(self):
+        safe_terminate(self.server_proc, "server")
+        stop_coordinator(self.coord_proc)
+        self.server_proc = self.coord_proc = None
+
+
+PEERS = PersistentPeers()
+atexit.register(PEERS.close)
+
 
 def safe_terminate(proc: subprocess.Popen, name: str):
     if proc is None or proc.poll() is not None:
@@ -88,39 +249,54 @@ def safe_terminate(proc: subprocess.Popen, name: str):
 
 
 class ClientCapture:
-    def __init__(self, index: str):
+    """
+    merged 模式：stdout/stderr 合并成带序号的 <idx>_client.log，语义标记边读边解析（self.markers），
+    client.tmp.*.log 由 view_path() 按需生成。lines 模式：原来的逐行写四个文件。
+    """
+
+    def __init__(self, index: str, mode: Optional[str] = None):
         self.index = index
-        self.stdout_path = REPO_DIR / f"{index}_client.stdout.log"
-        self.stderr_path = REPO_DIR / f"{index}_client.stderr.log"
+        self.mode = mode or CAPTURE_MODE
+        self.run_dir = run_dir(index, REPO_DIR)
+        self.log_path = self.run_dir / f"{index}_client.log"
+        self.markers: Optional[MergedCapture] = None
+        self.stdout_path = self.run_dir / f"{index}_client.stdout.log"
+        self.stderr_path = self.run_dir / f"{index}_client.stderr.log"
         self.tmp_stdout_path = REPO_DIR / f"client.tmp.stdout.log"
         self.tmp_stderr_path = REPO_DIR / f"client.tmp.stderr.log"
-        self.src_path = REPO_DIR / f"{index}_client.cpp"
+        self.src_path = self.run_dir / f"{index}_client.cpp"
         self.lock = threading.Lock()
         self.proc = None
         self.thread = None
-        self.dmesg_collector = DmesgCollector(REPO_DIR)  # 添加journalctl收集器
+        self.dmesg_collector = DmesgCollector(self.run_dir)  # 添加journalctl收集器
 
-    def start(self, env: dict):
+    def start(self, env: dict, client_bin: str = CLIENT_BIN):
         # 在client启动前设置时间基线
         self.dmesg_collector.get_baseline()
 
-        cmd = ["stdbuf", "-oL", "-eL", CLIENT_BIN]
+        cmd = ["stdbuf", "-oL", "-eL", client_bin]
         logger.info("Starting client: %s RDMA_FUZZ_RUNTIME=%s", " ".join(cmd), CLIENT_VIEW)
+        merged = self.mode == "merged"
         try:
-            self.proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=env,
-                bufsize=1,
-                text=True,
-                errors="replace"
-            )
+            if merged:
+                self.proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, bufsize=0)
+            else:
+                self.proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=env,
+                    bufsize=1,
+                    text=True,
+                    errors="replace"
+                )
         except Exception:
             logger.exception("Failed to start client")
             self.proc = None
             return None
-        self.thread = threading.Thread(target=self._reader_thread, daemon=True)
+        if merged:
+            self.markers = MergedCapture(self.log_path, echo=_echo_client_line if CAPTURE_ECHO else None)
+        self.thread = threading.Thread(target=self._pump_thread if merged else self._reader_thread, daemon=True)
         self.thread.start()
         return self.proc
 
@@ -157,57 +333,55 @@ class ClientCapture:
         finally:
             logger.info("Client output reader thread exiting")
 
-    def save_client_and_check_binary(self):
+    def _pump_thread(self):
+        cap = self.markers
         try:
-            shutil.copy2(CLIENT_SRC, self.src_path)
-            logger.info("Saved client.cpp to %s", self.src_path)
+            assert self.proc is not None and cap is not None
+            cap.pump({self.proc.stdout.fileno(): STDOUT, self.proc.stderr.fileno(): STDERR})
         except Exception:
-            logger.exception("Failed to save client.cpp")
+            logger.exception("Exception while reading client output")
+        finally:
+            cap.close()
+            logger.info(
+                "Client output: %d records, %d bytes, %d dropped, %d sem markers%s -> %s",
+                cap.seq, cap.written, cap.dropped, len(cap.sem_signature),
+                ", ASan report" if cap.asan_lines else "", self.log_path,
+            )
 
-        if CACHE_BIN.exists():
-            if filecmp.cmp(CLIENT_BIN, CACHE_BIN, shallow=False):
-                logger.error("New client binary is identical to cache!")
-            else:
-                logger.info("New client binary differs from cache")
-        try:
-            shutil.copy2(CLIENT_BIN, CACHE_BIN)
-            logger.info("Updated client binary cache: %s", CACHE_BIN)
-        except Exception:
-            logger.exception("Failed to update client binary cache")
+    def view_path(self, stream: str) -> Path:
+        """单个流（"stdout" / "stderr"）的纯文本日志；merged 模式下这时才从合并流生成 client.tmp.*.log。"""
+        path = self.tmp_stdout_path if stream == "stdout" else self.tmp_stderr_path
+        if self.markers is not None:
+            split_view(self.log_path, STDOUT if stream == "stdout" else STDERR, path)
+        return path
 
     def collect_dmesg_after_exit(self) -> str:
         """收集client退出后的新增journalctl信息"""
         return self.dmesg_collector.collect_new_messages(self.index)
 
 
-def run_once():
-    # 立即保存client.cpp到repo，无论编译是否成功
-    files_to_delete = [
-        'server_update.json',
-        'client_update.json',
-        'server_view.json',
-        'client_view.json'
-    ]
-    clean_cached_files(files_to_delete)
-    idx = next_index()
-    src_path = REPO_DIR / f"{idx}_client.cpp"
-    try:
-        shutil.copy2(CLIENT_SRC, src_path)
-        logger.info("Saved client.cpp to %s", src_path)
-    except Exception:
-        logger.exception("Failed to save client.cpp")
+def _echo_client_line(tag: str, line: str):
+    logger.info("[client %s] %s", "stdout" if tag == STDOUT else "stderr", line)
+
 
-    logger.info("Starting make SAN=asan build")
-    compile_log_path = REPO_DIR / f"{idx}_compile.log"
+def build_client(idx: str, cache_key=None) -> bool:
+    """MAKE_CMD 编译，编译日志写到 repo/<idx>_compile.log；成功后按 cache_key 放入编译缓存。"""
+    make_str = " ".join(MAKE_CMD)
+    logger.info("Starting %s build", make_str)
+    compile_log_path = run_dir(idx, REPO_DIR) / f"{idx}_compile.log"
     try:
-        r_make = subprocess.run(["make", "SAN=asan"], capture_output=True, text=True)
+        t0 = time.perf_counter()
+        r_make = subprocess.run(MAKE_CMD, capture_output=True, text=True)
+        build_ms = int((time.perf_counter() - t0) * 1000)
 
         # 保存编译日志到文件
         with open(compile_log_path, "w", encoding="utf-8") as f:
             f.write("=== COMPILE COMMAND ===\n")
-            f.write("make SAN=asan\n\n")
+            f.write(f"{make_str}\n\n")
             f.write("=== RETURN CODE ===\n")
             f.write(f"{r_make.returncode}\n\n")
+            f.write("=== BUILD TIME (ms) ===\n")
+            f.write(f"{build_ms}\n\n")
             f.write("=== STDOUT ===\n")
             f.write(r_make.stdout or "(empty)")
             f.write("\n\n=== STDERR ===\n")
@@ -218,53 +392,115 @@ def run_once():
         if r_make.stderr:
             logger.info("Compile stderr: %s", r_make.stderr.strip())
         if r_make.returncode != 0:
-            logger.error("make SAN=asan build failed, returncode=%s", r_make.returncode)
+            logger.error("%s build failed, returncode=%s", make_str, r_make.returncode)
             logger.error("Full compile log saved to: %s", compile_log_path)
-            return
-        logger.info("make SAN=asan build finished successfully")
+            return False
+        logger.info("%s build finished successfully in %d ms", make_str, build_ms)
         logger.info("Compile log saved to: %s", compile_log_path)
+        if cache_key:
+            try:
+                BUILD_CACHE.put(cache_key, CLIENT_BIN)
+            except Exception:
+                logger.exception("Failed to store client binary in build cache")
+        return True
     except Exception:
-        logger.exception("Failed to execute make SAN=asan")
+        logger.exception("Failed to execute %s", make_str)
         # 保存异常信息
         try:
             with open(compile_log_path, "w", encoding="utf-8") as f:
                 f.write("=== COMPILE COMMAND ===\n")
-                f.write("make SAN=asan\n\n")
+                f.write(f"{make_str}\n\n")
                 f.write("=== EXCEPTION ===\n")
                 f.write("Failed to execute make command - see main log for details\n")
         except:
             pass
-        return
+        return False
 
-    coord_proc = None
+
+def run_once(client_src: str = CLIENT_SRC, client_bin: Optional[str] = None, before_start=None):
+    """
+    client_bin 不为空时表示已经编译好（流水线执行），直接运行它，不查缓存也不跑 make。
+    PERSISTENT 时 server / coordinator 不随本次运行启停，只开一个新 session。
+    before_start：编译完成、启动 coordinator / server / client 之前调用（runexec 在这里清零覆盖计数，
+    上一次运行的覆盖收集因此可以和这次编译重叠）。
+    返回本次 client 的 ClientCapture；没走到启动 client（编译失败等）时返回 None。
+    """
+    # 立即保存client.cpp到repo，无论编译是否成功
+    files_to_delete = [
+        'server_update.json',
+        'client_update.json',
+        'server_view.json',
+        'client_view.json'
+    ]
+    if not PERSISTENT:
+        clean_cached_files(files_to_delete)
+    idx = next_index()
+    out_dir = run_dir(idx, REPO_DIR)
+    src_path = out_dir / f"{idx}_client.cpp"
     try:
-        coord_proc = subprocess.Popen(COORDINATOR_CMD)
-        logger.info("coordinator pid=%s", getattr(coord_proc, "pid", None))
+        shutil.copy2(client_src, src_path)
+        logger.info("Saved client.cpp to %s", src_path)
     except Exception:
-        logger.exception("Failed to start coordinator.py")
-        coord_proc = None
+        logger.exception("Failed to save client.cpp")
+
+    if client_bin is not None:
+        # 流水线里已经编译好
+        with open(out_dir / f"{idx}_compile.log", "w", encoding="utf-8") as f:
+            f.write(f"=== PREBUILT ===\n{client_bin}\n")
+        if not os.path.exists(client_bin):
+            logger.error("Prebuilt client %s not found", client_bin)
+            return
+    else:
+        # 内容寻址编译缓存：client.cpp、运行时源码、编译参数都相同时直接复用二进制，不跑 make
+        cache_key = None
+        try:
+            cache_key = BUILD_CACHE.key_for(
+                client_src, flags=MAKE_CMD[1:], runtime_sources=[CWD / f for f in RUNTIME_SOURCES]
+            )
+        except Exception:
+            logger.exception("Failed to compute build cache key")
+        if cache_key and os.path.exists(SERVER_BIN) and BUILD_CACHE.fetch(cache_key, CLIENT_BIN):
+            logger.info("Build cache hit %s, skipping make (%s)", cache_key[:16], BUILD_CACHE.stats())
+            with open(out_dir / f"{idx}_compile.log", "w", encoding="utf-8") as f:
+                f.write(f"=== BUILD CACHE HIT ===\n{cache_key}\n")
+        elif not build_client(idx, cache_key):
+            return
 
-    time.sleep(1)
+    if before_start is not None:
+        before_start()
 
+    # 原来 coordinator、server 启动后各固定 sleep 1s；现在等它们的就绪握手
+    coord_proc = None
     server_proc = None
-    try:
-        env_s = os.environ.copy()
-        env_s["RDMA_FUZZ_RUNTIME"] = SERVER_VIEW
-        logger.info("Starting server: %s RDMA_FUZZ_RUNTIME=%s", SERVER_BIN, SERVER_VIEW)
-        server_proc = subprocess.Popen([SERVER_BIN], env=env_s)
-    except Exception:
-        logger.exception("Failed to start server")
-        server_proc = None
+    if PERSISTENT:
+        try:
+            PEERS.begin_session()
+        except Exception:
+            logger.exception("Failed to start persistent server/coordinator")
+    else:
+        try:
+            coord_proc, _ = start_coordinator()
+        except Exception:
+            logger.exception("Failed to start coordinator.py")
+            coord_proc = None
 
-    time.sleep(1)
+        try:
+            env_s = os.environ.copy()
+            env_s["RDMA_FUZZ_RUNTIME"] = SERVER_VIEW
+            logger.info("Starting server: %s RDMA_FUZZ_RUNTIME=%s", SERVER_BIN, SERVER_VIEW)
+            server_proc, server_ready = start_with_ready([SERVER_BIN], "server", env=env_s)
+            # server 写出 server_update.json 后，还要等 coordinator 把它合并进 client 的视图
+            if server_ready and coord_proc is not None:
+                wait_for_view(CLIENT_VIEW)
+        except Exception:
+            logger.exception("Failed to start server")
+            server_proc = None
 
     logger.info("Starting client...")
     cc = ClientCapture(idx)  # 使用已经生成的idx
     env_c = os.environ.copy()
     env_c["RDMA_FUZZ_RUNTIME"] = CLIENT_VIEW
-    client_proc = cc.start(env=env_c)
-
-    cc.save_client_and_check_binary()
+    client_proc = cc.start(env=env_c, client_bin=client_bin or CLIENT_BIN)
 
     try:
         if client_proc is not None:
@@ -284,10 +520,11 @@ def run_once():
     finally:
         logger.info("Cleaning up: terminating server and coordinator if running")
         safe_terminate(server_proc, "server")
-        safe_terminate(coord_proc, "coordinator")
+        stop_coordinator(coord_proc)
         if cc.thread is not None:
             cc.thread.join(timeout=2)
         logger.info("Run finished")
+    return cc
 
 if __name__ == "__main__":
     run_once()
\ No newline at end of file
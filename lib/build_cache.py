@@ -0,0 +1,185 @@
+# lib/build_cache.py
+# -*- coding: utf-8 -*-
+"""
+生成的 client 的内容寻址编译缓存：
+- key = sha256(client.cpp + 运行时源码/头文件 + Makefile + 编译参数 + 编译器版本)
+- 命中时直接把缓存的二进制放到 build/<SAN>/client，完全跳过 make；未命中时照常编译，成功后入库
+- 条目按内容寻址存放在 repo/build_cache/<key[:2]>/<key>，写入走临时文件 + os.replace，多个 fuzz 进程共享安全
+- 按磁盘占用做 LRU 淘汰：命中时刷新条目的 mtime，总大小超过 max_bytes 时从最久未用的开始删
+
+变异里大量是 move / 无效参数翻转之类渲染结果不变的情况，这些都能直接命中。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+PathLike = Union[str, os.PathLike]
+
+# client 链接进来的运行时源码：它们一变，所有缓存都失效
+RUNTIME_SOURCES = (
+    "pair_runtime.cpp",
+    "pair_runtime.h",
+    "runtime_resolver.c",
+    "runtime_resolver.h",
+    "view_shm.h",
+    "client_prelude.h",
+    "Makefile",
+)
+
+DEFAULT_MAX_BYTES = 2 << 30  # 2 GiB
+
+
+@lru_cache(maxsize=None)
+def compiler_version(cxx: str = "g++") -> str:
+    try:
+        return subprocess.run([cxx, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class BuildCache:
+    def __init__(self, root: PathLike = "./repo/build_cache", max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        # 运行时源码很少变：按 (路径, mtime, size) 缓存摘要，不用每次重读
+        self._digests: dict = {}
+
+    # ---------- key ----------
+
+    def _digest(self, path: Path) -> str:
+        st = path.stat()
+        k = (str(path), st.st_mtime_ns, st.st_size)
+        d = self._digests.get(k)
+        if d is None:
+            d = self._digests[k] = _file_digest(path)
+        return d
+
+    def key_for(
+        self,
+        source: PathLike,
+        flags: Sequence[str] = (),
+        runtime_sources: Iterable[PathLike] = (),
+        cxx: str = "g++",
+    ) -> str:
+        """source 为渲染出的 client.cpp；runtime_sources 不存在的文件按缺失记入 key。"""
+        h = hashlib.sha256(b"build-cache-v1\0")
+        h.update(Path(source).read_bytes())
+        for p in runtime_sources:
+            p = Path(p)
+            h.update(f"\0{p.name}=".encode())
+            h.update(self._digest(p).encode() if p.exists() else b"<missing>")
+        h.update(("\0flags=" + "\x1f".join(flags)).encode())
+        h.update(("\0cxx=" + compiler_version(cxx)).encode())
+        return h.hexdigest()
+
+    def entry(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    # ---------- get / put ----------
+
+    def fetch(self, key: str, dest: PathLike) -> bool:
+        """命中时把二进制复制到 dest（保留可执行权限）并刷新 LRU 时间，返回 True。"""
+        src = self.entry(key)
+        try:
+            os.utime(src)  # LRU：最近使用
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copy2(src, tmp)
+            os.utime(tmp)  # 比 .o 新，避免后续 make 误判
+            os.replace(tmp, dest)
+        except FileNotFoundError:
+            # 刚好被别的进程淘汰
+            self.misses += 1
+            return False
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self.hits += 1
+        return True
+
+    def put(self, key: str, binary: PathLike) -> Path:
+        dst = self.entry(key)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".put.", dir=dst.parent)
+        os.close(fd)
+        try:
+            shutil.copy2(binary, tmp)
+            os.replace(tmp, dst)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        os.utime(dst)
+        self.evict()
+        return dst
+
+    # ---------- LRU ----------
+
+    def entries(self) -> List[Tuple[float, int, Path]]:
+        """[(最近使用时间, 字节数, 路径)]，按时间从旧到新。"""
+        out = []
+        if not self.root.is_dir():
+            return out
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for p in shard.iterdir():
+                if p.name.startswith("."):
+                    continue
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue
+                out.append((st.st_mtime, st.st_size, p))
+        out.sort(key=lambda e: e[0])
+        return out
+
+    def total_bytes(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """删掉最久未用的条目直到总大小不超过 max_bytes，返回删除个数。"""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, p in entries:
+            if total <= limit:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        n = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / n if n else 0.0}
+
+
+# 进程内共享实例；RDMA_FUZZ_BUILD_CACHE_MB 调整磁盘上限
+BUILD_CACHE = BuildCache(max_bytes=int(os.environ.get("RDMA_FUZZ_BUILD_CACHE_MB", DEFAULT_MAX_BYTES >> 20)) << 20)
@@ -0,0 +1,244 @@
+# lib/capture.py
+# -*- coding: utf-8 -*-
+"""
+client 输出的低开销捕获（auto_run.ClientCapture 的默认模式）：
+- stdout / stderr 两个管道用 os.read 大块读，不再每行 select + readline、每行 flush 四个文件、每行 logger.info
+- 只写一个合并流 <idx>_client.log，每行一条记录 "<seq> <O|E|M> <原始行>"，seq 按到达顺序递增；
+  client 以 stdbuf -oL -eL 行缓冲运行，原来 readline 的文本缓冲会把已读进来的行压在 select 看不到的地方，
+  这里直接按 fd 读，两个流之间的先后就是到达的先后（README 里 stdout/stderr 乱序的 TODO）；
+  同一轮里两个管道都有数据时先 stdout 后 stderr，所以 ASan 报告总在它之前的 stdout 后面
+- 每次运行的日志有上限：超过 max_bytes 后只保留最后 tail_bytes 的记录，中间写一条 M 截断标记
+- 边读边解析语义标记：stdout 的 "@b"/"@e" 数字结果标记（client_prelude.h 的 RR_VERB_BEGIN/END，
+  rdma_exec 也打同样的格式）进 VerbOutcomes 结果向量，sem_signature 由它导出（旧的 "[N] action start." 横幅也认）；
+  stderr 每行喂给 sanitizer_report.ReportParser，ASan / LSan 报告边读边解析成 reports；
+  出现 AddressSanitizer 之后的原始行也留在内存里（asan_text）。截断不影响这几项
+- client.tmp.stdout.log / client.tmp.stderr.log 不再实时写，要用时 split_view() 从合并流生成
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import re
+import select
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from lib.sanitizer_report import CrashReport, ReportParser
+
+PathLike = Union[str, os.PathLike]
+
+CHUNK = 1 << 16
+MAX_BYTES = int(os.environ.get("RDMA_FUZZ_CAPTURE_MAX", str(8 << 20)))
+TAIL_BYTES = int(os.environ.get("RDMA_FUZZ_CAPTURE_TAIL", str(256 << 10)))
+MAX_LINE = 1 << 20  # 没有换行的超长输出按这个长度切成记录
+MAX_ASAN_LINES = 4096
+
+STDOUT, STDERR, META = "O", "E", "M"
+
+# 旧格式横幅（codegen_cache banners="text"）：每个 verb 开头打印 "[N] action start."
+SEM_START_RE = re.compile(r"^\[(\d+)\]\s*(.+?)\s+start\.$")
+ASAN_MARK = "AddressSanitizer"
+
+# client_prelude.h / rdma_executor.c 的结果标记："@b <i> <verb id> [类名]"、"@e <i> <status> <errno>"
+MARK_BEGIN, MARK_END = "@b ", "@e "
+STATUS_NAMES = ("ok", "skip", "fail")
+
+
+@lru_cache(maxsize=None)
+def _verb_names() -> Tuple[str, ...]:
+    from lib.exec_schema import build_schema
+
+    schema = build_schema()
+    return tuple(name for name, _ in schema.classes[: schema.verb_count])
+
+
+def verb_name(cls: int) -> str:
+    names = _verb_names()
+    return names[cls] if 0 <= cls < len(names) else f"verb#{cls}"
+
+
+class VerbOutcome(NamedTuple):
+    index: int
+    cls: int
+    name: str
+    status: Optional[int]  # None：有开始标记没有结束标记（verb 中途崩溃 / die）
+    errno: int = 0
+
+    def token(self) -> str:
+        """语义签名里的一项，如 "CreateQP:ok"、"ModifyQP:fail:EINVAL"、"PostSend:abort"。"""
+        if self.status is None:
+            return f"{self.name}:abort"
+        st = STATUS_NAMES[self.status] if 0 <= self.status < len(STATUS_NAMES) else f"status{self.status}"
+        if self.status == 0 or not self.errno:
+            return f"{self.name}:{st}"
+        return f"{self.name}:{st}:{errno.errorcode.get(self.errno, self.errno)}"
+
+
+class VerbOutcomes:
+    """一次运行的逐 verb 结果向量，按行喂入（merged 捕获线程边读边喂，或者事后扫日志）。"""
+
+    def __init__(self):
+        self.vector: List[VerbOutcome] = []
+        self._pos: Dict[int, int] = {}
+        self.banners: Set[str] = set()  # 旧格式横幅里的 action
+        self._banner_seen: Set[int] = set()
+
+    def feed(self, line: str) -> bool:
+        """解析一行 stdout，是标记返回 True。"""
+        if line.startswith(MARK_BEGIN) or line.startswith(MARK_END):
+            parts = line.split()
+            try:
+                nums = [int(x) for x in parts[1:3 if parts[0] == "@b" else 4]]
+            except ValueError:
+                return False
+            if parts[0] == "@b" and len(nums) == 2:
+                idx, cls = nums[0], nums[1]
+                name = parts[3] if cls < 0 and len(parts) > 3 else verb_name(cls)
+                if idx not in self._pos:
+                    self._pos[idx] = len(self.vector)
+                    self.vector.append(VerbOutcome(idx, cls, name, None))
+                return True
+            if parts[0] == "@e" and len(nums) == 3:
+                pos = self._pos.get(nums[0])
+                if pos is not None and self.vector[pos].status is None:
+                    self.vector[pos] = self.vector[pos]._replace(status=nums[1], errno=nums[2])
+                return True
+            return False
+        m = SEM_START_RE.match(line)
+        if m is None:
+            return False
+        if int(m.group(1)) not in self._banner_seen:
+            self._banner_seen.add(int(m.group(1)))
+            self.banners.add(m.group(2))
+        return True
+
+    def signature(self) -> Set[str]:
+        return self.banners | {o.token() for o in self.vector}
+
+    def as_list(self) -> List[List[Optional[int]]]:
+        """[[序号, 类编号, 结果, errno], ...]，结果 None 表示中途中断；写进 detail。"""
+        return [[o.index, o.cls, o.status, o.errno] for o in self.vector]
+
+
+class MergedCapture:
+    def __init__(self, log_path: PathLike, max_bytes: int = MAX_BYTES, tail_bytes: int = TAIL_BYTES, echo=None):
+        self.log_path = Path(log_path)
+        self.max_bytes = max_bytes
+        self.tail_bytes = tail_bytes
+        self.echo = echo  # 可选 callable(tag, line)，调试时把每行转给 logger
+        self.seq = 0
+        self.written = 0
+        self.dropped = 0
+        self.outcomes = VerbOutcomes()
+        self._reports = ReportParser()
+        self.asan_lines: List[str] = []
+        self._tail: Deque[bytes] = deque()
+        self._tail_size = 0
+        self._partial: Dict[str, bytes] = {STDOUT: b"", STDERR: b""}
+        self._f = open(self.log_path, "wb", buffering=CHUNK)
+
+    # ---------- 写 ----------
+
+    def pump(self, fds: Dict[int, str]) -> None:
+        """读 {fd: STDOUT/STDERR} 直到全部 EOF。"""
+        fds = dict(fds)
+        while fds:
+            readable, _, _ = select.select(list(fds), [], [], 1.0)
+            for fd in sorted(readable, key=lambda fd: fds[fd] != STDOUT):
+                data = os.read(fd, CHUNK)
+                if data:
+                    self.feed(fds[fd], data)
+                else:
+                    self._flush_partial(fds.pop(fd))
+
+    def feed(self, tag: str, data: bytes) -> None:
+        buf = self._partial[tag] + data
+        lines = buf.split(b"\n")
+        rest = lines.pop()
+        if lines:
+            # 另一个流里还没换行的半行先落盘（多半是崩溃前没来得及打完的输出），保证先后顺序
+            self._flush_partial(STDERR if tag == STDOUT else STDOUT)
+        for line in lines:
+            self._record(tag, line)
+        while len(rest) >= MAX_LINE:
+            self._record(tag, rest[:MAX_LINE])
+            rest = rest[MAX_LINE:]
+        self._partial[tag] = rest
+
+    def _flush_partial(self, tag: str) -> None:
+        if self._partial[tag]:
+            self._record(tag, self._partial[tag])
+            self._partial[tag] = b""
+
+    def _record(self, tag: str, raw: bytes) -> None:
+        line = raw.decode("utf-8", "replace").rstrip("\r")
+        if tag == STDOUT:
+            self.outcomes.feed(line.strip())
+        else:
+            self._reports.feed(line)
+            if (self.asan_lines or ASAN_MARK in line) and len(self.asan_lines) < MAX_ASAN_LINES:
+                self.asan_lines.append(line)
+        if self.echo is not None:
+            self.echo(tag, line)
+
+        self.seq += 1
+        rec = f"{self.seq} {tag} {line}\n".encode("utf-8", "replace")
+        if not self._tail and self.written + len(rec) <= self.max_bytes:
+            self._f.write(rec)
+            self.written += len(rec)
+            return
+        # 超过上限：只留尾部
+        self._tail.append(rec)
+        self._tail_size += len(rec)
+        while self._tail_size > self.tail_bytes and len(self._tail) > 1:
+            self._tail_size -= len(self._tail.popleft())
+            self.dropped += 1
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        for tag in (STDOUT, STDERR):
+            self._flush_partial(tag)
+        self._reports.close()
+        if self.dropped:
+            # 标记占用最后一条被丢弃记录的 seq，整个文件的 seq 仍然递增
+            last_dropped = int(self._tail[0].split(b" ", 1)[0]) - 1
+            note = f"{last_dropped} {META} truncated {self.dropped} records (cap {self.max_bytes} bytes)\n"
+            self._f.write(note.encode())
+        self._f.writelines(self._tail)
+        self.written += self._tail_size
+        self._tail.clear()
+        self._tail_size = 0
+        self._f.close()
+
+    # ---------- 读 ----------
+
+    @property
+    def sem_signature(self) -> Set[str]:
+        return self.outcomes.signature()
+
+    @property
+    def reports(self) -> List[CrashReport]:
+        """stderr 里解析出的 sanitizer 报告（close 之后包括没收完的那份）。"""
+        return self._reports.reports
+
+    def asan_text(self) -> str:
+        return "\n".join(self.asan_lines)
+
+
+def iter_records(log_path: PathLike) -> Iterator[Tuple[int, str, str]]:
+    # 记录只以 \n 分隔，行内的 \r（进度条之类）原样保留
+    with open(log_path, "r", encoding="utf-8", errors="replace", newline="\n") as f:
+        for rec in f:
+            seq, tag, line = rec.rstrip("\n").split(" ", 2)
+            yield int(seq), tag, line
+
+
+def split_view(log_path: PathLike, tag: str, out_path: PathLike) -> Path:
+    """从合并流里取出一个流（STDOUT / STDERR），写成原来的纯文本日志格式。"""
+    with open(out_path, "w", encoding="utf-8") as out:
+        out.writelines(f"{line}\n" for _, t, line in iter_records(log_path) if t == tag)
+    return Path(out_path)
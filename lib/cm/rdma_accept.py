@@ -94,6 +94,7 @@ class RdmaAccept(VerbCall):
         {code_param}
         int __rc_accept = rdma_accept({id_name}, {param_ptr_expr});
         if (__rc_accept) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_accept failed on {id_name}: %s\\n", strerror(errno));
         }}
     }});
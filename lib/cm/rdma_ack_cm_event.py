@@ -73,6 +73,7 @@ class AckCmEvent(VerbCall):
     IF_OK_PTR({event_name}, {{
         int rc = rdma_ack_cm_event({event_name});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_ack_cm_event({event_name}) failed: rc=%d\\n", rc);
         }} else {{
             /* Event successfully acknowledged; invalidate the pointer to prevent reuse. */
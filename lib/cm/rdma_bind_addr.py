@@ -66,6 +66,7 @@ class RdmaBindAddr(VerbCall):
     IF_OK_PTR({id_name}, {{
         int ret = rdma_bind_addr({id_name}, {addr_expr});
         if (ret) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_bind_addr failed for {id_name}: ret=%d errno=%d (%s)\\n", ret, errno, strerror(errno));
         }}
     }});
@@ -101,6 +101,7 @@ class RdmaConnect(VerbCall):
         {param_code}
         int rc = rdma_connect({id_name}, {conn_arg});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_connect({id_name}) failed: rc=%d (%s)\\n", rc, strerror(errno));
         }} else {{
             // Runtime model hint: cm_id is now connecting; actual ESTABLISHED is async via CM events.
@@ -155,6 +155,7 @@ class RdmaCreateEP(VerbCall):
         /* Capture created QP from cm_id */
         {qp_name} = {id_name} ? {id_name}->qp : NULL;
         if (!{qp_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_create_ep did not produce a QP (qp_init_attr provided)\\n");
         }}
 """
@@ -188,6 +189,7 @@ class RdmaCreateEP(VerbCall):
         {attr_code}
         int ret = rdma_create_ep(&{id_name}, {res_name}, {pd_name}, {"&" + attr_name if attr_name else "NULL"});
         if (ret) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_create_ep failed ret=%d\\n");
         }}
     }});"""
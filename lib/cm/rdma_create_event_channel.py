@@ -86,6 +86,7 @@ class CreateEventChannel(VerbCall):
     /* rdma_create_event_channel */
     {ec_name} = rdma_create_event_channel();
     if (!{ec_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to create RDMA CM event channel {ec_name}\\n");
     }} else {{
         // The event channel maps to a file descriptor: {ec_name}->fd
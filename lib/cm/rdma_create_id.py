@@ -102,6 +102,7 @@ class RdmaCreateId(VerbCall):
     {{
         int ret_create_id = rdma_create_id({channel_expr}, &{id_name}, {context_expr}, {ps_expr});
         if (ret_create_id) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_create_id failed (id={id_name}, ps={ps_expr}): %d\\n", ret_create_id);
         }}
     }}
@@ -116,6 +116,7 @@ class RdmaCreateQP(VerbCall):
         {attr_code}
         int rc = rdma_create_qp({id_name}, {pd_name}, &{attr_name});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_create_qp failed for id {id_name} (rc=%d)\\n", rc);
         }} else {{
 
@@ -138,10 +138,12 @@ class RdmaCreateSRQ(VerbCall):
             {attr_code}
             int ret_create_srq = rdma_create_srq({id_name}, {pd_name}, &{attr_name});
             if (ret_create_srq) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "Failed to rdma_create_srq on id=%p, pd=%p: %d\\n", (void*){id_name}, (void*){pd_name}, ret_create_srq);
             }} else {{
                 {srq_name} = {id_name}->srq;
                 if (!{srq_name}) {{
+                    RR_SET_FAIL();
                     fprintf(stderr, "rdma_create_srq succeeded but id->srq is NULL (unexpected)\\n");
                 }}
             }}
@@ -108,10 +108,12 @@ class CreateSRQEx(VerbCall):
         {code}
         int rc = rdma_create_srq_ex({id_name}, &{attr_name});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_create_srq_ex failed for SRQ {srq_name}, rc=%d, errno=%d (%s)\\n", rc, errno, strerror(errno));
         }} else {{
             {srq_name} = {id_name}->srq;
             if (!{srq_name}) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "rdma_create_srq_ex returned success but id->srq is NULL for {srq_name}\\n");
             }}
         }}
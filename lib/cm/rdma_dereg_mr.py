@@ -58,6 +58,7 @@ class RDMADeregMR(VerbCall):
     IF_OK_PTR({mr_name}, {{
         int __ret_dereg_mr = rdma_dereg_mr({mr_name});
         if (__ret_dereg_mr) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_dereg_mr failed on {mr_name}: ret=%d\\n", __ret_dereg_mr);
         }} else {{
             {mr_name} = NULL; /* Pointer invalidated after successful deregistration */
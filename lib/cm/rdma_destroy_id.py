@@ -67,6 +67,7 @@ class DestroyCmId(VerbCall):
     IF_OK_PTR({id_name}, {{
         int __ret_destroy_id = rdma_destroy_id({id_name});
         if (__ret_destroy_id) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_destroy_id({id_name}) failed: %d\\n", __ret_destroy_id);
         }} else {{
             {id_name} = NULL; /* Invalidate handle after destruction */
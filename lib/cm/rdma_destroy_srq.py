@@ -87,6 +87,7 @@ class DestroySRQ(VerbCall):
     IF_OK_PTR({id_name}, {{
         int ret = rdma_destroy_srq({id_name});
         if (ret) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_destroy_srq failed for id=%s: %d (%s)\\n", "{id_name}", ret, strerror(-ret));
         }} else {{{srq_stmt}
         }}
@@ -96,6 +96,7 @@ class RDMADisconnect(VerbCall):
     IF_OK_PTR({id_name}, {{
         int ret = rdma_disconnect({id_name});
         if (ret) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_disconnect({id_name}) failed: ret=%d errno=%s\\n",
                     ret, strerror(ret < 0 ? -ret : ret));
         }} else {{
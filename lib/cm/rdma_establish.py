@@ -76,6 +76,7 @@ class RdmaEstablish(VerbCall):
     IF_OK_PTR({id_name}, {{
         int rc = rdma_establish({id_name});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_establish({id_name}) failed: rc=%d, errno=%d (%s)\\n", rc, errno, strerror(errno));
         }} else {{
             fprintf(stderr, "rdma_establish({id_name}) succeeded (connection finalized)\\n");
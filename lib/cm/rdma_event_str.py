@@ -90,6 +90,7 @@ class RdmaEventStr(VerbCall):
     /* rdma_event_str */
     {out_var} = rdma_event_str({event_expr});
     if (!{out_var}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "rdma_event_str returned NULL for event expression: {event_expr}\\n");
     }}
 """
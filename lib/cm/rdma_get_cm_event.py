@@ -85,6 +85,7 @@ class RdmaGetCmEvent(VerbCall):
     IF_OK_PTR({channel_name}, {{
         int __ret_get_ev = rdma_get_cm_event({channel_name}, &{event_name});
         if (__ret_get_ev) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_get_cm_event failed on channel %p: %s\\n", (void*){channel_name}, strerror(errno));
         }} else {{
             if ({event_name}) {{
@@ -92,6 +93,7 @@ class RdmaGetCmEvent(VerbCall):
                 fprintf(stderr, "CM event received: %s (id=%p) on channel %p\\n",
                         ev_str ? ev_str : "UNKNOWN", (void*){event_name}->id, (void*){channel_name});
             }} else {{
+                RR_SET_FAIL();
                 fprintf(stderr, "rdma_get_cm_event returned success but event is NULL?\\n");
             }}
         }}
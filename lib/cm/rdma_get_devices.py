@@ -79,6 +79,7 @@ class RdmaGetDevices(VerbCall):
     /* rdma_get_devices */
     {dev_arr} = rdma_get_devices(&{num_name});
     if (!{dev_arr}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "rdma_get_devices: returned NULL device list\\n");
     }} else {{
         fprintf(stderr, "rdma_get_devices: %d device(s) available\\n", {num_name});
@@ -97,6 +97,7 @@ class RdmaGetLocalAddr(VerbCall):
                     break;
             }}
         }} else {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_get_local_addr({id_var}) returned NULL\\n");
         }}
         """
@@ -89,6 +89,7 @@ class GetPeerAddr(VerbCall):
     IF_OK_PTR({cm_id_name}, {{
         {peer_var_name} = rdma_get_peer_addr({cm_id_name});
         if (!{peer_var_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_get_peer_addr({cm_id_name}) returned NULL\\n");
         }} else {{
             // Pointer references internal storage in rdma_cm_id->route.addr.dst_addr (do not free).
@@ -99,6 +99,7 @@ class RDMAGetRecvComp(VerbCall):
             acceptable = " || ".join([f"{wc_name}.opcode == {op}" for op in self.expect_opcodes.value])
             opcode_check_code = f"""
         if (!({acceptable})) {{
+            RR_SET_FAIL();
             fprintf(stderr,
                     "rdma_get_recv_comp: unexpected opcode %d (allowed: {", ".join(self.expect_opcodes.value)})\\n",
                     {wc_name}.opcode);
@@ -109,6 +110,7 @@ class RDMAGetRecvComp(VerbCall):
         if self.expect_status and self.expect_status.value:
             status_check_code = f"""
         if ({wc_name}.status != {self.expect_status.value}) {{
+            RR_SET_FAIL();
             fprintf(stderr,
                     "rdma_get_recv_comp: unexpected status %d (expected {self.expect_status.value})\\n",
                     {wc_name}.status);
@@ -130,6 +132,7 @@ class RDMAGetRecvComp(VerbCall):
     IF_OK_PTR({id_name}, {{
         int __rc = rdma_get_recv_comp({id_name}, &{wc_name});
         if (__rc < 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_get_recv_comp(id={id_name}) failed: rc=%d\\n", __rc);
         }} else if (__rc == 0) {{
             fprintf(stderr, "rdma_get_recv_comp(id={id_name}) returned 0 (no recv completions)\\n");
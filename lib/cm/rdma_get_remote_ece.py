@@ -81,6 +81,7 @@ class GetRemoteECE(VerbCall):
         memset(&{ece_name}, 0, sizeof({ece_name}));
         int ret_ece = rdma_get_remote_ece({id_name}, &{ece_name});
         if (ret_ece) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_get_remote_ece({id_name}) failed: %d\\n", ret_ece);
         }} else {{
             // Remote ECE parameters fetched and stored in {ece_name}
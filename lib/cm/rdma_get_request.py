@@ -76,8 +76,10 @@ class RdmaGetRequest(VerbCall):
     IF_OK_PTR({listen_name}, {{
         int rc = rdma_get_request({listen_name}, &{id_name});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_get_request on %s failed: %d (%s)\\n", "{listen_name}", rc, strerror(-rc));
         }} else if (!{id_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_get_request succeeded but returned NULL id\\n");
         }}
     }});
@@ -111,10 +111,12 @@ class RdmaGetSendComp(VerbCall):
         {declare_wc}
         int {ret_name} = rdma_get_send_comp({id_name}, {wc_addr});
         if ({ret_name} <= 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_get_send_comp({id_name}) failed: ret=%d errno=%d (%s)\\n", {ret_name}, errno, strerror(errno));
         }} else {{
             /* Successfully retrieved a send completion */
             if ({wc_name}.status != IBV_WC_SUCCESS) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "Send WC status %d (%s) for cm_id=%s, wr_id=%" "PRIu64" "\\n",
                         {wc_name}.status,
                         ibv_wc_status_str({wc_name}.status),
@@ -150,6 +150,7 @@ class RdmaGetAddrInfo(VerbCall):
     do {{
         int gai_ret = rdma_getaddrinfo({node_var}, {service_var}, {hints_ptr}, &{res_name});
         if (gai_ret) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_getaddrinfo failed (ret=%d, node=%s, service=%s)\\n",
                     gai_ret,
                     {node_var} ? {node_var} : "NULL",
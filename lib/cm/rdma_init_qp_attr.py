@@ -85,6 +85,7 @@ class RdmaInitQPAttr(VerbCall):
     IF_OK_PTR({id_name}, {{
         int rc_rdma_init_qp_attr = rdma_init_qp_attr({id_name}, &{attr_name}, &{mask_name});
         if (rc_rdma_init_qp_attr) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_init_qp_attr({id_name}) failed: %d\\n", rc_rdma_init_qp_attr);
         }} else {{
             /* Successfully initialized QP attributes into {attr_name}, mask in {mask_name} */
@@ -133,6 +133,7 @@ class RdmaJoinMulticast(VerbCall):
             {qp_note}
             int ret_join = rdma_join_multicast({id_name}, (struct sockaddr *){addr_name}, {ctx_ptr});
             if (ret_join) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "rdma_join_multicast(id=%s, addr=%s) failed: %d\\n", "{id_name}", "{addr_name}", ret_join);
             }} else {{
                 /* Track membership handle (logical, for fuzzing bookkeeping) */
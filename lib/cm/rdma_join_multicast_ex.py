@@ -100,6 +100,7 @@ class JoinMulticastEx(VerbCall):
     IF_OK_PTR({id_name}, {{
         int ret = rdma_join_multicast_ex({id_name}, {mc_attr_name}, {user_ctx});
         if (ret) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_join_multicast_ex(id={id_name}) failed: ret=%d\\n", ret);
         }} else {{
             fprintf(stdout, "rdma_join_multicast_ex(id={id_name}) succeeded\\n");
@@ -89,6 +89,7 @@ class RdmaLeaveMulticast(VerbCall):
         IF_OK_PTR({addr_name}, {{
             int ret = rdma_leave_multicast({id_name}, (struct sockaddr *){addr_name});
             if (ret) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "rdma_leave_multicast(id={id_name}, addr={addr_name}) failed: %d\\n", ret);
             }} else {{
                 /* Left multicast group successfully.
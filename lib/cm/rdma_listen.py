@@ -93,6 +93,7 @@ class RdmaListen(VerbCall):
     IF_OK_PTR({id_name}, {{
         int ret = rdma_listen({id_name}, {backlog_expr});
         if (ret) {{
+            RR_SET_FAIL();
             perror("rdma_listen");
             fprintf(stderr, "rdma_listen failed on {id_name} (backlog=%d), ret=%d\\n", {backlog_expr}, ret);
         }} else {{
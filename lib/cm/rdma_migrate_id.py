@@ -99,6 +99,7 @@ class RdmaMigrateId(VerbCall):
         IF_OK_PTR({ch_name}, {{
             int __ret_migrate = rdma_migrate_id({id_name}, {ch_name});
             if (__ret_migrate) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "rdma_migrate_id({id_name} -> {ch_name}) failed: %d\\n", __ret_migrate);
             }} else {{
                 // Successfully migrated: events for {id_name} will now arrive on {ch_name}.
@@ -117,6 +117,7 @@ class RdmaNotify(VerbCall):
     IF_OK_PTR({id_name}, {{
         int notify_rc = rdma_notify({id_name}, {event_code});
         if (notify_rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_notify({id_name}, {event_code}) failed: %d\\n", notify_rc);
         }} else {{
             /* On success, CM may be forced into an established state if event is COMM_EST. */
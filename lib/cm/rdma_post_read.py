@@ -154,11 +154,13 @@ class RdmaPostRead(VerbCall):
                                 (uint64_t){remote_addr_expr},
                                 (uint32_t){rkey_expr});
             if (__rdma_read_rc) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "rdma_post_read failed: rc=%d (id=%p, addr=%p, len=%zu, mr=%p, raddr=0x%lx, rkey=0x%x)\\n",
                         __rdma_read_rc, (void*){id_name}, __rdma_read_addr, __rdma_read_len,
                         (void*){mr_name}, (unsigned long){remote_addr_expr}, (unsigned int){rkey_expr});
             }}
         }} else {{
+            RR_SET_SKIP();
             fprintf(stderr, "rdma_post_read skipped: invalid local buffer or MR (addr=%p, len=%zu, mr=%p)\\n",
                     __rdma_read_addr, __rdma_read_len, (void*){mr_name});
         }}
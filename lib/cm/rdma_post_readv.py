@@ -114,6 +114,7 @@ class RdmaPostReadv(VerbCall):
     IF_OK_PTR({id_expr}, {{
         int __rc = rdma_post_readv({id_expr}, {context_arg}, {sgl_expr}, {nsge_expr}, {flags_expr}, (uint64_t)({remote_addr_expr}), (uint32_t)({rkey_expr}));
         if (__rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_post_readv failed (rc=%d) id=%p nsge=%d flags=0x%x raddr=0x%lx rkey=0x%x\\n",
                     __rc, (void*){id_expr}, {nsge_expr}, {flags_expr}, (unsigned long){remote_addr_expr}, (unsigned){rkey_expr});
         }}
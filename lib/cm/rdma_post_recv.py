@@ -110,6 +110,7 @@ class RdmaPostRecv(VerbCall):
         IF_OK_PTR({mr_name}, {{
             int rc = rdma_post_recv({id_name}, {wr_ctx_expr}, {addr_expr}, (size_t){len_expr}, {mr_name});
             if (rc) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "rdma_post_recv failed: id={id_name}, length=%zu\\n", (size_t){len_expr});
             }} else {{
                 /* Successfully posted a receive WR on id={id_name} (len=%zu) */ 
@@ -222,6 +222,7 @@ class RDMAPostRecvv(VerbCall):
 {sgl_init_code}
         int rc = rdma_post_recvv({cm_name}, {ctx_expr}, {sgl_ptr_expr}, {nsge_expr});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_post_recvv failed on cm_id %s: rc=%d (errno=%d)\\n", "{cm_name}", rc, errno);
         }} else {{
             fprintf(stdout, "rdma_post_recvv posted on cm_id %s (nsge={nsge_expr})\\n", "{cm_name}");
@@ -148,6 +148,7 @@ class RdmaPostSend(VerbCall):
 
         int rc = rdma_post_send({id_name}, wr_ctx, buf_addr, buf_len, mr_ptr, send_flags);
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_post_send(id=%s) failed: %d\\n", "{id_name}", rc);
         }} else {{
             fprintf(stdout, "rdma_post_send(id=%s) posted: addr=%p len=%zu flags=0x%x\\n",
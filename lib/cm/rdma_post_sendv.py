@@ -170,6 +170,7 @@ class RdmaPostSendV(VerbCall):
         {sgl_init_code}
         int _ret_sendv = rdma_post_sendv({id_name}, {user_ctx_expr}, {sgl_var_name}, {nsge_final}, {flags_expr});
         if (_ret_sendv) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_post_sendv failed on {id_name}: %d\\n", _ret_sendv);
         }} else {{
             VERBOSE_LOG("rdma_post_sendv posted on {id_name}, nsge={{{{int}}}}", {nsge_final});
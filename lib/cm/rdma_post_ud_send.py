@@ -174,6 +174,7 @@ class RdmaPostUdSend(VerbCall):
             IF_OK_PTR({ah_name}, {{
                 int rc = rdma_post_ud_send({id_name}, {context_expr}, {addr_expr}, {length_expr}, {mr_name}, {flags_expr}, {ah_name}, {remote_qpn_expr});
                 if (rc) {{
+                    RR_SET_FAIL();
                     fprintf(stderr, "rdma_post_ud_send failed (id=%s, rc=%d)\\n", "{id_name}", rc);
                 }}
             }});
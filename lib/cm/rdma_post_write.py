@@ -158,6 +158,7 @@ class RdmaPostWrite(VerbCall):
                                      (uint64_t)({remote_addr_expr}),
                                      (uint32_t)({rkey_expr}));
         if (rc_rpw) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_post_write(id={id_name}) failed: %s\\n", strerror(errno));
         }} else {{
             VERBOSE_LOG("rdma_post_write(id={id_name}, addr=%p, len=%zu, raddr=0x%lx, rkey=0x%x, flags=0x%x) posted",
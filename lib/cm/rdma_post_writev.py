@@ -161,6 +161,7 @@ class RdmaPostWritev(VerbCall):
         {sge_array_decl}
         int __ret_writev = rdma_post_writev({id_name}, {context_expr}, {sgl_ptr_expr}, {nsge_expr}, {flags_expr}, (uint64_t){raddr_expr}, (uint32_t){rkey_expr});
         if (__ret_writev) {{
+            RR_SET_FAIL();
             fprintf(stderr,
                     "rdma_post_writev(id=%p) failed: ret=%d, nsge=%d, flags=0x%x, raddr=0x%llx, rkey=0x%x\\n",
                     (void*){id_name},
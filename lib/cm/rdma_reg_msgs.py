@@ -103,6 +103,7 @@ class RdmaRegMsgs(VerbCall):
     IF_OK_PTR({id_name}, {{
         {mr_name} = rdma_reg_msgs({id_name}, {addr_expr}, {length_expr});
         if (!{mr_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_reg_msgs failed: id=%p addr=%p len=%zu\\n", (void*){id_name}, (void*)({addr_expr}), (size_t)({length_expr}));
         }}
     }});
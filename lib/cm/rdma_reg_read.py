@@ -118,6 +118,7 @@ class RdmaRegRead(VerbCall):
     IF_OK_PTR({id_name}, {{
         {mr_name} = rdma_reg_read({id_name}, (void *)({addr_name}), (size_t)({length_expr}));
         if (!{mr_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_reg_read failed: id=%p addr=%p len=%zu (mr={mr_name})\\n",
                     (void*){id_name}, (void*)({addr_name}), (size_t)({length_expr}));
         }} else {{
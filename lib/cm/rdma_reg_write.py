@@ -110,6 +110,7 @@ class RdmaRegWrite(VerbCall):
     IF_OK_PTR({id_name}, {{
         {mr_name} = rdma_reg_write({id_name}, {addr_expr}, (size_t){length_expr});
         if (!{mr_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_reg_write failed: id=%s addr=%p len=%zu\\n", "{id_name}", (void*){addr_expr}, (size_t){length_expr});
         }} else {{
             fprintf(stderr, "rdma_reg_write OK: mr=%s lkey=0x%x rkey=0x%x addr=%p len=%zu\\n",
@@ -140,6 +140,7 @@ class RdmaReject(VerbCall):
     IF_OK_PTR({id_name}, {{
         {priv_def_code}int rc = rdma_reject({id_name}, {pdata_expr}, {plen_expr});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_reject failed on %s (rc=%d)\\n", "{id_name}", rc);
         }} else {{
             fprintf(stderr, "rdma_reject succeeded on %s\\n", "{id_name}");
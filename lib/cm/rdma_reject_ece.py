@@ -170,6 +170,7 @@ class RdmaRejectECE(VerbCall):
         {init_lines}
         int ret = rdma_reject_ece({id_name}, (const void *){ptr_expr}, (uint8_t)({len_expr}));
         if (ret) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_reject_ece failed on cm_id %s (ret=%d, errno=%d): %s\\n",
                     "{id_name}", ret, errno, strerror(errno));
         }} else {{
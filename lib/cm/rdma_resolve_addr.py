@@ -117,6 +117,7 @@ class RdmaResolveAddr(VerbCall):
     IF_OK_PTR({id_name}, {{
         int ret_resolve_addr = rdma_resolve_addr({id_name}, {src_expr}, {dst_expr}, {timeout});
         if (ret_resolve_addr) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_resolve_addr failed for {id_name}: ret=%d errno=%d (%s)\\n",
                     ret_resolve_addr, errno, strerror(errno));
         }} else {{
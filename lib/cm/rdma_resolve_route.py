@@ -68,6 +68,7 @@ class RdmaResolveRoute(VerbCall):
     IF_OK_PTR({id_name}, {{
         int ret_rr = rdma_resolve_route({id_name}, {timeout_expr});
         if (ret_rr) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_resolve_route failed for id=%p: ret=%d errno=%d (%s)\\n",
                     (void*){id_name}, ret_rr, errno, strerror(errno));
         }}
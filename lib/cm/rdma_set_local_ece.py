@@ -97,6 +97,7 @@ class RdmaSetLocalECE(VerbCall):
         {ece_code}
         int rc = rdma_set_local_ece({id_name}, {ece_arg});
         if (rc) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_set_local_ece({id_name}) failed: %d\\n", rc);
         }}
     }});
@@ -193,6 +193,7 @@ class RdmaSetOption(VerbCall):
         {prelude}
         int rc_setopt{suffix} = rdma_set_option({id_name}, {level_expr}, {optname_expr}, {optptr_expr}, {optlen_expr});
         if (rc_setopt{suffix}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "rdma_set_option(id=%p, level=%d, optname=%d, optlen=%zu) failed: errno=%d (%s)\\n",
                     (void*){id_name}, (int)({level_expr}), (int)({optname_expr}), (size_t)({optlen_expr}), errno, strerror(errno));
         }} else {{
@@ -0,0 +1,298 @@
+# lib/codegen_cache.py
+# -*- coding: utf-8 -*-
+"""
+按 verb 记忆化的 C 代码生成：
+- 缓存项以 verb 内容哈希为主键；generate_c 第一次执行时通过一个记录型 ctx 代理，
+  记下它读过的 ctx 输入（变量是否已分配/类型、QP 绑定、gid_var 等，精确到 dict 的 key）和做过的写入
+- 再次遇到同一 verb 时，只要那些读过的输入在当前 ctx 里取值不变，就直接拼接缓存的代码并重放写入，
+  保证 ctx.generate_variable_definitions_all() 与逐个调用 generate_c 的结果一致
+- 每个 verb 前后默认只打印数字结果标记（RR_VERB_BEGIN/END：序号、类编号、结果码 rr_rc、失败时的 errno）；
+  旧的 printf 横幅（banners="text"）里的 summarize_verb(deep=True, max_items=1000) 只依赖 verb 本身，按内容哈希单独缓存
+
+apply(ctx) 仍然对每个 verb 执行（契约/追踪器依赖它），只有 generate_c 和横幅被跳过。
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from lib.merkle import node_hash
+
+# apply() 阶段使用的重量级对象，generate_c 不读，也不参与缓存校验
+_CTX_PASSTHROUGH = {"tracker", "contracts"}
+_MISSING = ("<missing>",)
+
+
+def escape_c_string(s: str) -> str:
+    """转义为合法的 C 字符串常量内容（json.dumps 会做 C 风格转义）。"""
+    return json.dumps(s)[1:-1]
+
+
+def verb_class_id(v: Any) -> int:
+    """verb 在 lib/exec_schema.py 里的类编号（和 rdma_exec 共用），不在 schema 里的返回 -1。"""
+    from lib.exec_schema import build_schema
+
+    return build_schema().class_id.get(type(v).__name__, -1)
+
+
+def verb_digest(v: Any) -> str:
+    """verb 的内容哈希：缓存的 Merkle 结构哈希（与 to_state 编码等价），未变异的 verb 为 O(1)。"""
+    return node_hash(v)
+
+
+def _freeze(x: Any):
+    if isinstance(x, dict):
+        return tuple((k, _freeze(v)) for k, v in x.items())
+    if isinstance(x, (list, tuple)):
+        return tuple(_freeze(v) for v in x)
+    if isinstance(x, set):
+        return tuple(sorted(map(repr, x)))
+    if x is None or isinstance(x, (bool, int, float, str)):
+        return x
+    return (type(x).__name__, str(x))
+
+
+class _Recorder:
+    def __init__(self):
+        self.reads: List[Tuple] = []
+        self.writes: List[Tuple] = []
+        self._written = set()
+
+    def read(self, op: Tuple, slot: Tuple):
+        # 本次调用自己写过的位置再读，不构成对外部输入的依赖
+        if slot not in self._written:
+            self.reads.append(op)
+
+    def write(self, op: Tuple, slot: Tuple):
+        self._written.add(slot)
+        self.writes.append(op)
+
+
+class _RecordingDict:
+    """包一层 ctx 上的 dict 属性，按 key 记录读写。"""
+
+    def __init__(self, d: dict, attr: str, rec: _Recorder):
+        self._d, self._attr, self._rec = d, attr, rec
+
+    def _whole(self):
+        self._rec.read(("whole", self._attr, _freeze(self._d)), (self._attr, None))
+
+    def __contains__(self, k):
+        r = k in self._d
+        self._rec.read(("has", self._attr, k, r), (self._attr, k))
+        return r
+
+    def __getitem__(self, k):
+        if k not in self._d:
+            self._rec.read(("has", self._attr, k, False), (self._attr, k))
+            raise KeyError(k)
+        v = self._d[k]
+        self._rec.read(("get", self._attr, k, _freeze(v)), (self._attr, k))
+        return v
+
+    def get(self, k, default=None):
+        return self[k] if k in self else default
+
+    def __setitem__(self, k, v):
+        self._d[k] = v
+        self._rec.write(("dict_set", self._attr, k, copy.deepcopy(v)), (self._attr, k))
+
+    def pop(self, k, *default):
+        present = k in self
+        v = self._d.pop(k, *default)
+        if present:
+            self._rec.write(("dict_del", self._attr, k), (self._attr, k))
+        return v
+
+    def setdefault(self, k, default=None):
+        if k not in self:
+            self[k] = default
+        return self._d[k]
+
+    def __iter__(self):
+        self._whole()
+        return iter(self._d)
+
+    def __len__(self):
+        self._whole()
+        return len(self._d)
+
+    def keys(self):
+        self._whole()
+        return self._d.keys()
+
+    def values(self):
+        self._whole()
+        return self._d.values()
+
+    def items(self):
+        self._whole()
+        return self._d.items()
+
+
+class _RecordingCtx:
+    """CodeGenContext 的记录型代理：方法也绑定到代理上，这样方法内部对 self.variables 等的访问同样被记录。"""
+
+    def __init__(self, ctx, rec: _Recorder):
+        object.__setattr__(self, "_ctx", ctx)
+        object.__setattr__(self, "_rec", rec)
+
+    def __getattr__(self, name):
+        ctx, rec = self._ctx, self._rec
+        inst = vars(ctx)
+        if name in _CTX_PASSTHROUGH:
+            return getattr(ctx, name)
+        if name in inst:
+            v = inst[name]
+            if isinstance(v, dict):
+                return _RecordingDict(v, name, rec)
+            rec.read(("attr", name, _freeze(v)), (name, None))
+            return v
+        cls_attr = getattr(type(ctx), name, _MISSING)
+        if callable(cls_attr) and hasattr(cls_attr, "__get__"):
+            return cls_attr.__get__(self, type(self))
+        if cls_attr is _MISSING:
+            rec.read(("attr", name, _MISSING), (name, None))
+            raise AttributeError(name)
+        return cls_attr
+
+    def __setattr__(self, name, value):
+        setattr(self._ctx, name, value)
+        self._rec.write(("set", name, copy.deepcopy(value)), (name, None))
+
+
+def _reads_hold(ctx, reads: List[Tuple]) -> bool:
+    inst = vars(ctx)
+    for op in reads:
+        kind, attr = op[0], op[1]
+        if kind == "attr":
+            if _freeze(inst.get(attr, getattr(type(ctx), attr, _MISSING))) != op[2]:
+                return False
+            continue
+        d = inst.get(attr)
+        if not isinstance(d, dict):
+            return False
+        if kind == "has":
+            if (op[2] in d) != op[3]:
+                return False
+        elif kind == "get":
+            if op[2] not in d or _freeze(d[op[2]]) != op[3]:
+                return False
+        elif kind == "whole":
+            if _freeze(d) != op[2]:
+                return False
+    return True
+
+
+def _replay(ctx, writes: List[Tuple]) -> None:
+    for op in writes:
+        if op[0] == "set":
+            setattr(ctx, op[1], copy.deepcopy(op[2]))
+        elif op[0] == "dict_set":
+            getattr(ctx, op[1])[op[2]] = copy.deepcopy(op[3])
+        elif op[0] == "dict_del":
+            getattr(ctx, op[1]).pop(op[2], None)
+
+
+class CodegenCache:
+    """generate_c 输出 + 横幅的 LRU 缓存；可跨多次 render() 复用。"""
+
+    # 同一 verb 在不同上下文下的变体上限
+    MAX_VARIANTS = 8
+
+    def __init__(self, max_entries: int = 20000, digest: Optional[Callable[[Any], str]] = None):
+        self.max_entries = max_entries
+        self.digest = digest or verb_digest
+        self._code: "OrderedDict[str, List[Tuple[List[Tuple], str, List[Tuple]]]]" = OrderedDict()
+        self._banner: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _touch(self, store: OrderedDict, key):
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def banner(self, v: Any, digest: Optional[str] = None) -> str:
+        from lib.debug_dump import summarize_verb
+
+        d = digest or self.digest(v)
+        s = self._banner.get(d)
+        if s is None:
+            s = escape_c_string(summarize_verb(v, deep=True, max_items=1000))
+            self._banner[d] = s
+        self._touch(self._banner, d)
+        return s
+
+    def generate(self, v: Any, ctx, digest: Optional[str] = None) -> str:
+        """等价于 v.generate_c(ctx)，命中时跳过生成并重放 ctx 改动。"""
+        d = digest or self.digest(v)
+        variants = self._code.get(d)
+        if variants is not None:
+            self._touch(self._code, d)
+            for reads, code, writes in variants:
+                if _reads_hold(ctx, reads):
+                    self.hits += 1
+                    _replay(ctx, writes)
+                    return code
+
+        self.misses += 1
+        rec = _Recorder()
+        proxy = _RecordingCtx(ctx, rec)
+        # apply() 里常把 ctx 存到 self.context，generate_c 再经由它访问；临时换成代理以便记录
+        swapped = [k for k, val in vars(v).items() if val is ctx]
+        for k in swapped:
+            setattr(v, k, proxy)
+        try:
+            code = v.generate_c(proxy)
+        finally:
+            for k in swapped:
+                setattr(v, k, ctx)
+
+        variants = self._code.setdefault(d, [])
+        variants.insert(0, (rec.reads, code, rec.writes))
+        del variants[self.MAX_VARIANTS :]
+        self._touch(self._code, d)
+        return code
+
+    def iter_body(self, verbs: List[Any], ctx, banners: Union[bool, str] = True) -> Iterator[str]:
+        """
+        逐段产出 main 里的 verbs 区域（对已 apply 过的 verbs）。
+        banners=True 时每个 verb 前后是 client_prelude.h 的 RR_VERB_BEGIN / RR_VERB_END 数字结果标记，
+        结果码是 verb 的失败分支（RR_SET_FAIL）/ 资源检查（RR_SET_SKIP）设置的 rr_rc
+        （lib/capture.py 解析成结果向量）；banners="text" 时是原来的 "[i] ... start." / "[i] done." 横幅。
+        """
+        for i, v in enumerate(verbs):
+            d = self.digest(v)
+            if banners == "text":
+                yield f'    printf("[{i + 1}] {self.banner(v, d)} start.\\n");\n'
+                yield self.generate(v, ctx, d)
+                yield f'    printf("[{i + 1}] done.\\n");\n\n'
+            elif banners:
+                cid = verb_class_id(v)
+                if cid < 0:
+                    yield f'    RR_VERB_BEGIN_NAMED({i + 1}, "{type(v).__name__}");\n'
+                else:
+                    yield f"    RR_VERB_BEGIN({i + 1}, {cid});\n"
+                yield self.generate(v, ctx, d)
+                yield f"    RR_VERB_END({i + 1}, rr_rc);\n\n"
+            else:
+                yield self.generate(v, ctx, d)
+
+    def render_body(self, verbs: List[Any], ctx, banners: Union[bool, str] = True) -> str:
+        return "".join(self.iter_body(verbs, ctx, banners))
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "code_entries": len(self._code), "banners": len(self._banner)}
+
+    def clear(self):
+        self._code.clear()
+        self._banner.clear()
+        self.hits = self.misses = 0
+
+
+# 进程内共享的默认实例
+CODEGEN_CACHE = CodegenCache()
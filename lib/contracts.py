@@ -3,9 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import networkx
+if TYPE_CHECKING:  # networkx 导入很慢（~130ms），只在导出图时按需导入
+    import networkx
 
 # ===== 在文件开头加一个全局开关和工具函数 =====
 DEBUG = False  # 改成 True 就能打开所有调试信息
@@ -343,7 +344,21 @@ class ContractTable:
             for j in range(16):
                 self.put("remote_mr", f"lbuf{i}_{j}", State.ALLOCATED)
 
-        self.resource_graph = networkx.DiGraph()
+        # 资源依赖图先记在普通 dict 里，需要时再由 resource_graph 物化成 networkx.DiGraph
+        self._graph_nodes: Dict[str, Dict[str, Any]] = {}
+        self._graph_edges: Dict[Tuple[str, str], None] = {}
+
+    @property
+    def resource_graph(self) -> "networkx.DiGraph":
+        import networkx
+
+        g = networkx.DiGraph()
+        g.add_nodes_from(self._graph_nodes.items())
+        g.add_edges_from(self._graph_edges)
+        return g
+
+    def _graph_add_node(self, name: str, **attrs):
+        self._graph_nodes.setdefault(name, {}).update(attrs)
 
     # ===== 基本操作 =====
     def put(self, rtype: str, name: str, state: State, metadata: Optional[Dict[str, Any]] = None):
@@ -462,24 +477,26 @@ class ContractTable:
 
         # build resource graph
         for name in produces:
-            if self.resource_graph.has_node(name):
+            if name in self._graph_nodes:
                 print(f"  [contract] resource graph already has node {name}")
-            self.resource_graph.add_node(name, rtype=spec.rtype, state=spec.state)
+            self._graph_add_node(name, rtype=spec.rtype, state=spec.state)
 
         for name in requires:
-            if self.resource_graph.has_node(name):
+            if name in self._graph_nodes:
                 print(f"  [contract] resource graph already has node {name}")
-            self.resource_graph.add_node(name, rtype=spec.rtype)
+            self._graph_add_node(name, rtype=spec.rtype)
 
         for name in requires:
             for pname in produces:
-                self.resource_graph.add_edge(name, pname)
+                self._graph_nodes.setdefault(name, {})
+                self._graph_nodes.setdefault(pname, {})
+                self._graph_edges[(name, pname)] = None
 
     # ===== 查询 / 调试 =====
     def snapshot(self) -> Dict[Tuple[str, str], str]:
         return {(k.rtype, k.name): (v.state, v.metadata) for k, v in self._store.items()}
 
-    def export_graph(self) -> networkx.DiGraph:
+    def export_graph(self) -> "networkx.DiGraph":
         return self.resource_graph
 
     def export_graph_dot(self, filename: str):
@@ -493,14 +510,16 @@ class ContractTable:
     def export_graph_png(self, filename: str):
         try:
             import matplotlib.pyplot as plt
+            import networkx
 
+            graph = self.resource_graph
             plt.figure(figsize=(12, 8))
-            pos = networkx.spring_layout(self.resource_graph)
+            pos = networkx.spring_layout(graph)
             labels = {
-                n: f"{n}\n{data['rtype']}\n{data.get('state', '')}" for n, data in self.resource_graph.nodes(data=True)
+                n: f"{n}\n{data['rtype']}\n{data.get('state', '')}" for n, data in graph.nodes(data=True)
             }
             networkx.draw(
-                self.resource_graph,
+                graph,
                 pos,
                 with_labels=True,
                 labels=labels,
@@ -508,7 +527,7 @@ class ContractTable:
                 node_color="lightblue",
                 font_size=8,
             )
-            networkx.draw_networkx_edges(self.resource_graph, pos, arrows=True)
+            networkx.draw_networkx_edges(graph, pos, arrows=True)
             plt.savefig(filename)
             plt.close()
         except ImportError:
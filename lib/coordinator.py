@@ -0,0 +1,381 @@
+# lib/coordinator.py
+# -*- coding: utf-8 -*-
+"""
+coordinator 的库形式：合并 server_update.json / client_update.json，生成 server_view.json / client_view.json。
+- extract_pairs / merge_states / build_view 与原 coordinator.py 相同（coordinator.py 现在只是命令行外壳）
+- Coordinator 用 inotify 监听更新文件所在目录（rename 进来的 IN_MOVED_TO / IN_CLOSE_WRITE），
+  事件到达即合并，不再每 100ms 轮询 mtime；没有 inotify 时退回短周期轮询
+- 更新文件按 (mtime, size) 缓存解析结果，只重新解析变了的那个
+- 视图内容（忽略 _coordinator.generated_at_ms）没变就不写，写的时候用紧凑 JSON
+- 既可以 asyncio 方式跑（await run()），也可以 start_thread() 在 fuzz 驱动进程内后台运行
+- shm=True 时每次写视图前先写同内容的 <view>.shm 二进制快照（lib/shm_view.py），供 runtime_resolver 免解析读取
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import json
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from lib.shm_view import ShmViewWriter, shm_path
+
+POLL_INTERVAL = 0.1  # seconds；仅在没有 inotify 时使用
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+_EVENT = struct.Struct("iIII")
+
+
+def clean_cached_files(cached_files: list):
+    for f in cached_files:
+        try:
+            os.remove(f)
+        except Exception:
+            pass
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def atomic_write_json(path: str, obj: Dict[str, Any], indent: Optional[int] = 2):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        if indent is None:
+            json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(obj, f, indent=indent, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def extract_pairs(obj: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    out = {}
+    pairs = obj.get("local", {}).get("pairs", [])
+    # Also accept top-level "pairs" for client demo
+    if not pairs and "pairs" in obj:
+        pairs = obj.get("pairs", [])
+    for p in pairs or []:
+        pid = p.get("id")
+        if pid:
+            out[pid] = p
+    return out
+
+
+def max_state(state_a: str, state_b: str) -> str:
+    order = {"INIT": 0, "CLAIMED": 1, "PARAMS_BOUND": 2, "BOTH_RTS": 3, "READY": 4}
+    a = order.get((state_a or "INIT"), 0)
+    b = order.get((state_b or "INIT"), 0)
+    # Choose the higher (more advanced) state
+    inv = {v: k for k, v in order.items()}
+    return inv[max(a, b)]
+
+
+def merge_states(
+    cli_pairs: Dict[str, Any], srv_pairs: Dict[str, Any], prev_view: Dict[str, Any], session: int = 0
+) -> Dict[str, Dict[str, Any]]:
+    # previous epochs from last output to preserve epoch unless state changes
+    prev_epochs = {}
+    prev_state = {}
+    new_session = prev_view.get("session", 0) != session
+    for p in prev_view.get("pairs") or []:
+        # new session: every pair starts a fresh epoch, whatever its previous state was
+        prev_epochs[p.get("id", "")] = p.get("epoch", 0) + (1 if new_session else 0)
+        if not new_session:
+            prev_state[p.get("id", "")] = p.get("state", "INIT")
+
+    all_ids = set(cli_pairs.keys()) | set(srv_pairs.keys())
+    merged = {}
+    for pid in sorted(all_ids):
+        c = cli_pairs.get(pid, {})
+        s = srv_pairs.get(pid, {})
+        st = max_state(c.get("state", "INIT"), s.get("state", "INIT"))
+        epoch = prev_epochs.get(pid, 0) + (1 if st != prev_state.get(pid, "INIT") else 0)
+        merged[pid] = {
+            "id": pid,
+            "cli_id": c.get("cli_id", ""),
+            "srv_id": c.get("srv_id", s.get("srv_id", "")),  # client may hint srv_id
+            "state": st,
+            "epoch": epoch,
+            "ts": max(c.get("ts", 0), s.get("ts", 0)),
+        }
+    return merged
+
+
+def build_view(
+    local_update: Dict[str, Any],
+    remote_update: Dict[str, Any],
+    merged_pairs: Dict[str, Dict[str, Any]],
+    prev_view: Dict[str, Any],
+    # server_pairs: Dict[str, Dict[str, Any]] = None,
+    client_pairs: Dict[str, Dict[str, Any]] = {},
+    session: int = 0,
+) -> Dict[str, Any]:
+    view = {"session": session}
+    # local
+    view["local"] = local_update.get("local", {})
+    # remote
+    view["remote"] = dict(remote_update.get("local", {}))
+    if "QP" not in view["remote"]:
+        view["remote"]["QP"] = []
+    # derive remote.ids.QP[]
+    rid_list = [q.get("id", "") for q in (view["remote"].get("QP") or []) if q.get("id")]
+    pairid_list = list(client_pairs.keys())
+    view["remote"]["ids"] = {"QP": rid_list, "pairs": pairid_list}
+    # pairs (list)
+    view["pairs"] = list(merged_pairs.values())
+    # carry build info
+    view["_coordinator"] = {
+        "generated_at_ms": int(time.time() * 1000),
+        "local_qp_count": len(view["local"].get("QP", [])),
+        "remote_qp_count": len(view["remote"].get("QP", [])),
+        "pair_count": len(view["pairs"]),
+        "remote_session": remote_update.get("session", 0),
+    }
+    return view
+
+
+def view_content_key(view: Dict[str, Any]) -> str:
+    """视图内容的比较键：忽略每次都会变的 generated_at_ms。"""
+    meta = view.get("_coordinator", {})
+    stamp = meta.pop("generated_at_ms", None)
+    try:
+        return json.dumps(view, sort_keys=True, separators=(",", ":"))
+    finally:
+        if stamp is not None:
+            meta["generated_at_ms"] = stamp
+
+
+class _Inotify:
+    """最小的 ctypes inotify 封装；不可用时构造抛 OSError。"""
+
+    def __init__(self, directories, mask: int = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        for d in directories:
+            if libc.inotify_add_watch(self.fd, os.fsencode(d), mask) < 0:
+                err = ctypes.get_errno()
+                self.close()
+                raise OSError(err, f"inotify_add_watch {d}")
+
+    def read_names(self):
+        names = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            if not buf:
+                return names
+            off = 0
+            while off < len(buf):
+                _, _, _, n = _EVENT.unpack_from(buf, off)
+                off += _EVENT.size
+                names.add(buf[off : off + n].rstrip(b"\0").decode(errors="replace"))
+                off += n
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class Coordinator:
+    def __init__(
+        self,
+        server_update: str,
+        client_update: str,
+        server_view: str,
+        client_view: str,
+        session_file: Optional[str] = None,
+        indent: Optional[int] = None,
+        shm: bool = False,
+    ):
+        self.server_update = server_update
+        self.client_update = client_update
+        self.server_view = server_view
+        self.client_view = client_view
+        self.session_file = session_file
+        self.indent = indent
+        self.shm = shm
+        self._shm_writers: Dict[str, ShmViewWriter] = {}
+        self.sv: Dict[str, Any] = {}
+        self.cv: Dict[str, Any] = {}
+        self._parsed: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._written: Dict[str, str] = {}
+        self._stop: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self.ready = threading.Event()
+        self.stats = {"rounds": 0, "writes": 0, "unchanged": 0, "last_round_us": 0}
+
+    # ---------- 合并 ----------
+
+    def watched(self) -> Dict[str, str]:
+        """触发合并的文件：basename -> 路径。"""
+        paths = [self.server_update, self.client_update] + ([self.session_file] if self.session_file else [])
+        return {os.path.basename(p): p for p in paths}
+
+    def _load(self, path: str) -> Dict[str, Any]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._parsed.pop(path, None)
+            return {}
+        sig = (st.st_mtime_ns, st.st_size)
+        hit = self._parsed.get(path)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        obj = load_json(path)
+        self._parsed[path] = (sig, obj)
+        return obj
+
+    def _write(self, path: str, view: Dict[str, Any]) -> bool:
+        key = view_content_key(view)
+        if self._written.get(path) == key and os.path.exists(path):
+            self.stats["unchanged"] += 1
+            return False
+        if self.shm:
+            # 先写 .shm：读端被 JSON 的 inotify 事件唤醒时，二进制快照已经不旧于 JSON
+            writer = self._shm_writers.get(path)
+            if writer is None:
+                writer = self._shm_writers[path] = ShmViewWriter(shm_path(path))
+            writer.write(view)
+        atomic_write_json(path, view, indent=self.indent)
+        self._written[path] = key
+        self.stats["writes"] += 1
+        return True
+
+    def round(self) -> bool:
+        """合并一次，返回是否写了视图。"""
+        t0 = time.perf_counter()
+        srv_u = self._load(self.server_update)
+        cli_u = self._load(self.client_update)
+        session = int(self._load(self.session_file).get("session", 0)) if self.session_file else 0
+
+        # extract pairs from both sides
+        cli_pairs = extract_pairs(cli_u)
+        srv_pairs = extract_pairs(srv_u)
+        if srv_u.get("session", 0) != session:
+            # server has not recycled its QPs for this session yet: its pair states are stale
+            srv_pairs = {pid: dict(p, state="INIT") for pid, p in srv_pairs.items()}
+
+        # merge states with previous epochs
+        # For server view, use prev_sv to preserve epochs; for client view, use prev_cv
+        merged_for_server = merge_states(cli_pairs, srv_pairs, self.sv, session)
+        merged_for_client = merge_states(cli_pairs, srv_pairs, self.cv, session)
+
+        # server view: local=srv_u.local, remote=cli_u.local
+        self.sv = build_view(srv_u, cli_u, merged_for_server, self.sv, client_pairs=cli_pairs, session=session)
+        # client view: local=cli_u.local, remote=srv_u.local
+        self.cv = build_view(cli_u, srv_u, merged_for_client, self.cv, session=session)
+
+        wrote = self._write(self.server_view, self.sv)
+        wrote = self._write(self.client_view, self.cv) or wrote
+        self.stats["rounds"] += 1
+        self.stats["last_round_us"] = int((time.perf_counter() - t0) * 1e6)
+        return wrote
+
+    # ---------- 事件循环 ----------
+
+    async def run(self, on_ready: Optional[Callable[[], None]] = None) -> None:
+        """先合并一次（之后 ready 置位并调用 on_ready），然后每次更新文件变化时立即合并，直到 stop()。"""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        names = self.watched()
+        # 先建监听再做第一次合并，ready 之后的更新不会漏掉
+        try:
+            ino = _Inotify({os.path.dirname(os.path.abspath(p)) for p in names.values()})
+        except (OSError, AttributeError):
+            ino = None
+        last = self._signature(names)
+        self.round()
+        self.ready.set()
+        if on_ready is not None:
+            on_ready()
+
+        if ino is None:
+            await self._poll_loop(names, last)
+            self._close_shm()
+            return
+
+        changed = asyncio.Event()
+
+        def on_readable():
+            if ino.read_names() & names.keys():
+                changed.set()
+
+        self._loop.add_reader(ino.fd, on_readable)
+        try:
+            while not self._stop.is_set():
+                waiter = asyncio.ensure_future(changed.wait())
+                stopper = asyncio.ensure_future(self._stop.wait())
+                await asyncio.wait({waiter, stopper}, return_when=asyncio.FIRST_COMPLETED)
+                waiter.cancel()
+                stopper.cancel()
+                if changed.is_set():
+                    changed.clear()
+                    self.round()
+        finally:
+            self._loop.remove_reader(ino.fd)
+            self._close_shm()
+            ino.close()
+
+    @staticmethod
+    def _signature(names: Dict[str, str]):
+        out = []
+        for p in names.values():
+            try:
+                st = os.stat(p)
+                out.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                out.append(None)
+        return out
+
+    async def _poll_loop(self, names: Dict[str, str], last) -> None:
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            cur = self._signature(names)
+            if cur != last:
+                last = cur
+                self.round()
+
+    def _close_shm(self) -> None:
+        for writer in self._shm_writers.values():
+            writer.close()
+        self._shm_writers.clear()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    # ---------- 进程内后台运行 ----------
+
+    def start_thread(self, timeout: float = 10.0) -> "Coordinator":
+        """在后台线程里跑事件循环，等第一次视图写出后返回。"""
+        self.ready.clear()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self.run()), name="coordinator", daemon=True)
+        self._thread.start()
+        if not self.ready.wait(timeout):
+            raise TimeoutError("coordinator did not produce the initial views")
+        return self
+
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
@@ -3,9 +3,12 @@
 """
 Corpus 管理：
 - 以 SQLite + seeds/ 目录持久化
-- 规范化 IR + 稳定哈希 去重
+- 种子 id = verb 结构哈希的 Merkle 组合（lib.merkle），变异后只重算改动过的 verb；规范化 IR 仅作可读存档
 - 记录运行结果与综合得分，用于调度
 
+- 种子对象以无损 program JSON（verb_registry.to_state）保存，可 diff / 去重 / 跨机器分发；
+  dill 仅作为旧种子的兜底
+
 依赖：标准库 + dill（可选：已在项目中使用）
 """
 
@@ -20,6 +23,9 @@ import random
 from dataclasses import is_dataclass, asdict
 from typing import Any, Dict, List, Optional
 
+from lib.json_utils import dump_program_json, iter_programs_jsonl, load_program_json, verbs_to_program_obj
+from lib.merkle import program_hash
+
 try:
     import dill  # 更好地序列化 Python 对象
 except ImportError:  # 允许无 dill 的退化存档
@@ -54,7 +60,8 @@ class Corpus:
                 flaky_rate REAL DEFAULT 0.0,
                 runtime_ms_mean REAL DEFAULT 0.0,
                 runtime_ms_p95 REAL DEFAULT 0.0,
-                score REAL DEFAULT 0.0
+                score REAL DEFAULT 0.0,
+                favoured INTEGER DEFAULT 0
             );
             """
         )
@@ -78,8 +85,59 @@ class Corpus:
             );
             """
         )
+        # 每个种子命中的边编号：zlib(packbits(位图))，编号见 lib.fingerprint / kv 里的 edge_space；
+        # runtime_ms / length（verb 数）是精简语料（lib.culling）时的代价
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seed_cov (
+                seed_id TEXT PRIMARY KEY,
+                edges INTEGER,
+                bitmap BLOB,
+                runtime_ms INTEGER DEFAULT 0,
+                length INTEGER DEFAULT 0
+            );
+            """
+        )
+        # 崩溃分桶（lib/sanitizer_report.py 的 source:bug_type:栈哈希）与每个桶下复现过的种子 / 运行目录，
+        # 去重和 collect_crashes.py 打包都查这里，不再扫 repo/ 下的日志
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS crash_buckets (
+                bucket TEXT PRIMARY KEY,
+                source TEXT,
+                bug_type TEXT,
+                access TEXT,
+                site TEXT,
+                frames TEXT,
+                first_seed TEXT,
+                first_seen INTEGER,
+                last_seen INTEGER,
+                hits INTEGER DEFAULT 0
+            );
+            """
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS crash_seeds (
+                bucket TEXT,
+                seed_id TEXT,
+                run_index TEXT,
+                time INTEGER
+            );
+            """
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS crash_seeds_bucket ON crash_seeds(bucket)")
+        # 老库补列
+        self._add_missing_columns("seeds", {"favoured": "INTEGER DEFAULT 0"})
+        self._add_missing_columns("seed_cov", {"runtime_ms": "INTEGER DEFAULT 0", "length": "INTEGER DEFAULT 0"})
         self.db.commit()
 
+    def _add_missing_columns(self, table: str, columns: Dict[str, str]):
+        have = {r[1] for r in self.db.execute(f"PRAGMA table_info({table})")}
+        for name, decl in columns.items():
+            if name not in have:
+                self.db.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
     # ----------------------------- utils ------------------------------
     @staticmethod
     def _safe_primitive(v: Any) -> Any:
@@ -135,28 +193,42 @@ class Corpus:
         b = json.dumps(ir, sort_keys=True, ensure_ascii=False).encode()
         return hashlib.sha256(b).hexdigest()
 
+    @staticmethod
+    def program_id(verbs: List[Any]) -> str:
+        """种子 id：各 verb 缓存的结构哈希按顺序组合，和子程序只差一个 verb 时只需重算那一个。"""
+        return program_hash(verbs)
+
     # ----------------------------- IO ------------------------------
     def _seed_paths(self, sid: str) -> Dict[str, str]:
         return {
             "ir": os.path.join(self.seed_dir, f"{sid}.json"),
             "meta": os.path.join(self.seed_dir, f"{sid}.meta.json"),
             "obj": os.path.join(self.seed_dir, f"{sid}.dill"),
+            "prog": os.path.join(self.seed_dir, f"{sid}.prog.json"),
         }
 
     def add(self, verbs: List[Any], meta: Optional[Dict[str, Any]] = None) -> str:
-        ir = self.normalize_ir(verbs)
-        sid = self.seed_hash(ir)
+        sid = self.program_id(verbs)
         paths = self._seed_paths(sid)
 
         # 写 IR / meta / 对象
         if not os.path.exists(paths["ir"]): # Remark: ir弄好看其实意义不大，我们可以通过dill来复现verbs
+            ir = self.normalize_ir(verbs)
             with open(paths["ir"], "w", encoding="utf-8") as f:
                 json.dump(ir, f, ensure_ascii=False, indent=2)
         if meta is None:
             meta = {}
         with open(paths["meta"], "w", encoding="utf-8") as f:
             json.dump(meta, f, ensure_ascii=False, indent=2)
-        if dill is not None:
+        prog_ok = False
+        try:
+            dump_program_json(verbs, paths["prog"], extra_meta={"sid": sid})
+            prog_ok = True
+        except Exception:
+            # 个别对象无法无损编码时退回 dill
+            if os.path.exists(paths["prog"]):
+                os.remove(paths["prog"])
+        if dill is not None and not prog_ok:
             with open(paths["obj"], "wb") as f:
                 dill.dump(verbs, f)
 
@@ -177,6 +249,11 @@ class Corpus:
 
     def load_verbs(self, sid: str) -> Optional[List[Any]]:
         paths = self._seed_paths(sid)
+        if os.path.exists(paths["prog"]):
+            try:
+                return load_program_json(paths["prog"])
+            except Exception:
+                pass
         if dill is None or not os.path.exists(paths["obj"]):
             return None
         try:
@@ -186,6 +263,39 @@ class Corpus:
         except Exception:
             return None
 
+    def export_jsonl(self, path: str) -> int:
+        """把全部种子按 program JSONL 导出（每行一个种子），返回导出条数。"""
+        n = 0
+        with open(path, "w", encoding="utf-8") as out:
+            for (sid,) in self.db.execute("SELECT id FROM seeds ORDER BY added_at"):
+                p = self._seed_paths(sid)["prog"]
+                if os.path.exists(p):
+                    with open(p, "r", encoding="utf-8") as f:
+                        root = json.load(f)
+                else:
+                    verbs = self.load_verbs(sid)
+                    if verbs is None:
+                        continue
+                    root = verbs_to_program_obj(verbs, extra_meta={"sid": sid})
+                out.write(json.dumps(root, separators=(",", ":"), ensure_ascii=False) + "\n")
+                n += 1
+        return n
+
+    def import_jsonl(self, path: str) -> List[str]:
+        """流式导入 program JSONL，重复种子按 program_id 自动去重。"""
+        sids = []
+        for meta, verbs in iter_programs_jsonl(path):
+            meta = {k: v for k, v in meta.items() if k != "sid"}
+            sids.append(self.add(verbs, meta=meta))
+        return sids
+
+    def has_seed(self, sid: str) -> bool:
+        return self.db.execute("SELECT 1 FROM seeds WHERE id=?", (sid,)).fetchone() is not None
+
+    def has_run(self, sid: str) -> bool:
+        """该程序是否已经执行过（用于跳过结构完全相同的重复执行）。"""
+        return self.db.execute("SELECT 1 FROM runs WHERE seed_id=? LIMIT 1", (sid,)).fetchone() is not None
+
     def record_run(self, sid: str, run: Dict[str, Any]):
         def make_json_safe(obj):
             if isinstance(obj, set):
@@ -219,17 +329,43 @@ class Corpus:
         self.db.commit()
 
     # ----------------------------- 调度 -----------------------------
-    def pick_for_fuzz(self) -> Optional[str]:
-        """按 score 排序 + 温度采样。若库空，返回 None。"""
+    # 有 favoured 种子时，pick_for_fuzz 以这个概率只在 favoured 里选（AFL 跳过非 favoured 种子的做法）
+    FAVOURED_PROB = float(os.environ.get("RDMA_FUZZ_FAVOURED_PROB", "0.9"))
+
+    def _pool(self, limit: int):
         cur = self.db.cursor()
-        cur.execute("SELECT id, score FROM seeds ORDER BY score DESC LIMIT 64")
-        rows = cur.fetchall()
-        if not rows:
+        cur.execute("SELECT id, score, favoured FROM seeds ORDER BY favoured DESC, score DESC LIMIT ?", (limit,))
+        return cur.fetchall()
+
+    def top_scores(self, limit: int = 64) -> Dict[str, float]:
+        """
+        pick_for_fuzz 的候选池：favoured 种子优先，其余按 score，共 limit 个 -> score
+        （流水线执行据此调整 / 取消预编译的候选）。
+        """
+        return {r[0]: float(r[1]) for r in self._pool(limit)}
+
+    def pick_for_fuzz(self) -> Optional[str]:
+        """候选池里按 score 温度采样，多数时候只在 favoured 种子里选。若库空，返回 None。"""
+        pool = self._pool(64)
+        if not pool:
             return None
-        ids = [r[0] for r in rows]
-        ws = [max(float(r[1]), 0.0) + 1e-3 for r in rows]
+        favoured = [r for r in pool if r[2]]
+        if favoured and random.random() < self.FAVOURED_PROB:
+            pool = favoured
+        ids = [r[0] for r in pool]
+        ws = [max(float(r[1]), 0.0) + 1e-3 for r in pool]
         return random.choices(ids, weights=ws, k=1)[0]
 
+    def set_favoured(self, sids) -> None:
+        """精简语料（lib.culling.cull）的结果：只有 sids 是 favoured。"""
+        cur = self.db.cursor()
+        cur.execute("UPDATE seeds SET favoured = 0 WHERE favoured != 0")
+        cur.executemany("UPDATE seeds SET favoured = 1 WHERE id = ?", [(sid,) for sid in sids])
+        self.db.commit()
+
+    def favoured_seeds(self) -> List[str]:
+        return [r[0] for r in self.db.execute("SELECT id FROM seeds WHERE favoured != 0 ORDER BY id")]
+
     # ----------------------------- 全局状态 -----------------------------
     def get_global_cov_fingerprint(self) -> str:
         """可选：维护全局覆盖位的压缩摘要（便于快速比较）。"""
@@ -242,3 +378,105 @@ class Corpus:
         cur = self.db.cursor()
         cur.execute("REPLACE INTO kv(k, v) VALUES ('global_cov', ?)", (zlib.compress(blob).hex(),))
         self.db.commit()
+
+    def _get_blob(self, k: str) -> Optional[bytes]:
+        cur = self.db.cursor()
+        cur.execute("SELECT v FROM kv WHERE k=?", (k,))
+        row = cur.fetchone()
+        return zlib.decompress(bytes.fromhex(row[0])) if row and row[0] else None
+
+    def load_coverage_state(self):
+        """(EdgeSpace 键表, 全局覆盖图)，传给 FingerprintManager.load_state。"""
+        return self._get_blob("edge_space"), self._get_blob("global_cov")
+
+    def save_coverage_state(self, space_blob: bytes, cov_blob: bytes):
+        cur = self.db.cursor()
+        cur.execute("REPLACE INTO kv(k, v) VALUES ('edge_space', ?)", (zlib.compress(space_blob).hex(),))
+        self.set_global_cov_fingerprint(cov_blob)
+
+    def set_seed_coverage(self, sid: str, edges: int, bitmap: bytes, runtime_ms: int = 0, length: int = 0):
+        cur = self.db.cursor()
+        cur.execute(
+            "REPLACE INTO seed_cov(seed_id, edges, bitmap, runtime_ms, length) VALUES (?,?,?,?,?)",
+            (sid, int(edges), bitmap, int(runtime_ms), int(length)),
+        )
+        self.db.commit()
+
+    def iter_seed_coverage(self):
+        """(seed_id, bitmap, runtime_ms, length)，只含仍在 seeds 表里的种子。"""
+        cur = self.db.cursor()
+        cur.execute(
+            "SELECT c.seed_id, c.bitmap, c.runtime_ms, c.length"
+            " FROM seed_cov c JOIN seeds s ON s.id = c.seed_id ORDER BY c.seed_id"
+        )
+        yield from cur
+
+    def get_seed_coverage(self, sid: str) -> Optional[bytes]:
+        cur = self.db.cursor()
+        cur.execute("SELECT bitmap FROM seed_cov WHERE seed_id=?", (sid,))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+    # ----------------------------- 崩溃分桶 -----------------------------
+    def record_crash(self, sid: str, report: Dict[str, Any], run_index: Optional[str] = None) -> bool:
+        """report 是 CrashReport.to_dict()；返回是否是新桶。种子的 crash_kind / crash_site 一并更新。"""
+        now = int(time.time())
+        cur = self.db.cursor()
+        cur.execute(
+            "INSERT OR IGNORE INTO crash_buckets"
+            "(bucket, source, bug_type, access, site, frames, first_seed, first_seen, last_seen, hits)"
+            " VALUES (?,?,?,?,?,?,?,?,?,0)",
+            (
+                report["bucket"],
+                report.get("source"),
+                report.get("bug_type"),
+                report.get("access"),
+                report.get("site"),
+                json.dumps(report.get("frames", []), ensure_ascii=False),
+                sid,
+                now,
+                now,
+            ),
+        )
+        new = cur.rowcount > 0
+        cur.execute("UPDATE crash_buckets SET hits = hits + 1, last_seen = ? WHERE bucket = ?", (now, report["bucket"]))
+        cur.execute(
+            "INSERT INTO crash_seeds(bucket, seed_id, run_index, time) VALUES (?,?,?,?)",
+            (report["bucket"], sid, run_index, now),
+        )
+        cur.execute(
+            "UPDATE seeds SET crash_kind = ?, crash_site = ? WHERE id = ?",
+            (f"{report.get('source')}:{report.get('bug_type')}", report.get("site"), sid),
+        )
+        self.db.commit()
+        return new
+
+    def has_crash_bucket(self, bucket: str) -> bool:
+        cur = self.db.cursor()
+        cur.execute("SELECT 1 FROM crash_buckets WHERE bucket=?", (bucket,))
+        return cur.fetchone() is not None
+
+    def crash_buckets(self) -> List[Dict[str, Any]]:
+        """全部崩溃桶，按首次出现排序。"""
+        cur = self.db.cursor()
+        cur.execute(
+            "SELECT bucket, source, bug_type, access, site, frames, first_seed, first_seen, last_seen, hits"
+            " FROM crash_buckets ORDER BY first_seen, bucket"
+        )
+        cols = [d[0] for d in cur.description]
+        rows = [dict(zip(cols, r)) for r in cur.fetchall()]
+        for r in rows:
+            r["frames"] = json.loads(r["frames"] or "[]")
+        return rows
+
+    def crash_seeds(self, bucket: Optional[str] = None) -> List[Dict[str, Any]]:
+        """复现过崩溃的 (bucket, seed_id, run_index, time)，bucket 为空时返回全部。"""
+        cur = self.db.cursor()
+        if bucket is None:
+            cur.execute("SELECT bucket, seed_id, run_index, time FROM crash_seeds ORDER BY time, rowid")
+        else:
+            cur.execute(
+                "SELECT bucket, seed_id, run_index, time FROM crash_seeds WHERE bucket=? ORDER BY time, rowid",
+                (bucket,),
+            )
+        return [dict(zip(("bucket", "seed_id", "run_index", "time"), r)) for r in cur.fetchall()]
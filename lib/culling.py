@@ -0,0 +1,81 @@
+# lib/culling.py
+# -*- coding: utf-8 -*-
+"""
+语料精简（AFL 的 cull_queue / favoured 种子）：
+- 每个种子最近一次运行命中的边编号存在 corpus 的 seed_cov 表里（lib.fingerprint.pack_ids 的 zlib(packbits)），
+  同时记着这次运行的耗时和 verb 数
+- 加权贪心集合覆盖：每一步选 "还没被覆盖的边数 / 代价" 最大的种子，代价 = 耗时 × 长度，
+  直到所有种子覆盖过的边都被覆盖；选出来的就是 favoured 集合
+- 覆盖增益只会越来越小，用懒惰堆：弹出时重算增益，仍不小于堆顶就直接选，不必每步重算所有种子
+- corpus.pick_for_fuzz 多数时候只在 favoured 里选，全局覆盖饱和后不会一直挑老的高分种子
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from lib.fingerprint import unpack_ids
+
+logger = logging.getLogger(__name__)
+
+
+def seed_cost(runtime_ms: int, length: int) -> float:
+    """耗时 × 长度，缺的按 1 算。"""
+    return float(max(int(runtime_ms or 0), 1) * max(int(length or 0), 1))
+
+
+def greedy_cover(seeds: Dict[str, np.ndarray], costs: Optional[Dict[str, float]] = None) -> List[str]:
+    """
+    seeds：种子 -> 边编号数组；costs：种子 -> 代价（默认都是 1）。
+    返回覆盖所有边的种子列表（按选中的先后）；同样的增益 / 代价下按种子 id 排，结果是确定的。
+    """
+    if not seeds:
+        return []
+    size = max((int(ids.max()) + 1 for ids in seeds.values() if len(ids)), default=0)
+    covered = np.zeros(size, dtype=bool)
+    cost = {sid: max(float((costs or {}).get(sid, 1.0)), 1e-9) for sid in seeds}
+    heap = [(-len(ids) / cost[sid], sid) for sid, ids in seeds.items() if len(ids)]
+    heapq.heapify(heap)
+    chosen: List[str] = []
+    while heap:
+        _, sid = heapq.heappop(heap)
+        ids = seeds[sid]
+        gain = int(len(ids) - np.count_nonzero(covered[ids]))
+        if gain == 0:
+            continue
+        prio = -gain / cost[sid]
+        if heap and prio > heap[0][0]:
+            # 增益变小了，排回去
+            heapq.heappush(heap, (prio, sid))
+            continue
+        covered[ids] = True
+        chosen.append(sid)
+    return chosen
+
+
+class CullResult(NamedTuple):
+    favoured: List[str]
+    seeds: int
+    edges: int
+    ms: float
+
+
+def cull(corpus) -> CullResult:
+    """读 seed_cov 算 favoured 集合，写回 seeds.favoured。"""
+    t0 = time.perf_counter()
+    seeds: Dict[str, np.ndarray] = {}
+    costs: Dict[str, float] = {}
+    for sid, bitmap, runtime_ms, length in corpus.iter_seed_coverage():
+        seeds[sid] = unpack_ids(bitmap)
+        costs[sid] = seed_cost(runtime_ms, length)
+    favoured = greedy_cover(seeds, costs)
+    corpus.set_favoured(favoured)
+    edges = int(np.unique(np.concatenate(list(seeds.values()))).size) if seeds else 0
+    res = CullResult(favoured, len(seeds), edges, (time.perf_counter() - t0) * 1000)
+    logger.info("Culled corpus: %d/%d seeds favoured, %d edges, %.1f ms", len(favoured), res.seeds, edges, res.ms)
+    return res
@@ -0,0 +1,221 @@
+# lib/distill.py
+# -*- coding: utf-8 -*-
+"""
+语料蒸馏（afl-cmin 的等价物）：长时间跑下来 seeds/ 里有成千上万个互相重叠的种子，
+从中挑一个尽量小的子集，保住全部覆盖和全部崩溃桶，写成一个新的语料目录。
+
+- 覆盖来源：
+  * 默认直接用 corpus 的 seed_cov（每个种子最近一次运行的边编号 + 耗时 + 长度），不碰硬件；
+    没有覆盖记录的种子原样保留（不知道它覆盖了什么，丢了可能丢边）
+  * 给了 runner 就把每个种子重跑一遍；runner.run 和 ForkServerRunner.run 一样返回
+    coverage_edges / runtime_ms / crash_reports。gcov 计数是进程外全局的，真硬件只能一个个跑；
+    StubRunner 按程序结构造出确定的假覆盖，可以并行，没有 RDMA 设备时用来演练
+- 崩溃桶当成额外的"边"（编号接在真边后面）一起做 lib.culling.greedy_cover，
+  每个桶至少留一个复现过它的种子，同样代价最低优先；贪心之后再去掉被其它选中种子完全盖住的
+- 输出：新目录下的 Corpus，选中种子的 program / meta、seed_cov、崩溃记录和覆盖状态（edge_space / global_cov）
+  都带过去，全部标成 favoured，可以直接当 fuzz 的起点
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from lib.corpus import Corpus
+from lib.culling import greedy_cover, seed_cost
+from lib.fingerprint import FingerprintManager, pack_ids, unpack_ids
+from lib.gcov_reader import EdgeSpace
+
+logger = logging.getLogger(__name__)
+
+
+class SeedCoverage(NamedTuple):
+    ids: np.ndarray
+    runtime_ms: int
+    length: int
+    reports: List[Dict[str, Any]]  # 重跑时新出的 CrashReport.to_dict()
+
+
+class DistillResult(NamedTuple):
+    kept: List[str]  # 源语料里的种子 id，按选中的先后
+    seeds: int
+    edges: int
+    buckets: int
+    unknown: List[str]  # 没有覆盖信息、原样保留的种子
+    failed: List[str]  # 重跑时读不出 verbs 的种子
+    ms: float
+
+
+class StubRunner:
+    """
+    不碰硬件的假执行器：每个 verb 类名算一条边，相邻两个 verb 的类名对再算一条，
+    同样的程序总得到同样的覆盖；耗时按 verb 数算。
+    """
+
+    parallel = True
+
+    def run(self, verbs: List[Any], tag: Optional[str] = None, **meta) -> Dict[str, Any]:
+        names = [type(v).__name__ for v in verbs]
+        edges = {f"stub:{n}" for n in names} | {f"stub:{a}->{b}" for a, b in zip(names, names[1:])}
+        return {
+            "outcome": "ok",
+            "runtime_ms": len(verbs),
+            "coverage_edges": edges,
+            "crash_reports": [],
+            "run_index": tag,
+        }
+
+
+def stored_coverage(corpus: Corpus) -> Dict[str, SeedCoverage]:
+    return {
+        sid: SeedCoverage(unpack_ids(bitmap), int(runtime_ms or 0), int(length or 0), [])
+        for sid, bitmap, runtime_ms, length in corpus.iter_seed_coverage()
+    }
+
+
+def rerun_coverage(corpus: Corpus, sids: List[str], runner, fp: FingerprintManager, jobs: int = 1):
+    """
+    用 runner 重跑 sids，返回 (sid -> SeedCoverage, 读不出 verbs 的种子)。
+    runner 没有 parallel = True 时一个个跑；边编号和全局覆盖图都在调用线程里并入 fp。
+    """
+
+    def one(sid: str):
+        verbs = corpus.load_verbs(sid)
+        if verbs is None:
+            return sid, None, None
+        return sid, verbs, runner.run(verbs, tag=f"cmin_{sid[:16]}")
+
+    jobs = max(1, jobs) if getattr(runner, "parallel", False) else 1
+    out: Dict[str, SeedCoverage] = {}
+    failed: List[str] = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for sid, verbs, raw in pool.map(one, sids):
+            if verbs is None:
+                failed.append(sid)
+                continue
+            edges = raw.get("coverage_edges")
+            if hasattr(edges, "result"):  # runexec 的异步覆盖收集
+                edges = edges.result()
+            ids, buckets = fp._as_sample(edges if edges is not None else set())
+            hit = np.flatnonzero(buckets)
+            fp.cov.merge(ids[hit], buckets[hit])
+            reports = list(raw.get("crash_reports") or [])
+            out[sid] = SeedCoverage(ids[hit], int(raw.get("runtime_ms", 0)), len(verbs), reports)
+    return out, failed
+
+
+def select(cov: Dict[str, SeedCoverage], crashers: Dict[str, set]) -> List[str]:
+    """
+    cov：种子 -> 覆盖；crashers：崩溃桶 -> 复现过它的种子。
+    桶编号接在最大边编号后面，和边一起做加权集合覆盖。
+    """
+    base = max((int(c.ids.max()) + 1 for c in cov.values() if len(c.ids)), default=0)
+    bucket_id = {b: base + i for i, b in enumerate(sorted(crashers))}
+    extra: Dict[str, List[int]] = {}
+    for b, sids in crashers.items():
+        for sid in sids:
+            extra.setdefault(sid, []).append(bucket_id[b])
+    universe = {
+        sid: np.concatenate([c.ids, np.array(sorted(extra.get(sid, [])), dtype=np.int64)]) for sid, c in cov.items()
+    }
+    costs = {sid: seed_cost(c.runtime_ms, c.length) for sid, c in cov.items()}
+    chosen = greedy_cover(universe, costs)
+
+    # 贪心先选的便宜种子可能被后选的几个合起来盖住：从最贵的开始，去掉全被别人覆盖的
+    hits = np.zeros(base + len(bucket_id), dtype=np.int32)
+    for sid in chosen:
+        hits[universe[sid]] += 1
+    dropped = set()
+    for sid in sorted(chosen, key=lambda s: (-costs[s], s)):
+        if np.all(hits[universe[sid]] > 1):
+            hits[universe[sid]] -= 1
+            dropped.add(sid)
+    return [sid for sid in chosen if sid not in dropped]
+
+
+def distill(src_root: str, out_root: str, runner=None, jobs: int = 4) -> DistillResult:
+    """
+    把 src_root 的语料蒸馏到 out_root（不能已经有 corpus.db）。
+    runner 为空时用已存的 seed_cov；否则每个种子都用 runner 重跑一遍。
+    """
+    t0 = time.perf_counter()
+    if os.path.abspath(src_root) == os.path.abspath(out_root):
+        raise ValueError("output corpus must differ from the source corpus")
+    if os.path.exists(os.path.join(out_root, Corpus.DB_NAME)):
+        raise FileExistsError(f"{out_root} already holds a corpus")
+
+    src = Corpus(src_root)
+    sids = [sid for (sid,) in src.db.execute("SELECT id FROM seeds ORDER BY added_at, id")]
+    fp = None
+    if runner is None:
+        cov, failed = stored_coverage(src), []
+    else:
+        # 沿用原语料的编号，重跑得到的 seed_cov 和原来的可比
+        fp = FingerprintManager(EdgeSpace())
+        fp.load_state(*src.load_coverage_state())
+        cov, failed = rerun_coverage(src, sids, runner, fp, jobs)
+    unknown = [sid for sid in sids if sid not in cov and sid not in failed]
+
+    # 崩溃桶：原语料里记过的 + 这次重跑新出的
+    crashers: Dict[str, set] = {}
+    for row in src.crash_seeds():
+        crashers.setdefault(row["bucket"], set()).add(row["seed_id"])
+    for sid, c in cov.items():
+        for rep in c.reports:
+            crashers.setdefault(rep["bucket"], set()).add(sid)
+
+    kept = select(cov, {b: {s for s in seeds if s in cov} for b, seeds in crashers.items()})
+    kept += unknown
+    edges = int(np.unique(np.concatenate([c.ids for c in cov.values()])).size) if cov else 0
+    write_corpus(src, out_root, kept, cov, fp)
+
+    res = DistillResult(kept, len(sids), edges, len(crashers), unknown, failed, (time.perf_counter() - t0) * 1000)
+    logger.info(
+        "Distilled %s -> %s: %d/%d seeds, %d edges, %d crash buckets, %d unknown, %d failed, %.1f ms",
+        src_root, out_root, len(kept), res.seeds, edges, res.buckets, len(unknown), len(failed), res.ms,
+    )
+    return res
+
+
+def write_corpus(
+    src: Corpus, out_root: str, kept: List[str], cov: Dict[str, SeedCoverage], fp: Optional[FingerprintManager]
+):
+    """把 kept 里的种子连同覆盖、崩溃记录写进 out_root 的新语料，全部标成 favoured。"""
+    dst = Corpus(out_root)
+    buckets = {b["bucket"]: b for b in src.crash_buckets()}
+    crash_rows: Dict[str, List[Dict[str, Any]]] = {}
+    for row in src.crash_seeds():
+        crash_rows.setdefault(row["seed_id"], []).append(row)
+
+    new_ids = []
+    for sid in kept:
+        verbs = src.load_verbs(sid)
+        if verbs is None:
+            logger.warning("Seed %s has no loadable program, dropped", sid)
+            continue
+        meta_path = src._seed_paths(sid)["meta"]
+        meta = {}
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        new_sid = dst.add(verbs, meta=meta)
+        new_ids.append(new_sid)
+        c = cov.get(sid)
+        if c is not None:
+            dst.set_seed_coverage(new_sid, len(c.ids), pack_ids(c.ids), c.runtime_ms, c.length)
+            for rep in c.reports:
+                dst.record_crash(new_sid, rep, f"cmin_{sid[:16]}")
+        for row in crash_rows.get(sid, []):
+            if row["bucket"] in buckets:
+                dst.record_crash(new_sid, buckets[row["bucket"]], row["run_index"])
+
+    space_blob, cov_blob = fp.state() if fp is not None else src.load_coverage_state()
+    if space_blob:
+        dst.save_coverage_state(space_blob, cov_blob or b"")
+    dst.set_favoured(new_ids)
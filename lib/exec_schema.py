@@ -0,0 +1,987 @@
+# lib/exec_schema.py
+# -*- coding: utf-8 -*-
+"""
+JSON 执行器（rdma_exec）的 schema 生成与二进制程序编码：
+- 遍历 lib.verbs 里所有 VerbCall 子类和所有 Attr 子类，按 EXPORT_FIELDS（也就是 to_dict 输出的字段）建立 schema
+- 类按名字排序编号：前 verb_count 个是 verb（编号即 verb id），后面是 attr；字段用在 EXPORT_FIELDS 里的下标编号
+- generate_c() 生成 rdma_exec/verb_schema.gen.{h,c}：类/字段表、每个类的参数结构 RdxArgs_<Cls> 和解码函数、
+  每个 verb 一个调用 libibverbs 的 handler（调用方式见 VERB_CALLS / ATTR_CTYPES）、按 verb id 索引的 handler 表、
+  rdx_verb_id() 二分查找；program JSON 仍优先走 rdma_exec/verb_*.h 里声明的手写 handle_<Verb>
+- encode_program() 把 verbs（或 to_dict 结果）编成紧凑的二进制程序；rdma_exec/program_bin.c 直接把它解码进
+  RdxArgs_<Cls>，不再经过 cJSON
+
+二进制格式（小端）：
+    "RDXB" | u8 版本 | u32 schema 哈希 | 值(meta) | varint verb 数 | 值(verb)...
+值以一个 tag 字节开头，见 TAGS；{"type": T, "value": v} 形式的 Value 包装用 TAG_TYPED + 值类型编号，
+{"verb": Cls, ...} 形式的对象用 TAG_SCHEMA + 类编号 + (字段下标, 值)...，其余 dict 退化为带字符串键的 TAG_OBJ。
+
+用法：
+    python -m lib.exec_schema                # 重新生成 rdma_exec/verb_schema.gen.{h,c}
+    python -m lib.exec_schema --check        # 生成结果与仓库里的不一致时返回 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import struct
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+RDMA_EXEC_DIR = Path(__file__).resolve().parent.parent / "rdma_exec"
+GEN_HEADER = "verb_schema.gen.h"
+GEN_SOURCE = "verb_schema.gen.c"
+
+MAGIC = b"RDXB"
+VERSION = 1
+
+TAGS = {
+    "NULL": 0,
+    "FALSE": 1,
+    "TRUE": 2,
+    "INT": 3,  # zigzag varint
+    "FLOAT": 4,  # f64
+    "STR": 5,  # varint 长度 + utf-8
+    "LIST": 6,  # varint 个数 + 值...
+    "OBJ": 7,  # varint 个数 + (STR 键, 值)...
+    "TYPED": 8,  # u8 值类型编号 + 值
+    "SCHEMA": 9,  # varint 类编号 + varint 字段个数 + (varint 字段下标, 值)...
+}
+T = type("Tags", (), TAGS)
+
+# Value.to_dict() 里出现的 "type"（OptionalValue 为空时输出 "None"）
+VALUE_TYPES = (
+    "BoolValue",
+    "ConstantValue",
+    "DeferredValue",
+    "EnumValue",
+    "FlagValue",
+    "IntValue",
+    "ListValue",
+    "LocalResourceValue",
+    "None",
+    "OptionalValue",
+    "ResourceValue",
+)
+
+
+class Schema:
+    def __init__(self, verbs: Sequence[Tuple[str, Sequence[str]]], attrs: Sequence[Tuple[str, Sequence[str]]]):
+        self.classes: List[Tuple[str, Tuple[str, ...]]] = [(n, tuple(f)) for n, f in list(verbs) + list(attrs)]
+        self.verb_count = len(verbs)
+        self.class_id: Dict[str, int] = {n: i for i, (n, _) in enumerate(self.classes)}
+        self.field_id: List[Dict[str, int]] = [{f: j for j, f in enumerate(fs)} for _, fs in self.classes]
+        self.value_type_id: Dict[str, int] = {t: i for i, t in enumerate(VALUE_TYPES)}
+        canon = json.dumps({"classes": self.classes, "verbs": self.verb_count, "types": VALUE_TYPES, "tags": TAGS})
+        self.hash = int.from_bytes(hashlib.sha256(canon.encode()).digest()[:4], "little")
+
+
+def _class_fields(cls) -> Tuple[str, ...]:
+    fields = tuple(getattr(cls, "EXPORT_FIELDS", ()) or ())
+    if len(fields) > 255:
+        raise ValueError(f"{cls.__name__}: too many EXPORT_FIELDS")
+    return fields
+
+
+@lru_cache(maxsize=None)
+def build_schema() -> Schema:
+    """从 Python 类生成 schema（verb 与 attr 各自按名字排序）。"""
+    import lib.ibv_all  # noqa: F401  确保所有 Attr 子类都已定义
+    import lib.verbs as verbs_mod
+    from lib.attr import Attr
+    from lib.verbs import VerbCall
+
+    verbs = {
+        c.__name__: _class_fields(c)
+        for c in vars(verbs_mod).values()
+        if isinstance(c, type) and issubclass(c, VerbCall) and c is not VerbCall and c.__module__ == verbs_mod.__name__
+    }
+    attrs: Dict[str, Tuple[str, ...]] = {}
+    stack = list(Attr.__subclasses__())
+    while stack:
+        c = stack.pop()
+        stack.extend(c.__subclasses__())
+        # CM 插件（lib/cm）的 attr 和 CM verb 一样不进 schema，否则 schema 随是否导入过插件而变
+        if c.__name__ not in verbs and not c.__module__.startswith("lib.cm."):
+            attrs.setdefault(c.__name__, _class_fields(c))
+    return Schema(sorted(verbs.items()), sorted(attrs.items()))
+
+
+# ---------- 二进制编码 ----------
+
+
+def _put_varint(out: bytearray, n: int) -> None:
+    if n < 0:
+        raise ValueError("varint must be non-negative")
+    while True:
+        b = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(b | 0x80)
+        else:
+            out.append(b)
+            return
+
+
+def _put_str(out: bytearray, s: str) -> None:
+    b = s.encode("utf-8")
+    _put_varint(out, len(b))
+    out += b
+
+
+def _put_value(out: bytearray, x: Any, schema: Schema) -> None:
+    if x is None:
+        out.append(T.NULL)
+    elif x is True or x is False:
+        out.append(T.TRUE if x else T.FALSE)
+    elif isinstance(x, int):
+        if not -(1 << 63) <= x < (1 << 63):
+            raise ValueError(f"integer out of range: {x}")
+        out.append(T.INT)
+        _put_varint(out, (x << 1) ^ (x >> 63))
+    elif isinstance(x, float):
+        out.append(T.FLOAT)
+        out += struct.pack("<d", x)
+    elif isinstance(x, str):
+        out.append(T.STR)
+        _put_str(out, x)
+    elif isinstance(x, (list, tuple)):
+        out.append(T.LIST)
+        _put_varint(out, len(x))
+        for i in x:
+            _put_value(out, i, schema)
+    elif isinstance(x, dict):
+        _put_dict(out, x, schema)
+    else:
+        raise TypeError(f"cannot encode {type(x).__name__}")
+
+
+def _put_dict(out: bytearray, d: Dict[str, Any], schema: Schema) -> None:
+    if set(d) == {"type", "value"} and d["type"] in schema.value_type_id:
+        out.append(T.TYPED)
+        out.append(schema.value_type_id[d["type"]])
+        _put_value(out, d["value"], schema)
+        return
+    cid = schema.class_id.get(d.get("verb")) if isinstance(d.get("verb"), str) else None
+    if cid is not None:
+        fid = schema.field_id[cid]
+        keys = [k for k in d if k != "verb"]
+        if all(k in fid for k in keys):
+            out.append(T.SCHEMA)
+            _put_varint(out, cid)
+            _put_varint(out, len(keys))
+            for k in keys:
+                _put_varint(out, fid[k])
+                _put_value(out, d[k], schema)
+            return
+    out.append(T.OBJ)
+    _put_varint(out, len(d))
+    for k, v in d.items():
+        _put_str(out, str(k))
+        _put_value(out, v, schema)
+
+
+def encode_program(
+    verbs_list: Sequence[Any],
+    trace_id: Optional[str] = None,
+    seed: Optional[int] = None,
+    extra_meta: Optional[Dict[str, Any]] = None,
+    schema: Optional[Schema] = None,
+) -> bytes:
+    """与 json_utils.export_verbs_to_program_json 参数一致，输出二进制程序。"""
+    from lib.json_utils import verb_to_obj
+
+    schema = schema or build_schema()
+    meta: Dict[str, Any] = {}
+    if trace_id is not None:
+        meta["trace_id"] = trace_id
+    if seed is not None:
+        meta["seed"] = seed
+    if extra_meta:
+        meta.update(extra_meta)
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    out += struct.pack("<I", schema.hash)
+    _put_value(out, meta, schema)
+    _put_varint(out, len(verbs_list))
+    for v in verbs_list:
+        _put_value(out, verb_to_obj(v), schema)
+    return bytes(out)
+
+
+class _Reader:
+    def __init__(self, buf: bytes, schema: Schema):
+        self.buf, self.pos, self.schema = buf, 0, schema
+
+    def take(self, n: int) -> bytes:
+        if self.pos + n > len(self.buf):
+            raise ValueError("truncated program")
+        b = self.buf[self.pos : self.pos + n]
+        self.pos += n
+        return b
+
+    def varint(self) -> int:
+        n = shift = 0
+        while True:
+            b = self.take(1)[0]
+            n |= (b & 0x7F) << shift
+            if not b & 0x80:
+                return n
+            shift += 7
+            if shift > 63:
+                raise ValueError("varint too long")
+
+    def string(self) -> str:
+        return self.take(self.varint()).decode("utf-8")
+
+    def value(self) -> Any:
+        tag = self.take(1)[0]
+        s = self.schema
+        if tag == T.NULL:
+            return None
+        if tag in (T.FALSE, T.TRUE):
+            return tag == T.TRUE
+        if tag == T.INT:
+            z = self.varint()
+            return (z >> 1) ^ -(z & 1)
+        if tag == T.FLOAT:
+            return struct.unpack("<d", self.take(8))[0]
+        if tag == T.STR:
+            return self.string()
+        if tag == T.LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == T.OBJ:
+            return {self.string(): self.value() for _ in range(self.varint())}
+        if tag == T.TYPED:
+            t = self.take(1)[0]
+            if t >= len(VALUE_TYPES):
+                raise ValueError(f"bad value type {t}")
+            return {"type": VALUE_TYPES[t], "value": self.value()}
+        if tag == T.SCHEMA:
+            cid = self.varint()
+            if cid >= len(s.classes):
+                raise ValueError(f"bad class id {cid}")
+            name, fields = s.classes[cid]
+            got = {}
+            for _ in range(self.varint()):
+                j = self.varint()
+                if j >= len(fields):
+                    raise ValueError(f"bad field {j} for {name}")
+                got[j] = self.value()
+            # 按 EXPORT_FIELDS 顺序还原，与 to_dict 输出一致
+            d = {"verb": name}
+            d.update((fields[j], got[j]) for j in sorted(got))
+            return d
+        raise ValueError(f"bad tag {tag}")
+
+
+def decode_program(buf: bytes, schema: Optional[Schema] = None) -> Dict[str, Any]:
+    """二进制程序 -> 与 program JSON 相同结构的 dict。"""
+    schema = schema or build_schema()
+    if buf[:4] != MAGIC:
+        raise ValueError("not a binary program")
+    r = _Reader(buf, schema)
+    r.pos = 4
+    version = r.take(1)[0]
+    (h,) = struct.unpack("<I", r.take(4))
+    if version != VERSION or h != schema.hash:
+        raise ValueError(f"schema mismatch: version {version}, hash {h:#010x} != {schema.hash:#010x}")
+    meta = r.value()
+    program = [r.value() for _ in range(r.varint())]
+    return {"version": VERSION, "meta": meta, "program": program}
+
+
+# ---------- verb -> libibverbs 调用 ----------
+
+
+class IbvCall(NamedTuple):
+    """
+    一个 verb 在 rdma_exec 里对应的 libibverbs 调用，generate_c() 据此生成 rdx_exec_<Verb>。
+    call / decls 是 C 片段，其中的占位符（见 _Expander）引用 EXPORT_FIELDS 里的字段：
+      {ctx}                   env->ctx
+      {<资源类型>:f}           按名字查到的资源（类型见 RES_CTYPES），查不到就跳过这个 verb；
+                              {<资源类型>?:f} 允许为 NULL
+      {last:<资源类型>}        取出并注销最近登记的该类型资源（CloseDevice）
+      {int:f} / {int:f:默认}   整数、枚举名、"A | B" 形式的标志、mr0->lkey 这类表达式
+      {name:f}                字段的字符串值
+      {attr:f:Cls}            按 ATTR_CTYPES[Cls] 填好的结构体指针（字段缺省为 0）
+      {sges:f:计数字段} / {n:f} ibv_sge 数组和它的元素个数
+      {buf:f:长度字段}         按名字分配 / 复用的本地缓冲区，{buf?:...} 允许为 NULL
+      {gid:f}                 union ibv_gid 指针
+      {dev:f}                 struct ibv_device 指针
+    ret：rc（返回 0 成功）、neg（>= 0 成功）、void、ptr（非 NULL 成功）、
+         new（返回新对象，按 res = "类型:字段" 登记）、free（成功后注销 res）
+    """
+
+    call: str
+    ret: str = "rc"
+    res: str = ""
+    decls: str = ""
+
+
+RES_CTYPES = {
+    "ah": "struct ibv_ah",
+    "channel": "struct ibv_comp_channel",
+    "context": "struct ibv_context",
+    "cq": "struct ibv_cq",
+    "cq_ex": "struct ibv_cq_ex",
+    "dm": "struct ibv_dm",
+    "flow": "struct ibv_flow",
+    "mr": "struct ibv_mr",
+    "mw": "struct ibv_mw",
+    "pd": "struct ibv_pd",
+    "qp": "struct ibv_qp",
+    "qp_ex": "struct ibv_qp_ex",
+    "srq": "struct ibv_srq",
+    "td": "struct ibv_td",
+    "wq": "struct ibv_wq",
+    "xrcd": "struct ibv_xrcd",
+}
+
+
+def _new(call: str, res: str) -> IbvCall:
+    return IbvCall(call, "new", res)
+
+
+def _free(call: str, res: str) -> IbvCall:
+    return IbvCall(call, "free", res)
+
+
+VERB_CALLS: Dict[str, IbvCall] = {
+    "AbortWR": IbvCall("ibv_wr_abort({qp_ex:qp_ex})", "void"),
+    "AckCQEvents": IbvCall("ibv_ack_cq_events({cq:cq}, {int:nevents})", "void"),
+    "AdviseMR": IbvCall("ibv_advise_mr({pd:pd}, {int:advice}, {int:flags}, {sges:sg_list:num_sge}, {n:sg_list})"),
+    "AllocDM": _new("ibv_alloc_dm({ctx}, {attr:attr_obj:IbvAllocDmAttr})", "dm:dm"),
+    "AllocMW": _new("ibv_alloc_mw({pd:pd}, {int:mw_type:IBV_MW_TYPE_1})", "mw:mw"),
+    "AllocNullMR": _new("ibv_alloc_null_mr({pd:pd})", "mr:mr"),
+    "AllocPD": _new("ibv_alloc_pd({ctx})", "pd:pd"),
+    "AllocParentDomain": _new(
+        "ibv_alloc_parent_domain({ctx}, {attr:attr_obj:IbvParentDomainInitAttr})", "pd:parent_pd"
+    ),
+    "AllocTD": _new("ibv_alloc_td({ctx}, {attr:attr_obj:IbvTdInitAttr})", "td:td"),
+    "AttachMcast": IbvCall("ibv_attach_mcast({qp:qp}, {gid:gid}, {int:lid})"),
+    "BindMW": IbvCall("ibv_bind_mw({qp:qp}, {mw:mw}, {attr:mw_bind_obj:IbvMwBind})"),
+    "CloseDevice": IbvCall("ibv_close_device({last:context})"),
+    "CloseXRCD": _free("ibv_close_xrcd({xrcd:xrcd})", "xrcd:xrcd"),
+    "CreateAH": _new("ibv_create_ah({pd:pd}, {attr:attr_obj:IbvAHAttr})", "ah:ah"),
+    "CreateAHFromWC": IbvCall(
+        "ibv_create_ah_from_wc({pd:pd}, rdx_last_wc(), &grh, {int:port_num:1})",
+        "new",
+        "ah:ah",
+        "struct ibv_grh grh;\nmemset(&grh, 0, sizeof(grh));",
+    ),
+    "CreateCQ": _new("ibv_create_cq({ctx}, {int:cqe}, NULL, {channel?:channel}, {int:comp_vector})", "cq:cq"),
+    "CreateCQEx": _new("ibv_create_cq_ex({ctx}, {attr:cq_attr_obj:IbvCQInitAttrEx})", "cq_ex:cq_ex"),
+    "CreateCompChannel": _new("ibv_create_comp_channel({ctx})", "channel:channel"),
+    "CreateFlow": _new("ibv_create_flow({qp:qp}, {attr:flow_attr_obj:IbvFlowAttr})", "flow:flow"),
+    "CreateQP": _new("ibv_create_qp({pd:pd}, {attr:init_attr_obj:IbvQPInitAttr})", "qp:qp"),
+    "CreateQPEx": _new("ibv_create_qp_ex({ctx}, {attr:qp_attr_obj:IbvQPInitAttrEx})", "qp:qp"),
+    "CreateSRQ": _new("ibv_create_srq({pd:pd}, {attr:srq_init_obj:IbvSrqInitAttr})", "srq:srq"),
+    "CreateSRQEx": _new("ibv_create_srq_ex({ctx}, {attr:srq_attr_obj:IbvSrqInitAttrEx})", "srq:srq"),
+    "CreateWQ": _new("ibv_create_wq({ctx}, {attr:wq_attr_obj:IbvWQInitAttr})", "wq:wq"),
+    "DeallocMW": _free("ibv_dealloc_mw({mw:mw})", "mw:mw"),
+    "DeallocPD": _free("ibv_dealloc_pd({pd:pd})", "pd:pd"),
+    "DeallocTD": _free("ibv_dealloc_td({td:td})", "td:td"),
+    "DeregMR": _free("ibv_dereg_mr({mr:mr})", "mr:mr"),
+    "DestroyAH": _free("ibv_destroy_ah({ah:ah})", "ah:ah"),
+    "DestroyCQ": _free("ibv_destroy_cq({cq:cq})", "cq:cq"),
+    "DestroyCompChannel": _free("ibv_destroy_comp_channel({channel:channel})", "channel:channel"),
+    "DestroyFlow": _free("ibv_destroy_flow({flow:flow})", "flow:flow"),
+    "DestroyQP": _free("ibv_destroy_qp({qp:qp})", "qp:qp"),
+    "DestroySRQ": _free("ibv_destroy_srq({srq:srq})", "srq:srq"),
+    "DestroyWQ": _free("ibv_destroy_wq({wq:wq})", "wq:wq"),
+    "DetachMcast": IbvCall("ibv_detach_mcast({qp:qp}, {gid:gid}, {int:lid})"),
+    "ForkInit": IbvCall("ibv_fork_init()"),
+    "FreeDM": _free("ibv_free_dm({dm:dm})", "dm:dm"),
+    "FreeDeviceList": IbvCall("rdx_free_device_list()", "void"),
+    "GetDeviceGUID": IbvCall("ibv_get_device_guid({dev:device})", "void"),
+    "GetDeviceIndex": IbvCall("ibv_get_device_index({dev:device_name})", "neg"),
+    "GetDeviceList": IbvCall("rdx_get_device_list()", "ptr"),
+    "GetDeviceName": IbvCall("ibv_get_device_name({dev:device})", "ptr"),
+    "GetPKeyIndex": IbvCall("ibv_get_pkey_index({ctx}, {int:port_num:1}, {int:pkey})", "neg"),
+    "GetSRQNum": IbvCall("ibv_get_srq_num({srq:srq}, &srq_num)", decls="uint32_t srq_num = 0;"),
+    "ImportDM": _new("ibv_import_dm({ctx}, {int:dm_handle})", "dm:dm"),
+    "ImportMR": _new("ibv_import_mr({pd:pd}, {int:mr_handle})", "mr:mr"),
+    "ImportPD": _new("ibv_import_pd({ctx}, {int:pd_handle})", "pd:pd"),
+    "MemcpyFromDM": IbvCall("ibv_memcpy_from_dm({buf:host:length}, {dm:dm}, {int:dm_offset}, {int:length})"),
+    "MemcpyToDM": IbvCall("ibv_memcpy_to_dm({dm:dm}, {int:dm_offset}, {buf:host:length}, {int:length})"),
+    "ModifyCQ": IbvCall("ibv_modify_cq({cq:cq}, {attr:attr_obj:IbvModifyCQAttr})"),
+    # 和手写的 handle_ModifyQP 一样，连过 server 的 QP 用对端的 qpn / psn / gid 覆盖 attr
+    "ModifyQP": IbvCall(
+        "ibv_modify_qp({qp:qp}, {attr:attr_obj:IbvQPAttr}, attr_mask)",
+        decls="int attr_mask = (int){int:attr_mask};\n"
+        "server_fill_qp_attr_from_remote(env, {name:qp}, {attr:attr_obj:IbvQPAttr}, &attr_mask,\n"
+        "                                {attr:attr_obj:IbvQPAttr}->qp_state);",
+    ),
+    "ModifyQPRateLimit": IbvCall("ibv_modify_qp_rate_limit({qp:qp}, {attr:attr_obj:IbvQPRateLimitAttr})"),
+    "ModifySRQ": IbvCall("ibv_modify_srq({srq:srq}, {attr:attr_obj:IbvSrqAttr}, {int:attr_mask})"),
+    "ModifyWQ": IbvCall("ibv_modify_wq({wq:wq}, {attr:attr_obj:IbvWQAttr})"),
+    "OpenDevice": _new("ibv_open_device({dev:device})", "context:device"),
+    "OpenQP": _new("ibv_open_qp({ctx}, {attr:attr_obj:IbvQPOpenAttr})", "qp:qp"),
+    "OpenXRCD": _new("ibv_open_xrcd({ctx}, {attr:attr_obj:IbvXRCDInitAttr})", "xrcd:xrcd"),
+    "PollCQ": IbvCall("ibv_poll_cq({cq:cq}, 1, rdx_last_wc())", "neg"),
+    "PostRecv": IbvCall(
+        "ibv_post_recv({qp:qp}, {attr:wr_obj:IbvRecvWR}, &bad_wr)", decls="struct ibv_recv_wr *bad_wr = NULL;"
+    ),
+    "PostSRQRecv": IbvCall(
+        "ibv_post_srq_recv({srq:srq}, {attr:wr_obj:IbvRecvWR}, &bad_wr)", decls="struct ibv_recv_wr *bad_wr = NULL;"
+    ),
+    "PostSend": IbvCall(
+        "ibv_post_send({qp:qp}, {attr:wr_obj:IbvSendWR}, &bad_wr)", decls="struct ibv_send_wr *bad_wr = NULL;"
+    ),
+    "QueryDeviceAttr": IbvCall("ibv_query_device({ctx}, &dev_attr)", decls="struct ibv_device_attr dev_attr;"),
+    "QueryDeviceEx": IbvCall(
+        "ibv_query_device_ex({ctx}, &input, &attr_ex)",
+        decls="struct ibv_query_device_ex_input input = {.comp_mask = (uint32_t){int:comp_mask}};\n"
+        "struct ibv_device_attr_ex attr_ex;",
+    ),
+    "QueryECE": IbvCall("ibv_query_ece({qp:qp}, &ece)", decls="struct ibv_ece ece;"),
+    "QueryGID": IbvCall("ibv_query_gid({ctx}, {int:port_num:1}, {int:index}, &gid)", decls="union ibv_gid gid;"),
+    "QueryGIDEx": IbvCall(
+        "ibv_query_gid_ex({ctx}, {int:port_num:1}, {int:gid_index}, &entry, {int:flags})",
+        decls="struct ibv_gid_entry entry;",
+    ),
+    "QueryGIDTable": IbvCall(
+        "ibv_query_gid_table({ctx}, entries, max_entries, 0)",
+        "neg",
+        decls="size_t max_entries = rdx_count({int:max_entries});\n"
+        "struct ibv_gid_entry *entries = rdx_scratch(sizeof(*entries) * (max_entries ? max_entries : 1));\n"
+        "if (!entries)\n"
+        '    return rdx_fail("QueryGIDTable", "rdx_scratch", ENOMEM);',
+    ),
+    "QueryPKey": IbvCall("ibv_query_pkey({ctx}, {int:port_num:1}, {int:index}, &pkey)", decls="__be16 pkey;"),
+    "QueryPortAttr": IbvCall(
+        "ibv_query_port({ctx}, {int:port_num:1}, &port_attr)", decls="struct ibv_port_attr port_attr;"
+    ),
+    "QueryQP": IbvCall(
+        "ibv_query_qp({qp:qp}, &attr, {int:attr_mask}, &init_attr)",
+        decls="struct ibv_qp_attr attr;\nstruct ibv_qp_init_attr init_attr;",
+    ),
+    "QuerySRQ": IbvCall("ibv_query_srq({srq:srq}, &attr)", decls="struct ibv_srq_attr attr;"),
+    "ReRegMR": IbvCall(
+        "ibv_rereg_mr({mr:mr}, {int:flags}, {pd?:pd}, {buf?:addr:length}, {int:length}, {int:access})"
+    ),
+    "RegDmaBufMR": _new(
+        "ibv_reg_dmabuf_mr({pd:pd}, {int:offset}, {int:length}, {int:iova}, {int:fd}, {int:access})", "mr:mr"
+    ),
+    "RegMR": _new("ibv_reg_mr({pd:pd}, {buf:addr:length}, {int:length}, {int:access})", "mr:mr"),
+    "RegMRIova": _new("ibv_reg_mr_iova({pd:pd}, {buf:buf:length}, {int:length}, {int:iova}, {int:access})", "mr:mr"),
+    "ReqNotifyCQ": IbvCall("ibv_req_notify_cq({cq:cq}, {int:solicited_only})"),
+    "ResizeCQ": IbvCall("ibv_resize_cq({cq:cq}, {int:cqe})"),
+    "SetECE": IbvCall("ibv_set_ece({qp:qp}, {attr:ece_obj:IbvECE})"),
+    "WRComplete": IbvCall("ibv_wr_complete({qp_ex:qp_ex})"),
+    "WrStart": IbvCall("ibv_wr_start({qp_ex:qp_ex})", "void"),
+}
+
+# Attr -> (C 结构体, 非整数成员的填法)；C 结构体为 None 的类没有独立结构，
+# 只以 inline 形式展开到外层（ibv_send_wr 里的匿名 union 成员），或由 verb_args.c 直接处理（IbvSge / IbvGID）。
+# 成员填法：res:<资源类型>、attr:<Cls>（内嵌结构）、ptr:<Cls>（next 链）、sges:<计数字段>、gid、
+#           bytes:<长度字段>、buf:<长度字段>、inline:<Cls>@<成员路径>、skip（不填，留 0）；其余按整数填
+ATTR_CTYPES: Dict[str, Tuple[Optional[str], Dict[str, str]]] = {
+    "IbvAHAttr": ("struct ibv_ah_attr", {"grh": "attr:IbvGlobalRoute"}),
+    "IbvAllocDmAttr": ("struct ibv_alloc_dm_attr", {}),
+    "IbvAtomicInfo": (None, {}),
+    "IbvBindMwInfo": (None, {"mw": "res:mw", "bind_info": "attr:IbvMwBindInfo"}),
+    "IbvCQInitAttrEx": (
+        "struct ibv_cq_init_attr_ex",
+        {"cq_context": "skip", "channel": "res:channel", "parent_domain": "res:pd"},
+    ),
+    "IbvECE": ("struct ibv_ece", {}),
+    "IbvFlowAttr": ("struct ibv_flow_attr", {}),
+    "IbvGID": (None, {}),
+    "IbvGlobalRoute": ("struct ibv_global_route", {"dgid": "gid"}),
+    "IbvModerateCQ": ("struct ibv_moderate_cq", {}),
+    "IbvModifyCQAttr": ("struct ibv_modify_cq_attr", {"moderate": "attr:IbvModerateCQ"}),
+    "IbvMwBind": ("struct ibv_mw_bind", {"bind_info": "attr:IbvMwBindInfo"}),
+    "IbvMwBindInfo": ("struct ibv_mw_bind_info", {"mr": "res:mr"}),
+    "IbvParentDomainInitAttr": (
+        "struct ibv_parent_domain_init_attr",
+        {"pd": "res:pd", "td": "res:td", "alloc": "skip", "free": "skip", "pd_context": "skip"},
+    ),
+    "IbvQPAttr": (
+        "struct ibv_qp_attr",
+        {"cap": "attr:IbvQPCap", "ah_attr": "attr:IbvAHAttr", "alt_ah_attr": "attr:IbvAHAttr"},
+    ),
+    "IbvQPCap": ("struct ibv_qp_cap", {}),
+    "IbvQPInitAttr": (
+        "struct ibv_qp_init_attr",
+        {"qp_context": "skip", "send_cq": "res:cq", "recv_cq": "res:cq", "srq": "res:srq", "cap": "attr:IbvQPCap"},
+    ),
+    "IbvQPInitAttrEx": (
+        "struct ibv_qp_init_attr_ex",
+        {
+            "qp_context": "skip",
+            "send_cq": "res:cq",
+            "recv_cq": "res:cq",
+            "srq": "res:srq",
+            "cap": "attr:IbvQPCap",
+            "pd": "res:pd",
+            "xrcd": "res:xrcd",
+            "rwq_ind_tbl": "skip",
+            "rx_hash_conf": "attr:IbvRxHashConf",
+        },
+    ),
+    "IbvQPOpenAttr": ("struct ibv_qp_open_attr", {"xrcd": "res:xrcd", "qp_context": "skip"}),
+    "IbvQPRateLimitAttr": ("struct ibv_qp_rate_limit_attr", {}),
+    "IbvRdmaInfo": (None, {}),
+    "IbvRecvWR": ("struct ibv_recv_wr", {"next": "ptr:IbvRecvWR", "sg_list": "sges:num_sge", "num_sge": "skip"}),
+    "IbvRxHashConf": ("struct ibv_rx_hash_conf", {"rx_hash_key": "bytes:rx_hash_key_len"}),
+    "IbvSendWR": (
+        "struct ibv_send_wr",
+        {
+            "next": "ptr:IbvSendWR",
+            "sg_list": "sges:num_sge",
+            "num_sge": "skip",
+            "rdma": "inline:IbvRdmaInfo@wr.rdma",
+            "atomic": "inline:IbvAtomicInfo@wr.atomic",
+            "ud": "inline:IbvUdInfo@wr.ud",
+            "xrc": "skip",
+            "bind_mw": "inline:IbvBindMwInfo@bind_mw",
+            "tso": "inline:IbvTsoInfo@tso",
+        },
+    ),
+    "IbvSge": (None, {}),
+    "IbvSrqAttr": ("struct ibv_srq_attr", {}),
+    "IbvSrqInitAttr": ("struct ibv_srq_init_attr", {"srq_context": "skip", "attr": "attr:IbvSrqAttr"}),
+    "IbvSrqInitAttrEx": (
+        "struct ibv_srq_init_attr_ex",
+        {
+            "srq_context": "skip",
+            "attr": "attr:IbvSrqAttr",
+            "pd": "res:pd",
+            "xrcd": "res:xrcd",
+            "cq": "res:cq",
+            "tm_cap": "attr:IbvTMCap",
+        },
+    ),
+    "IbvTMCap": ("struct ibv_tm_cap", {}),
+    "IbvTdInitAttr": ("struct ibv_td_init_attr", {}),
+    "IbvTsoInfo": (None, {"hdr": "buf:hdr_sz"}),
+    "IbvUdInfo": (None, {"ah": "res:ah"}),
+    "IbvWQAttr": ("struct ibv_wq_attr", {}),
+    "IbvWQInitAttr": ("struct ibv_wq_init_attr", {"wq_context": "skip", "pd": "res:pd", "cq": "res:cq"}),
+    "IbvXRCDInitAttr": ("struct ibv_xrcd_init_attr", {}),
+    "IbvXrcInfo": (None, {}),
+}
+
+
+def value_constants() -> Dict[str, int]:
+    """lib/value.py 里 EnumValue（值 -> 名字）和 FlagValue（名字 -> 值）的全部表，合并成 名字 -> 值。"""
+    from lib.value import EnumValue, FlagValue
+
+    consts: Dict[str, int] = {}
+    for cls, by_value in ((EnumValue, True), (FlagValue, False)):
+        for table in vars(cls).values():
+            if not isinstance(table, dict):
+                continue
+            for k, v in table.items():
+                name, val = (v, k) if by_value else (k, v)
+                if not isinstance(name, str) or not isinstance(val, int):
+                    continue
+                if consts.setdefault(name, val) != val:
+                    raise ValueError(f"constant {name} has conflicting values {consts[name]} / {val}")
+    return consts
+
+
+# ---------- C 表生成 ----------
+
+_HANDLER_RE = re.compile(r"^\s*int\s+handle_(\w+)\s*\(", re.M)
+_TOKEN_RE = re.compile(r"\{(\w+)(\?)?:?(\w*)(?::([^{}]+))?\}")
+
+
+def find_handlers(exec_dir: Path = RDMA_EXEC_DIR) -> Dict[str, str]:
+    """扫描 rdma_exec/verb_*.h 里声明的手写 handle_<Verb>（读 program JSON），返回 verb 名 -> 头文件名。"""
+    found: Dict[str, str] = {}
+    for h in sorted(exec_dir.glob("verb_*.h")):
+        if h.name in ("verb_dispatch.h", "verb_args.h", GEN_HEADER):
+            continue
+        for name in _HANDLER_RE.findall(h.read_text(encoding="utf-8", errors="replace")):
+            found.setdefault(name, h.name)
+    return found
+
+
+def _c_ident(name: str) -> str:
+    return re.sub(r"\W", "_", name)
+
+
+class _Expander:
+    """展开一个 verb 的 IbvCall 占位符；需要先查资源 / 填结构体的，把语句收集到 hoist 里，放在调用之前。"""
+
+    def __init__(self, verb: str, fields: Sequence[str]):
+        self.verb, self.fields = verb, set(fields)
+        self.hoist: List[str] = []
+        self.seen: set = set()
+        self.attrs: set = set()
+
+    def _once(self, key: Tuple[str, str], lines: Sequence[str]) -> None:
+        if key not in self.seen:
+            self.seen.add(key)
+            self.hoist.extend(lines)
+
+    def _skip(self, var: str, field: str, arg: str) -> List[str]:
+        return [f"if (!{var})", f'    return rdx_skip("{self.verb}", "{field}", {arg});']
+
+    def expand(self, text: str) -> str:
+        return _TOKEN_RE.sub(self._sub, text)
+
+    def _sub(self, m: "re.Match[str]") -> str:
+        kind, opt, field, extra = m.group(1), m.group(2), m.group(3), m.group(4)
+        if kind == "ctx":
+            self._once(("ctx", ""), self._skip("env->ctx", "ctx", "NULL"))
+            return "env->ctx"
+        if kind == "last":
+            var = f"r_last_{field}"
+            take = f'{RES_CTYPES[field]} *{var} = env_take_obj(env, "{field}", NULL);'
+            self._once((kind, field), [take] + self._skip(var, field, "NULL"))
+            return var
+        if field not in self.fields:
+            raise ValueError(f"{self.verb}: {m.group(0)} refers to a field outside EXPORT_FIELDS")
+        arg = f"&a->{field}"
+        if kind == "int":
+            return f"rdx_int(env, {arg}, {extra or 0})"
+        if kind == "name":
+            return f"rdx_str({arg})"
+        if kind == "n":
+            return f"n_{field}"
+        if kind in RES_CTYPES:
+            var = f"r_{field}"
+            lines = [f'{RES_CTYPES[kind]} *{var} = rdx_res(env, {arg}, "{kind}");']
+            self._once((kind, field), lines + ([] if opt else self._skip(var, field, arg)))
+            return var
+        if kind == "attr":
+            ctype = ATTR_CTYPES[extra][0]
+            if ctype is None:
+                raise ValueError(f"{self.verb}: {extra} has no C struct")
+            var = f"at_{field}"
+            self.attrs.add(extra)
+            self._once(
+                (kind, field),
+                [
+                    f"{ctype} *{var} = rdx_scratch(sizeof(*{var}));",
+                    f"if (!{var})",
+                    f'    return rdx_fail("{self.verb}", "rdx_scratch", ENOMEM);',
+                    f"rdx_fill_{extra}(env, {arg}, {var});",
+                ],
+            )
+            return var
+        if kind == "sges":
+            lines = [
+                f"int n_{field} = 0;",
+                f"struct ibv_sge *l_{field} = rdx_sge_list(env, {arg}, &a->{extra}, &n_{field});",
+            ]
+            self._once((kind, field), lines)
+            return f"l_{field}"
+        if kind == "buf":
+            var = f"b_{field}"
+            lines = [f"void *{var} = rdx_buf(env, {arg}, rdx_int(env, &a->{extra}, 0));"]
+            self._once((kind, field), lines + ([] if opt else self._skip(var, field, arg)))
+            return var
+        if kind == "gid":
+            self._once((kind, field), [f"union ibv_gid g_{field};", f"rdx_gid({arg}, &g_{field});"])
+            return f"&g_{field}"
+        if kind == "dev":
+            var = f"d_{field}"
+            decl = f"struct ibv_device *{var} = rdx_device(env, {arg});"
+            self._once((kind, field), [decl] + self._skip(var, field, arg))
+            return var
+        raise ValueError(f"{self.verb}: unknown placeholder {m.group(0)}")
+
+
+def _gen_handler(verb: str, fields: Sequence[str], spec: IbvCall) -> Tuple[List[str], set]:
+    """生成 rdx_exec_<verb>，返回 (C 代码行, 用到的 attr 类)。"""
+    ex = _Expander(verb, fields)
+    call = ex.expand(spec.call)  # 先展开调用，资源按参数顺序查
+    decls = [ex.expand(line) for line in spec.decls.splitlines()]
+    fn = re.match(r"\w+", spec.call).group(0)
+    body = ex.hoist + decls
+    if spec.ret in ("new", "free"):
+        typ, field = spec.res.split(":")
+        if typ not in RES_CTYPES or field not in fields:
+            raise ValueError(f"{verb}: bad resource {spec.res}")
+    if spec.ret in ("rc", "free"):
+        body += [f"int rc = {call};", "if (rc != 0)", f'    return rdx_fail("{verb}", "{fn}", rc);']
+        if spec.ret == "free":
+            body.append(f'rdx_drop(env, "{typ}", &a->{field});')
+    elif spec.ret == "neg":
+        body += [f"int rc = (int){call};", "if (rc < 0)", f'    return rdx_fail("{verb}", "{fn}", rc);']
+    elif spec.ret == "void":
+        body.append(f"(void){call};")
+    elif spec.ret == "ptr":
+        body += [f"if (!{call})", f'    return rdx_fail("{verb}", "{fn}", 0);']
+    elif spec.ret == "new":
+        body += [
+            f"{RES_CTYPES[typ]} *obj = {call};",
+            "if (!obj)",
+            f'    return rdx_fail("{verb}", "{fn}", 0);',
+            f'rdx_put(env, "{typ}", &a->{field}, obj);',
+        ]
+    else:
+        raise ValueError(f"{verb}: unknown ret kind {spec.ret}")
+    body.append("return 0;")
+
+    text = "\n".join(body)
+    head = [f"const RdxArgs_{verb} *a = args;"] if "a->" in text else ["(void)args;"]
+    if not re.search(r"\benv\b", text):
+        head.append("(void)env;")
+    out = [f"static int rdx_exec_{verb}(const void *args, ResourceEnv *env)", "{"]
+    out += [f"    {line}" if line else "" for line in head + "\n".join(body).splitlines()]
+    out.append("}\n")
+    return out, ex.attrs
+
+
+def _attr_deps(cls: str) -> List[str]:
+    """cls 的填充函数会调用到的其它 attr 类（attr: / ptr: / inline: 里的）。"""
+    deps = []
+    for kind in ATTR_CTYPES[cls][1].values():
+        name = kind.partition(":")[2].partition("@")[0]
+        if kind.startswith(("attr:", "ptr:")):
+            deps.append(name)
+        elif kind.startswith("inline:"):
+            deps += _attr_deps(name)
+    return deps
+
+
+def _fill_members(cls: str, fields: Sequence[str], src: str, dst: str, indent: str, schema: Schema) -> List[str]:
+    kinds = ATTR_CTYPES[cls][1]
+    out = []
+    for f in fields:
+        kind = kinds.get(f, "int")
+        name, _, extra = kind.partition(":")
+        arg, member = f"&{src}->{f}", f"{dst}{f}"
+        if kind == "skip":
+            continue
+        if kind == "int":
+            out.append(f"{member} = rdx_int(env, {arg}, {member});")
+        elif name == "res":
+            out.append(f'{member} = rdx_res(env, {arg}, "{extra}");')
+        elif name == "attr":
+            out.append(f"rdx_fill_{extra}(env, {arg}, &{member});")
+        elif name == "ptr":
+            out.append(f"{member} = rdx_attr({arg}, RDX_ATTR_{extra}) ? rdx_scratch(sizeof(*{member})) : NULL;")
+            out += [f"if ({member})", f"    rdx_fill_{extra}(env, {arg}, {member});"]
+        elif name == "sges":
+            out.append(f"{member} = rdx_sge_list(env, {arg}, &{src}->{extra}, &{dst}{extra});")
+        elif name == "gid":
+            out.append(f"rdx_gid({arg}, &{member});")
+        elif name == "bytes":
+            out.append(f"{member} = rdx_bytes({arg}, {dst}{extra});")
+        elif name == "buf":
+            out.append(f"{member} = rdx_buf(env, {arg}, rdx_int(env, &{src}->{extra}, 0));")
+        elif name == "inline":
+            sub, _, path = extra.partition("@")
+            var = f"s_{f}"
+            out += [f"const RdxArgs_{sub} *{var} = rdx_attr({arg}, RDX_ATTR_{sub});", f"if ({var})", "{"]
+            inner = _fill_members(sub, schema.classes[schema.class_id[sub]][1], var, f"{dst}{path}.", "    ", schema)
+            out += inner
+            out.append("}")
+        else:
+            raise ValueError(f"{cls}.{f}: unknown member kind {kind}")
+    return [f"{indent}{line}" for line in out]
+
+
+def _gen_fill(cls: str, schema: Schema) -> List[str]:
+    ctype = ATTR_CTYPES[cls][0]
+    fields = schema.classes[schema.class_id[cls]][1]
+    out = [f"static void rdx_fill_{cls}(ResourceEnv *env, const RdxArg *arg, {ctype} *o)", "{"]
+    out += [f"    const RdxArgs_{cls} *a = rdx_attr(arg, RDX_ATTR_{cls});", "    if (!a)", "        return;"]
+    out += _fill_members(cls, fields, "a", "o->", "    ", schema)
+    out.append("}\n")
+    return out
+
+
+def _gen_decoder(name: str, fields: Sequence[str]) -> List[str]:
+    """二进制：字段个数 + (字段下标, 值)...，按下标直接解到 RdxArgs_<name> 的成员。"""
+    out = [f"static int rdx_decode_{name}(RdxReader *r, void *args)", "{"]
+    if not fields:
+        out += ["    uint64_t n;", "    (void)args;"]
+        return out + ["    return (rdx_rd_varint(r, &n) != 0 || n != 0) ? -1 : 0;", "}\n"]
+    out += [f"    RdxArgs_{name} *a = args;", "    uint64_t n;"]
+    out += ["    if (rdx_rd_varint(r, &n) != 0)", "        return -1;"]
+    out += ["    for (uint64_t i = 0; i < n; i++)", "    {", "        uint64_t j;", "        RdxArg *f;"]
+    out += ["        if (rdx_rd_varint(r, &j) != 0)", "            return -1;", "        switch (j)", "        {"]
+    for j, f in enumerate(fields):
+        out += [f"        case {j}:", f"            f = &a->{f};", "            break;"]
+    out += ["        default:", "            return -1;", "        }"]
+    out += ["        if (f->set || rdx_rd_arg(r, f) != 0)", "            return -1;", "    }", "    return 0;", "}\n"]
+    return out
+
+
+def _gen_json_decoder(name: str, fields: Sequence[str]) -> List[str]:
+    """program JSON：按 EXPORT_FIELDS 的键取值，转成 RdxArgs_<name> 的成员。"""
+    out = [f"static int rdx_json_{name}(RdxArena *ar, const cJSON *obj, void *args)", "{"]
+    if not fields:
+        return out + ["    (void)ar;", "    (void)obj;", "    (void)args;", "    return 0;", "}\n"]
+    out.append(f"    RdxArgs_{name} *a = args;")
+    conds = [f'rdx_json_field(ar, obj, "{f}", &a->{f}) != 0' for f in fields]
+    out.append(f"    if ({conds[0]}" + (" ||" if len(conds) > 1 else ")"))
+    for i, cond in enumerate(conds[1:], 1):
+        out.append(f"        {cond}" + (" ||" if i < len(conds) - 1 else ")"))
+    return out + ["        return -1;", "    return 0;", "}\n"]
+
+
+def generate_c(schema: Optional[Schema] = None, handlers: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+    """返回 (verb_schema.gen.h, verb_schema.gen.c) 的内容。"""
+    schema = schema or build_schema()
+    handlers = find_handlers() if handlers is None else handlers
+    verbs = schema.classes[: schema.verb_count]
+    missing = [n for n, _ in verbs if n not in VERB_CALLS]
+    if missing:
+        raise ValueError(f"verbs without an IbvCall in VERB_CALLS: {', '.join(missing)}")
+    unknown_attrs = [n for n, _ in schema.classes[schema.verb_count :] if n not in ATTR_CTYPES]
+    if unknown_attrs:
+        raise ValueError(f"attrs without an entry in ATTR_CTYPES: {', '.join(unknown_attrs)}")
+    consts = sorted(value_constants().items())
+    banner = "/* Auto-generated by lib/exec_schema.py from VerbCall / Attr EXPORT_FIELDS; do not edit manually. */\n"
+
+    h = [banner, "#pragma once\n", "#include <stddef.h>\n", "#include <stdint.h>\n"]
+    h.append('#include "program_bin.h"\n#include "verb_args.h"\n#include "verb_dispatch.h"\n\n')
+    h.append(f"#define RDX_SCHEMA_HASH 0x{schema.hash:08x}u\n")
+    h.append(f"#define RDX_BIN_VERSION {VERSION}\n")
+    h.append(f"#define RDX_VERB_COUNT {schema.verb_count}\n")
+    h.append(f"#define RDX_CLASS_COUNT {len(schema.classes)}\n")
+    h.append(f"#define RDX_VALUE_TYPE_COUNT {len(VALUE_TYPES)}\n")
+    h.append(f"#define RDX_CONST_COUNT {len(consts)}\n\n")
+    h.append("/* 值编码的 tag */\nenum\n{\n")
+    h += [f"    RDX_TAG_{k} = {v},\n" for k, v in TAGS.items()]
+    h.append("};\n\n/* 类编号：[0, RDX_VERB_COUNT) 为 verb id，其后为 attr */\nenum\n{\n")
+    for i, (name, _) in enumerate(schema.classes):
+        kind = "VERB" if i < schema.verb_count else "ATTR"
+        h.append(f"    RDX_{kind}_{_c_ident(name)} = {i},\n")
+    h.append("};\n\n/* 每个类的参数：成员与 EXPORT_FIELDS 一一对应，程序里没给出的字段 set == 0 */\n")
+    for name, fields in schema.classes:
+        members = "".join(f"    RdxArg {f};\n" for f in fields) or "    char unused;\n"
+        h.append(f"typedef struct\n{{\n{members}}} RdxArgs_{_c_ident(name)};\n\n")
+    h.append(
+        "typedef struct\n{\n"
+        "    const char *name;\n"
+        "    uint8_t nfields;\n"
+        "    const char *const *fields; // EXPORT_FIELDS 顺序\n"
+        "    size_t args_size;          // sizeof(RdxArgs_<name>)\n"
+        "    int (*decode)(RdxReader *r, void *args);\n"
+        "    int (*from_json)(RdxArena *ar, const cJSON *obj, void *args);\n"
+        "} RdxClassSchema;\n\n"
+        "typedef struct\n{\n"
+        "    const char *name;\n"
+        "    int64_t value;\n"
+        "} RdxConst;\n\n"
+    )
+    h.append("extern const RdxClassSchema g_rdx_classes[RDX_CLASS_COUNT];\n")
+    h.append("extern const char *const g_rdx_value_types[RDX_VALUE_TYPE_COUNT];\n")
+    h.append("extern const RdxConst g_rdx_consts[RDX_CONST_COUNT];\n")
+    h.append("extern const RdxVerbHandler g_rdx_handlers[RDX_VERB_COUNT];\n")
+    h.append("extern const VerbHandler g_rdx_json_handlers[RDX_VERB_COUNT];\n\n")
+    h.append("// verb 名 -> verb id（二分查找），未知返回 -1\n")
+    h.append("int rdx_verb_id(const char *name);\n")
+    h.append("// EnumValue / FlagValue 里的常量名 -> 值，找到返回 0\n")
+    h.append("int rdx_const(const char *name, int64_t *out);\n")
+
+    headers = sorted(set(handlers.values()))
+    c = [banner, f'#include "{GEN_HEADER}"\n']
+    c += [f'#include "{x}"\n' for x in headers]
+    c.append('#include "server_conn.h"\n\n#include <errno.h>\n#include <stdlib.h>\n#include <string.h>\n\n')
+    for i, (name, fields) in enumerate(schema.classes):
+        if fields:
+            items = ", ".join(f'"{f}"' for f in fields)
+            c.append(f"static const char *const k_fields_{i}[] = {{{items}}};\n")
+    c.append("\n/* ---------- 二进制程序 -> RdxArgs ---------- */\n\n")
+    for name, fields in schema.classes:
+        c.append("\n".join(_gen_decoder(_c_ident(name), fields)) + "\n")
+    c.append("/* ---------- program JSON -> RdxArgs（没有手写 handler 的 verb） ---------- */\n\n")
+    for name, fields in schema.classes:
+        c.append("\n".join(_gen_json_decoder(_c_ident(name), fields)) + "\n")
+    c.append("const RdxClassSchema g_rdx_classes[RDX_CLASS_COUNT] = {\n")
+    for i, (name, fields) in enumerate(schema.classes):
+        arr = f"k_fields_{i}" if fields else "NULL"
+        ident = _c_ident(name)
+        c.append(
+            f'    {{"{name}", {len(fields)}, {arr}, sizeof(RdxArgs_{ident}), rdx_decode_{ident}, rdx_json_{ident}}},\n'
+        )
+    c.append("};\n\nconst char *const g_rdx_value_types[RDX_VALUE_TYPE_COUNT] = {\n")
+    c += [f'    "{t}",\n' for t in VALUE_TYPES]
+    c.append("};\n\n/* 取自 lib/value.py，按名字排序 */\nconst RdxConst g_rdx_consts[RDX_CONST_COUNT] = {\n")
+    c += [f'    {{"{k}", {v}}},\n' for k, v in consts]
+    c.append("};\n")
+
+    handler_code, used = [], set()
+    for name, fields in verbs:
+        lines, attrs = _gen_handler(name, fields, VERB_CALLS[name])
+        handler_code.append("\n".join(lines) + "\n")
+        used |= attrs
+    stack = list(used)
+    while stack:
+        for dep in _attr_deps(stack.pop()):
+            if dep not in used:
+                used.add(dep)
+                stack.append(dep)
+    fills = [n for n, _ in schema.classes[schema.verb_count :] if n in used]
+    c.append("\n/* ---------- attr -> libibverbs 结构体 ---------- */\n\n")
+    c += [f"static void rdx_fill_{n}(ResourceEnv *env, const RdxArg *arg, {ATTR_CTYPES[n][0]} *o);\n" for n in fills]
+    c.append("\n")
+    c += ["\n".join(_gen_fill(n, schema)) + "\n" for n in fills]
+    c.append("/* ---------- 每个 verb 的 handler ---------- */\n\n")
+    c += handler_code
+    c.append("const RdxVerbHandler g_rdx_handlers[RDX_VERB_COUNT] = {\n")
+    for name, _ in verbs:
+        c.append(f"    [RDX_VERB_{_c_ident(name)}] = rdx_exec_{_c_ident(name)},\n")
+    c.append("};\n\n/* 手写的 handler（读 program JSON），没有的为 NULL，走上面生成的 */\n")
+    c.append("const VerbHandler g_rdx_json_handlers[RDX_VERB_COUNT] = {\n")
+    for name, _ in verbs:
+        fn = f"handle_{name}" if name in handlers else "NULL"
+        c.append(f"    [RDX_VERB_{_c_ident(name)}] = {fn},\n")
+    c.append("};\n\n")
+    c.append(
+        "static int cmp_verb_name(const void *key, const void *elem)\n{\n"
+        "    return strcmp((const char *)key, ((const RdxClassSchema *)elem)->name);\n}\n\n"
+        "int rdx_verb_id(const char *name)\n{\n"
+        "    if (!name)\n        return -1;\n"
+        "    const RdxClassSchema *hit =\n"
+        "        bsearch(name, g_rdx_classes, RDX_VERB_COUNT, sizeof(g_rdx_classes[0]), cmp_verb_name);\n"
+        "    return hit ? (int)(hit - g_rdx_classes) : -1;\n}\n\n"
+        "static int cmp_const_name(const void *key, const void *elem)\n{\n"
+        "    return strcmp((const char *)key, ((const RdxConst *)elem)->name);\n}\n\n"
+        "int rdx_const(const char *name, int64_t *out)\n{\n"
+        "    const RdxConst *hit = name ? bsearch(name, g_rdx_consts, RDX_CONST_COUNT, sizeof(g_rdx_consts[0]),\n"
+        "                                         cmp_const_name)\n"
+        "                               : NULL;\n"
+        "    if (!hit)\n        return -1;\n"
+        "    *out = hit->value;\n"
+        "    return 0;\n}\n"
+    )
+    return "".join(h), "".join(c)
+
+
+def write_c(out_dir: Path = RDMA_EXEC_DIR, check: bool = False) -> bool:
+    """写出（或 check=True 时只比较）生成的 C 文件，返回是否与磁盘一致。"""
+    header, source = generate_c(handlers=find_handlers(out_dir))
+    same = True
+    for name, text in ((GEN_HEADER, header), (GEN_SOURCE, source)):
+        p = out_dir / name
+        old = p.read_text(encoding="utf-8") if p.exists() else None
+        if old != text:
+            same = False
+            if not check:
+                p.write_text(text, encoding="utf-8")
+    return same
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="generate rdma_exec verb schema / dispatch tables")
+    ap.add_argument("out_dir", nargs="?", default=str(RDMA_EXEC_DIR))
+    ap.add_argument("--check", action="store_true", help="exit 1 if the generated files are stale")
+    args = ap.parse_args(argv)
+    same = write_c(Path(args.out_dir), check=args.check)
+    s = build_schema()
+    print(f"[schema] {s.verb_count} verbs, {len(s.classes) - s.verb_count} attrs, hash {s.hash:#010x}")
+    if args.check and not same:
+        print("[schema] generated files are stale, run: python -m lib.exec_schema", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,105 @@
 import hashlib
-from typing import Set, Iterable, Tuple
+import zlib
+from typing import Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+from lib.gcov_reader import EDGES, CoverageSample, EdgeSpace
+
+# AFL 风格的命中次数分桶：1, 2, 3, 4-7, 8-15, 16-31, 32-127, 128+ 各占一位
+_BUCKET_EDGES = [1, 2, 3, 4, 8, 16, 32, 128]
+_BUCKET_LUT = np.zeros(129, dtype=np.uint8)
+for _bit, _lo in enumerate(_BUCKET_EDGES):
+    _BUCKET_LUT[_lo:] = 1 << _bit
+
+
+def classify_counts(counts: np.ndarray) -> np.ndarray:
+    """命中次数 -> 桶位（uint8，0 表示没命中）。"""
+    return _BUCKET_LUT[np.minimum(counts, 128).astype(np.intp)]
+
+
+class CoverageMap:
+    """全局覆盖图：bits[edge id] 是这条边见过的所有桶位的并集，随 EdgeSpace 增长。"""
+
+    def __init__(self, bits: Optional[np.ndarray] = None):
+        self.bits = np.zeros(0, dtype=np.uint8) if bits is None else bits
+
+    def _reserve(self, n: int) -> None:
+        if n > len(self.bits):
+            grown = np.zeros(max(n, 2 * len(self.bits)), dtype=np.uint8)
+            grown[: len(self.bits)] = self.bits
+            self.bits = grown
+
+    def merge(self, ids: np.ndarray, buckets: np.ndarray) -> Tuple[int, int]:
+        """并入一次运行（ids 不重复、buckets 非 0），返回 (新边数, 出现新桶位的边数)。"""
+        if not len(ids):
+            return 0, 0
+        self._reserve(int(ids.max()) + 1)
+        seen = self.bits[ids]
+        fresh = buckets & ~seen
+        self.bits[ids] = seen | buckets
+        return int(np.count_nonzero(seen == 0)), int(np.count_nonzero(fresh))
+
+    def covered(self) -> int:
+        return int(np.count_nonzero(self.bits))
+
+    def to_bytes(self) -> bytes:
+        return np.trim_zeros(self.bits, "b").tobytes()
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "CoverageMap":
+        return cls(np.frombuffer(blob, dtype=np.uint8).copy())
+
+
+def pack_ids(ids: np.ndarray) -> bytes:
+    """一组边编号 -> zlib(packbits(位图))，种子覆盖的持久化格式。"""
+    if not len(ids):
+        return zlib.compress(b"")
+    bitmap = np.zeros(int(ids.max()) + 1, dtype=bool)
+    bitmap[ids] = True
+    return zlib.compress(np.packbits(bitmap, bitorder="little").tobytes())
+
+
+def unpack_ids(blob: bytes) -> np.ndarray:
+    bits = np.unpackbits(np.frombuffer(zlib.decompress(blob), dtype=np.uint8), bitorder="little")
+    return np.flatnonzero(bits).astype(np.int64)
+
 
 class FingerprintManager:
-    def __init__(self):
-        self.cov_hashes: Set[int] = set()
+    """
+    覆盖：边先映射到 EdgeSpace 的稠密编号（gcov 读出来的本来就是编号；字符串边每个 key 只 intern 一次），
+    一次运行和全局覆盖图的比较是向量化的 new & ~global，不再逐条 sha256。
+    语义签名量小，仍用哈希集合。
+    """
+
+    def __init__(self, space: EdgeSpace = EDGES):
+        self.space = space
+        self.cov = CoverageMap()
         self.sem_hashes: Set[int] = set()
+        self.last_covered = np.zeros(0, dtype=np.int64)  # 最近一次运行命中的边编号
+        self.last_new_buckets = 0
 
     @staticmethod
     def hash_item(item: str) -> int:
         h = hashlib.sha256(item.encode("utf-8")).digest()
         return int.from_bytes(h[:8], "little")  # 取前 8 字节做哈希值
 
-    def update_coverage(self, edges: Iterable[str]) -> int:
-        new_count = 0
-        for edge in edges:
-            h = self.hash_item(edge)
-            if h not in self.cov_hashes:
-                self.cov_hashes.add(h)
-                new_count += 1
+    def _as_sample(self, edges) -> Tuple[np.ndarray, np.ndarray]:
+        if isinstance(edges, CoverageSample):
+            # 同一个 gcda 里的边编号不会重复
+            return edges.ids, classify_counts(edges.counts)
+        if isinstance(edges, np.ndarray):
+            ids = np.unique(edges.astype(np.int64, copy=False))
+        else:
+            ids = np.unique(np.fromiter((self.space.intern_key(e) for e in edges), dtype=np.int64))
+        return ids, np.ones(len(ids), dtype=np.uint8)
+
+    def update_coverage(self, edges) -> int:
+        """edges：CoverageSample、边编号数组或字符串边的集合。返回新覆盖的边数。"""
+        ids, buckets = self._as_sample(edges)
+        hit = np.flatnonzero(buckets)
+        self.last_covered = ids[hit]
+        new_count, self.last_new_buckets = self.cov.merge(self.last_covered, buckets[hit])
         return new_count
 
     def update_semantics(self, sems: Iterable[str]) -> int:
@@ -29,7 +111,21 @@ class FingerprintManager:
                 new_count += 1
         return new_count
 
-    def diff(self, edges: Iterable[str], sems: Iterable[str]) -> Tuple[int, int]:
+    def diff(self, edges, sems: Iterable[str]) -> Tuple[int, int]:
         cov_new = self.update_coverage(edges)
         sem_new = self.update_semantics(sems)
         return cov_new, sem_new
+
+    # ---------- 持久化 ----------
+
+    def state(self) -> Tuple[bytes, bytes]:
+        """(EdgeSpace 键表, 全局覆盖图)，存进 corpus 的 kv 表。"""
+        return self.space.dumps(), self.cov.to_bytes()
+
+    def load_state(self, space_blob: Optional[bytes], cov_blob: Optional[bytes]) -> bool:
+        """恢复上次的编号和全局覆盖；本进程已经分配过编号时不恢复（编号会对不上）。"""
+        if not space_blob or not self.space.loads(space_blob):
+            return False
+        if cov_blob:
+            self.cov = CoverageMap.from_bytes(cov_blob)
+        return True
@@ -0,0 +1,289 @@
+# lib/forkserver.py
+# -*- coding: utf-8 -*-
+"""
+rdma_exec 的 fork-server 驱动：
+- 常驻一个 `rdma_exec --fork-server [device]` 进程，设备只打开一次；每个测试用例由它 fork 子进程执行
+- 程序以 program JSON（json_utils.export_verbs_to_program_json）通过 stdin 发给它，协议见 rdma_exec/rdma_executor.c
+- 不再需要写 client.cpp / make SAN=asan / 启动新 client，单个用例的开销只剩 fork + 执行
+- ForkServerRunner.run() 返回与 runexec.build_and_run() 相同的字典，可直接喂给 execute_and_collect(raw)
+
+覆盖率与 dmesg 的收集函数可以注入（coverage_fn / dmesg_fn / reset_fn），默认沿用 runexec 里的
+feed_back / collect_latest_dmesg / reset_coverage（每个用例前清零 gcda，覆盖只算这一个用例的）；
+测试里用一个说同样协议的桩程序代替 rdma_exec，不需要 RDMA 硬件。
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import signal
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+RDMA_EXEC = Path(__file__).resolve().parent.parent / "rdma_exec" / "rdma_exec"
+
+
+class ForkServerError(RuntimeError):
+    pass
+
+
+def _signal_name(signo: int) -> str:
+    try:
+        return signal.Signals(signo).name
+    except ValueError:
+        return f"SIG{signo}"
+
+
+class ForkServerRunner:
+    def __init__(
+        self,
+        argv: Optional[Sequence[str]] = None,
+        device: Optional[str] = None,
+        workdir: Union[str, os.PathLike] = "./repo",
+        timeout_ms: int = 10000,
+        start_timeout_s: float = 10.0,
+        coverage_fn: Optional[Callable[[], Any]] = None,
+        dmesg_fn: Optional[Callable[[], str]] = None,
+        binary: bool = False,
+        reset_fn: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        argv:       启动命令，默认 [rdma_exec/rdma_exec, --fork-server, device]
+        workdir:    每个用例的 stdout / stderr 日志目录（路径中不能有空白，协议按空白分隔）
+        timeout_ms: 单个用例的执行超时，超时由 fork-server 端 SIGKILL，结果记为 error
+        binary:     run(verbs) 时用 exec_schema.encode_program 的二进制编码代替 program JSON
+        reset_fn:   每个用例执行前调用；不传时只有 coverage_fn 也用默认值才用 runexec.reset_coverage
+        """
+        if argv is None:
+            argv = [str(RDMA_EXEC), "--fork-server"] + ([device] if device else [])
+        self.argv = list(argv)
+        self.workdir = Path(workdir)
+        self.timeout_ms = int(timeout_ms)
+        self.start_timeout_s = start_timeout_s
+        self.coverage_fn = coverage_fn
+        self.dmesg_fn = dmesg_fn
+        self.reset_fn = reset_fn
+        self.binary = binary
+        self.proc: Optional[subprocess.Popen] = None
+        self.server_pid: Optional[int] = None
+        self.restarts = 0
+        self._seq = 0
+        self._server_log = None
+
+    # ---------- 进程管理 ----------
+
+    def start(self) -> "ForkServerRunner":
+        if self.alive():
+            return self
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        if any(c.isspace() for c in str(self.workdir)):
+            raise ValueError(f"workdir must not contain whitespace: {self.workdir}")
+        if self._server_log is None:
+            self._server_log = open(self.workdir / "forkserver.stderr.log", "ab")
+        self.proc = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._server_log,
+            bufsize=0,
+        )
+        line = self._readline(self.start_timeout_s)
+        if not line or not line.startswith("READY"):
+            self._kill()
+            raise ForkServerError(f"fork-server did not become ready: {line!r}")
+        parts = line.split()
+        self.server_pid = int(parts[1]) if len(parts) > 1 else self.proc.pid
+        return self
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def close(self) -> None:
+        if self.proc is not None:
+            if self.alive():
+                try:
+                    self.proc.stdin.write(b"QUIT\n")
+                    self.proc.stdin.flush()
+                    self.proc.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+            self._kill()
+        if self._server_log is not None:
+            self._server_log.close()
+            self._server_log = None
+
+    def _kill(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        for f in (proc.stdin, proc.stdout):
+            if f is not None:
+                f.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _readline(self, timeout_s: float) -> Optional[str]:
+        """带超时地从控制通道读一行（stdout 无缓冲，逐字节读，行很短）。"""
+        fd = self.proc.stdout.fileno()
+        deadline = time.monotonic() + timeout_s
+        buf = bytearray()
+        while True:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], left)
+            if not ready:
+                return None
+            ch = os.read(fd, 1)
+            if not ch:
+                return None  # EOF：fork-server 退出了
+            if ch == b"\n":
+                return buf.decode("utf-8", "replace")
+            buf += ch
+
+    # ---------- 执行 ----------
+
+    def run_program(self, program: Union[str, bytes], tag: Optional[str] = None) -> Dict[str, Any]:
+        """
+        执行一个 program JSON（或二进制程序），返回 fork-server 的原始回执：
+        {exit_code, signal, runtime_us, timed_out, stdout_path, stderr_path, error}
+        fork-server 挂掉时自动重启一次并记为 error。
+        """
+        self._seq += 1
+        tag = tag or f"{self._seq:06d}"
+        out_path = (self.workdir / f"{tag}.fs.stdout.log").resolve()
+        err_path = (self.workdir / f"{tag}.fs.stderr.log").resolve()
+        if any(c.isspace() for c in f"{tag}{out_path}{err_path}"):
+            raise ValueError(f"tag / log paths must not contain whitespace: {tag!r}")
+        payload = program.encode("utf-8") if isinstance(program, str) else bytes(program)
+        res: Dict[str, Any] = {
+            "exit_code": None,
+            "signal": 0,
+            "runtime_us": 0,
+            "timed_out": False,
+            "stdout_path": str(out_path),
+            "stderr_path": str(err_path),
+            "error": None,
+        }
+
+        self.start()
+        header = f"RUN {tag} {len(payload)} {self.timeout_ms} {out_path} {err_path}\n".encode()
+        try:
+            self.proc.stdin.write(header + payload)
+            self.proc.stdin.flush()
+        except OSError as e:
+            res["error"] = f"fork-server write failed: {e}"
+            self._restart()
+            return res
+
+        # 子进程超时由服务端处理，这里只防服务端本身卡死
+        line = self._readline(self.timeout_ms / 1000.0 + self.start_timeout_s)
+        parts = line.split() if line else []
+        if len(parts) != 6 or parts[0] != "DONE" or parts[1] != tag:
+            res["error"] = f"unexpected fork-server reply: {line!r}"
+            self._restart()
+            return res
+
+        res["exit_code"] = int(parts[2]) if int(parts[3]) == 0 else None
+        res["signal"] = int(parts[3])
+        res["runtime_us"] = int(parts[4])
+        res["timed_out"] = parts[5] == "1"
+        return res
+
+    def _restart(self) -> None:
+        self._kill()
+        self.restarts += 1
+        try:
+            self.start()
+        except ForkServerError:
+            pass  # 下一次 run_program 会再试
+
+    def run(self, verbs: Union[str, bytes, List[Any]], tag: Optional[str] = None, **meta) -> Dict[str, Any]:
+        """
+        执行 verbs（或现成的 program JSON / 二进制程序），返回与 runexec.build_and_run() 相同的字典：
+        outcome / runtime_ms / coverage_edges / sem_signature / verb_outcomes / crash_site / crash_reports /
+        run_index / dmesg_new，另加 detail。
+        """
+        from lib.runexec import collect_crash_reports, extract_verb_outcomes
+        from lib.sanitizer_report import USER_SOURCES, parse_report_file
+
+        if isinstance(verbs, (str, bytes)):
+            program = verbs
+        elif self.binary:
+            from lib.exec_schema import encode_program
+
+            program = encode_program(verbs, trace_id=tag, extra_meta=meta or None)
+        else:
+            from lib.json_utils import export_verbs_to_program_json
+
+            program = export_verbs_to_program_json(verbs, trace_id=tag, extra_meta=meta or None, pretty=False)
+
+        reset_fn = self.reset_fn
+        if reset_fn is None and self.coverage_fn is None:
+            from lib.runexec import reset_coverage as reset_fn
+        if reset_fn is not None:
+            reset_fn()
+        t0 = time.time()
+        res = self.run_program(program, tag=tag)
+
+        out_path, err_path = res["stdout_path"], res["stderr_path"]
+        outcomes = extract_verb_outcomes(out_path) if os.path.exists(out_path) else None
+        user_reports = parse_report_file(err_path) if os.path.exists(err_path) else []
+        user_reports = [r for r in user_reports if r.source in USER_SOURCES]
+        crash_site = user_reports[0].site if user_reports else None
+
+        detail = None
+        if res["error"]:
+            outcome, detail = "error", res["error"]
+        elif res["timed_out"]:
+            outcome, detail = "error", f"timeout after {self.timeout_ms} ms"
+        elif crash_site:
+            outcome = "crash"
+        elif res["signal"]:
+            # 没有 ASan 报告但被信号杀死（SIGSEGV 等）
+            outcome = "crash"
+            crash_site = f"sig#{_signal_name(res['signal'])}"
+        else:
+            outcome = "ok"
+            if res["exit_code"]:
+                detail = f"exit code {res['exit_code']}"
+
+        if outcome == "crash":
+            print(f"[!] Crash detected, site: {crash_site}")
+
+        coverage_fn, dmesg_fn = self.coverage_fn, self.dmesg_fn
+        if coverage_fn is None or dmesg_fn is None:
+            from lib import runexec
+
+            coverage_fn = coverage_fn or runexec.feed_back
+            dmesg_fn = dmesg_fn or runexec.collect_latest_dmesg
+
+        coverage_edges = coverage_fn()
+        dmesg_new = dmesg_fn()
+        reports = collect_crash_reports(user_reports, dmesg_new)
+        if reports and not crash_site and outcome == "ok":
+            # client 没报错，内核里有 KASAN / WARNING / BUG
+            outcome, crash_site = "crash", reports[0].site
+            print(f"[!] Kernel report, site: {crash_site}")
+
+        return {
+            "outcome": outcome,
+            "runtime_ms": int((time.time() - t0) * 1000),
+            "coverage_edges": coverage_edges,
+            "sem_signature": outcomes.signature() if outcomes else set(),
+            "verb_outcomes": outcomes.as_list() if outcomes else [],
+            "crash_site": crash_site,
+            "crash_reports": [r.to_dict() for r in reports],
+            "run_index": tag,
+            "dmesg_new": dmesg_new,
+            "detail": detail,
+        }
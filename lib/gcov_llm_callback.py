@@ -1,6 +1,8 @@
+import heapq
 import json
+import os
 import random
-from typing import List, Optional
+from typing import Dict, List, Mapping, Optional, Set
 
 
 def load_coverage_data(file_path: str) -> dict:
@@ -77,6 +79,138 @@ def extract_zero_coverage_functions(coverage_data: dict, target_functions: set)
     return zero_coverage_funcs
 
 
+class UncoveredFunctionIndex:
+    """
+    常驻内存的未覆盖函数索引，代替每次 exec 都重新读覆盖率 JSON 和函数列表：
+    - 函数列表（user.txt / kernel.txt）只读一次
+    - 未覆盖 = 在函数列表里、出现在覆盖数据里、且从未执行过（和 extract_zero_coverage_functions 的口径一致）
+    - update() 用一次运行里变化的函数计数增量更新（runexec.feed_back 从 GcovSource 喂进来）；
+      没被喂过时（fastcov 模式）覆盖率 JSON 的 mtime 变了才整体重建
+    - count() / pick() 是 O(1)：未覆盖集合用 list + 下标表，删除时和末尾交换；
+      pick(ranked=True) 按函数列表里的顺序取最靠前的（堆，惰性删除）
+    """
+
+    def __init__(self, function_list_path: str, coverage_path: Optional[str] = None):
+        self.function_list_path = function_list_path
+        self.coverage_path = coverage_path
+        self._targets: Optional[Dict[str, int]] = None  # 函数名 -> 在列表里的位置
+        self._covered: Set[str] = set()
+        self._items: List[str] = []
+        self._pos: Dict[str, int] = {}
+        self._heap: List[tuple] = []
+        self._json_mtime = None
+        self.fed = False
+
+    @property
+    def targets(self) -> Dict[str, int]:
+        if self._targets is None:
+            # 和 load_function_list 一样的读法，但保留文件里的顺序（pick(ranked=True) 用）
+            order: Dict[str, int] = {}
+            with open(self.function_list_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    name = line.strip()
+                    if name and name not in order:
+                        order[name] = len(order)
+            print(f"[+] 加载了 {len(order)} 个函数名: {self.function_list_path}")
+            self._targets = order
+        return self._targets
+
+    def _add(self, name: str) -> None:
+        if name in self._pos:
+            return
+        self._pos[name] = len(self._items)
+        self._items.append(name)
+        heapq.heappush(self._heap, (self.targets[name], name))
+
+    def _remove(self, name: str) -> None:
+        i = self._pos.pop(name, None)
+        if i is None:
+            return
+        last = self._items.pop()
+        if i < len(self._items):
+            self._items[i] = last
+            self._pos[last] = i
+
+    def update(self, counts: Mapping[str, int]) -> int:
+        """counts：函数名 -> 这次的执行计数。返回新覆盖的目标函数数。"""
+        self.fed = True
+        targets = self.targets
+        newly = 0
+        for name, c in counts.items():
+            if name not in targets or name in self._covered:
+                continue
+            if c:
+                self._covered.add(name)
+                self._remove(name)
+                newly += 1
+            else:
+                self._add(name)
+        return newly
+
+    def _reset(self) -> None:
+        self._covered.clear()
+        self._items.clear()
+        self._pos.clear()
+        self._heap.clear()
+
+    def _sync(self) -> None:
+        if self.fed or not self.coverage_path:
+            return
+        try:
+            mtime = os.stat(self.coverage_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._json_mtime:
+            return
+        data = load_coverage_data(self.coverage_path)
+        self._json_mtime = mtime
+        self._reset()
+        counts: Dict[str, int] = {}
+        for source_data in data.get("sources", {}).values():
+            for file_data in source_data.values():
+                for name, info in file_data.get("functions", {}).items():
+                    counts[name] = counts.get(name, 0) + int(info.get("execution_count", 0))
+        self.update(counts)
+        self.fed = False
+
+    def count(self) -> int:
+        self._sync()
+        return len(self._items)
+
+    def all(self) -> List[str]:
+        self._sync()
+        return sorted(self._items)
+
+    def pick(self, ranked: bool = False, rng: Optional[random.Random] = None) -> Optional[str]:
+        self._sync()
+        if not self._items:
+            return None
+        if not ranked:
+            return (rng or random).choice(self._items)
+        while self._heap[0][1] not in self._pos:
+            heapq.heappop(self._heap)
+        return self._heap[0][1]
+
+
+DEFAULT_COVERAGE_PATHS = {"user": "/home/user_coverage.json", "kernel": "/home/kernel_coverage.json"}
+DEFAULT_LIST_PATHS = {"user": "user.txt", "kernel": "kernel.txt"}
+INDEXES: Dict[str, UncoveredFunctionIndex] = {}
+
+
+def get_index(space: str) -> UncoveredFunctionIndex:
+    space = space.lower()
+    if space not in DEFAULT_LIST_PATHS:
+        raise ValueError(f"space 参数必须是 'user' 或 'kernel'，当前值为 '{space}'")
+    if space not in INDEXES:
+        INDEXES[space] = UncoveredFunctionIndex(DEFAULT_LIST_PATHS[space], DEFAULT_COVERAGE_PATHS[space])
+    return INDEXES[space]
+
+
+def _use_index(*paths) -> bool:
+    # 显式给了路径的调用（脚本 / 调试）仍然走原来直接读文件的逻辑
+    return all(p is None for p in paths)
+
+
 def get_all_uncovered_functions(
     space: str = "user",
     user_coverage_path: Optional[str] = None,
@@ -163,6 +297,18 @@ def get_random_uncovered_function(
     Returns:
         Optional[str]: 随机选择的未覆盖函数名，如果没有则返回None
     """
+    if _use_index(user_coverage_path, kernel_coverage_path, user_list_path, kernel_list_path):
+        try:
+            func = get_index(space).pick()
+        except Exception as e:
+            print(f"[-] 处理过程中出错: {e}")
+            return None
+        if func is None:
+            print("[-] 没有找到execution_count为0的目标函数")
+        else:
+            print(f"[+] 随机选择函数: {func}")
+        return func
+
     if user_coverage_path is None:
         user_coverage_path = "/home/user_coverage.json"
     if kernel_coverage_path is None:
@@ -229,6 +375,13 @@ def get_all_uncovered_functions(
     Returns:
         List[str]: 所有未覆盖函数名列表
     """
+    if _use_index(user_coverage_path, kernel_coverage_path, user_list_path, kernel_list_path):
+        try:
+            return get_index(space).all()
+        except Exception as e:
+            print(f"[-] 处理过程中出错: {e}")
+            return []
+
     if user_coverage_path is None:
         user_coverage_path = "/home/user_coverage.json"
     if kernel_coverage_path is None:
@@ -281,6 +434,16 @@ def get_uncovered_function_count(
     Returns:
         int: 未覆盖函数的数量
     """
+    if _use_index(user_coverage_path, kernel_coverage_path, user_list_path, kernel_list_path):
+        try:
+            index = get_index(space)
+            count = index.count()
+        except Exception as e:
+            print(f"[-] 统计过程中出错: {e}")
+            return 0
+        print(f"[+] {space} 未覆盖函数数量: {count} / {len(index.targets)}")
+        return count
+
     if user_coverage_path is None:
         user_coverage_path = "/home/user_coverage.json"
     if kernel_coverage_path is None:
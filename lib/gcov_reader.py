@@ -0,0 +1,504 @@
+# lib/gcov_reader.py
+# -*- coding: utf-8 -*-
+"""
+进程内读取 gcda / gcno，代替每次 exec 都起 fastcov.py（再起 gcov、写 JSON、json.load）：
+- parse_gcda：FUNCTION / ARC_COUNTS 记录直接 np.frombuffer 成 uint64 计数数组，不经过行号
+- parse_gcno：只取每个函数的名字、源文件、起始行（命名、include/exclude 过滤、未覆盖函数统计用）
+- EdgeSpace：(对象文件, 函数 ident + cfg_checksum, arc 下标) -> 稠密 int 编号；函数重新编译（cfg 变了）得到新编号
+- GcovSource：一组 glob（用户态 build 目录或 /sys/kernel/debug/gcov 树），按 (mtime, size) 只重读变了的文件；
+  debugfs 文件 size 恒为 0、mtime 不变，这类文件每次都读
+- GcovSource.reset()：每次运行前清零计数（删用户态 gcda / 写 debugfs gcda），read() 只反映这一次运行
+- 同时支持 GCC 12+（记录长度按字节、全零计数写负长度）和更早的按 4 字节字长的格式
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+GCDA_MAGIC = 0x67636461  # "gcda"
+GCNO_MAGIC = 0x67636E6F  # "gcno"
+TAG_FUNCTION = 0x01000000
+TAG_ARC_COUNTS = 0x01A10000
+
+# 每个 GcovSource 按 gcda 所在目录分片，分片在线程池里并行读（读 debugfs 时大部分时间在内核里，不占 GIL）
+WORKERS = int(os.environ.get("RDMA_FUZZ_COVERAGE_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+_EMPTY_IDS = np.zeros(0, dtype=np.int64)
+_EMPTY_COUNTS = np.zeros(0, dtype=np.uint64)
+
+
+class GcovFormatError(ValueError):
+    pass
+
+
+def gcov_major(version: int) -> int:
+    """版本字 "B22*"（GCC 12.2）/ "A93*"（9.3）/ "408*"（4.8）-> GCC 主版本。"""
+    b0, b1 = (version >> 24) & 0xFF, (version >> 16) & 0xFF
+    if b0 >= ord("A"):
+        return (b0 - ord("A")) * 10 + (b1 - ord("0"))
+    return b0 - ord("0")
+
+
+class _Reader:
+    def __init__(self, data: bytes, magic: int):
+        if len(data) < 12:
+            raise GcovFormatError("truncated header")
+        self.data = data
+        if struct.unpack_from("<I", data, 0)[0] == magic:
+            self.endian = "<"
+        elif struct.unpack_from(">I", data, 0)[0] == magic:
+            self.endian = ">"
+        else:
+            raise GcovFormatError("bad magic")
+        self.pos = 4
+        self.version = self.u32()
+        self.major = gcov_major(self.version)
+        self.unit = 1 if self.major >= 12 else 4  # 记录长度的单位（字节）
+        self.stamp = self.u32()
+
+    def u32(self) -> int:
+        v = struct.unpack_from(self.endian + "I", self.data, self.pos)[0]
+        self.pos += 4
+        return v
+
+    def string(self) -> str:
+        n = self.u32()
+        size = n if self.major >= 12 else 4 * n  # GCC 12 起字符串长度按字节且不补齐
+        raw = self.data[self.pos : self.pos + size]
+        self.pos += size
+        return raw.split(b"\0", 1)[0].decode("utf-8", "replace")
+
+    def records(self):
+        """(tag, 负长度=全零, 字节长度, 数据起点)；调用方可以在记录内部自由移动 pos。"""
+        end = len(self.data)
+        while self.pos + 8 <= end:
+            tag = self.u32()
+            length = struct.unpack_from(self.endian + "i", self.data, self.pos)[0]
+            self.pos += 4
+            zero = length < 0
+            size = -length * self.unit if zero else length * self.unit
+            start = self.pos
+            if zero and tag == TAG_ARC_COUNTS:
+                # 全零计数只有长度没有数据
+                yield tag, True, size, start
+                self.pos = start
+                continue
+            if start + size > end:
+                raise GcovFormatError(f"record {tag:#x} overruns file")
+            yield tag, False, size, start
+            self.pos = start + size
+
+
+class GcdaFile:
+    """
+    一个 gcda：keys[i] = (ident, lineno_checksum, cfg_checksum)，
+    第 i 个函数的计数是 counts[offsets[i]:offsets[i+1]]。
+    """
+
+    __slots__ = ("version", "stamp", "keys", "offsets", "counts")
+
+    def __init__(self, version: int, stamp: int, keys, offsets: np.ndarray, counts: np.ndarray):
+        self.version = version
+        self.stamp = stamp
+        self.keys = keys
+        self.offsets = offsets
+        self.counts = counts
+
+
+def parse_gcda(data: bytes) -> GcdaFile:
+    r = _Reader(data, GCDA_MAGIC)
+    if r.major >= 12:
+        r.u32()  # checksum
+    dtype = np.dtype(r.endian + "u8") if r.endian == "<" else None
+    keys: List[Tuple[int, int, int]] = []
+    sizes: List[int] = []
+    chunks: List[np.ndarray] = []
+    cur: Optional[Tuple[int, int, int]] = None
+    for tag, zero, size, start in r.records():
+        if tag == TAG_FUNCTION:
+            # 长度为 0 的 FUNCTION 是占位（函数没被链接进来）
+            cur = (r.u32(), r.u32(), r.u32()) if size >= 12 else None
+        elif tag == TAG_ARC_COUNTS and cur is not None:
+            n = size // 8
+            if zero:
+                arr = np.zeros(n, dtype=np.uint64)
+            elif dtype is not None:
+                # 每个计数是 (lo, hi) 两个 u32，小端下正好就是一个 u64
+                arr = np.frombuffer(data, dtype=dtype, count=n, offset=start).astype(np.uint64, copy=False)
+            else:
+                words = np.frombuffer(data, dtype=">u4", count=2 * n, offset=start).astype(np.uint64)
+                arr = words[0::2] | (words[1::2] << np.uint64(32))
+            keys.append(cur)
+            sizes.append(n)
+            chunks.append(arr)
+            cur = None
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    counts = np.concatenate(chunks) if chunks else _EMPTY_COUNTS
+    return GcdaFile(r.version, r.stamp, keys, offsets, counts)
+
+
+class GcnoFunction:
+    __slots__ = ("ident", "name", "source", "lineno")
+
+    def __init__(self, ident: int, name: str, source: str, lineno: int):
+        self.ident = ident
+        self.name = name
+        self.source = source
+        self.lineno = lineno
+
+
+def parse_gcno(data: bytes) -> Dict[int, GcnoFunction]:
+    """ident -> 函数信息；相对路径的源文件按 gcno 里记录的 cwd 补全。"""
+    r = _Reader(data, GCNO_MAGIC)
+    if r.major >= 12:
+        r.u32()  # checksum
+    cwd = r.string() if r.major >= 9 else ""
+    if r.major >= 8:
+        r.u32()  # has_unexecuted_blocks
+    out: Dict[int, GcnoFunction] = {}
+    for tag, _, size, start in r.records():
+        if tag != TAG_FUNCTION or size < 12:
+            continue
+        ident, _, _ = r.u32(), r.u32(), r.u32()
+        name = r.string()
+        if r.major >= 8:
+            r.u32()  # artificial
+        source = r.string()
+        lineno = r.u32()
+        if cwd and source and not os.path.isabs(source):
+            source = os.path.normpath(os.path.join(cwd, source))
+        out[ident] = GcnoFunction(ident, name, source, lineno)
+    return out
+
+
+class EdgeSpace:
+    """
+    (对象文件, 函数, arc) 的稠密编号。函数按首次出现的顺序分配一段连续编号。
+    其它来源的字符串边（fastcov 的 "file:line"、测试里注入的边）用 intern_key 各占一个编号。
+    编号只在进程内稳定；跨进程要先 loads() 上次 dumps() 的键表，按同样顺序重建。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()  # GcovSource 的分片线程并发 intern
+        self._base: Dict[Tuple[str, int, int], int] = {}
+        self._funcs: List[Tuple[int, str, int, int, int, str]] = []  # (base, obj, ident, cfg, n_arcs, 名字)
+        self._bases: Optional[np.ndarray] = None
+        self.size = 0
+
+    def intern(self, obj: str, ident: int, cfg_checksum: int, n_arcs: int, name: str = "") -> int:
+        key = (obj, ident, cfg_checksum)
+        base = self._base.get(key)
+        if base is None:
+            with self._lock:
+                base = self._base.get(key)
+                if base is None:
+                    base = self.size
+                    self._funcs.append((base, obj, ident, cfg_checksum, n_arcs, name or f"fn{ident}"))
+                    self._base[key] = base
+                    self.size += n_arcs
+                    self._bases = None
+        return base
+
+    def intern_key(self, key: str) -> int:
+        return self.intern(key, -1, 0, 1, key)
+
+    def describe(self, edge_id: int) -> Tuple[str, str, int]:
+        """编号 -> (对象文件, 函数名, arc 下标)"""
+        bases = self._bases
+        if bases is None or len(bases) != len(self._funcs):
+            funcs = list(self._funcs)
+            bases = self._bases = np.fromiter((f[0] for f in funcs), dtype=np.int64, count=len(funcs))
+        i = int(np.searchsorted(bases, edge_id, side="right")) - 1
+        base, obj, _, _, _, name = self._funcs[i]
+        return obj, name, int(edge_id) - base
+
+    def names(self, ids: Iterable[int]) -> List[str]:
+        out = []
+        for obj, name, arc in map(self.describe, ids):
+            out.append(obj if name == obj else f"{obj}:{name}#{arc}")
+        return out
+
+    def dumps(self) -> bytes:
+        with self._lock:
+            funcs = list(self._funcs)
+        return json.dumps([f[1:] for f in funcs], separators=(",", ":")).encode()
+
+    def loads(self, blob: bytes) -> bool:
+        """按 dumps() 的键表重建编号；只能在还没分配过编号时恢复。"""
+        if self.size or not blob:
+            return False
+        for obj, ident, cfg, n_arcs, name in json.loads(blob):
+            self.intern(obj, ident, cfg, n_arcs, name)
+        return True
+
+
+EDGES = EdgeSpace()
+
+
+class CoverageSample:
+    """一次读取的结果：ids[i] 是 counts[i] 对应的边编号（EdgeSpace）。"""
+
+    __slots__ = ("ids", "counts")
+
+    def __init__(self, ids: np.ndarray, counts: np.ndarray):
+        self.ids = ids
+        self.counts = counts
+
+    def covered(self) -> np.ndarray:
+        return self.ids[self.counts > 0]
+
+    @classmethod
+    def concat(cls, samples: Sequence["CoverageSample"]) -> "CoverageSample":
+        if not samples:
+            return cls(_EMPTY_IDS, _EMPTY_COUNTS)
+        return cls(np.concatenate([s.ids for s in samples]), np.concatenate([s.counts for s in samples]))
+
+
+_ERROR = ("error",)
+
+
+class GcovSource:
+    """
+    patterns：gcda 的 glob 列表。include / exclude：按函数源文件路径前缀过滤（对应 fastcov 的 -i / -e），
+    需要同目录的 gcno；没有 gcno 时不过滤，函数名用 fn<ident>。
+    workers > 1 时按目录分片并行读；同一目录（同一组 gcno）只由一个线程处理。
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[str],
+        include: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        space: EdgeSpace = EDGES,
+        name: str = "",
+        workers: int = WORKERS,
+    ):
+        self.patterns = list(patterns)
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.space = space
+        self.name = name
+        self.workers = max(1, int(workers))
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._last_parsed: List[str] = []
+        # gcda 路径 -> (签名, ids, counts, 函数表)
+        self._files: Dict[str, tuple] = {}
+        self._gcno: Dict[str, Tuple[tuple, Dict[int, GcnoFunction]]] = {}
+        self._summary_key = None
+        # reset() 之前的运行累计下来的函数计数；function_counts() = 累计 + 当前 gcda
+        self._func_totals: Dict[Tuple[str, str], int] = {}
+        self._func_lines: Dict[Tuple[str, str], int] = {}
+        self.stats = {
+            "files": 0,
+            "parsed": 0,
+            "cached": 0,
+            "errors": 0,
+            "last_ms": 0.0,
+            "resets": 0,
+            "reset_errors": 0,
+            "shards": 0,
+        }
+
+    def paths(self) -> List[str]:
+        out = set()
+        for pat in self.patterns:
+            out.update(glob.glob(pat))
+        return sorted(out)
+
+    @staticmethod
+    def _signature(st: os.stat_result):
+        # debugfs / sysfs 的 gcov 文件 size 为 0，没法判断变没变
+        return None if st.st_size == 0 else (st.st_mtime_ns, st.st_size)
+
+    def _functions(self, gcda_path: str) -> Dict[int, GcnoFunction]:
+        gcno = gcda_path[: -len(".gcda")] + ".gcno"
+        try:
+            st = os.stat(gcno)
+        except OSError:
+            return {}
+        sig = (st.st_mtime_ns, st.st_size)
+        hit = self._gcno.get(gcno)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        try:
+            with open(gcno, "rb") as f:
+                funcs = parse_gcno(f.read())
+        except (OSError, GcovFormatError, struct.error):
+            funcs = {}
+        self._gcno[gcno] = (sig, funcs)
+        return funcs
+
+    def _wanted(self, fn: Optional[GcnoFunction]) -> bool:
+        if fn is None or not (self.include or self.exclude):
+            return True
+        src = fn.source
+        if self.include and not src.startswith(self.include):
+            return False
+        return not (self.exclude and src.startswith(self.exclude))
+
+    def _load(self, path: str):
+        with open(path, "rb") as f:
+            gcda = parse_gcda(f.read())
+        obj = path[: -len(".gcda")]
+        funcs = self._functions(path)
+        ids: List[np.ndarray] = []
+        keep: List[np.ndarray] = []
+        table = []  # (函数信息或 None, 在本文件 ids/counts 里的起止)
+        pos = 0
+        for i, (ident, _, cfg) in enumerate(gcda.keys):
+            fn = funcs.get(ident)
+            if not self._wanted(fn):
+                continue
+            lo, hi = int(gcda.offsets[i]), int(gcda.offsets[i + 1])
+            base = self.space.intern(obj, ident, cfg, hi - lo, fn.name if fn else "")
+            ids.append(np.arange(base, base + hi - lo, dtype=np.int64))
+            keep.append(np.arange(lo, hi, dtype=np.int64))
+            table.append((fn, pos, pos + hi - lo))
+            if fn is not None:
+                self._func_lines[(fn.source, fn.name)] = fn.lineno
+            pos += hi - lo
+        if not ids:
+            return _EMPTY_IDS, _EMPTY_COUNTS, table
+        counts = gcda.counts[np.concatenate(keep)] if len(keep) != len(gcda.keys) else gcda.counts
+        return np.concatenate(ids), counts, table
+
+    def _read_shard(self, paths: List[str]) -> List[Tuple[str, Optional[tuple]]]:
+        """一个目录里的 gcda：(路径, 新条目)；条目为 None 表示没变，_ERROR 表示读失败。"""
+        out = []
+        for path in paths:
+            try:
+                sig = self._signature(os.stat(path))
+            except OSError:
+                continue
+            hit = self._files.get(path)
+            if hit is not None and sig is not None and hit[0] == sig:
+                out.append((path, None))
+                continue
+            try:
+                out.append((path, (sig,) + self._load(path)))
+            except (OSError, GcovFormatError, struct.error):
+                out.append((path, _ERROR))
+        return out
+
+    def read(self) -> CoverageSample:
+        t0 = time.perf_counter()
+        paths = self.paths()
+        seen = set(paths)
+        for stale in [p for p in self._files if p not in seen]:
+            del self._files[stale]
+        shards: Dict[str, List[str]] = {}
+        for path in paths:
+            shards.setdefault(os.path.dirname(path), []).append(path)
+        jobs = list(shards.values())
+        if self.workers > 1 and len(jobs) > 1:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"gcov-{self.name}")
+            results = list(self._pool.map(self._read_shard, jobs))
+        else:
+            results = [self._read_shard(job) for job in jobs]
+        # 分片线程只读 self._files，合并在调用方线程里做
+        self._last_parsed = []
+        for res in results:
+            for path, entry in res:
+                if entry is None:
+                    self.stats["cached"] += 1
+                elif entry is _ERROR:
+                    self.stats["errors"] += 1
+                else:
+                    self._files[path] = entry
+                    self._last_parsed.append(path)
+                    self.stats["parsed"] += 1
+        self.stats["files"] = len(self._files)
+        self.stats["shards"] = len(jobs)
+        sample = CoverageSample.concat([CoverageSample(e[1], e[2]) for e in self._files.values()])
+        self.stats["last_ms"] = (time.perf_counter() - t0) * 1000
+        return sample
+
+    # ---------- 函数级 ----------
+
+    def _current_function_counts(self, paths: Optional[Iterable[str]] = None) -> Dict[Tuple[str, str], int]:
+        entries = self._files.values() if paths is None else [self._files[p] for p in paths if p in self._files]
+        out: Dict[Tuple[str, str], int] = {}
+        for _, _, counts, table in entries:
+            for fn, lo, hi in table:
+                if fn is None:
+                    continue
+                c = int(counts[lo:hi].max()) if hi > lo else 0
+                key = (fn.source, fn.name)
+                out[key] = max(out.get(key, 0), c)
+        return out
+
+    def function_counts(self) -> Dict[Tuple[str, str], int]:
+        """
+        (源文件, 函数名) -> 最大 arc 计数（跨 reset 累加）；
+        0 当且仅当函数从未执行（所有插桩 arc 都为 0 时整张流图的流量都为 0）。
+        """
+        out = dict(self._func_totals)
+        for key, c in self._current_function_counts().items():
+            out[key] = out.get(key, 0) + c
+        return out
+
+    def changed_function_counts(self) -> Dict[Tuple[str, str], int]:
+        """最近一次 read() 重新解析过的 gcda 里的函数计数（其余文件没变，函数计数也没变）。"""
+        return self._current_function_counts(self._last_parsed)
+
+    # ---------- 清零 ----------
+
+    def reset(self) -> int:
+        """
+        运行前把计数清零，之后 read() 读到的只有这一次运行的计数。返回清掉的文件数。
+        - 普通 gcda：删掉，进程退出时 gcov 运行时重新创建（不删的话会累加进去）
+        - debugfs 的 gcda（size 0）：写任意内容即清零该文件的计数（内核 gcov 接口）
+        清零前先把当前的函数计数并入累计，未覆盖函数的统计不受影响。
+        """
+        for key, c in self._current_function_counts().items():
+            self._func_totals[key] = self._func_totals.get(key, 0) + c
+        n = 0
+        for path in self.paths():
+            try:
+                if os.stat(path).st_size == 0:
+                    with open(path, "wb") as f:
+                        f.write(b"0")
+                else:
+                    os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                self.stats["reset_errors"] += 1
+                continue
+            self._files.pop(path, None)
+            n += 1
+        self.stats["resets"] += 1
+        return n
+
+    def export_function_summary(self, path: str) -> bool:
+        """
+        写 fastcov 格式里 gcov_llm_callback 用到的那部分（sources/<src>/""/functions/<name>/execution_count），
+        只在"执行过的函数集合"变化时重写。返回是否写了。
+        """
+        if not self._last_parsed and self._summary_key is not None and os.path.exists(path):
+            return False  # 上次 read() 没有文件变化
+        counts = self.function_counts()
+        key = frozenset(k for k, c in counts.items() if c)
+        if key == self._summary_key and os.path.exists(path):
+            return False
+        sources: Dict[str, dict] = {}
+        for (src, name), c in counts.items():
+            funcs = sources.setdefault(src, {"": {"functions": {}, "lines": {}}})[""]["functions"]
+            funcs[name] = {"execution_count": c, "start_line": self._func_lines.get((src, name), 0)}
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"sources": sources}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        self._summary_key = key
+        return True
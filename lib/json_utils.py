@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 def verb_to_obj(verb: Any) -> Dict:
@@ -64,3 +64,83 @@ def export_verbs_to_program_json(
         return json.dumps(root, indent=2, sort_keys=False, ensure_ascii=False)
     else:
         return json.dumps(root, separators=(",", ":"), ensure_ascii=False)
+
+
+# ========== 无损 program JSON / JSONL（可还原为 verb 对象） ==========
+
+
+def verbs_to_program_obj(
+    verbs_list: List[Any],
+    trace_id: Optional[str] = None,
+    seed: Optional[int] = None,
+    extra_meta: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    与 export_verbs_to_program_json 结构相同，但 program 里每个元素是 verb_registry.to_state() 的无损编码：
+    {
+      "version": 2,
+      "encoding": "state",
+      "meta": { ... },
+      "program": [ {"verb": "AllocPD", "fields": {...}}, ... ]
+    }
+    """
+    from lib.verb_registry import to_state
+
+    meta: Dict[str, Any] = {}
+    if trace_id is not None:
+        meta["trace_id"] = trace_id
+    if seed is not None:
+        meta["seed"] = seed
+    if extra_meta:
+        meta.update(extra_meta)
+
+    return {
+        "version": 2,
+        "encoding": "state",
+        "meta": meta,
+        "program": [to_state(v) for v in verbs_list],
+    }
+
+
+def program_obj_to_verbs(root: Dict[str, Any]) -> List[Any]:
+    """verbs_to_program_obj 的逆操作。"""
+    from lib.verb_registry import from_dict
+
+    if root.get("encoding") != "state":
+        raise ValueError("program JSON was exported lossy (to_dict); only 'state' encoding can be loaded back")
+    return [from_dict(v) for v in root.get("program", [])]
+
+
+def dump_program_json(verbs_list: List[Any], path: str, pretty: bool = False, **kwargs) -> None:
+    root = verbs_to_program_obj(verbs_list, **kwargs)
+    with open(path, "w", encoding="utf-8") as f:
+        if pretty:
+            json.dump(root, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(root, f, separators=(",", ":"), ensure_ascii=False)
+
+
+def load_program_json(path: str) -> List[Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return program_obj_to_verbs(json.load(f))
+
+
+def append_program_jsonl(verbs_list: List[Any], path: str, **kwargs) -> None:
+    """把一个程序追加为 JSONL 的一行（每行一个完整的 program 对象）。"""
+    line = json.dumps(verbs_to_program_obj(verbs_list, **kwargs), separators=(",", ":"), ensure_ascii=False)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def iter_programs_jsonl(path: str, decode: bool = True) -> Iterator[Tuple[Dict[str, Any], Any]]:
+    """
+    流式读取 JSONL：逐行产出 (meta, verbs)；decode=False 时产出 (meta, 原始 program 对象)，
+    便于只做去重/统计而不构建 verb 对象。
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            root = json.loads(line)
+            yield root.get("meta", {}), (program_obj_to_verbs(root) if decode else root)
@@ -3,8 +3,7 @@ import os
 from datetime import datetime
 from typing import List, Optional
 
-import httpx
-from openai import OpenAI
+# openai / httpx 导入要 ~650ms，只在真正调用 LLM 时才导入（见 make_client）
 
 
 def load_config():
@@ -25,6 +24,15 @@ def load_config():
     return None, None, None
 
 
+def make_client(base_url, api_key, proxy_url=None):
+    """按需导入 openai / httpx 并构造客户端；proxy_url 为空时直连。"""
+    import httpx
+    from openai import OpenAI
+
+    http_client = None if not proxy_url else httpx.Client(proxy=proxy_url)
+    return OpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
+
+
 def fail_if_no_creds(base_url, api_key):
     if not base_url or not api_key:
         raise RuntimeError(
@@ -41,11 +49,7 @@ def gen_scaffold(
 ):
     base_url, api_key, proxy_url = load_config()
     fail_if_no_creds(base_url, api_key)
-    client = (
-        OpenAI(base_url=base_url, api_key=api_key)
-        if proxy_url is None or proxy_url == ""
-        else OpenAI(base_url=base_url, api_key=api_key, http_client=httpx.Client(proxy=proxy_url))
-    )
+    client = make_client(base_url, api_key, proxy_url)
     example_scaffold = ""
     with open("lib/scaffolds/base_connect.py", "r", encoding="utf-8") as f:
         example_scaffold = f.read()
@@ -146,11 +150,7 @@ def gen_scaffold_by_function(
 ):
     base_url, api_key, proxy_url = load_config()
     fail_if_no_creds(base_url, api_key)
-    client = (
-        OpenAI(base_url=base_url, api_key=api_key)
-        if proxy_url is None or proxy_url == ""
-        else OpenAI(base_url=base_url, api_key=api_key, http_client=httpx.Client(proxy=proxy_url))
-    )
+    client = make_client(base_url, api_key, proxy_url)
     example_scaffold = ""
     with open("lib/scaffolds/base_connect.py", "r", encoding="utf-8") as f:
         example_scaffold = f.read()
@@ -270,11 +270,7 @@ def mutate_scaffold(
 ):
     base_url, api_key, proxy_url = load_config()
     fail_if_no_creds(base_url, api_key)
-    client = (
-        OpenAI(base_url=base_url, api_key=api_key)
-        if proxy_url is None or proxy_url == ""
-        else OpenAI(base_url=base_url, api_key=api_key, http_client=httpx.Client(proxy=proxy_url))
-    )
+    client = make_client(base_url, api_key, proxy_url)
     existing_scaffold = ""
     with open(existing_scaffold_path, "r", encoding="utf-8") as f:
         existing_scaffold = f.read()
@@ -479,8 +475,7 @@ def generate_mvs_scaffold(
 """.strip()
 
     # OpenAI Client
-    http_client = None if not proxy_url else httpx.Client(proxy=proxy_url)
-    client = OpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
+    client = make_client(base_url, api_key, proxy_url)
 
     completion = client.chat.completions.create(
         model=model,
@@ -629,8 +624,7 @@ def generate_mvs_scaffold_v2(
 你生成的 Python scaffold 插件文件代码为：
 """.strip()
 
-    http_client = None if not proxy_url else httpx.Client(proxy=proxy_url)
-    client = OpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
+    client = make_client(base_url, api_key, proxy_url)
 
     completion = client.chat.completions.create(
         model=model,
@@ -0,0 +1,176 @@
+# lib/merkle.py
+# -*- coding: utf-8 -*-
+"""
+Merkle 式结构哈希：
+- VerbCall / UtilityCall / Attr / Value 都继承 MerkleNode，各自缓存一个结构哈希（_mhash）
+- 节点哈希 = sha256(类名 + 自身的原始字段 + 子节点哈希)，编码覆盖的字段与 verb_registry.to_state 一致，
+  因此 to_state 相同 <=> 哈希相同
+- 计算父节点哈希时把父节点登记到子节点的 _mparents（弱引用）；任何非瞬态字段被赋值时，
+  自身与所有祖先的缓存被清掉（不变式：某节点无缓存 => 它的祖先都无缓存，所以向上走到无缓存的节点即可停）
+- 原地改 list 的地方（ListValue.mutate）需要显式调用 touch()
+- program_hash(verbs) 把各 verb 哈希再组合一次：子程序只改了一个 verb 时，只有那个 verb 需要重新哈希
+
+缓存字段以 "_" 开头，不进入 to_state；pickle / dill 时去掉（落盘的对象从零计算），
+deepcopy 时保留哈希并把副本里的子节点重新登记到副本父节点上（fuzz 循环每轮都会 deepcopy 基础种子）。
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import weakref
+from typing import Any, Iterable
+
+from lib.verb_registry import TRANSIENT_FIELDS, _VALUE_META_FIELDS, _enc_meta
+
+_HASH = "_mhash"
+_PARENTS = "_mparents"
+_MERKLE_STATE = (_HASH, _PARENTS)
+
+
+class MerkleNode:
+    """结构哈希缓存 + 赋值即失效。"""
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name[0] != "_" and name not in TRANSIENT_FIELDS:
+            invalidate(self)
+
+    def __getstate__(self):
+        getstate = getattr(super(), "__getstate__", None)
+        state = getstate() if getstate is not None else self.__dict__
+        if isinstance(state, tuple):
+            # 带 __slots__ 的子类：(dict, slots)
+            d, slots = state
+            if d:
+                d = {k: v for k, v in d.items() if k not in _MERKLE_STATE}
+            return (d or None, slots)
+        if isinstance(state, dict) and (_HASH in state or _PARENTS in state):
+            return {k: v for k, v in state.items() if k not in _MERKLE_STATE}
+        return state
+
+    def __deepcopy__(self, memo):
+        cls = type(self)
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        state = copy.deepcopy(self.__getstate__(), memo)
+        d, slots = state if isinstance(state, tuple) else (state, None)
+        if d:
+            new.__dict__.update(d)
+        for k, v in (slots or {}).items():
+            object.__setattr__(new, k, v)
+        h = self.__dict__.get(_HASH)
+        if h is not None:
+            # 子节点副本也带着哈希（不变式保证），重新挂到新父节点下即可
+            new.__dict__[_HASH] = h
+            _relink(new)
+        return new
+
+
+def invalidate(node: Any) -> None:
+    """清掉 node 及其祖先的哈希缓存。"""
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        d = getattr(n, "__dict__", None)
+        if d is None or d.get(_HASH) is None:
+            continue
+        d[_HASH] = None
+        for ref in d.get(_PARENTS, ()):
+            p = ref()
+            if p is not None:
+                stack.append(p)
+
+
+def touch(node: Any) -> None:
+    """原地修改（如 list.append）后手动失效。"""
+    invalidate(node)
+
+
+def _link(child: MerkleNode, parent: MerkleNode) -> None:
+    d = child.__dict__
+    refs = d.get(_PARENTS)
+    if refs is None:
+        refs = d[_PARENTS] = []
+    for r in refs:
+        if r() is parent:
+            return
+    refs.append(weakref.ref(parent))
+
+
+def _relink(obj: MerkleNode) -> None:
+    def walk(x):
+        if isinstance(x, MerkleNode):
+            if x.__dict__.get(_HASH) is None:
+                # 子节点没有缓存时父节点也不能有
+                obj.__dict__[_HASH] = None
+            else:
+                _link(x, obj)
+        elif isinstance(x, list):
+            for i in x:
+                walk(i)
+
+    from lib.value import Value
+
+    if isinstance(obj, Value):
+        walk(getattr(obj, "value", None))
+        return
+    for k, v in vars(obj).items():
+        if k not in TRANSIENT_FIELDS and not k.startswith("_"):
+            walk(v)
+
+
+def _cls_ref(obj: Any) -> str:
+    cls = type(obj)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _field(x: Any, parent: MerkleNode) -> Any:
+    if x is None or isinstance(x, (bool, int, float, str)):
+        return x
+    if isinstance(x, list):
+        return [_field(i, parent) for i in x]
+    if isinstance(x, MerkleNode):
+        h = node_hash(x)
+        _link(x, parent)
+        return {"#": h}
+    return {"~": _enc_meta(x)}
+
+
+def _encode(obj: MerkleNode) -> Any:
+    from lib.value import Value
+
+    if isinstance(obj, Value):
+        cls_name = type(obj).__name__
+        meta_fields = _VALUE_META_FIELDS.get(cls_name, ("mutable",))
+        meta = {f: _enc_meta(getattr(obj, f)) for f in meta_fields if hasattr(obj, f)}
+        enc = {"v": _cls_ref(obj), "m": meta}
+        if cls_name != "DeferredValue":
+            enc["x"] = _field(getattr(obj, "value", None), obj)
+        return enc
+    fields = {}
+    for k, v in vars(obj).items():
+        if k in TRANSIENT_FIELDS or k.startswith("_") or callable(v):
+            continue
+        fields[k] = _field(v, obj)
+    return {"o": _cls_ref(obj), "f": fields}
+
+
+def node_hash(obj: MerkleNode) -> str:
+    """单个节点（verb / attr / value）的结构哈希，命中缓存时 O(1)。"""
+    h = obj.__dict__.get(_HASH)
+    if h is None:
+        b = json.dumps(_encode(obj), sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode()
+        h = hashlib.sha256(b).hexdigest()
+        obj.__dict__[_HASH] = h
+    return h
+
+
+def program_hash(verbs: Iterable[Any]) -> str:
+    """程序哈希：各 verb 哈希的有序组合。"""
+    m = hashlib.sha256(b"prog:")
+    for v in verbs:
+        m.update(node_hash(v).encode())
+        m.update(b"\n")
+    return m.hexdigest()
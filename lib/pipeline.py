@@ -0,0 +1,300 @@
+# lib/pipeline.py
+# -*- coding: utf-8 -*-
+"""
+流水线执行：编译和运行重叠。
+- 原来 build_and_run 里 编译 -> coordinator -> server -> client -> 覆盖率 -> 打分 全部串行，
+  make 时设备空闲，client 运行时 CPU 空闲
+- PipelinedExecutor 用一个编译线程池提前编译最多 lookahead 个候选，当前候选运行的同时后面的在编译，
+  吞吐接近 max(编译, 运行) 而不是 编译 + 运行
+- 运行阶段始终在调用方线程里串行执行（设备 / coordinator / server 只有一套）
+- 每个候选有优先级，run_next() 总是取优先级最高的；调度器优先级变化时 reprioritize()，
+  不再需要的候选 cancel()：还没开始的直接丢弃，正在编译的会被杀掉编译进程
+
+build_fn(job) / run_fn(job) / cleanup_fn(job) 都可以注入；默认实现（make_build_fn / run_built / remove_workdir）
+每个候选在 repo/pipeline/<key>/ 下渲染 client.cpp 并用 make fast 编译到独立的二进制，命中编译缓存时直接复用；
+运行完、编译失败或被取消后删掉这个目录。
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+QUEUED, BUILDING, BUILT, FAILED, CANCELLED, DONE = "queued", "building", "built", "failed", "cancelled", "done"
+
+
+class BuildCancelled(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, key: str, payload: Any, priority: float = 0.0):
+        self.key = key
+        self.payload = payload
+        self.priority = float(priority)
+        self.state = QUEUED
+        self.src_path: Optional[str] = None
+        self.bin_path: Optional[str] = None
+        self.error: Optional[str] = None
+        self.build_ms = 0
+        self.cancel_event = threading.Event()
+        self.future = None
+        self.seq = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def __repr__(self):
+        return f"Job({self.key!r}, prio={self.priority:.3f}, {self.state})"
+
+
+class PipelinedExecutor:
+    def __init__(
+        self,
+        build_fn: Callable[[Job], Optional[str]],
+        run_fn: Callable[[Job], Dict[str, Any]],
+        workers: int = 2,
+        lookahead: int = 4,
+        cleanup_fn: Optional[Callable[[Job], None]] = None,
+    ):
+        """
+        build_fn(job):   编译 job，返回二进制路径（也可以自己设置 job.bin_path）；失败抛异常。
+                         应当定期检查 job.cancelled，被取消时抛 BuildCancelled。
+        run_fn(job):     运行已编译好的 job，返回结果字典（一般是 execute_and_collect 的输出）。
+        lookahead:       同时处于 排队/编译中/已编译 状态的候选上限。
+        cleanup_fn(job): 编译失败的 job 交给调用方之前、被取消的 job 编译线程退出之后调用，
+                         清理编译产物（运行过的 job 由 run_fn 自己清理）。
+        """
+        self.build_fn = build_fn
+        self.run_fn = run_fn
+        self.cleanup_fn = cleanup_fn
+        self.lookahead = max(1, int(lookahead))
+        self.pool = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="build")
+        self.jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.stats = {"built": 0, "failed": 0, "cancelled": 0, "run": 0, "build_ms": 0, "run_ms": 0, "wait_ms": 0}
+
+    # ---------- 提交 / 取消 ----------
+
+    def pending(self) -> List[Job]:
+        with self._lock:
+            return [j for j in self.jobs.values() if j.state in (QUEUED, BUILDING, BUILT, FAILED)]
+
+    def has_capacity(self) -> bool:
+        return len(self.pending()) < self.lookahead
+
+    def submit(self, key: str, payload: Any, priority: float = 0.0) -> Job:
+        with self._lock:
+            old = self.jobs.get(key)
+            if old is not None and old.state not in (CANCELLED, DONE):
+                old.priority = max(old.priority, float(priority))
+                return old
+            self._seq += 1
+            job = Job(key, payload, priority)
+            job.seq = self._seq
+            self.jobs[key] = job
+        job.future = self.pool.submit(self._build, job)
+        return job
+
+    def _build(self, job: Job) -> None:
+        if job.cancelled:
+            return
+        job.state = BUILDING
+        t0 = time.perf_counter()
+        try:
+            path = self.build_fn(job)
+            if path is not None:
+                job.bin_path = str(path)
+            job.state = BUILT
+        except BuildCancelled:
+            job.state = CANCELLED
+        except Exception as e:  # 编译失败也要交给运行阶段记录
+            if job.cancelled:
+                job.state = CANCELLED
+            else:
+                job.error = f"{type(e).__name__}: {e}"
+                job.state = FAILED
+        finally:
+            job.build_ms = int((time.perf_counter() - t0) * 1000)
+            with self._lock:
+                self.stats["build_ms"] += job.build_ms
+                if job.state in (BUILT, FAILED):
+                    self.stats["built" if job.state == BUILT else "failed"] += 1
+
+    def cancel(self, key: str) -> bool:
+        with self._lock:
+            job = self.jobs.get(key)
+            if job is None or job.state in (CANCELLED, DONE):
+                return False
+            job.cancel_event.set()
+            if job.future is not None:
+                job.future.cancel()  # 还没开始编译的直接丢弃
+            job.state = CANCELLED
+            del self.jobs[key]
+            self.stats["cancelled"] += 1
+        if job.future is not None:
+            # 正在编译的等编译线程退出再清理；已经结束的立即清理
+            job.future.add_done_callback(lambda _f: self._cleanup(job))
+        else:
+            self._cleanup(job)
+        return True
+
+    def _cleanup(self, job: Job) -> None:
+        if self.cleanup_fn is not None:
+            self.cleanup_fn(job)
+
+    def reprioritize(self, priorities: Mapping[str, float], cancel_missing: bool = False) -> List[str]:
+        """更新待运行候选的优先级；cancel_missing=True 时取消 priorities 里没有的候选，返回被取消的 key。"""
+        dropped = []
+        for job in self.pending():
+            if job.key in priorities:
+                job.priority = float(priorities[job.key])
+            elif cancel_missing:
+                dropped.append(job.key)
+        for key in dropped:
+            self.cancel(key)
+        return dropped
+
+    # ---------- 运行 ----------
+
+    def _best(self) -> Optional[Job]:
+        jobs = self.pending()
+        if not jobs:
+            return None
+        # 优先级相同按提交顺序
+        return max(jobs, key=lambda j: (j.priority, -j.seq))
+
+    def next_ready(self, timeout: Optional[float] = None) -> Optional[Job]:
+        """等待优先级最高的候选编译完成并返回它（编译失败的也返回，state=FAILED）。"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        t0 = time.perf_counter()
+        try:
+            while True:
+                job = self._best()
+                if job is None:
+                    return None
+                left = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    # 等待期间优先级可能被改，短周期轮询重新选
+                    job.future.result(timeout=0.05 if left is None else min(0.05, left))
+                except CancelledError:
+                    continue
+                except Exception:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        return None
+                    continue
+                if job.state in (BUILT, FAILED) and job is self._best():
+                    return job
+        finally:
+            self.stats["wait_ms"] += int((time.perf_counter() - t0) * 1000)
+
+    def run_next(self, timeout: Optional[float] = None) -> Optional[Tuple[Job, Dict[str, Any]]]:
+        job = self.next_ready(timeout)
+        if job is None:
+            return None
+        with self._lock:
+            self.jobs.pop(job.key, None)
+        if job.state == FAILED:
+            result = {"outcome": "error", "detail": f"build failed: {job.error}", "runtime_ms": 0}
+            self._cleanup(job)
+        else:
+            t0 = time.perf_counter()
+            result = self.run_fn(job)
+            self.stats["run_ms"] += int((time.perf_counter() - t0) * 1000)
+            self.stats["run"] += 1
+        job.state = DONE
+        return job, result
+
+    def close(self) -> None:
+        for job in self.pending():
+            self.cancel(job.key)
+        self.pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------- 默认的编译 / 运行实现 ----------
+
+PIPELINE_DIR = Path("./repo/pipeline")
+
+
+def prepare_fast_build(san: str = "asan") -> None:
+    """预先构建所有候选共享的产物（server、运行时静态库、PCH），避免多个 make 并发争抢。"""
+    subprocess.run(["make", f"SAN={san}", "fast-prereqs"], check=True, capture_output=True, text=True)
+
+
+def make_build_fn(
+    render_fn: Callable[[Any], str],
+    workdir: os.PathLike = PIPELINE_DIR,
+    san: str = "asan",
+    cache=None,
+    poll_s: float = 0.05,
+) -> Callable[[Job], str]:
+    """
+    render_fn(payload) -> client.cpp 源码。每个候选在 workdir/<key>/ 下有独立的 client.cpp / client.o / client，
+    编译缓存（默认 BUILD_CACHE）命中时不跑 make。
+    """
+    from lib.build_cache import BUILD_CACHE, RUNTIME_SOURCES
+
+    cache = BUILD_CACHE if cache is None else cache
+    root = Path.cwd()
+
+    def build(job: Job) -> str:
+        d = Path(workdir) / job.key
+        d.mkdir(parents=True, exist_ok=True)
+        src, obj, binary = d / "client.cpp", d / "client.o", d / "client"
+        job.src_path = str(src)
+        src.write_text(render_fn(job.payload))
+
+        cmd = ["make", f"SAN={san}", "fast", f"CLIENT_SRC={src}", f"CLIENT_OBJ={obj}", f"BIN_CLIENT={binary}"]
+        key = cache.key_for(src, flags=cmd[1:3], runtime_sources=[root / f for f in RUNTIME_SOURCES])
+        if cache.fetch(key, binary):
+            return str(binary)
+
+        log = open(d / "compile.log", "w", encoding="utf-8")
+        try:
+            proc = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT, text=True)
+            while proc.poll() is None:
+                if job.cancelled:
+                    proc.kill()
+                    proc.wait()
+                    raise BuildCancelled(job.key)
+                time.sleep(poll_s)
+        finally:
+            log.close()
+        if proc.returncode != 0:
+            # 工作目录随后会被 cleanup_fn 删掉，编译日志的末尾带进错误信息
+            tail = (d / "compile.log").read_text(encoding="utf-8", errors="replace")[-2000:]
+            raise RuntimeError(f"make exited with {proc.returncode}:\n{tail}")
+        cache.put(key, binary)
+        return str(binary)
+
+    return build
+
+
+def remove_workdir(job: Job) -> None:
+    """删掉 make_build_fn 给 job 建的工作目录（client.cpp / client.o / compile.log / 二进制）。"""
+    if job.src_path:
+        shutil.rmtree(Path(job.src_path).parent, ignore_errors=True)
+
+
+def run_built(job: Job) -> Dict[str, Any]:
+    """用 job 编译好的二进制跑一轮 build_and_run（跳过编译）并打分。"""
+    from lib.runexec import build_and_run, execute_and_collect
+
+    try:
+        return execute_and_collect(build_and_run(client_src=job.src_path, client_bin=job.bin_path))
+    finally:
+        remove_workdir(job)
@@ -0,0 +1,172 @@
+# lib/renderer.py
+# -*- coding: utf-8 -*-
+"""
+client.cpp.j2 的共享渲染器：
+- 模板只编译一次（进程内共享 RENDERER），不再每个程序新建 Environment / get_template
+- 除 prolog_extra（变量定义）和 verbs_region（verb 主体）外，其余 knob（include、宏、PR_* 数组的 length 等）
+  都是不变量：按 knob 组合用哨兵字符串渲染一次，切成 head / mid / tail 三段缓存起来
+- render_to() 把 head、变量定义、逐个 verb 的代码片段、tail 直接 writelines 到输出文件，不拼接成大字符串
+- render_many() 批量渲染多个程序，共用编译好的模板与缓存的不变段
+
+原先 my_fuzz_test / fuzz_test / gen_code_* 里各自复制的 render() 现在都只是这里的薄封装。
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from lib.codegen_cache import CODEGEN_CACHE, CodegenCache
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+CLIENT_TEMPLATE = "client.cpp.j2"
+
+# 与原来各脚本 tpl.render(...) 传入的取值一致
+DEFAULT_KNOBS: Dict[str, Any] = {
+    "compile_units": "pair_runtime.cpp runtime_resolver.c -lcjson",
+    "output_name": "rdma_client_autogen",
+    "ib_port": 1,
+    "msg_size": 1024,
+    "bundle_env": "RDMA_FUZZ_RUNTIME",
+    "client_update": "client_update.json",
+    "length": 1000,
+    "setup_region": "/* setup generated by verbs (alloc/reg/create) moved here if你把这些也用 generate_c 产出 */",
+    "early_verbs_region": "",
+    "epilog_region": "/* optional CQ polling & cleanup */",
+}
+
+# 每个程序都不同的两个区域，用哨兵占位后切分模板输出
+_PROLOG_MARK = "\x00@@prolog_extra@@\x00"
+_VERBS_MARK = "\x00@@verbs_region@@\x00"
+
+
+def default_prolog(gid_index: Optional[int] = None) -> list:
+    """所有程序前面固定的设备/端口/GID 查询序列（QueryGID 产出 gid_var，后续 verb 依赖它）。"""
+    from lib.verbs import FreeDeviceList, GetDeviceList, OpenDevice, QueryDeviceAttr, QueryGID, QueryPortAttr
+
+    return [
+        GetDeviceList("dev_list"),
+        OpenDevice("dev_list"),
+        FreeDeviceList(),
+        QueryDeviceAttr(),
+        QueryPortAttr(),
+        QueryGID() if gid_index is None else QueryGID(index=gid_index),
+    ]
+
+
+def apply_program(verbs: Sequence[Any], prolog: bool = True, gid_index: Optional[int] = None, ctx=None):
+    """加上 prolog 后依次 apply，返回 (完整 verbs, ctx)；ctx 可以传入已有的。"""
+    from lib.codegen_context import CodeGenContext
+
+    ctx = ctx if ctx is not None else CodeGenContext()
+    full = (default_prolog(gid_index) if prolog else []) + list(verbs)
+    for v in full:
+        v.apply(ctx)
+    return full, ctx
+
+
+class ClientRenderer:
+    def __init__(
+        self,
+        template_dir: Union[str, Path, None] = None,
+        template_name: str = CLIENT_TEMPLATE,
+        cache: Optional[CodegenCache] = None,
+        **knobs,
+    ):
+        self.template_dir = Path(template_dir) if template_dir else TEMPLATE_DIR
+        self.template_name = template_name
+        self.cache = cache or CODEGEN_CACHE
+        self.knobs = {**DEFAULT_KNOBS, **knobs}
+        self._tpl = None
+        self._segments: Dict[Tuple, Tuple[str, str, str]] = {}
+
+    @property
+    def template(self):
+        if self._tpl is None:
+            from jinja2 import Environment, FileSystemLoader
+
+            env = Environment(loader=FileSystemLoader(str(self.template_dir)), trim_blocks=True, lstrip_blocks=True)
+            self._tpl = env.get_template(self.template_name)
+        return self._tpl
+
+    def segments(self, **knobs) -> Tuple[str, str, str]:
+        """返回 (head, mid, tail)：输出 = head + prolog_extra + mid + verbs_region + tail。"""
+        merged = {**self.knobs, **knobs}
+        key = tuple(sorted((k, repr(v)) for k, v in merged.items()))
+        seg = self._segments.get(key)
+        if seg is None:
+            text = self.template.render(**merged, prolog_extra=_PROLOG_MARK, verbs_region=_VERBS_MARK)
+            if text.count(_PROLOG_MARK) != 1 or text.count(_VERBS_MARK) != 1:
+                raise ValueError(f"{self.template_name}: prolog_extra / verbs_region must each appear exactly once")
+            head, rest = text.split(_PROLOG_MARK)
+            if _VERBS_MARK not in rest:
+                raise ValueError(f"{self.template_name}: prolog_extra must precede verbs_region")
+            mid, tail = rest.split(_VERBS_MARK)
+            seg = self._segments[key] = (head, mid, tail)
+        return seg
+
+    def iter_parts(self, verbs: Sequence[Any], ctx, banners: Union[bool, str] = False, **knobs) -> Iterator[str]:
+        """对已 apply 过的 verbs 逐段产出完整源文件。"""
+        head, mid, tail = self.segments(**knobs)
+        # 变量定义在模板里位于主体之前，但要等 generate_c 全部跑完才完整
+        body = list(self.cache.iter_body(verbs, ctx, banners=banners))
+        yield head
+        yield ctx.generate_variable_definitions_all()
+        yield mid
+        yield from body
+        yield tail
+
+    def render(self, verbs: Sequence[Any], ctx, banners: Union[bool, str] = False, **knobs) -> str:
+        return "".join(self.iter_parts(verbs, ctx, banners=banners, **knobs))
+
+    def render_text(self, verbs_region: str, prolog_extra: str = "", **knobs) -> str:
+        """直接填两个可变区域（调用方自己生成了代码时用）。"""
+        head, mid, tail = self.segments(**knobs)
+        return head + prolog_extra + mid + verbs_region + tail
+
+    def render_to(
+        self,
+        out: Union[str, os.PathLike, IO[str]],
+        verbs: Sequence[Any],
+        ctx,
+        banners: Union[bool, str] = False,
+        **knobs,
+    ):
+        """流式写出到路径或已打开的文本文件对象。"""
+        parts = self.iter_parts(verbs, ctx, banners=banners, **knobs)
+        if hasattr(out, "write"):
+            out.writelines(parts)
+            return out
+        # 先把 parts 生成完，渲染出错时不会留下半截文件
+        parts = list(parts)
+        with open(out, "w") as f:
+            f.writelines(parts)
+        return out
+
+    def render_many(
+        self,
+        programs: Iterable[Sequence[Any]],
+        out_paths: Optional[Iterable[Union[str, os.PathLike]]] = None,
+        banners: Union[bool, str] = False,
+        prolog: bool = True,
+        gid_index: Optional[int] = None,
+        **knobs,
+    ) -> List[Any]:
+        """
+        批量渲染未 apply 的程序：每个程序各自新建 ctx 并 apply；模板、不变段和 verb 代码缓存在整批内共享。
+        out_paths 为空时返回源码字符串列表，否则写文件并返回路径列表。
+        """
+        paths = iter(out_paths) if out_paths is not None else None
+        results = []
+        for verbs in programs:
+            full, ctx = apply_program(verbs, prolog=prolog, gid_index=gid_index)
+            if paths is None:
+                results.append(self.render(full, ctx, banners=banners, **knobs))
+            else:
+                results.append(self.render_to(next(paths), full, ctx, banners=banners, **knobs))
+        return results
+
+
+# 进程内共享的默认实例（模板在第一次渲染时编译）
+RENDERER = ClientRenderer()
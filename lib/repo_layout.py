@@ -0,0 +1,133 @@
+# lib/repo_layout.py
+# -*- coding: utf-8 -*-
+"""
+运行编号分配与 ./repo 目录布局：
+- 原来 auto_run.next_index() / my_fuzz_test.next_seed_index() 每次都 iterdir 整个 ./repo 解析文件名前缀取最大值，
+  运行越多越慢；现在编号是 repo/.<name>.id 里的计数器，fcntl.flock 保护，分配 O(1)，多进程安全
+- 计数器文件不存在时（老目录第一次用）扫一遍现有文件 / 运行目录做种，编号接着往后排
+- 新布局：repo/<shard>/<id>/<id>_client.cpp ...，shard = id // SHARD_SIZE（"000"、"001"…），每个 shard 下最多
+  SHARD_SIZE 个运行目录；文件名保留 <id>_ 前缀，按前缀找文件的工具和打包出来的文件名都不变
+- 种子日志用另一个计数器，编号和运行编号会重，所以单独放在 repo/seeds/<shard>/<id>/（seed_dir），
+  不和同号的 client 运行混在一个目录里
+- RDMA_FUZZ_REPO_LAYOUT=flat 时仍然全部平铺在 repo/ 下；读的一侧（find_run_dir / iter_run_dirs）两种布局都认
+"""
+
+from __future__ import annotations
+
+import fcntl
+import os
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+PathLike = Union[str, os.PathLike]
+
+REPO_ROOT = Path("./repo")
+SEEDS_DIR = "seeds"
+SHARD_SIZE = 1000
+LAYOUT = os.environ.get("RDMA_FUZZ_REPO_LAYOUT", "sharded")
+
+
+def shard_of(idx: str) -> str:
+    return f"{int(idx) // SHARD_SIZE:03d}"
+
+
+def run_dir(idx: str, root: PathLike = REPO_ROOT, layout: Optional[str] = None) -> Path:
+    """写的一侧：编号 idx 的文件放在哪个目录（按需创建）。"""
+    root = Path(root)
+    d = root if (layout or LAYOUT) == "flat" else root / shard_of(idx) / idx
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+def seed_dir(idx: str, root: PathLike = REPO_ROOT, layout: Optional[str] = None) -> Path:
+    """种子 idx 的日志目录：repo/seeds/<shard>/<id>/；平铺布局下仍是 repo/。"""
+    if (layout or LAYOUT) == "flat":
+        return run_dir(idx, root, "flat")
+    return run_dir(idx, Path(root) / SEEDS_DIR)
+
+
+def find_run_dir(idx: str, root: PathLike = REPO_ROOT) -> Path:
+    """读的一侧：有分片目录就用分片目录，否则是平铺布局的 repo/。"""
+    d = Path(root) / shard_of(idx) / idx
+    return d if d.is_dir() else Path(root)
+
+
+def iter_run_dirs(root: PathLike = REPO_ROOT) -> Iterator[Path]:
+    """repo/ 本身（平铺的老文件）和所有 repo/<shard>/<id>/ 运行目录。"""
+    root = Path(root)
+    if not root.is_dir():
+        return
+    yield root
+    for shard in sorted(os.scandir(root), key=lambda e: e.name):
+        if not (shard.is_dir() and shard.name.isdigit()):
+            continue
+        for run in sorted(os.scandir(shard.path), key=lambda e: e.name):
+            if run.is_dir() and run.name.isdigit():
+                yield Path(run.path)
+
+
+def _leading_int(name: str) -> Optional[int]:
+    digits = ""
+    for c in name:
+        if not c.isdigit():
+            break
+        digits += c
+    return int(digits) if digits else None
+
+
+class RunIdAllocator:
+    """
+    repo/.<name>.id 里存最后分配的编号。suffix 是这类编号对应的文件后缀（"_client.cpp" / "_seed.log"），
+    只在做种时用来认老文件；scan 是做种时要扫的目录（默认只有 root）。
+    """
+
+    def __init__(
+        self, root: PathLike = REPO_ROOT, name: str = "run", suffix: str = "_client.cpp", scan: Sequence[PathLike] = ()
+    ):
+        self.root = Path(root)
+        self.name = name
+        self.suffix = suffix
+        self.scan = [Path(d) for d in scan] or [self.root]
+
+    @property
+    def path(self) -> Path:
+        return self.root / f".{self.name}.id"
+
+    def _scan_max(self) -> int:
+        best = 0
+        for d in (d for top in self.scan for d in iter_run_dirs(top)):
+            if d in self.scan:
+                for e in os.scandir(d):
+                    if e.name.endswith(self.suffix) and e.is_file():
+                        best = max(best, _leading_int(e.name) or 0)
+            elif (d / f"{d.name}{self.suffix}").exists():
+                best = max(best, int(d.name))
+        return best
+
+    def next(self) -> str:
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            raw = os.read(fd, 64).strip()
+            last = int(raw) if raw else self._scan_max()
+            n = last + 1
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, f"{n}\n".encode())
+        finally:
+            os.close(fd)  # 关闭即释放 flock
+        return f"{n:06d}"
+
+    def current(self) -> Optional[str]:
+        """最近一次分配的编号（还没分配过时为 None）。"""
+        try:
+            raw = self.path.read_text().strip()
+        except OSError:
+            return None
+        return f"{int(raw):06d}" if raw else None
+
+
+RUN_IDS = RunIdAllocator(REPO_ROOT, "run", "_client.cpp")
+# 老的种子日志可能在 repo/ 或运行目录里，也可能在 repo/seeds/ 下
+SEED_IDS = RunIdAllocator(REPO_ROOT, "seed", "_seed.log", scan=(REPO_ROOT, REPO_ROOT / SEEDS_DIR))
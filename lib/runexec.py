@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import json
 import os.path
-import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from lib import utils
-from lib.auto_run import run_once
+from lib.auto_run import CLIENT_SRC, run_once
+from lib.capture import VerbOutcomes
+from lib.repo_layout import RUN_IDS, find_run_dir
 from lib.fingerprint import FingerprintManager
-from lib.gcov_llm_callback import get_random_uncovered_function, get_uncovered_function_count
+from lib.gcov_reader import CoverageSample, GcovSource
+from lib.gcov_llm_callback import get_index, get_random_uncovered_function, get_uncovered_function_count
 from lib.llm_utils import gen_scaffold, generate_mvs_scaffold, mutate_scaffold
+from lib.sanitizer_report import USER_SOURCES, CrashReport, parse_report_file, parse_report_text
 from lib.sqlite3_llm_callback import get_call_chain
 
 FP_MANAGER = FingerprintManager()
@@ -23,14 +27,104 @@ user_no_change_streak = 0
 kernel_no_change_streak = 0
 
 
+# native：进程内直接读 gcda（lib/gcov_reader.py）；fastcov：原来每次起 fastcov.py 子进程、按行号算覆盖
+COVERAGE_BACKEND = os.environ.get("RDMA_FUZZ_COVERAGE", "native")
+# 每次运行前清零 gcda 计数，feed_back() 只返回这一次运行的覆盖
+# （只对 native 生效：fastcov 的 JSON 本身就是累计的函数表来源）
+COVERAGE_RESET = os.environ.get("RDMA_FUZZ_COVERAGE_RESET", "1") != "0"
+# 覆盖收集作为单独的流水线阶段：build_and_run 不等它，coverage_edges 先是一个 Future，
+# execute_and_collect 做保留 / 丢弃判断时才等；下一次运行清零前也会等它收完
+COVERAGE_ASYNC = os.environ.get("RDMA_FUZZ_COVERAGE_ASYNC", "1") != "0"
+_COVERAGE_STAGE = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coverage")
+_pending_coverage: Optional[Future] = None
+
+USER_GCDA_DIR = "/home/rdma-core-master/build"
+KERNEL_GCOV_DIR = "/sys/kernel/debug/gcov/home/lbz/qemu/noble/drivers/infiniband"
+USER_COVERAGE_JSON = "/home/user_coverage.json"
+KERNEL_COVERAGE_JSON = "/home/kernel_coverage.json"
+
+USER_COV = GcovSource(
+    [
+        f"{USER_GCDA_DIR}/librdmacm/CMakeFiles/rspreload.dir/*.gcda",
+        f"{USER_GCDA_DIR}/libibverbs/CMakeFiles/ibverbs.dir/*.gcda",
+        f"{USER_GCDA_DIR}/librdmacm/CMakeFiles/rdmacm.dir/*.gcda",
+        f"{USER_GCDA_DIR}/providers/mlx5/CMakeFiles/mlx5.dir/*.gcda",
+    ],
+    exclude=[f"{USER_GCDA_DIR}/include"],
+    name="user",
+)
+KERNEL_COV = GcovSource(
+    [f"{KERNEL_GCOV_DIR}/{sub}/*.gcda" for sub in ("core", "sw/rxe", "hw/mlx5")],
+    include=["/home/lbz/qemu/noble/drivers/infiniband/"],
+    name="kernel",
+)
+
+
+def collect_coverage_async() -> Future:
+    global _pending_coverage
+    _pending_coverage = _COVERAGE_STAGE.submit(feed_back)
+    return _pending_coverage
+
+
+def wait_coverage() -> None:
+    """等上一次运行的覆盖收集结束（结果由 execute_and_collect 取，这里不管异常）。"""
+    fut = _pending_coverage
+    if fut is not None:
+        try:
+            fut.result()
+        except Exception:
+            pass
+
+
+def reset_coverage() -> None:
+    wait_coverage()
+    if COVERAGE_BACKEND == "fastcov" or not COVERAGE_RESET:
+        return
+    for src in (USER_COV, KERNEL_COV):
+        n = src.reset()
+        if src.stats["reset_errors"]:
+            print(f"[-] {src.name} coverage reset: {src.stats['reset_errors']} gcda could not be reset")
+        elif n:
+            print(f"[+] {src.name} coverage reset: {n} gcda")
+
+
 def feed_back():
+    if COVERAGE_BACKEND == "fastcov":
+        return feed_back_fastcov()
+    samples = []
+    for src, summary in ((USER_COV, USER_COVERAGE_JSON), (KERNEL_COV, KERNEL_COVERAGE_JSON)):
+        samples.append(src.read())
+        st = src.stats
+        if not st["files"]:
+            print(f"[-] No {src.name} gcda found")
+            continue
+        # 只把这次重新解析过的 gcda 里的函数喂给常驻的未覆盖函数索引
+        changed: Dict[str, int] = {}
+        for (_, fn), c in src.changed_function_counts().items():
+            changed[fn] = changed.get(fn, 0) + c
+        try:
+            get_index(src.name).update(changed)
+        except OSError as e:
+            print(f"[-] Uncovered function index for {src.name} not updated: {e}")
+        # fastcov 格式的函数表仍然写出（显式传路径调用 gcov_llm_callback 的脚本用），只在执行过的函数集合变化时重写
+        try:
+            src.export_function_summary(summary)
+        except OSError as e:
+            print(f"[-] Failed to write {summary}: {e}")
+        print(f"[+] {src.name} coverage: {st['files']} gcda ({st['parsed']} parsed total), {st['last_ms']:.1f} ms")
+    sample = CoverageSample.concat(samples)
+    print(f"[+] Coverage collection done, edges: {len(sample.covered())}")
+    return sample
+
+
+def feed_back_fastcov():
     utils.run_cmd("rm -f /home/user_coverage.json")
     utils.run_cmd("rm -f /home/kernel_coverage.json")
 
     user_cmd = "python3 /home/fastcov/fastcov.py -f /home/rdma-core-master/build/librdmacm/CMakeFiles/rspreload.dir/*.gcda /home/rdma-core-master/build/libibverbs/CMakeFiles/ibverbs.dir/*.gcda /home/rdma-core-master/build/librdmacm/CMakeFiles/rdmacm.dir/*.gcda /home/rdma-core-master/build/providers/mlx5/CMakeFiles/mlx5.dir/*.gcda -e /home/rdma-core-master/build/include -o /home/user_coverage.json -X"
     for i in range(5):
         utils.run_cmd(user_cmd)
-        if utils.retry_until_file_exist("/home/user_coverage.json"):
+        if utils.retry_until_file_exist(USER_COVERAGE_JSON):
             print("[+] User coverage generated successfully")
             break
         else:
@@ -39,14 +133,14 @@ def feed_back():
     kernel_cmd = "python3 /home/fastcov/fastcov.py -f /sys/kernel/debug/gcov/home/lbz/qemu/noble/drivers/infiniband/core/*.gcda /sys/kernel/debug/gcov/home/lbz/qemu/noble/drivers/infiniband/sw/rxe/*.gcda /sys/kernel/debug/gcov/home/lbz/qemu/noble/drivers/infiniband/hw/mlx5/*.gcda -i /home/lbz/qemu/noble/drivers/infiniband/ -o /home/kernel_coverage.json -X"
     for i in range(5):
         utils.run_cmd(kernel_cmd)
-        if utils.retry_until_file_exist("/home/kernel_coverage.json"):
+        if utils.retry_until_file_exist(KERNEL_COVERAGE_JSON):
             print("[+] Kernel coverage generated successfully")
             break
         else:
             print("[-] /home/kernel_coverage.json not found, retrying...")
 
-    if os.path.exists("/home/user_coverage.json") and os.path.exists("/home/kernel_coverage.json"):
-        all_edges = collect_all_edges("/home/user_coverage.json", "/home/kernel_coverage.json")
+    if os.path.exists(USER_COVERAGE_JSON) and os.path.exists(KERNEL_COVERAGE_JSON):
+        all_edges = collect_all_edges(USER_COVERAGE_JSON, KERNEL_COVERAGE_JSON)
         print(f"[+] Coverage collection done, edges: {len(all_edges)}")
         return all_edges
     else:
@@ -77,79 +171,45 @@ def parse_fastgcov_edges(json_path: str) -> set[str]:
     return edges
 
 
-def extract_sem_signature(log_path: str) -> set[str]:
-    sem_signature = set()
-    seen_indices = set()
-
-    pattern = re.compile(r"^\[(\d+)\]\s*(.+?)\s+start\.$")
-
+def extract_verb_outcomes(log_path: str) -> VerbOutcomes:
+    """事后扫 stdout 日志（lines 模式 / fork-server），和 merged 捕获边读边解析的结果一致。"""
+    outcomes = VerbOutcomes()
     with open(log_path, "r", encoding="utf-8", errors="replace") as f:
         for line in f:
-            line = line.strip()
-            m = pattern.match(line)
-            if not m:
-                continue
-            idx = int(m.group(1))
-            if idx in seen_indices:
-                continue
-            seen_indices.add(idx)
+            outcomes.feed(line.strip())
+    return outcomes
 
-            action = m.group(2)
-            sem_signature.add(action)
 
-    return sem_signature
+def extract_sem_signature(log_path: str) -> set[str]:
+    return extract_verb_outcomes(log_path).signature()
 
 
 def parse_crash_site(log_path: str) -> Optional[str]:
-    SUMMARY_RE = re.compile(r"^SUMMARY: AddressSanitizer: \S+ (\S+):(\d+) in (\S+)")
-    FRAME_SRC_RE = re.compile(r"^\s*#\d+\s+\S+\s+in\s+\S+\s+(/[^:]+):(\d+)")
-    FRAME_MODULE_RE = re.compile(r"\(([^)]+)\+0x([0-9a-fA-F]+)\)")
+    reports = [r for r in parse_report_file(log_path) if r.source in USER_SOURCES]
+    return reports[0].site if reports else None
 
-    log_text = ""
-    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
-        log_text = f.read()
-
-    if "AddressSanitizer" not in log_text:
-        return None
-
-    # Try to extract from SUMMARY
-    for line in log_text.splitlines():
-        m = SUMMARY_RE.search(line)
-        if m:
-            filepath, lineno, function = m.group(1), m.group(2), m.group(3)
-            lib = Path(filepath).name
-            return f"bt#{lib}:{lineno} in {function}"
-
-    # Fallback: Extract from stack frames
-    for line in log_text.splitlines():
-        m = FRAME_SRC_RE.search(line)
-        if m:
-            filepath, lineno = m.group(1), m.group(2)
-            lib = Path(filepath).name
-            return f"bt#{lib}:{lineno}"
-
-    # Fallback: Extract from module offsets
-    for line in log_text.splitlines():
-        m = FRAME_MODULE_RE.search(line)
-        if m:
-            module_path, offset = m.group(1), m.group(2)
-            module_name = Path(module_path).name
-            return f"bt#{module_name}+0x{offset}"
-
-    return None
 
+def parse_crash_site_text(log_text: str) -> Optional[str]:
+    reports = [r for r in parse_report_text(log_text) if r.source in USER_SOURCES]
+    return reports[0].site if reports else None
 
-# ========== 需要你接到现有实现的钩子 ==========
 
+def collect_crash_reports(user_reports: List[CrashReport], dmesg_content: str) -> List[CrashReport]:
+    """client 的 ASan / LSan 报告在前，dmesg 里的 KASAN / WARNING / BUG 在后。"""
+    return [r for r in user_reports if r.source in USER_SOURCES] + parse_report_text(dmesg_content)
 
-def collect_latest_dmesg() -> str:
-    """收集最新生成的dmesg文件内容"""
-    from pathlib import Path
 
+# ========== 需要你接到现有实现的钩子 ==========
+
+
+def collect_latest_dmesg(run_index: Optional[str] = None) -> str:
+    """收集最新生成的dmesg文件内容（默认看最近一次分配的运行目录；平铺布局下就是整个 repo/）"""
     repo_dir = Path("./repo")
+    run_index = run_index or RUN_IDS.current()
+    search_dir = find_run_dir(run_index, repo_dir) if run_index else repo_dir
 
     # 查找最新的dmesg文件
-    dmesg_files = list(repo_dir.glob("*_dmesg.log"))
+    dmesg_files = list(search_dir.glob("*_dmesg.log"))
     if not dmesg_files:
         return ""
 
@@ -166,43 +226,80 @@ def collect_latest_dmesg() -> str:
         return ""
 
 
-def build_and_run() -> Dict[str, Any]:
+def build_and_run(client_src: Optional[str] = None, client_bin: Optional[str] = None) -> Dict[str, Any]:
     """编译 & 执行 verbs 序列，并返回一次性原始指标。
+    client_src / client_bin：流水线里提前渲染、编译好的候选（见 lib/pipeline.py），默认用 ./client.cpp 现编。
     期望返回：
     {
       'outcome': 'ok' | 'crash' | 'asan' | 'error',
       'runtime_ms': 123,
-      'coverage_edges': set([...]) 或 可哈希摘要（bytes/str），
-      'sem_signature': set([...]) 或 可哈希摘要（bytes/str），
-      'crash_site': 'bt#lib+offset' | None,
+      'coverage_edges': gcov_reader.CoverageSample（native）或 set(["file:line", ...])（fastcov），
+                        COVERAGE_ASYNC 时是还在收集的 Future，
+      'sem_signature': set([...]) 或 可哈希摘要（bytes/str），每个 verb 一项 "名字:ok|skip|fail[:errno]|abort"，
+      'verb_outcomes': [[序号, 类编号, 结果(0 成功/1 跳过/2 失败/None 中断), errno], ...]，
+      'crash_site': 'bt#lib+offset' | 'kasan#func' | None,
+      'crash_reports': [CrashReport.to_dict(), ...]（client 的 ASan / LSan 在前，dmesg 的 KASAN / WARNING / BUG 在后），
+      'run_index': 这次运行在 ./repo 下的编号（日志所在目录），
     }
     """
     # TODO: 接你现有执行流程（你已有的 codegen/runner/trace 收集）
     t0 = time.time()
 
-    run_once()
+    # 编译完、启动之前清零计数（会先等上一次的覆盖收集），之后 feed_back() 读到的只有这一次运行的计数
+    started = []
+
+    def before_start():
+        reset_coverage()
+        started.append(True)
+
+    if client_bin is not None:
+        capture = run_once(client_src=client_src or CLIENT_SRC, client_bin=client_bin, before_start=before_start)
+    else:
+        capture = run_once(before_start=before_start)
     print("[+] run_once finished")
+    if not started:
+        # 编译失败等没走到启动：gcda 还是上一次运行的，不能算在这次头上
+        coverage_edges = set()
+    elif COVERAGE_ASYNC:
+        coverage_edges = collect_coverage_async()
+    else:
+        coverage_edges = None
 
     # 收集dmesg信息
-    dmesg_content = collect_latest_dmesg()
-
-    coverage_edges = feed_back()
-    sem_signature = extract_sem_signature("./repo/client.tmp.stdout.log")
+    dmesg_content = collect_latest_dmesg(getattr(capture, "index", None))
+
+    if coverage_edges is None:
+        coverage_edges = feed_back()
+    markers = getattr(capture, "markers", None)
+    if markers is not None:
+        # merged 捕获已经边读边解析过，不再回读日志
+        outcomes = markers.outcomes
+        user_reports = markers.reports
+    else:
+        # lines 模式，或者 client 没跑起来（merged 模式下 tmp 日志可能不存在）
+        out_log, err_log = "./repo/client.tmp.stdout.log", "./repo/client.tmp.stderr.log"
+        outcomes = extract_verb_outcomes(out_log) if os.path.exists(out_log) else VerbOutcomes()
+        user_reports = parse_report_file(err_log) if os.path.exists(err_log) else []
+    sem_signature = outcomes.signature()
     print(f"[+] Extracted sem_signature, count={len(sem_signature)}")
-    crash_site = parse_crash_site("./repo/client.tmp.stderr.log")
+    reports = collect_crash_reports(user_reports, dmesg_content)
+    crash_site = reports[0].site if reports else None
     if not crash_site:
         outcome = "ok"
         print("[+] No crash detected")
     else:
         outcome = "crash"
-        print(f"[!] Crash detected, site: {crash_site}")
+        print(f"[!] Crash detected, site: {crash_site} ({len(reports)} report(s), bucket {reports[0].bucket})")
 
     return {
         "outcome": outcome,
         "runtime_ms": int((time.time() - t0) * 1000),
         "coverage_edges": coverage_edges,
         "sem_signature": sem_signature,
+        "verb_outcomes": outcomes.as_list(),
         "crash_site": crash_site,
+        "crash_reports": [r.to_dict() for r in reports],
+        "run_index": getattr(capture, "index", None),
         "dmesg_new": dmesg_content,  # 新增dmesg字段
     }
 
@@ -230,13 +327,20 @@ def compute_score(cov_new: int, sem_new: int, outcome: str, runtime_ms: int, fla
     return max(score, 0.0)
 
 
-def execute_and_collect() -> Dict[str, Any]:
+def execute_and_collect(raw: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """raw 为空时走 build_and_run()；fork-server 模式下传入 ForkServerRunner.run() 的结果。"""
     global user_no_change_streak, kernel_no_change_streak
     global last_user_coverage, last_kernel_coverage
 
     print("[+] Collecting fuzz execution metrics")
-    raw = build_and_run()
-    diff = diff_coverage_and_semantics(raw.get("coverage_edges", set()), raw.get("sem_signature", set()))
+    if raw is None:
+        raw = build_and_run()
+    coverage_edges = raw.get("coverage_edges", set())
+    if isinstance(coverage_edges, Future):
+        t_wait = time.perf_counter()
+        coverage_edges = coverage_edges.result()
+        print(f"[+] Waited {(time.perf_counter() - t_wait) * 1000:.1f} ms for coverage")
+    diff = diff_coverage_and_semantics(coverage_edges, raw.get("sem_signature", set()))
     cov_new = diff["cov_new"]
     sem_new = diff["sem_new"]
     print(f"[+] Coverage delta: {cov_new}, Semantic delta: {sem_new}")
@@ -328,14 +432,19 @@ def execute_and_collect() -> Dict[str, Any]:
             except Exception as e:
                 print(f"[-] gen_scaffold() failed: {e}")
 
+    # 这次运行的覆盖以边编号给调用方（存进 corpus 的 seed_cov），detail 里只留边数
+    cov_ids = FP_MANAGER.last_covered
     return {
         "keep": keep,
         "outcome": raw.get("outcome"),
         "cov_new": cov_new,
+        "cov_ids": cov_ids,
         "sem_novelty": float(sem_new),
         "runtime_ms": int(raw.get("runtime_ms", 0)),
         "crash_site": raw.get("crash_site"),
         "score": score,
         "dmesg_new": dmesg_content,
-        "detail": raw,
+        "crash_reports": raw.get("crash_reports", []),
+        "run_index": raw.get("run_index"),
+        "detail": {**raw, "coverage_edges": len(cov_ids)},
     }
\ No newline at end of file
@@ -0,0 +1,338 @@
+# lib/sanitizer_report.py
+# -*- coding: utf-8 -*-
+"""
+sanitizer / 内核报告的流式解析与崩溃分桶：
+- 用户态：client stderr 里的 ASan / LSan 报告（"==pid==ERROR: AddressSanitizer: <类型> ..."，到 SUMMARY 为止）
+- 内核：dmesg / journalctl 里的 KASAN、WARNING、BUG / Oops / general protection fault
+  （dmesg 的 "[ 12.345]" 和 journalctl -o short-iso 的 "<时间> <主机> kernel: " 前缀会先去掉）
+- 每份报告取出：来源、错误类型、访问类型（READ / WRITE）和大小、第一个栈（出错位置的那个）的帧
+- 归一化栈哈希：去掉 sanitizer / 报告路径自身的帧（__asan_*、kasan_report、dump_stack、__warn ...）、
+  内核里不可靠的 "? xxx" 帧和偏移 / 行号，取前 TOP_FRAMES 个函数名（没符号时用 模块+偏移）
+  与来源、错误类型一起哈希；同一个桶 = 同一个 bug，corpus 里的 crash_buckets 表按它去重
+
+ReportParser 逐行喂，空闲时每行只做一次正则匹配，可以直接挂在捕获线程上（lib/capture.py）。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+TOP_FRAMES = int(os.environ.get("RDMA_FUZZ_CRASH_FRAMES", "5"))
+MAX_FRAMES = 64  # 每份报告最多留这么多帧
+USER_SOURCES = ("asan", "lsan")
+KERNEL_SOURCES = ("kasan", "warn", "bug")
+
+# 一份报告的开头
+_ASAN_START_RE = re.compile(r"ERROR: (Address|Leak)Sanitizer: (.*)$")
+_KERNEL_START_RE = re.compile(
+    r"^(?:BUG: KASAN: (?P<kasan>\S+)(?: in (?P<kasan_fn>\S+))?"
+    r"|WARNING: CPU: \d+ PID: \d+ at (?P<warn_at>\S+)(?: (?P<warn_fn>\S+))?"
+    r"|BUG: (?P<bug>.+)"
+    r"|(?P<gpf>general protection fault)"
+    r"|Oops: (?P<oops>.+))"
+)
+_START_HINT_RE = re.compile(r"ERROR: (?:Address|Leak)Sanitizer|BUG: |WARNING: CPU|general protection fault|Oops: ")
+
+# 行前缀
+_DMESG_PREFIX_RE = re.compile(r"^\[\s*\d+\.\d+\]\s?")
+_JOURNAL_PREFIX_RE = re.compile(r"^\S+\s+\S+\s+kernel:\s?")
+
+# ASan："#3 0x4c8b4a in post_send /src/pair_runtime.cpp:42:5"、"#2 0x7f.. in __libc_start_main (/lib/libc.so.6+0x21bf6)"
+_ASAN_FRAME_RE = re.compile(r"^#(\d+)\s+0x[0-9a-fA-F]+\s*(?:in\s+)?(.*?)(?:\s+\(BuildId: [0-9a-fA-F]+\))?\s*$")
+_SRC_LOC_RE = re.compile(r"^(.*?)\s*(\S+?):(\d+)(?::\d+)?$")
+_MOD_LOC_RE = re.compile(r"^(.*?)\s*\(([^()]+?)\+0x([0-9a-fA-F]+)\)$")
+_ASAN_ACCESS_RE = re.compile(r"^(READ|WRITE) of size (\d+)")
+_ASAN_SIGNAL_RE = re.compile(r"The signal is caused by a (READ|WRITE) memory access")
+_ASAN_SUMMARY_RE = re.compile(r"^SUMMARY: \w+Sanitizer: (\S+)(?: (\S+):(\d+)(?::\d+)? in (\S+))?")
+
+# 内核："rxe_post_send+0x1234/0x2000 [rdma_rxe]"，"? " 开头的是栈上扫到的不可靠地址
+_KERNEL_FRAME_RE = re.compile(r"^(\? )?([\w.$]+)\+0x[0-9a-fA-F]+/0x[0-9a-fA-F]+(?: \[(\S+)\])?$")
+_KERNEL_ACCESS_RE = re.compile(r"^(Read|Write) of size (\d+)")
+_KERNEL_PF_RE = re.compile(r"^#PF: supervisor (read|write|instruction fetch) access")
+_KERNEL_RIP_RE = re.compile(r"^RIP: \w+:([\w.$]+)\+0x")
+_KERNEL_END_RE = re.compile(r"^(?:</TASK>|---\[ end trace|={20,})")
+
+# 报告机制自身的帧，不参与分桶
+_NOISE_PREFIXES = (
+    "__asan", "__interceptor_", "___interceptor_", "__sanitizer", "__lsan", "__ubsan",
+    "kasan_", "__kasan", "dump_stack", "print_report", "print_address_description", "check_region",
+    "__warn", "warn_slowpath", "report_bug", "handle_bug", "exc_invalid_op", "asm_exc_",
+    "__die", "die_body", "oops_", "page_fault_oops", "do_user_addr_fault", "exc_page_fault",
+)
+_NOISE_FUNCS = {
+    "malloc", "calloc", "realloc", "free", "operator new", "operator delete",
+    "__libc_start_main", "__libc_start_call_main", "_start",
+    "do_syscall_64", "entry_SYSCALL_64_after_hwframe", "kasan_report",
+}
+_NOISE_MODULES = ("libasan", "libclang_rt.asan")
+
+_BUG_TYPES = (
+    ("NULL pointer dereference", "null-ptr-deref"),
+    ("unable to handle page fault", "page-fault"),
+    ("scheduling while atomic", "sleep-in-atomic"),
+    ("sleeping function called from invalid context", "sleep-in-atomic"),
+    ("soft lockup", "soft-lockup"),
+    ("general protection fault", "gpf"),
+    ("spinlock", "spinlock"),
+)
+
+
+def strip_kernel_prefix(line: str) -> str:
+    line = _DMESG_PREFIX_RE.sub("", line, count=1)
+    return _JOURNAL_PREFIX_RE.sub("", line, count=1)
+
+
+def _slug(text: str) -> str:
+    for needle, slug in _BUG_TYPES:
+        if needle in text:
+            return slug
+    text = text.split(",", 1)[0].split(":", 1)[0].strip().lower()
+    return re.sub(r"[^a-z0-9]+", "-", text).strip("-") or "bug"
+
+
+@dataclass
+class Frame:
+    func: Optional[str] = None
+    file: Optional[str] = None
+    line: Optional[int] = None
+    module: Optional[str] = None
+    offset: Optional[int] = None
+
+    def key(self) -> str:
+        """分桶用：函数名；没符号时 模块名+偏移。"""
+        if self.func:
+            return self.func
+        if self.module:
+            return f"{Path(self.module).name}+{self.offset or 0:#x}"
+        return "?"
+
+    def is_noise(self) -> bool:
+        if self.func:
+            name = self.func.split("(", 1)[0]
+            return name in _NOISE_FUNCS or name.startswith(_NOISE_PREFIXES)
+        return bool(self.module) and Path(self.module).name.startswith(_NOISE_MODULES)
+
+    def __str__(self) -> str:
+        if self.file:
+            where = f"{Path(self.file).name}:{self.line}"
+        elif self.module:
+            name = Path(self.module).name
+            where = f"[{name}]" if self.offset is None else f"{name}+{self.offset:#x}"
+        else:
+            where = ""
+        if self.func and where:
+            return f"{self.func} {where}"
+        return self.func or where or "?"
+
+
+@dataclass
+class CrashReport:
+    source: str  # asan / lsan / kasan / warn / bug
+    bug_type: str
+    access: Optional[str] = None  # READ / WRITE
+    size: Optional[int] = None
+    frames: List[Frame] = field(default_factory=list)
+    summary: Optional[Frame] = None  # ASan SUMMARY 行里的位置；内核报告开头点名的函数
+    title: str = ""
+
+    def top_frames(self, n: int = TOP_FRAMES) -> List[Frame]:
+        frames = [f for f in self.frames if not f.is_noise()] or self.frames
+        if not frames and self.summary is not None:
+            frames = [self.summary]
+        return frames[:n]
+
+    def stack_hash(self, n: int = TOP_FRAMES) -> str:
+        text = "\n".join([self.source, self.bug_type] + [f.key() for f in self.top_frames(n)])
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def bucket(self) -> str:
+        return f"{self.source}:{self.bug_type}:{self.stack_hash()}"
+
+    @property
+    def site(self) -> str:
+        """和原来 parse_crash_site 一样的 "bt#..." 形式（用户态），内核报告是 "<来源>#<函数>"。"""
+        if self.source in ("asan", "lsan"):
+            s = self.summary
+            if s is not None and s.file:
+                return f"bt#{Path(s.file).name}:{s.line} in {s.func}"
+            for f in self.frames:
+                if f.file:
+                    return f"bt#{Path(f.file).name}:{f.line}"
+            for f in self.frames:
+                if f.module:
+                    return f"bt#{Path(f.module).name}+{f.offset or 0:#x}"
+            return f"bt#{self.bug_type}"
+        top = self.top_frames(1)
+        return f"{self.source}#{top[0].key() if top else self.bug_type}"
+
+    def to_dict(self, n: int = TOP_FRAMES) -> Dict[str, Any]:
+        return {
+            "bucket": self.bucket,
+            "source": self.source,
+            "bug_type": self.bug_type,
+            "access": self.access,
+            "size": self.size,
+            "site": self.site,
+            "stack_hash": self.stack_hash(n),
+            "frames": [str(f) for f in self.top_frames(n)],
+            "title": self.title,
+        }
+
+
+def _asan_frame(rest: Optional[str]) -> Frame:
+    rest = (rest or "").strip()
+    m = _MOD_LOC_RE.match(rest)
+    if m:
+        return Frame(func=m.group(1) or None, module=m.group(2), offset=int(m.group(3), 16))
+    m = _SRC_LOC_RE.match(rest)
+    if m and m.group(1):
+        return Frame(func=m.group(1), file=m.group(2), line=int(m.group(3)))
+    return Frame(func=rest or None)
+
+
+class ReportParser:
+    """逐行解析，报告结束（ASan 的 SUMMARY、内核栈的 </TASK> / end trace / ===== 或者下一份报告开头）时进 reports。"""
+
+    def __init__(self):
+        self.reports: List[CrashReport] = []
+        self._cur: Optional[CrashReport] = None
+        self._kernel = False
+        self._in_stack = False  # 正在收第一个栈
+        self._stack_done = False
+
+    def feed(self, line: str) -> Optional[CrashReport]:
+        """喂一行，返回这一行结束掉的报告（没有则 None）。"""
+        if self._cur is None and not _START_HINT_RE.search(line):
+            return None
+        text = strip_kernel_prefix(line).strip()
+        finished = None
+        started = self._start(text)
+        if started is not None:
+            finished = self._finish()
+            self._cur = started
+            return finished
+        if self._cur is None:
+            return None
+        if self._kernel:
+            return self._kernel_line(text)
+        return self._asan_line(text)
+
+    def close(self) -> List[CrashReport]:
+        """流结束：没收完的报告（日志被截断、进程被杀）也算一份。"""
+        self._finish()
+        return self.reports
+
+    def _finish(self) -> Optional[CrashReport]:
+        cur, self._cur = self._cur, None
+        if cur is not None:
+            self.reports.append(cur)
+        return cur
+
+    def _start(self, text: str) -> Optional[CrashReport]:
+        m = _ASAN_START_RE.search(text)
+        if m:
+            self._kernel, self._in_stack, self._stack_done = False, False, False
+            if m.group(1) == "Leak":
+                return CrashReport("lsan", "memory-leak", title=text)
+            bug = m.group(2).split(" on ", 1)[0].split()[0] if m.group(2) else "unknown"
+            return CrashReport("asan", bug, title=text)
+        m = _KERNEL_START_RE.match(text)
+        if not m:
+            return None
+        cur = self._cur
+        if (m.group("oops") or m.group("gpf")) and cur is not None and self._kernel and not self._in_stack:
+            return None  # "BUG: ..." 后面紧跟的 "Oops: ..." 是同一份报告
+        self._kernel, self._in_stack, self._stack_done = True, False, False
+        if m.group("kasan"):
+            rep = CrashReport("kasan", m.group("kasan"), title=text)
+            fn = m.group("kasan_fn")
+        elif m.group("warn_at"):
+            rep = CrashReport("warn", "WARNING", title=text)
+            fn = m.group("warn_fn")
+        elif m.group("gpf"):
+            rep, fn = CrashReport("bug", "gpf", title=text), None
+        else:
+            rep, fn = CrashReport("bug", _slug(m.group("bug") or m.group("oops")), title=text), None
+        if fn:
+            rep.summary = Frame(func=fn.split("+", 1)[0])
+        return rep
+
+    def _asan_line(self, text: str) -> Optional[CrashReport]:
+        cur = self._cur
+        m = _ASAN_SUMMARY_RE.match(text)
+        if m:
+            if m.group(2):
+                cur.summary = Frame(func=m.group(4), file=m.group(2), line=int(m.group(3)))
+            return self._finish()
+        if self._stack_done:
+            return None
+        m = _ASAN_FRAME_RE.match(text)
+        if m:
+            if m.group(1) == "0" and cur.frames:
+                self._stack_done = True  # 第二个栈（freed by / previously allocated by）
+                return None
+            self._in_stack = True
+            if len(cur.frames) < MAX_FRAMES:
+                cur.frames.append(_asan_frame(m.group(2)))
+            return None
+        if self._in_stack:
+            self._stack_done = True
+            return None
+        m = _ASAN_ACCESS_RE.match(text) or _ASAN_SIGNAL_RE.search(text)
+        if m:
+            cur.access = m.group(1)
+            if m.re is _ASAN_ACCESS_RE:
+                cur.size = int(m.group(2))
+        return None
+
+    def _kernel_line(self, text: str) -> Optional[CrashReport]:
+        cur = self._cur
+        if _KERNEL_END_RE.match(text):
+            if text.startswith("</TASK>"):
+                self._stack_done = True
+                # KASAN 后面还有分配 / 释放栈，等到 ===== 再结束；其他报告到这里就完了
+                return None if cur.source == "kasan" else self._finish()
+            return self._finish()
+        if self._stack_done:
+            return None
+        if text == "Call Trace:":
+            self._in_stack = True
+            return None
+        if self._in_stack:
+            m = _KERNEL_FRAME_RE.match(text)
+            if m and not m.group(1) and len(cur.frames) < MAX_FRAMES:
+                cur.frames.append(Frame(func=m.group(2), module=m.group(3)))
+            return None
+        m = _KERNEL_ACCESS_RE.match(text) or _KERNEL_PF_RE.match(text)
+        if m:
+            cur.access = m.group(1).upper().split()[0]
+            if m.re is _KERNEL_ACCESS_RE:
+                cur.size = int(m.group(2))
+            return None
+        m = _KERNEL_RIP_RE.match(text)
+        if m and cur.summary is None:
+            cur.summary = Frame(func=m.group(1))
+        return None
+
+
+def parse_reports(lines: Iterable[str]) -> List[CrashReport]:
+    parser = ReportParser()
+    for line in lines:
+        parser.feed(line)
+    return parser.close()
+
+
+def parse_report_text(text: str) -> List[CrashReport]:
+    return parse_reports(text.splitlines()) if text else []
+
+
+def parse_report_file(path) -> List[CrashReport]:
+    """逐行读，不把整个日志读进内存。"""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return parse_reports(f)
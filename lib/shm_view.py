@@ -0,0 +1,213 @@
+# lib/shm_view.py
+# -*- coding: utf-8 -*-
+"""
+视图的二进制 mmap 通道（格式见 view_shm.h，C 端读者在 runtime_resolver.c）：
+- coordinator 每次写 JSON 视图之前先把同一份视图写进 <view>.shm
+- 视图被拍平成 规范路径 -> 值 的表（"local.QP[0].qpn"），带 id 的对象数组额外生成别名键
+  （"remote.QP{srv0}.qpn"），rr_*_by_id 查找直接命中，不用扫数组
+- 表后面跟一个开放寻址哈希索引（CRC-32），C 端查找 O(1)
+- seqlock：写之前 seq 加一（奇数），写完再加一；读者看到奇数或前后 seq 不同就重读
+- 容量不够时写一个更大的新文件 rename 过去，再在旧映射里置 moved=1，读者据此重新打开
+
+写端假设是 x86 这样的强序内存模型（Python 没有显式屏障，mmap 写就是普通 memcpy）。
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from array import array
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"RDXV"
+VERSION = 1
+HEADER_SIZE = 64
+MIN_CAPACITY = 1 << 20
+
+T_NULL, T_NUM, T_STR, T_BOOL, T_OBJ, T_ARR = range(6)
+
+_HEADER = struct.Struct("<4sIQQQI")  # magic, version, seq, capacity, data_len, moved
+_PAYLOAD = struct.Struct("<6I")  # n_entries, n_slots, entries_off, slots_off, pool_off, pool_len
+_ENTRY = struct.Struct("<4Id")  # key_off, key_len, type, aux, num
+_SLOT = struct.Struct("<2I")
+_SEQ_OFF, _LEN_OFF, _MOVED_OFF = 8, 24, 32
+
+
+def key_hash(data: bytes) -> int:
+    # 标准 CRC-32（zlib），C 端 rr_shm_hash 用同一张表实现
+    return zlib.crc32(data)
+
+
+def shm_path(view_path: str) -> str:
+    return f"{view_path}.shm"
+
+
+def flatten(view: Any) -> Iterator[Tuple[str, Any]]:
+    """(规范路径, 值)；容器也各占一项（值为原容器），对象数组里带 "id" 的元素额外给出 {id} 别名。"""
+
+    def walk(node, path):
+        yield path, node
+        if isinstance(node, dict):
+            for k, v in node.items():
+                yield from walk(v, f"{path}.{k}" if path else str(k))
+        elif isinstance(node, list):
+            for i, v in enumerate(node):
+                yield from walk(v, f"{path}[{i}]")
+            for v in node:
+                if isinstance(v, dict) and isinstance(v.get("id"), str):
+                    yield from walk(v, f"{path}{{{v['id']}}}")
+
+    for key, value in walk(view, ""):
+        if key:
+            yield key, value
+
+
+def encode(view: Dict[str, Any]) -> bytes:
+    pool = bytearray()
+    strings: Dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        off = strings.get(s)
+        if off is None:
+            off = strings[s] = len(pool)
+            pool.extend(s.encode("utf-8", "surrogatepass") + b"\0")
+        return off
+
+    pack = _ENTRY.pack
+    packed: List[bytes] = []
+    hashes: List[int] = []
+    seen = set()
+    for key, v in flatten(view):
+        if key in seen:  # 重复 id 时保留第一个（与 C 端按 id 扫数组取第一个一致）
+            continue
+        seen.add(key)
+        kb = key.encode("utf-8", "surrogatepass")
+        koff, klen = intern(key), len(kb)
+        if v is None:
+            e = pack(koff, klen, T_NULL, 0, 0.0)
+        elif v is True or v is False:
+            e = pack(koff, klen, T_BOOL, int(v), float(v))
+        elif isinstance(v, (int, float)):
+            e = pack(koff, klen, T_NUM, 0, float(v))
+        elif isinstance(v, str):
+            e = pack(koff, klen, T_STR, intern(v), 0.0)
+        elif isinstance(v, dict):
+            e = pack(koff, klen, T_OBJ, len(v), 0.0)
+        elif isinstance(v, list):
+            e = pack(koff, klen, T_ARR, len(v), 0.0)
+        else:
+            e = pack(koff, klen, T_STR, intern(str(v)), 0.0)
+        packed.append(e)
+        hashes.append(zlib.crc32(kb))
+
+    n_slots = 8
+    while n_slots < 2 * len(packed):
+        n_slots <<= 1
+    slots = array("I", bytes(_SLOT.size * n_slots))
+    mask = n_slots - 1
+    for idx, h in enumerate(hashes, 1):
+        i = h & mask
+        while slots[2 * i]:
+            i = (i + 1) & mask
+        slots[2 * i] = idx
+        slots[2 * i + 1] = h
+
+    entries_off = _PAYLOAD.size
+    slots_off = entries_off + len(packed) * _ENTRY.size
+    pool_off = slots_off + n_slots * _SLOT.size
+    header = _PAYLOAD.pack(len(packed), n_slots, entries_off, slots_off, pool_off, len(pool))
+    return b"".join((header, b"".join(packed), slots.tobytes(), bytes(pool)))
+
+
+class ShmViewWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._mm: Optional[mmap.mmap] = None
+        self.seq = 0
+
+    def _open(self, capacity: int):
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.ftruncate(fd, HEADER_SIZE + capacity)
+        mm = mmap.mmap(fd, HEADER_SIZE + capacity)
+        _HEADER.pack_into(mm, 0, MAGIC, VERSION, self.seq, capacity, 0, 0)
+        return tmp, fd, mm
+
+    def write(self, view: Dict[str, Any]) -> None:
+        payload = encode(view)
+        if self._mm is None or len(payload) > len(self._mm) - HEADER_SIZE:
+            capacity = max(MIN_CAPACITY, 2 * len(payload))
+            tmp, fd, mm = self._open(capacity)
+            mm[HEADER_SIZE : HEADER_SIZE + len(payload)] = payload
+            struct.pack_into("<Q", mm, _LEN_OFF, len(payload))
+            os.replace(tmp, self.path)
+            if self._mm is not None:
+                struct.pack_into("<I", self._mm, _MOVED_OFF, 1)
+            self.close()
+            self._fd, self._mm = fd, mm
+            return
+        mm = self._mm
+        self.seq += 1
+        struct.pack_into("<Q", mm, _SEQ_OFF, self.seq)  # 奇数：写入中
+        mm[HEADER_SIZE : HEADER_SIZE + len(payload)] = payload
+        struct.pack_into("<Q", mm, _LEN_OFF, len(payload))
+        self.seq += 1
+        struct.pack_into("<Q", mm, _SEQ_OFF, self.seq)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+# ---------- 读（测试 / 调试用；C 端见 view_shm.h） ----------
+
+
+def snapshot(path: str, retries: int = 100000) -> bytes:
+    for _ in range(retries):
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, seq, _, length, moved = _HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a shm view")
+            if moved or seq & 1:
+                continue
+            data = mm[HEADER_SIZE : HEADER_SIZE + length]
+            if struct.unpack_from("<Q", mm, _SEQ_OFF)[0] == seq:
+                return data
+        finally:
+            mm.close()
+    raise TimeoutError(f"{path}: writer never finished")
+
+
+def lookup(data: bytes, key: str) -> Optional[Tuple[int, Any]]:
+    """在 snapshot() 的结果里按规范键查找，返回 (类型, 值)；容器的值是子元素个数。"""
+    n_entries, n_slots, entries_off, slots_off, pool_off, pool_len = _PAYLOAD.unpack_from(data, 0)
+    kb = key.encode("utf-8", "surrogatepass")
+    h = key_hash(kb)
+    mask = n_slots - 1
+    i = h & mask
+    for _ in range(n_slots):
+        idx, sh = _SLOT.unpack_from(data, slots_off + i * _SLOT.size)
+        if idx == 0:
+            return None
+        if sh == h:
+            koff, klen, t, aux, num = _ENTRY.unpack_from(data, entries_off + (idx - 1) * _ENTRY.size)
+            if data[pool_off + koff : pool_off + koff + klen] == kb:
+                if t == T_STR:
+                    end = data.index(b"\0", pool_off + aux)
+                    return t, data[pool_off + aux : end].decode("utf-8", "surrogatepass")
+                if t == T_NUM:
+                    return t, num
+                if t == T_BOOL:
+                    return t, bool(aux)
+                return t, (None if t == T_NULL else aux)
+        i = (i + 1) & mask
+    return None
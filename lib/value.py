@@ -13,6 +13,11 @@ try:
 except ImportError:
     from .contracts import ContractTable, RequireSpec, State
 
+try:
+    from .merkle import MerkleNode, touch
+except ImportError:
+    from merkle import MerkleNode, touch
+
 # ===== 在文件开头加一个全局开关和工具函数 =====
 DEBUG = True  # 改成 True 就能打开所有调试信息
 
@@ -89,7 +94,7 @@ class Range:
         return self.min_value <= value <= self.max_value
 
 
-class Value(ABC):
+class Value(MerkleNode, ABC):
     def __init__(self, value, mutable: bool = True):
         self.value = value
         self.mutable = mutable  # Indicates if the value can be mutated
@@ -698,6 +703,8 @@ class ListValue(Value):  # 能不能限定：列表的元素都一样；传入
                 debug_print(f"Swapped items: {self.value[idx1]} and {self.value[idx2]}")
             else:
                 debug_print("Not enough items to swap in the list.")
+        # 上面对 self.value 的 append/pop/交换都是原地修改，不经过 __setattr__
+        touch(self)
         # if callable(self.on_after_mutate):
         #     self.on_after_mutate(self)
 
@@ -0,0 +1,367 @@
+# lib/verb_registry.py
+# -*- coding: utf-8 -*-
+"""
+类注册表 + 无损 (反) 序列化：
+- 注册表覆盖 lib.verbs / lib.cm.* / lib.Ibv* / lib.value 中的全部 VerbCall、Attr、Value 子类；
+  按类名惰性解析（先读源码建索引，只导入用到的模块），all_classes() 才会全量导入
+- to_state(obj) 产出纯 JSON 结构（保留 OptionalValue 包装、enum/flag 类型、DeferredValue 的 key 等）
+- from_dict(d) 为其逆操作：先用构造函数重建对象（拿回 factory / on_after_mutate 钩子），再按记录的状态回填
+
+注意：VerbCall.to_dict() 是给 rdma_executor 用的有损导出（丢掉 OptionalValue / DeferredValue 细节），
+这里的 to_state / from_dict 则要求 from_dict(to_state(v)) 生成的 C 代码与 v 完全一致。
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import importlib
+import inspect
+import logging
+import os
+import pkgutil
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+STATE_VERSION = 1
+
+# apply(ctx) 时才写入的运行期字段，不属于程序本身
+TRANSIENT_FIELDS = {"tracker", "context", "ctx", "required_resources", "allocated_resources"}
+
+# 各 Value 子类除 value 以外需要保留的元信息
+_VALUE_META_FIELDS = {
+    "IntValue": ("mutable", "range", "step"),
+    "BoolValue": ("mutable",),
+    "ConstantValue": ("mutable",),
+    "EnumValue": ("mutable", "enum_type"),
+    "FlagValue": ("mutable", "flag_type"),
+    "ResourceValue": ("mutable", "resource_type"),
+    "LocalResourceValue": ("mutable", "resource_type"),
+    "ListValue": ("mutable",),
+    "OptionalValue": ("mutable",),
+    "DeferredValue": ("key", "c_type", "source", "default", "by_id"),
+}
+
+# 注册表扫描的模块；lib.verbs 优先，重名时 cm 插件需带 module 才能区分
+_CORE_MODULES = ["lib.verbs", "lib.value", "lib.attr"]
+
+_REGISTRY: Dict[str, type] = {}
+_QUALIFIED: Dict[str, type] = {}
+_IMPORT_ERRORS: Dict[str, str] = {}
+_LOADED: Dict[str, bool] = {}
+# 类名 -> 定义它的模块（按优先级排列）；只读源码建立，不导入
+_SOURCE_INDEX: Optional[Dict[str, List[str]]] = None
+_CLASS_DEF = re.compile(r"^class\s+([A-Za-z_]\w*)\s*[(:]", re.M)
+
+
+@functools.lru_cache(maxsize=None)
+def _candidate_modules() -> Tuple[str, ...]:
+    lib_dir = os.path.dirname(__file__)
+    mods = list(_CORE_MODULES)
+    mods += [f"lib.{m.name}" for m in pkgutil.iter_modules([lib_dir]) if m.name.startswith("Ibv")]
+    mods += [f"lib.cm.{m.name}" for m in pkgutil.iter_modules([os.path.join(lib_dir, "cm")])]
+    return tuple(mods)
+
+
+def _module_rank(fqmn: str) -> int:
+    mods = _candidate_modules()
+    return mods.index(fqmn) if fqmn in mods else len(mods)
+
+
+def _source_index() -> Dict[str, List[str]]:
+    global _SOURCE_INDEX
+    if _SOURCE_INDEX is None:
+        lib_dir = os.path.dirname(os.path.dirname(__file__))
+        index: Dict[str, List[str]] = {}
+        for fqmn in _candidate_modules():
+            path = os.path.join(lib_dir, *fqmn.split(".")) + ".py"
+            try:
+                with open(path, encoding="utf-8") as f:
+                    src = f.read()
+            except OSError:
+                continue
+            for name in _CLASS_DEF.findall(src):
+                index.setdefault(name, []).append(fqmn)
+        _SOURCE_INDEX = index
+    return _SOURCE_INDEX
+
+
+def _is_program_class(c) -> bool:
+    from lib.attr import Attr
+    from lib.value import Value
+    from lib.verbs import UtilityCall, VerbCall
+
+    return inspect.isclass(c) and issubclass(c, (VerbCall, UtilityCall, Attr, Value))
+
+
+def register(cls: type) -> type:
+    """手动注册一个类（也可作装饰器使用）。重名时保留优先级更高的模块里的定义。"""
+    cur = _REGISTRY.get(cls.__name__)
+    if cur is None or _module_rank(cls.__module__) < _module_rank(cur.__module__):
+        _REGISTRY[cls.__name__] = cls
+    _QUALIFIED[f"{cls.__module__}.{cls.__name__}"] = cls
+    return cls
+
+
+def _load_module(fqmn: str) -> bool:
+    """导入一个候选模块并注册其中的类；结果缓存，失败的模块只尝试一次。"""
+    if fqmn not in _LOADED:
+        try:
+            mod = importlib.import_module(fqmn)
+        except Exception as e:
+            # 个别插件本身就导入失败（契约里用了未定义的状态），跳过即可
+            _IMPORT_ERRORS[fqmn] = f"{type(e).__name__}: {e}"
+            logging.debug("[registry] import failed: %s: %s", fqmn, e)
+            _LOADED[fqmn] = False
+            return False
+        for name, obj in vars(mod).items():
+            if _is_program_class(obj) and obj.__module__ == fqmn:
+                register(obj)
+        _LOADED[fqmn] = True
+    return _LOADED[fqmn]
+
+
+def _ensure_loaded():
+    for fqmn in _candidate_modules():
+        _load_module(fqmn)
+
+
+def get_class(name: str, module: Optional[str] = None) -> type:
+    """
+    按需解析类：只导入定义该类的模块（cm 插件、Ibv* 只有在程序里真的用到时才会被导入）。
+    module 给出时优先按限定名查找。
+    """
+    if module:
+        cls = _QUALIFIED.get(f"{module}.{name}")
+        if cls is None and _load_module(module):
+            cls = _QUALIFIED.get(f"{module}.{name}")
+        if cls is not None:
+            return cls
+    for fqmn in _source_index().get(name, ()):
+        # 按优先级逐个尝试，第一个能导入且确实定义了该类的模块即为规范定义
+        if _load_module(fqmn) and f"{fqmn}.{name}" in _QUALIFIED:
+            break
+    if name not in _REGISTRY:
+        # 源码索引找不到（动态生成的类等），退回全量扫描
+        _ensure_loaded()
+    if name not in _REGISTRY:
+        raise KeyError(f"Unknown class in program state: {name}")
+    return _REGISTRY[name]
+
+
+def all_classes() -> Dict[str, type]:
+    _ensure_loaded()
+    return dict(_REGISTRY)
+
+
+def import_errors() -> Dict[str, str]:
+    _ensure_loaded()
+    return dict(_IMPORT_ERRORS)
+
+
+# ----------------------------- encode ------------------------------
+
+
+def _class_ref(obj) -> Dict[str, Any]:
+    cls = type(obj)
+    ref = {}
+    try:
+        canonical = get_class(cls.__name__)
+    except KeyError:
+        canonical = None
+    if canonical is not cls:
+        ref["module"] = cls.__module__
+    return ref
+
+
+def _enc_meta(v):
+    if isinstance(v, dict):
+        # enum_type / flag_type 也可能直接是 dict，key 可能是 int
+        return {"type": "dict", "value": [[_enc_meta(k), _enc_meta(x)] for k, x in v.items()]}
+    if isinstance(v, tuple):
+        return {"type": "tuple", "value": [_enc_meta(x) for x in v]}
+    if type(v).__name__ == "Range":
+        return {"type": "Range", "value": [v.min_value, v.max_value]}
+    if isinstance(v, list):
+        return [_enc_meta(x) for x in v]
+    if v is None or isinstance(v, (bool, int, float, str)):
+        return v
+    return to_state(v)
+
+
+def to_state(obj: Any) -> Any:
+    """把 verb / attr / value 对象编码为可 JSON 序列化的无损结构。"""
+    from lib.attr import Attr
+    from lib.value import Value
+    from lib.verbs import UtilityCall, VerbCall
+
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, list):
+        return [to_state(x) for x in obj]
+    if isinstance(obj, (tuple, dict)) or type(obj).__name__ == "Range":
+        return _enc_meta(obj)
+    if isinstance(obj, Value):
+        cls_name = type(obj).__name__
+        d = {"type": cls_name, **_class_ref(obj)}
+        meta = {}
+        for f in _VALUE_META_FIELDS.get(cls_name, ("mutable",)):
+            if hasattr(obj, f):
+                meta[f] = _enc_meta(getattr(obj, f))
+        if meta:
+            d["meta"] = meta
+        if cls_name != "DeferredValue":
+            d["value"] = to_state(getattr(obj, "value", None))
+        return d
+    if isinstance(obj, (VerbCall, UtilityCall, Attr)):
+        fields = {}
+        for k, v in vars(obj).items():
+            if k in TRANSIENT_FIELDS or k.startswith("_") or callable(v):
+                continue
+            fields[k] = to_state(v)
+        return {"verb": type(obj).__name__, **_class_ref(obj), "fields": fields}
+    raise TypeError(f"Unsupported object for program state: {type(obj)}")
+
+
+# ----------------------------- decode ------------------------------
+
+
+def _dec_meta(v):
+    if isinstance(v, list):
+        return [_dec_meta(x) for x in v]
+    if isinstance(v, dict):
+        t = v.get("type")
+        if t == "dict":
+            return {_dec_meta(k): _dec_meta(x) for k, x in v["value"]}
+        if t == "tuple":
+            return tuple(_dec_meta(x) for x in v["value"])
+        if t == "Range":
+            from lib.value import Range
+
+            return Range(*v["value"])
+        return from_dict(v)
+    return v
+
+
+def _raw(x):
+    """构造函数参数：把 wrapper 摊平成原始值，Attr 对象原样传入。"""
+    from lib.value import DeferredValue, ListValue, OptionalValue, Value
+
+    if isinstance(x, DeferredValue):
+        return None
+    if isinstance(x, OptionalValue):
+        return _raw(x.value)
+    if isinstance(x, ListValue):
+        return [_raw(i) for i in x.value]
+    if isinstance(x, Value):
+        return x.value
+    if isinstance(x, list):
+        return [_raw(i) for i in x]
+    return x
+
+
+def _instantiate(cls, fields: Dict[str, Any]):
+    """尽量用构造函数建对象，以便 factory / 回调等闭包与新对象绑定；失败则退化为 __new__。"""
+    try:
+        sig = inspect.signature(cls.__init__)
+    except (TypeError, ValueError):
+        sig = None
+    if sig is not None:
+        kwargs = {}
+        required = {}
+        for name, p in list(sig.parameters.items())[1:]:
+            if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+                continue
+            if name in fields:
+                kwargs[name] = _raw(from_dict(fields[name]))
+                if p.default is p.empty:
+                    required[name] = kwargs[name]
+        for attempt in (kwargs, required):
+            try:
+                return cls(**attempt)
+            except Exception:
+                continue
+    obj = cls.__new__(cls)
+    for k in ("tracker",):
+        setattr(obj, k, None)
+    obj.required_resources = []
+    obj.allocated_resources = []
+    return obj
+
+
+def _surrogate_list_factory(items):
+    """ListValue 的原始 factory 丢失时，用元素类的 random_mutation 或首元素拷贝代替。"""
+    proto = items[0] if items else None
+    rm = getattr(type(proto), "random_mutation", None)
+    if callable(rm):
+        return rm
+    return lambda: copy.deepcopy(proto)
+
+
+def _decode_value(d: Dict[str, Any], into=None):
+    cls = get_class(d["type"], d.get("module"))
+    meta = {k: _dec_meta(v) for k, v in (d.get("meta") or {}).items()}
+    if cls.__name__ == "DeferredValue":
+        return cls(**{k: meta.get(k) for k in ("key", "c_type", "source", "default", "by_id")})
+
+    fresh = not (into is not None and type(into) is cls)
+    obj = cls.__new__(cls) if fresh else into
+    if fresh:
+        obj.mutable = True
+        if cls.__name__ in ("ListValue", "OptionalValue"):
+            obj.factory = None
+        if cls.__name__ == "ListValue":
+            obj.on_after_mutate = None
+    for k, v in meta.items():
+        setattr(obj, k, v)
+    if cls.__name__ == "EnumValue":
+        obj.enums = list(obj._get_enum_values(obj.enum_type))
+        obj.enum_dict = obj._get_enum_dict(obj.enum_type)
+    elif cls.__name__ == "FlagValue":
+        obj.flags = list(obj._get_flag_values(obj.flag_type))
+        obj.map = getattr(obj, obj.flag_type) if isinstance(obj.flag_type, str) else obj.flag_type
+    elif cls.__name__ == "IntValue":
+        obj.range = meta.get("range")
+        obj.step = meta.get("step")
+
+    old = None if fresh else getattr(into, "value", None)
+    if cls.__name__ == "ListValue":
+        obj.value = [from_dict(x) for x in (d.get("value") or [])]
+        if obj.factory is None:
+            obj.factory = _surrogate_list_factory(obj.value)
+    else:
+        obj.value = from_dict(d.get("value"), into=old)
+        if cls.__name__ == "OptionalValue" and obj.factory is None and obj.value is not None:
+            proto = copy.deepcopy(obj.value)
+            obj.factory = lambda: copy.deepcopy(proto)
+    return obj
+
+
+def _decode_object(d: Dict[str, Any], into=None):
+    cls = get_class(d["verb"], d.get("module"))
+    fields = d.get("fields", {})
+    obj = into if (into is not None and type(into) is cls) else _instantiate(cls, fields)
+    for k in list(vars(obj).keys()):
+        # 构造函数顺带生成、但原对象上不存在的字段要去掉
+        if k not in fields and k not in TRANSIENT_FIELDS and not k.startswith("_") and not callable(vars(obj)[k]):
+            delattr(obj, k)
+    for k, enc in fields.items():
+        setattr(obj, k, from_dict(enc, into=vars(obj).get(k)))
+    return obj
+
+
+def from_dict(d: Any, into: Any = None) -> Any:
+    """to_state 的逆操作；into 为同类型的已有对象时就地回填（保留其闭包钩子）。"""
+    if d is None or isinstance(d, (bool, int, float, str)):
+        return d
+    if isinstance(d, list):
+        return [from_dict(x) for x in d]
+    if isinstance(d, dict):
+        if "verb" in d and "fields" in d:
+            return _decode_object(d, into)
+        t = d.get("type")
+        if t in ("dict", "tuple", "Range"):
+            return _dec_meta(d)
+        if t is not None:
+            return _decode_value(d, into)
+    raise TypeError(f"Unsupported program state node: {d!r}")
@@ -59,6 +59,7 @@ except Exception:
     )
 
 from lib.contracts import Contract, InstantiatedContract, ProduceSpec, RequireSpec, State, TransitionSpec
+from lib.merkle import MerkleNode
 
 
 def mask_fields_to_c(mask):
@@ -96,7 +97,7 @@ def _parse_kv(info: str) -> dict[str, str]:
 # ---------- Verb call base ----------------------------------------------------
 
 
-class VerbCall:
+class VerbCall(MerkleNode):
     FIELD_LIST = []
     EXPORT_FIELDS = []
 
@@ -225,7 +226,7 @@ class VerbCall:
         return d
 
 
-class UtilityCall:  # 生成verbs之外的函数
+class UtilityCall(MerkleNode):  # 生成verbs之外的函数
     def __init__(self):
         self.tracker = None
         self.required_resources = []  # 记录所需资源
@@ -417,8 +418,9 @@ class AdviseMR(VerbCall):  # TODO: 暂时用不上，没改return -1
 
         s += f"""
     if (ibv_advise_mr({pd_name}, {advice_macro}, {flags}, {sg_var}, {num_sge}) != 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "ibv_advise_mr failed\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
         return s
@@ -479,6 +481,7 @@ class AllocDM(VerbCall):
         code += f"""
     {dm_name} = ibv_alloc_dm({ib_ctx}, &{self.attr_var});
     if (!{dm_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to allocate device memory (DM) {dm_name}\\n");
     }}
 """
@@ -540,6 +543,7 @@ class AllocMW(VerbCall):
     IF_OK_PTR({pd_name}, {{
         {mw_name} = ibv_alloc_mw({pd_name}, {self.mw_type});
         if (!{mw_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to allocate memory window {mw_name}\\n");
         }}
     }});
@@ -597,6 +601,7 @@ class AllocNullMR(VerbCall):
     IF_OK_PTR({pd_name}, {{
         {mr_name} = ibv_alloc_null_mr({pd_name});
         if (!{mr_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to allocate null MR {mr_name}\\n");
         }}
     }});
@@ -680,6 +685,7 @@ class AllocParentDomain(VerbCall):
         code += f"""
     {parent_pd_name} = ibv_alloc_parent_domain({self.context}, &{self.attr_var});
     if (!{parent_pd_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to allocate parent domain {parent_pd_name}\\n");
     }}
 """
@@ -735,6 +741,7 @@ class AllocPD(VerbCall):
     /* ibv_alloc_pd */
     {pd_name} = ibv_alloc_pd({self.context.ib_ctx});
     if (!{pd_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to allocate protection domain {pd_name}\\n");
     }}
 """
@@ -797,8 +804,9 @@ class AllocTD(VerbCall):
         code += f"""
     {td_name} = ibv_alloc_td({ctx.ib_ctx}, &{self.attr_var});
     if (!{td_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to allocate thread domain {td_name}\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
         return code
@@ -806,6 +814,7 @@ class AllocTD(VerbCall):
 
 class AttachMcast(VerbCall):
     MUTABLE_FIELDS = ["qp", "gid", "lid"]
+    EXPORT_FIELDS = ["qp", "gid", "lid"]
     CONTRACT = Contract(
         requires=[RequireSpec("qp", None, "qp", exclude_states=[State.DESTROYED])], produces=[], transitions=[]
     )
@@ -847,6 +856,7 @@ class AttachMcast(VerbCall):
     /* ibv_attach_mcast */
     IF_OK_PTR({qp_name}, {{
         if (ibv_attach_mcast({qp_name}, &{gid_value}, {self.lid})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to attach multicast group {qp_name}\\n");
         }}
     }});
@@ -855,6 +865,7 @@ class AttachMcast(VerbCall):
 
 class BindMW(VerbCall):
     MUTABLE_FIELDS = ["qp", "mw", "mw_bind_var", "mw_bind_obj"]
+    EXPORT_FIELDS = ["qp", "mw", "mw_bind_obj"]
     # CONTRACT = Contract(  # TODO: 改为动态（其实有办法筛选）
     #     requires=[RequireSpec("qp", None, "qp"), RequireSpec("mr", None, "mw_bind_obj.bind_info.mr")],
     #     produces=[ProduceSpec("mw", State.ALLOCATED, "mw")],
@@ -964,6 +975,7 @@ class BindMW(VerbCall):
     IF_OK_PTR({qp_name}, {{
         IF_OK_PTR({mw_name}, {{
             if (ibv_bind_mw({qp_name}, {mw_name}, &{mw_bind_var}) != 0) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "Failed to bind MW {mw_name}, {qp_name}\\n");
             }}
         }});
@@ -993,6 +1005,7 @@ class CloseDevice(VerbCall):
     /* ibv_close_device */
     IF_OK_PTR({context_name}, {{
         if (ibv_close_device({context_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to close device {context_name}\\n");
             }}
         }}
@@ -1041,6 +1054,7 @@ class CloseXRCD(VerbCall):
     /* ibv_close_xrcd */
     IF_OK_PTR({xrcd_name}, {{
         if (ibv_close_xrcd({xrcd_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to close XRCD {xrcd_name}\\n");
         }}
     }});
@@ -1114,6 +1128,7 @@ class CreateAH(VerbCall):
     IF_OK_PTR({pd_name}, {{
         {ah_var} = ibv_create_ah({pd_name}, &{self.attr_var});
         if (!{ah_var}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "ibv_create_ah failed {ah_var}\\n");
         }}
     }});
@@ -1191,6 +1206,7 @@ class CreateAHFromWC(VerbCall):
         IF_OK_PTR({wc_name}, {{
             {self.ah} = ibv_create_ah_from_wc({pd_name}, &{wc_name}, &{grh_name}, {port_num});
             if (!{self.ah}) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "Failed to create AH from work completion {self.ah}\\n");
             }}
         }}
@@ -1234,6 +1250,7 @@ class CreateCompChannel(VerbCall):
     /* ibv_create_comp_channel */
     {channel_name} = ibv_create_comp_channel({ib_ctx});
     if (!{channel_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to create completion channel {channel_name}\\n");
     }}
 """
@@ -1314,6 +1331,7 @@ class CreateCQ(VerbCall):
                               {cq_context}, {channel}, 
                               {comp_vector});
     if (!{cq_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to create completion queue {cq_name}\\n");
     }}
 """
@@ -1411,6 +1429,7 @@ class CreateCQEx(VerbCall):
         code += f"""
     {self.cq_ex} = ibv_create_cq_ex({self.ctx_name}, &{self.cq_attr_var});
     if (!{self.cq_ex}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "ibv_create_cq_ex failed {self.cq_ex}\\n");
     }}
 """
@@ -1495,6 +1514,7 @@ class CreateFlow(VerbCall):
     IF_OK_PTR({qp_name}, {{
         {flow_var} = ibv_create_flow({qp_name}, &{flow_attr_var});
         if (!{flow_var}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "ibv_create_flow failed {flow_var}\\n");
         }}
     }});
@@ -1617,6 +1637,7 @@ class CreateQP(VerbCall):
         {code}
         {qp_name} = ibv_create_qp({pd_name}, &{attr_name});
         if (!{qp_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to create QP {qp_name}\\n");
         }}
         
@@ -1758,6 +1779,7 @@ class CreateQPEx(VerbCall):
         {code}
         {qp_name} = ibv_create_qp_ex({self.ctx_name}, &{self.qp_attr_var});
         if (!{qp_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "ibv_create_qp_ex failed {qp_name}\\n");
         }}
         
@@ -1890,6 +1912,7 @@ class CreateSRQ(VerbCall):
         {code}
         {srq_name} = ibv_create_srq({pd_name}, &{attr_name});
         if (!{srq_name}) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to create SRQ {srq_name}\\n");
         }}
     }});
@@ -1981,6 +2004,7 @@ class CreateSRQEx(VerbCall):  # TODO: 暂时不用，没改return -1
         code += f"""
     {self.srq_var} = ibv_create_srq_ex({self.ctx_name}, &{self.srq_attr_var});
     if (!{self.srq_var}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "ibv_create_srq_ex failed {self.srq_var}\\n");
     }}
 """
@@ -2076,6 +2100,7 @@ class CreateWQ(VerbCall):  # TODO: 暂时不用，没改return -1
         code += f"""
     {self.wq_var} = ibv_create_wq({self.ctx_name}, &{self.wq_attr_var});
     if (!{self.wq_var}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "ibv_create_wq failed {self.wq_var}\\n");
     }}
 """
@@ -2118,6 +2143,7 @@ class DeallocMW(VerbCall):
     /* ibv_dealloc_mw */
     IF_OK_PTR({mw_name}, {{
         if (ibv_dealloc_mw({mw_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to deallocate MW {mw_name}\\n");
         }}
     }});
@@ -2165,6 +2191,7 @@ class DeallocPD(VerbCall):
     /* ibv_dealloc_pd */
     IF_OK_PTR({pd_name}, {{
         if (ibv_dealloc_pd({pd_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to deallocate PD {pd_name}\\n");
         }}
     }});
@@ -2210,6 +2237,7 @@ class DeallocTD(VerbCall):
     /* ibv_dealloc_td */
     IF_OK_PTR({td_name}, {{
         if (ibv_dealloc_td({td_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to deallocate TD {td_name}\\n");
         }}
     }});
@@ -2257,6 +2285,7 @@ class DeregMR(VerbCall):
     /* ibv_dereg_mr */
     IF_OK_PTR({mr_name}, {{
         if (ibv_dereg_mr({mr_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to deregister MR {mr_name}\\n");
         }}
     }});
@@ -2302,6 +2331,7 @@ class DestroyAH(VerbCall):
     /* ibv_destroy_ah */
     IF_OK_PTR({ah_name}, {{
         if (ibv_destroy_ah({ah_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to destroy AH {ah_name}\\n");
         }}
     }})
@@ -2353,6 +2383,7 @@ class DestroyCompChannel(VerbCall):
     /* ibv_destroy_comp_channel */
     IF_OK_PTR({channel_name}, {{
         if (ibv_destroy_comp_channel({channel_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to destroy completion channel {channel_name}\\n");
         }}
     }});
@@ -2400,6 +2431,7 @@ class DestroyCQ(VerbCall):
     /* ibv_destroy_cq */
     IF_OK_PTR({cq_name}, {{
         if (ibv_destroy_cq({cq_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to destroy CQ {cq_name}\\n");
         }}
     }});
@@ -2447,6 +2479,7 @@ class DestroyFlow(VerbCall):
     /* ibv_destroy_flow */
     IF_OK_PTR({flow_name}, {{
         if (ibv_destroy_flow({flow_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to destroy flow {flow_name}\\n");
         }}
     }});
@@ -2494,6 +2527,7 @@ class DestroyQP(VerbCall):
     /* ibv_destroy_qp */
     IF_OK_PTR({qp_name}, {{
         if (ibv_destroy_qp({qp_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to destroy QP {qp_name}\\n");
         }}
     }});
@@ -2566,6 +2600,7 @@ class DestroySRQ(VerbCall):
     /* ibv_destroy_srq */
     IF_OK_PTR({srq_name}, {{
         if (ibv_destroy_srq({srq_name}) != 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to destroy SRQ {srq_name}\\n");
         }}
     }});
@@ -2611,6 +2646,7 @@ class DestroyWQ(VerbCall):
     /* ibv_destroy_wq */
     IF_OK_PTR({wq_name}, {{
         if (ibv_destroy_wq({wq_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to destroy WQ {wq_name}\\n");
         }}
     }});
@@ -2662,6 +2698,7 @@ class DetachMcast(VerbCall):  # TODO: gid 需要是变量名
     /* ibv_detach_mcast */
     IF_OK_PTR({qp_name}, {{
         if (ibv_detach_mcast({qp_name}, &{self.gid}, {self.lid})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to detach multicast group {qp_name}\\n");
         }}
     }});
@@ -2744,8 +2781,9 @@ class ForkInit(VerbCall):
         return """
     /* ibv_fork_init */
     if (ibv_fork_init()) {
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to initialize fork support\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }
 """
 
@@ -2816,6 +2854,7 @@ class FreeDM(VerbCall):
     /* ibv_free_dm */
     IF_OK_PTR({dm_name}, {{
         if (ibv_free_dm({dm_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to free device memory (DM) {dm_name}\\n");
         }}
     }});
@@ -3022,6 +3061,7 @@ class GetDeviceIndex(VerbCall):
     /* Retrieve IB device index */
     {index_var} = ibv_get_device_index({device});
     if ({index_var} < 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to get device index for {device}\\n");
     }}
 """
@@ -3065,8 +3105,9 @@ class GetDeviceList(VerbCall):
     /* ibv_get_device_list */
     {self.dev_list} = ibv_get_device_list(NULL);
     if (!{self.dev_list}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to get device list: %s\\n", strerror(errno));
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
 
@@ -3098,6 +3139,7 @@ class GetDeviceName(VerbCall):
     /* ibv_get_device_name */
     {self.output} = ibv_get_device_name({self.device});
     if (!{self.output}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to get device name\\n");
     }} else {{
         printf("Device name: %s\\n", {self.output});
@@ -3141,8 +3183,9 @@ class GetPKeyIndex(VerbCall):
         return f"""
     /* ibv_get_pkey_index */
     if (({pkey_index} = ibv_get_pkey_index({ib_ctx}, {self.port_num}, {self.pkey})) < 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to get P_Key index\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
 
@@ -3199,6 +3242,7 @@ class GetSRQNum(VerbCall):
     /* ibv_get_srq_num */
     IF_OK_PTR({srq_name}, {{
         if (ibv_get_srq_num({srq_name}, &{self.srq_num_var})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to get SRQ number {srq_name}\\n");
         }}
     }});
@@ -3273,6 +3317,7 @@ class ImportDM(VerbCall):
     /* ibv_import_dm */
     {self.dm_var} = ibv_import_dm({ib_ctx}, {self.dm_handle});
     if (!{self.dm_var}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to import device memory {self.dm_var}\\n");
     }}
 """
@@ -3327,6 +3372,7 @@ class ImportMR(VerbCall):
     /* ibv_import_mr */
     {mr_name} = ibv_import_mr({pd_name}, {self.mr_handle});
     if (!{mr_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to import MR {mr_name}\\n");
     }}
 """
@@ -3374,6 +3420,7 @@ class ImportPD(VerbCall):
     /* ibv_import_pd */
     {pd_name} = ibv_import_pd({ctx.ib_ctx}, {self.pd_handle});
     if (!{pd_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to import PD {pd_name}\\n");
     }}
 """
@@ -3519,6 +3566,7 @@ class MemcpyFromDM(VerbCall):
     /* ibv_memcpy_from_dm */
     IF_OK_PTR({dm_name}, {{
         if (ibv_memcpy_from_dm({self.host}, {dm_name}, {self.dm_offset}, {self.length}) != 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to copy from device memory {dm_name}\\n");
         }}
     }});
@@ -3577,6 +3625,7 @@ class MemcpyToDM(VerbCall):
     /* ibv_memcpy_to_dm */
     IF_OK_PTR({dm_name}, {{
         if (ibv_memcpy_to_dm({dm_name}, {self.dm_offset}, {self.host}, {self.length}) != 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to copy to device memory {dm_name}\\n");
         }}
     }});
@@ -3639,6 +3688,7 @@ class ModifyCQ(VerbCall):
         code += f"""
     IF_OK_PTR({cq_name}, {{
         if (ibv_modify_cq({cq_name}, &{self.attr_var}) != 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "ibv_modify_cq failed {cq_name}\\n");
         }}
     }});
@@ -3790,6 +3840,7 @@ class ModifyQP(VerbCall):
         memset(&{attr_name}, 0, sizeof({attr_name}));
         {attr_lines}
         if (ibv_modify_qp({qp_name}, &{attr_name}, {mask_code})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to modify QP {qp_name}\\n");
         }}
     }});
@@ -3855,6 +3906,7 @@ class ModifyQPRateLimit(VerbCall):
         code += f"""
     IF_OK_PTR({qp_name}, {{
         if (ibv_modify_qp_rate_limit({qp_name}, &{self.attr_var}) != 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "ibv_modify_qp_rate_limit failed {qp_name}\\n");
         }}
     }});
@@ -3926,6 +3978,7 @@ class ModifySRQ(VerbCall):
         code += f"""
     IF_OK_PTR({srq_name}, {{
         if (ibv_modify_srq({srq_name}, &{self.attr_var}, {self.attr_mask}) != 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "ibv_modify_srq failed {srq_name}\\n");
         }}
     }});
@@ -3990,6 +4043,7 @@ class ModifyWQ(VerbCall):
         code += f"""
     IF_OK_PTR({wq_name}, {{
         if (ibv_modify_wq({wq_name}, &{self.attr_var}) != 0) {{
+            RR_SET_FAIL();
             fprintf(stderr, "ibv_modify_wq failed {wq_name}\\n");
         }}
     }});
@@ -4026,6 +4080,7 @@ class OpenDevice(VerbCall):
     /* ibv_open_device */
     {ib_ctx} = ibv_open_device({dev_list}[0]);
     if (!{ib_ctx}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to open device {dev_list}\\n");
     }}
 """
@@ -4104,6 +4159,7 @@ class OpenQP(VerbCall):
         code += f"""
     {self.qp_var} = ibv_open_qp({self.ctx_var}, &{self.attr_var});
     if (!{self.qp_var}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "ibv_open_qp failed {self.qp_var}\\n");
     }}
 """
@@ -4176,6 +4232,7 @@ class OpenXRCD(VerbCall):
         code += f"""
     {self.xrcd_var} = ibv_open_xrcd({self.ctx_var}, &{self.attr_var});
     if (!{self.xrcd_var}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "ibv_open_xrcd failed {self.xrcd_var}\\n");
     }}
 """
@@ -4224,10 +4281,12 @@ class PollCQ(VerbCall):  # TODO: 这个非常特殊，是一个compound的函数
                 while (attempts-- > 0) {{
                     n = ibv_poll_cq({cq_name}, 1, &wc);
                     if (n < 0) {{
+                        RR_SET_FAIL();
                         fprintf(stderr, "ibv_poll_cq failed {cq_name}\\n");
                     }}
                     if (n == 1) {{
                         if (wc.status != IBV_WC_SUCCESS) {{
+                            RR_SET_FAIL();
                             fprintf(stderr, "**bad** completion: status=0x%x vendor=0x%x cq={cq_name}\\n",
                                     wc.status, wc.vendor_err);
                         }}
@@ -4390,6 +4449,7 @@ class PostRecv(VerbCall):
 
         body = f"""\
     if (ibv_post_recv({qp_name}, &{wr_name}, &{bad_wr_name}) != 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "[warn] ibv_post_recv failed {qp_name}\\n");
     }}"""
         return f"""
@@ -4509,6 +4569,7 @@ class PostSend(VerbCall):
         bad_wr_arg = f"&{bad_wr_name}"
         body = f"""\
     if (ibv_post_send({qp_name}, &{wr_name}, {bad_wr_arg}) != 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "[warn] ibv_post_send failed {qp_name}\\n");
     }}"""
 
@@ -4655,6 +4716,7 @@ class PostSRQRecv(VerbCall):
 
         body = f"""\
     if (ibv_post_srq_recv({srq_name}, &{wr_name}, &{bad_wr_name}) != 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "[warn] ibv_post_srq_recv failed {srq_name}\\n");
     }}"""
         return f"""
@@ -4693,8 +4755,9 @@ class QueryDeviceAttr(VerbCall):
         return f"""
     /* ibv_query_device */
     if (ibv_query_device({ib_ctx}, &{self.output})) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to query device attributes\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
 
@@ -4756,8 +4819,9 @@ class QueryDeviceEx(VerbCall):
     memset(&{self.input_var}, 0, sizeof({self.input_var}));
     {self.input_var}.comp_mask = {self.comp_mask};
     if (ibv_query_device_ex({self.ctx_var}, &{self.input_var}, &{self.attr_var}) != 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "ibv_query_device_ex failed {self.ctx_var}\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
         return s
@@ -4807,6 +4871,7 @@ class QueryECE(VerbCall):
     /* ibv_query_ece */
     IF_OK_PTR({qp_name}, {{
         if (ibv_query_ece({qp_name}, &{self.output})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to query ECE options, error code: %d\\n", query_result);
         }}
         fprintf(stdout, "ECE options for QP: vendor_id=0x%x, options=0x%x, comp_mask=0x%x\\n",
@@ -4818,6 +4883,7 @@ class QueryECE(VerbCall):
 
 class QueryGID(VerbCall):
     MUTABLE_FIELDS = ["port_num", "index"]
+    EXPORT_FIELDS = ["port_num", "index"]
 
     def __init__(self, port_num: int = None, index: int = None, gid_var: str = None):
         self.port_num = IntValue(port_num or 1)  # Default port number
@@ -4841,8 +4907,9 @@ class QueryGID(VerbCall):
         return f"""
     /* ibv_query_gid */
     if (ibv_query_gid({self.context.ib_ctx}, {self.port_num}, {self.index}, &{self.gid_var})) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to query GID {self.context.ib_ctx}, {self.port_num}, {self.index}\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
 
@@ -4879,8 +4946,9 @@ class QueryGIDEx(VerbCall):
         return f"""
     /* ibv_query_gid_ex */
     if (ibv_query_gid_ex({ib_ctx}, {self.port_num}, {self.gid_index}, &{self.output}, {self.flags})) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to query GID {ib_ctx}, {self.port_num}, {self.gid_index}\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
 
@@ -4907,8 +4975,9 @@ class QueryGIDTable(VerbCall):
         return f"""
     /* ibv_query_gid_table */
     if (ibv_query_gid_table({ctx.ib_ctx}, {self.output}, {self.max_entries}, 0) < 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to query GID table {ctx.ib_ctx}, {self.output}, {self.max_entries}\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
 
@@ -4938,8 +5007,9 @@ class QueryPKey(VerbCall):
         return f"""
     /* ibv_query_pkey */
     if (ibv_query_pkey({ctx.ib_ctx}, {self.port_num}, {self.index}, &{pkey_name})) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to query P_Key {ctx.ib_ctx}, {self.port_num}, {self.index}\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
 
@@ -4970,8 +5040,9 @@ class QueryPortAttr(VerbCall):
         return f"""
     /* ibv_query_port */
     if (ibv_query_port({ib_ctx}, {self.port_num}, &{self.port_attr})) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to query port attributes {ib_ctx}, {self.port_num}\\n");
-        return -1;
+        RR_FAIL_RETURN();
     }}
 """
 
@@ -5028,6 +5099,7 @@ class QueryQP(VerbCall):
     /* ibv_query_qp */
     IF_OK_PTR({qp_name}, {{
         if (ibv_query_qp({qp_name}, &{attr_name}, {self.attr_mask}, &{init_attr_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to query QP {qp_name}\\n");
         }}
     }});
@@ -5126,6 +5198,7 @@ class QuerySRQ(VerbCall):
     /* ibv_query_srq */
     IF_OK_PTR({srq_name}, {{
         if (ibv_query_srq({srq_name}, &{attr_name})) {{
+            RR_SET_FAIL();
             fprintf(stderr, "Failed to query SRQ {srq_name}\\n");
         }}
         fprintf(stdout, "SRQ max_wr: %u, max_sge: %u, srq_limit: %u\\n", 
@@ -5260,6 +5333,7 @@ class RegDmaBufMR(VerbCall):
     /* ibv_reg_dmabuf_mr */
     {mr_name} = ibv_reg_dmabuf_mr({pd_name}, {self.offset}, {self.length}, {self.iova}, {self.fd}, {self.access});
     if (!{mr_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to register dmabuf MR {mr_name}\\n");
     }}
 
@@ -5347,6 +5421,7 @@ class RegMR(VerbCall):
     /* ibv_reg_mr */
     {mr_name} = ibv_reg_mr({pd_name}, {addr}, {length}, {access});
     if (!{mr_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to register memory region {mr_name}\\n");
     }}
     
@@ -5428,6 +5503,7 @@ class RegMRIova(VerbCall):
     /* ibv_reg_mr_iova */
     {mr_name} = ibv_reg_mr_iova({pd_name}, {self.buf}, {self.length}, {self.iova}, {self.access});
     if (!{mr_name}) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to register memory region with IOVA {mr_name}\\n");
     }}
     
@@ -5484,6 +5560,7 @@ class ReqNotifyCQ(VerbCall):
     /* ibv_req_notify_cq */
     IF_OK_PTR({cq_name}, {{
         if (ibv_req_notify_cq({cq_name}, {self.solicited_only})) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to request CQ notification {cq_name}\\n");
         }}
     }});
@@ -5493,6 +5570,7 @@ class ReqNotifyCQ(VerbCall):
 
 class ReRegMR(VerbCall):
     MUTABLE_FIELDS = ["mr", "flags", "pd", "addr", "length", "access"]
+    EXPORT_FIELDS = ["mr", "flags", "pd", "addr", "length", "access"]
     CONTRACT = Contract(
         requires=[
             RequireSpec("mr", None, "mr", exclude_states=[State.DESTROYED]),
@@ -5564,6 +5642,7 @@ class ReRegMR(VerbCall):
         IF_OK_PTR({mr_name}, {{
             IF_OK_PTR({pd_name}, {{
                     if (ibv_rereg_mr({mr_name}, {self.flags}, {pd_name}, {addr}, {self.length}, {self.access}) != 0) {{
+                    RR_SET_FAIL();
                     fprintf(stderr, "Failed to re-register MR {mr_name}\\n");
                 }}
             }});
@@ -5574,6 +5653,7 @@ class ReRegMR(VerbCall):
         /* ibv_rereg_mr */
         IF_OK_PTR({mr_name}, {{
                 if (ibv_rereg_mr({mr_name}, {self.flags}, NULL, {addr}, {self.length}, {self.access}) != 0) {{
+                RR_SET_FAIL();
                 fprintf(stderr, "Failed to re-register MR {mr_name}\\n");
             }}
         }});
@@ -5623,6 +5703,7 @@ class ResizeCQ(VerbCall):
     /* ibv_resize_cq */
     IF_OK_PTR({cq_name}, {{
         if (ibv_resize_cq({cq_name}, {self.cqe})) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to resize CQ {cq_name}\\n");
         }}
     }});
@@ -5689,6 +5770,7 @@ class SetECE(VerbCall):
         s += f"""
     IF_OK_PTR({qp_name}, {{
         if (ibv_set_ece({qp_name}, &{self.ece_var}) != 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "ibv_set_ece failed {qp_name}\\n");
         }}
     }});
@@ -5781,6 +5863,7 @@ class WRComplete(VerbCall):
     /* ibv_wr_complete */
     IF_OK_PTR({qp_ex_name}, {{
         if (ibv_wr_complete({qp_ex_name}) != 0) {{
+        RR_SET_FAIL();
         fprintf(stderr, "Failed to complete work request {qp_ex_name}\\n");
         }}
     }});
@@ -5790,6 +5873,7 @@ class WRComplete(VerbCall):
 
 class WrStart(VerbCall):
     MUTABLE_FIELDS = ["qp_ex"]
+    EXPORT_FIELDS = ["qp_ex"]
     CONTRACT = Contract(
         requires=[RequireSpec("qp_ex", State.ALLOCATED, "qp_ex")],
         produces=[],
@@ -1,16 +1,14 @@
 import copy
-import json
 import logging
+import os
 import sys
 import traceback
-from pathlib import Path
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader
-
 from lib import fuzz_mutate, sqlite3_llm_callback
 from lib.codegen_context import CodeGenContext
 from lib.corpus import Corpus
+from lib.culling import cull
 from lib.debug_dump import summarize_verb, summarize_verb_list
 from lib.ibv_all import (
     IbvAHAttr,
@@ -26,7 +24,10 @@ from lib.ibv_all import (
     IbvSrqAttr,
     IbvSrqInitAttr,
 )
-from lib.runexec import execute_and_collect
+from lib.renderer import RENDERER, apply_program
+from lib.repo_layout import SEED_IDS, seed_dir
+from lib.fingerprint import pack_ids
+from lib.runexec import COVERAGE_ASYNC, FP_MANAGER, build_and_run, execute_and_collect
 from lib.verbs import (
     AllocDM,
     AllocPD,
@@ -178,81 +179,20 @@ INITIAL_VERBS = [
 ]
 
 
-def escape_c_string(s: str) -> str:
-    """
-    转义字符串为合法的 C 字符串常量内容。
-    会转义双引号、反斜杠、换行等特殊字符。
-    """
-    # json.dumps 会自动做 C 风格转义
-    escaped = json.dumps(s)
-    # 去掉最外层的引号
-    return escaped[1:-1]
-
-
 def render(verbs: List[VerbCall]) -> str:
-    ctx = CodeGenContext()
-    verbs = [
-        GetDeviceList("dev_list"),
-        OpenDevice("dev_list"),
-        FreeDeviceList(),
-        QueryDeviceAttr(),
-        QueryPortAttr(),
-        QueryGID(index=3),
-    ] + verbs
-    for v in verbs:
-        v.apply(ctx)
-    body = ""
-    for i, v in enumerate(verbs):
-        summary = escape_c_string(summarize_verb(v, deep=True, max_items=1000))
-        body += f'    printf("[{i + 1}] {summary} start.\\n");\n'
-        body += v.generate_c(ctx)
-        body += f'    printf("[{i + 1}] done.\\n");\n\n'
-    # body = "".join(v.generate_c(ctx) for v in verbs)
-    template_dir = "./templates"
-    template_name = "client.cpp.j2"
-    env = Environment(loader=FileSystemLoader(template_dir), trim_blocks=True, lstrip_blocks=True)
-    tpl = env.get_template(template_name)
-    rendered = tpl.render(
-        compile_units="pair_runtime.cpp runtime_resolver.c -lcjson",
-        output_name="rdma_client_autogen",
-        ib_port=1,
-        msg_size=1024,
-        bundle_env="RDMA_FUZZ_RUNTIME",
-        client_update="client_update.json",
-        length=1000,
-        setup_region="/* setup generated by verbs (alloc/reg/create) moved here if你把这些也用 generate_c 产出 */",
-        early_verbs_region="".join([]),
-        verbs_region="".join(body),
-        epilog_region="/* optional CQ polling & cleanup */",
-        prolog_extra=ctx.generate_variable_definitions_all(),  # 如果你想注入额外 helper，这里填
-    )
-    return rendered
+    verbs, ctx = apply_program(verbs, gid_index=3)
+    # 模板只编译一次；未变化的 verb 直接复用上一次生成的代码和横幅
+    return RENDERER.render(verbs, ctx, banners=True)
 
 
 def next_seed_index() -> str:
-    """Generate next seed index based on existing files in repo directory"""
-    repo_dir = Path("./repo")
-    repo_dir.mkdir(parents=True, exist_ok=True)
-
-    existing = []
-    for p in repo_dir.iterdir():
-        if p.is_file() and p.name.endswith("_seed.log"):
-            digits = ""
-            for c in p.name:
-                if c.isdigit():
-                    digits += c
-                else:
-                    break
-            if digits:
-                existing.append(int(digits))
-    n = max(existing) + 1 if existing else 1
-    return f"{n:06d}"
+    """Allocate the next seed index (O(1) lock-protected counter, see lib/repo_layout.py)"""
+    return SEED_IDS.next()
 
 
 def setup_seed_logging(seed_index: str) -> logging.Logger:
     """Setup logging for a specific seed with dedicated log file"""
-    repo_dir = Path("./repo")
-    log_file = repo_dir / f"{seed_index}_seed.log"
+    log_file = seed_dir(seed_index) / f"{seed_index}_seed.log"
 
     logger = logging.getLogger(f"seed_{seed_index}")
     logger.setLevel(logging.DEBUG)
@@ -280,6 +220,13 @@ if __name__ == "__main__":
     print("This is my_fuzz_test.py - Multi-mutation batch mode")
 
     corpus = Corpus("seeds")
+    # 接着上次的边编号和全局覆盖图，重启后旧覆盖不再算作新覆盖
+    FP_MANAGER.load_state(*corpus.load_coverage_state())
+    # 每记录 CULL_EVERY 个种子重新精简一次语料（favoured 集合，见 lib/culling.py）；0 关闭
+    CULL_EVERY = int(os.environ.get("RDMA_FUZZ_CULL_EVERY", "50") or 0)
+    records_since_cull = 0
+    if CULL_EVERY > 0:
+        cull(corpus)
     verbs = copy.deepcopy(INITIAL_VERBS)
     sid0 = corpus.add(verbs, meta={"cov_bits_new": 0, "sem_novelty": 0.0})
     ctx = CodeGenContext()
@@ -289,10 +236,26 @@ if __name__ == "__main__":
     rng = None
     mutator = fuzz_mutate.ContractAwareMutator(rng)
 
+    # RDMA_FUZZ_FORKSERVER=<设备名>（或 1 表示默认设备）时用常驻的 rdma_exec fork-server 执行，
+    # 不再生成 client.cpp / 编译 / 拉起 server
+    fs_dev = os.environ.get("RDMA_FUZZ_FORKSERVER")
+    fork_runner = None
+    if fs_dev:
+        from lib.forkserver import ForkServerRunner
+
+        fork_runner = ForkServerRunner(device=None if fs_dev == "1" else fs_dev).start()
+
     # 配置批量变异参数
     BATCH_SIZE = 5  # 每批变异数量，可根据需要调整
 
-    while True:
+    def close_logger(logger):
+        # Close logger handlers to free resources
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+    def make_candidate():
+        """选种子 + BATCH_SIZE 次变异，返回候选 dict；重复程序返回 None。"""
         # Generate seed index and setup logging
         seed_index = next_seed_index()
         logger = setup_seed_logging(seed_index)
@@ -332,23 +295,34 @@ if __name__ == "__main__":
         # 现在只对最终的verbs生成cpp并执行（完全按照原有流程）
         logger.info("Final verbs after %d mutations: %s", BATCH_SIZE, summarize_verb_list(cur_verbs, deep=True))
 
+        # 结构哈希相同的程序已经执行过，不再重复编译/运行
+        cand_sid = corpus.program_id(cur_verbs)
+        if corpus.has_run(cand_sid):
+            logger.info("Program %s already executed, skipping duplicate run", cand_sid)
+            close_logger(logger)
+            return None
+        return {"seed_index": seed_index, "logger": logger, "base_sid": base_sid, "verbs": cur_verbs, "sid": cand_sid}
+
+    def render_candidate(cand) -> bool:
+        logger = cand["logger"]
         try:
-            rendered = render(cur_verbs)
-            with open("client.cpp", "w") as f:
-                f.write(rendered)
-            logger.info("Generated client.cpp for seed %s (after %d mutations)", seed_index, BATCH_SIZE)
+            cand["source"] = render(cand["verbs"])
+            logger.info("Generated client.cpp for seed %s (after %d mutations)", cand["seed_index"], BATCH_SIZE)
+            return True
         except Exception as e:
-            logger.error("Failed to render client.cpp for seed %s: %s", seed_index, str(e))
+            logger.error("Failed to render client.cpp for seed %s: %s", cand["seed_index"], str(e))
             logger.error("Traceback: %s", traceback.format_exc())
             # 跳过当前种子，继续下一个
-            continue
+            close_logger(logger)
+            return False
 
-        logger.info("Executing and collecting metrics for seed %s", seed_index)
-        metrics = execute_and_collect()
+    def record(cand, metrics):
+        global records_since_cull
+        logger, seed_index = cand["logger"], cand["seed_index"]
         logger.info("Metrics for seed %s: %s", seed_index, metrics)
 
         new_sid = corpus.add(
-            cur_verbs,
+            cand["verbs"],
             meta={
                 "cov_bits_new": int(metrics.get("cov_new", 0)),
                 "sem_novelty": float(metrics.get("sem_novelty", 0.0)),
@@ -356,6 +330,23 @@ if __name__ == "__main__":
             },
         )
         logger.info("Added to corpus as new_sid: %s", new_sid)
+        cov_ids = metrics.get("cov_ids")
+        if cov_ids is not None:
+            corpus.set_seed_coverage(
+                new_sid, len(cov_ids), pack_ids(cov_ids), int(metrics.get("runtime_ms", 0)), len(cand["verbs"])
+            )
+        if metrics.get("cov_new", 0) > 0:
+            corpus.save_coverage_state(*FP_MANAGER.state())
+        for rep in metrics.get("crash_reports") or []:
+            if corpus.record_crash(new_sid, rep, metrics.get("run_index")):
+                logger.info("New crash bucket %s: %s", rep["bucket"], rep["site"])
+            else:
+                logger.info("Known crash bucket %s", rep["bucket"])
+        records_since_cull += 1
+        if CULL_EVERY > 0 and records_since_cull >= CULL_EVERY:
+            records_since_cull = 0
+            res = cull(corpus)
+            logger.info("Culled corpus: %d/%d seeds favoured (%.1f ms)", len(res.favoured), res.seeds, res.ms)
 
         corpus.record_run(
             new_sid,
@@ -375,8 +366,75 @@ if __name__ == "__main__":
             float(metrics.get("score", 0.0)),
             BATCH_SIZE,
         )
-
-        # Close logger handlers to free resources
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-            handler.close()
+        close_logger(logger)
+
+    # RDMA_FUZZ_PIPELINE=<N> 时提前编译最多 N 个候选，当前候选运行的同时后面的在编译（见 lib/pipeline.py）
+    lookahead = int(os.environ.get("RDMA_FUZZ_PIPELINE", "0") or 0)
+    if lookahead > 0 and fork_runner is None:
+        from lib.pipeline import PipelinedExecutor, make_build_fn, prepare_fast_build, remove_workdir, run_built
+
+        prepare_fast_build()
+        with PipelinedExecutor(
+            make_build_fn(lambda cand: cand["source"]),
+            run_built,
+            workers=max(1, min(lookahead, (os.cpu_count() or 2) // 2)),
+            lookahead=lookahead,
+            cleanup_fn=remove_workdir,
+        ) as pipe:
+            while True:
+                top = corpus.top_scores()
+                for _ in range(4 * lookahead):
+                    if not pipe.has_capacity():
+                        break
+                    cand = make_candidate()
+                    if cand is not None and render_candidate(cand):
+                        job = pipe.submit(cand["sid"], cand, priority=top.get(cand["base_sid"], 0.0))
+                        if job.payload is not cand:
+                            # 同一个程序已经在流水线里，这个候选不会再单独运行
+                            cand["logger"].info("Program %s already pending in the pipeline, skipping", cand["sid"])
+                            close_logger(cand["logger"])
+                # 基础种子已经掉出 pick_for_fuzz 候选池的候选不再值得运行
+                pending = {j.key: j for j in pipe.pending()}
+                prios = {k: top[j.payload["base_sid"]] for k, j in pending.items() if j.payload["base_sid"] in top}
+                for key in pipe.reprioritize(prios, cancel_missing=True):
+                    pending[key].payload["logger"].info("Cancelled: base seed dropped out of the top seeds")
+                    close_logger(pending[key].payload["logger"])
+                done = pipe.run_next()
+                if done is None:
+                    continue
+                job, metrics = done
+                job.payload["logger"].info("Executed prebuilt %s (build %d ms)", job.bin_path, job.build_ms)
+                record(job.payload, metrics)
+
+    # 覆盖收集异步时，上一个候选的保留 / 丢弃判断推迟到这一个运行完之后，
+    # 它的覆盖收集和这一个的编译重叠（runexec.COVERAGE_ASYNC）
+    defer = fork_runner is None and COVERAGE_ASYNC
+    pending = None
+    try:
+        while True:
+            cand = make_candidate()
+            if cand is None:
+                continue
+            seed_index = cand["seed_index"]
+            if fork_runner is None:
+                if not render_candidate(cand):
+                    continue
+                with open("client.cpp", "w") as f:
+                    f.write(cand["source"])
+
+            cand["logger"].info("Executing and collecting metrics for seed %s", seed_index)
+            if fork_runner is not None:
+                raw = fork_runner.run(cand["verbs"], tag=seed_index)
+            else:
+                raw = build_and_run() if defer else None
+            if pending is not None:
+                record(pending[0], execute_and_collect(pending[1]))
+                pending = None
+            if defer:
+                pending = (cand, raw)
+            else:
+                record(cand, execute_and_collect(raw))
+    finally:
+        # Ctrl-C / 异常退出时也要停掉 fork-server 和它的 server 对端
+        if fork_runner is not None:
+            fork_runner.close()
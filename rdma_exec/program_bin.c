@@ -0,0 +1,206 @@
+#include "program_bin.h"
+#include "verb_schema.gen.h"
+
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define RDX_MAX_DEPTH 64
+
+static int rd_u8(RdxReader *r, uint8_t *out)
+{
+    if (r->p >= r->end)
+        return -1;
+    *out = *r->p++;
+    return 0;
+}
+
+int rdx_rd_varint(RdxReader *r, uint64_t *out)
+{
+    uint64_t n = 0;
+    for (int shift = 0; shift < 64; shift += 7)
+    {
+        uint8_t b;
+        if (rd_u8(r, &b) != 0)
+            return -1;
+        n |= (uint64_t)(b & 0x7F) << shift;
+        if (!(b & 0x80))
+        {
+            *out = n;
+            return 0;
+        }
+    }
+    return -1;
+}
+
+// 以 '\0' 结尾的字符串，分配在 r->arena 里
+static char *rd_str(RdxReader *r)
+{
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0 || n > (uint64_t)(r->end - r->p))
+        return NULL;
+    char *s = rdx_alloc(r->arena, (size_t)n + 1);
+    if (!s)
+        return NULL;
+    memcpy(s, r->p, (size_t)n);
+    r->p += n;
+    return s;
+}
+
+static int rd_items(RdxReader *r, RdxArg *out)
+{
+    uint64_t n;
+    // 每个元素至少一个字节，计数不可能超过剩下的字节数
+    if (rdx_rd_varint(r, &n) != 0 || n > (uint64_t)(r->end - r->p))
+        return -1;
+    out->n = (uint32_t)n;
+    if (n == 0)
+        return 0;
+    if (!(out->u.items = rdx_alloc(r->arena, (size_t)n * sizeof(RdxArg))))
+        return -1;
+    if (out->tag == RDX_TAG_OBJ && !(out->keys = rdx_alloc(r->arena, (size_t)n * sizeof(char *))))
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        if (out->keys && !(out->keys[i] = rd_str(r)))
+            return -1;
+        if (rdx_rd_arg(r, &out->u.items[i]) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+int rdx_rd_arg(RdxReader *r, RdxArg *out)
+{
+    uint8_t tag;
+    memset(out, 0, sizeof(*out));
+    out->set = 1;
+    out->vtype = -1;
+    if (r->depth > RDX_MAX_DEPTH || rd_u8(r, &tag) != 0)
+        return -1;
+    out->tag = tag;
+
+    int rc = -1;
+    r->depth++;
+    switch (tag)
+    {
+    case RDX_TAG_NULL:
+    case RDX_TAG_FALSE:
+    case RDX_TAG_TRUE:
+        rc = 0;
+        break;
+    case RDX_TAG_INT:
+    {
+        uint64_t z;
+        if (rdx_rd_varint(r, &z) != 0)
+            break;
+        out->u.i = (int64_t)(z >> 1) ^ -(int64_t)(z & 1);
+        rc = 0;
+        break;
+    }
+    case RDX_TAG_FLOAT:
+        if (r->end - r->p < 8)
+            break;
+        memcpy(&out->u.f, r->p, 8); // 小端主机
+        r->p += 8;
+        rc = 0;
+        break;
+    case RDX_TAG_STR:
+        rc = (out->u.s = rd_str(r)) ? 0 : -1;
+        break;
+    case RDX_TAG_LIST:
+    case RDX_TAG_OBJ:
+        rc = rd_items(r, out);
+        break;
+    case RDX_TAG_TYPED:
+    {
+        // Value 包装拆掉，只记下值类型
+        uint8_t t;
+        if (rd_u8(r, &t) != 0 || t >= RDX_VALUE_TYPE_COUNT || rdx_rd_arg(r, out) != 0)
+            break;
+        out->vtype = (int8_t)t;
+        rc = 0;
+        break;
+    }
+    case RDX_TAG_SCHEMA:
+    {
+        uint64_t cid;
+        if (rdx_rd_varint(r, &cid) != 0 || cid >= RDX_CLASS_COUNT)
+            break;
+        const RdxClassSchema *cls = &g_rdx_classes[cid];
+        out->cls = (uint16_t)cid;
+        if (!(out->u.obj = rdx_alloc(r->arena, cls->args_size)))
+            break;
+        rc = cls->decode(r, out->u.obj);
+        break;
+    }
+    default:
+        break;
+    }
+    r->depth--;
+    return rc;
+}
+
+int rdx_is_binary(const char *buf, size_t len)
+{
+    return buf && len >= 4 && memcmp(buf, "RDXB", 4) == 0;
+}
+
+void rdx_free_program(RdxProgram *prog)
+{
+    if (!prog)
+        return;
+    rdx_arena_free(&prog->arena);
+    free(prog);
+}
+
+RdxProgram *rdx_decode_program(const unsigned char *buf, size_t len)
+{
+    if (!rdx_is_binary((const char *)buf, len) || len < 9)
+    {
+        fprintf(stderr, "[ERR] not a binary program\n");
+        return NULL;
+    }
+    uint32_t hash;
+    memcpy(&hash, buf + 5, 4);
+    if (buf[4] != RDX_BIN_VERSION || hash != RDX_SCHEMA_HASH)
+    {
+        fprintf(stderr, "[ERR] binary program schema mismatch (version %u, hash 0x%08x, expected 0x%08x); "
+                        "regenerate with: python -m lib.exec_schema\n",
+                buf[4], hash, RDX_SCHEMA_HASH);
+        return NULL;
+    }
+
+    RdxProgram *prog = calloc(1, sizeof(*prog));
+    if (!prog)
+        return NULL;
+    RdxReader r = {buf + 9, buf + len, &prog->arena, 0};
+    uint64_t n;
+    if (rdx_rd_arg(&r, &prog->meta) != 0 || rdx_rd_varint(&r, &n) != 0 || n > (uint64_t)(r.end - r.p))
+        goto fail_meta;
+    if (n && !(prog->verbs = rdx_alloc(&prog->arena, (size_t)n * sizeof(RdxVerb))))
+        goto fail_meta;
+    prog->count = (uint32_t)n;
+
+    for (uint64_t i = 0; i < n; i++)
+    {
+        RdxArg verb;
+        if (rdx_rd_arg(&r, &verb) != 0)
+        {
+            fprintf(stderr, "[ERR] corrupt binary program at verb #%llu\n", (unsigned long long)i);
+            rdx_free_program(prog);
+            return NULL;
+        }
+        RdxVerb *v = &prog->verbs[i];
+        v->verb_id = (verb.tag == RDX_TAG_SCHEMA && verb.cls < RDX_VERB_COUNT) ? verb.cls : -1;
+        v->name = (verb.tag == RDX_TAG_SCHEMA) ? g_rdx_classes[verb.cls].name : NULL;
+        v->args = (v->verb_id >= 0) ? verb.u.obj : NULL;
+    }
+    return prog;
+
+fail_meta:
+    fprintf(stderr, "[ERR] corrupt binary program header\n");
+    rdx_free_program(prog);
+    return NULL;
+}
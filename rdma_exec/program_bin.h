@@ -0,0 +1,45 @@
+#pragma once
+#include <stddef.h>
+#include <stdint.h>
+
+#include "verb_args.h"
+
+/*
+ * 二进制程序（lib/exec_schema.py 的 encode_program 产出）解码。
+ * 每个 verb 直接解码进生成的 RdxArgs_<Verb>（verb_schema.gen.c 的 rdx_decode_<Cls>），
+ * 由 exec_verb_args 交给生成的 handler，不经过 cJSON。
+ */
+
+typedef struct
+{
+    const unsigned char *p;
+    const unsigned char *end;
+    RdxArena *arena;
+    int depth;
+} RdxReader;
+
+int rdx_rd_varint(RdxReader *r, uint64_t *out);
+// 读一个值（含 tag）到 out，失败返回 -1
+int rdx_rd_arg(RdxReader *r, RdxArg *out);
+
+typedef struct
+{
+    int verb_id;      // 不是 schema 里的 verb 时为 -1
+    const char *name; // 类名
+    void *args;       // RdxArgs_<Verb>
+} RdxVerb;
+
+typedef struct
+{
+    RdxArena arena; // verbs / args / 字符串都分配在这里
+    RdxArg meta;
+    uint32_t count;
+    RdxVerb *verbs;
+} RdxProgram;
+
+// buf 是否以 "RDXB" 开头
+int rdx_is_binary(const char *buf, size_t len);
+
+// 失败返回 NULL（并在 stderr 打印原因），成功时由调用方 rdx_free_program
+RdxProgram *rdx_decode_program(const unsigned char *buf, size_t len);
+void rdx_free_program(RdxProgram *prog);
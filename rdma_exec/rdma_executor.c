@@ -1,14 +1,48 @@
+#include <errno.h>
+#include <fcntl.h>
+#include <signal.h>
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
+#include <sys/wait.h>
+#include <time.h>
+#include <unistd.h>
 #include <cjson/cJSON.h>
+#include <infiniband/verbs.h>
 
 #include "json_utils.h"
+#include "program_bin.h"
 #include "resource_env.h"
 #include "verb_dispatch.h"
+#include "verb_schema.gen.h"
 
-static int run_program_from_json(const char *json_text)
+// 与生成的 client.cpp（client_prelude.h 的 RR_VERB_BEGIN/RR_VERB_END）相同的结果标记：
+// "@b <i> <verb id>" / "@e <i> <0 成功|1 跳过|2 失败> <errno>"，lib/capture.py 边读边解析；errno 只在失败时输出
+static void mark_begin(int i, int verb_id)
 {
-    cJSON *root = cJSON_Parse(json_text);
+    printf("@b %d %d\n", i, verb_id);
+    fflush(stdout);
+}
+
+static void mark_end(int i, int rc, int err)
+{
+    int code = rc == 0 ? 0 : (rc == EXEC_VERB_UNSUPPORTED || rc == EXEC_VERB_SKIPPED) ? 1 : 2;
+    printf("@e %d %d %d\n", i, code, code == 2 ? err : 0);
+    fflush(stdout);
+}
+
+static void apply_meta(ResourceEnv *env, const char *trace_id, int port_num, int gid_index)
+{
+    if (trace_id)
+        snprintf(env->trace_id, sizeof(env->trace_id), "%s", trace_id);
+    env_set_port_num(env, port_num);
+    env_set_gid_index(env, gid_index);
+    env_set_default_ctx(env);
+}
+
+static int run_program_from_json(const char *text)
+{
+    cJSON *root = cJSON_Parse(text);
     if (!root)
     {
         const char *err = cJSON_GetErrorPtr();
@@ -22,16 +56,8 @@ static int run_program_from_json(const char *json_text)
     // 读取 meta.trace_id（可选）
     cJSON *meta = obj_get(root, "meta");
     if (meta && cJSON_IsObject(meta))
-    {
-        const char *tid = obj_get_string(meta, "trace_id");
-        if (tid)
-            snprintf(env.trace_id, sizeof(env.trace_id), "%s", tid);
-        int port_num = obj_get_int(meta, "port_num", 0);
-        env_set_port_num(&env, port_num);
-        int gid_index = obj_get_int(meta, "gid_index", 0);
-        env_set_gid_index(&env, gid_index);
-        env_set_default_ctx(&env);
-    }
+        apply_meta(&env, obj_get_string(meta, "trace_id"), obj_get_int(meta, "port_num", 0),
+                   obj_get_int(meta, "gid_index", 0));
 
     // 程序数组
     cJSON *program = obj_get(root, "program");
@@ -49,19 +75,227 @@ static int run_program_from_json(const char *json_text)
     for (int i = 0; i < prog_len; i++)
     {
         cJSON *verb_obj = cJSON_GetArrayItem(program, i);
+        const char *verb_name = obj_get_string(verb_obj, "verb");
         fprintf(stderr, "[INFO] === Verb #%d ===\n", i);
-        exec_verb(verb_obj, &env);
+        int verb_id = rdx_verb_id(verb_name);
+        mark_begin(i + 1, verb_id);
+        int rc = EXEC_VERB_UNSUPPORTED;
+        errno = 0;
+        if (verb_id < 0)
+            fprintf(stderr, "[WARN] Unsupported verb '%s'\n", verb_name ? verb_name : "<missing>");
+        else
+            rc = exec_verb_id(verb_id, verb_obj, &env);
+        mark_end(i + 1, rc, errno);
     }
 
     cJSON_Delete(root);
     return 0;
 }
 
+// 二进制程序直接解码进 RdxArgs，由生成的 handler 执行
+static int run_program_from_bin(const char *buf, size_t len)
+{
+    RdxProgram *prog = rdx_decode_program((const unsigned char *)buf, len);
+    if (!prog)
+        return 1;
+
+    ResourceEnv env;
+    env_init(&env);
+    if (prog->meta.tag == RDX_TAG_OBJ)
+        apply_meta(&env, rdx_str(rdx_obj_get(&prog->meta, "trace_id")),
+                   (int)rdx_int(NULL, rdx_obj_get(&prog->meta, "port_num"), 0),
+                   (int)rdx_int(NULL, rdx_obj_get(&prog->meta, "gid_index"), 0));
+
+    fprintf(stderr, "[INFO] Running program: %u verbs, trace_id=%s, port_num=%d, gid_index=%d\n",
+            prog->count, env.trace_id[0] ? env.trace_id : "(none)", env.port_num, env.gid_index);
+
+    for (uint32_t i = 0; i < prog->count; i++)
+    {
+        const RdxVerb *v = &prog->verbs[i];
+        fprintf(stderr, "[INFO] === Verb #%u ===\n", i);
+        mark_begin((int)i + 1, v->verb_id);
+        int rc = EXEC_VERB_UNSUPPORTED;
+        errno = 0;
+        if (v->verb_id < 0)
+            fprintf(stderr, "[WARN] Unsupported verb '%s'\n", v->name ? v->name : "<missing>");
+        else
+            rc = exec_verb_args(v->verb_id, v->args, &env);
+        mark_end((int)i + 1, rc, errno);
+    }
+
+    rdx_free_program(prog);
+    return 0;
+}
+
+// 输入可以是 program JSON，也可以是 lib/exec_schema.py 编码的二进制程序（以 "RDXB" 开头）
+static int run_program(const char *text, size_t len)
+{
+    return rdx_is_binary(text, len) ? run_program_from_bin(text, len) : run_program_from_json(text);
+}
+
+/*
+ * fork-server 模式（lib/forkserver.py 的 ForkServerRunner 驱动）：
+ *
+ *   rdma_exec --fork-server [device_name]
+ *
+ * 父进程只打开一次设备（ibv_get_device_list + ibv_open_device，不注册任何 MR），
+ * 之后每个测试用例 fork 一个子进程执行，省掉每次编译 client 和打开设备的开销。
+ * 控制通道走 stdin/stdout（日志仍然写 stderr），协议是按行的文本：
+ *
+ *   父 -> 调用方: READY <pid>
+ *   调用方 -> 父: RUN <id> <nbytes> <timeout_ms> <stdout_path> <stderr_path>
+ *                 紧跟 nbytes 字节的 program JSON（或二进制程序）
+ *   父 -> 调用方: DONE <id> <exit_code> <signal> <runtime_us> <timed_out>
+ *   调用方 -> 父: QUIT
+ *
+ * 子进程把 stdout/stderr 重定向到给定文件后执行 run_program，然后 exit()
+ * （不是 _exit，让 gcov / ASan 的 atexit 钩子照常落盘）。超时由父进程 SIGKILL。
+ * 启动时调用 ibv_fork_init()，子进程里注册的 MR 不会和父进程的页表互相影响。
+ */
+static long long now_us(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (long long)ts.tv_sec * 1000000LL + ts.tv_nsec / 1000;
+}
+
+static int redirect_fd(const char *path, int fd)
+{
+    int out = open(path, O_WRONLY | O_CREAT | O_TRUNC, 0644);
+    if (out < 0)
+        return -1;
+    if (dup2(out, fd) < 0)
+    {
+        close(out);
+        return -1;
+    }
+    close(out);
+    return 0;
+}
+
+static int fork_server_run_one(const char *json_text, size_t json_len, long timeout_ms,
+                               const char *out_path, const char *err_path,
+                               int *exit_code, int *sig, long long *runtime_us, int *timed_out)
+{
+    *exit_code = -1;
+    *sig = 0;
+    *timed_out = 0;
+
+    fflush(stdout);
+    fflush(stderr);
+    long long t0 = now_us();
+    pid_t pid = fork();
+    if (pid < 0)
+    {
+        fprintf(stderr, "[ERR] fork failed: %s\n", strerror(errno));
+        return -1;
+    }
+    if (pid == 0)
+    {
+        signal(SIGPIPE, SIG_DFL);
+        if (redirect_fd(out_path, STDOUT_FILENO) != 0 || redirect_fd(err_path, STDERR_FILENO) != 0)
+            _exit(125);
+        int ret = run_program(json_text, json_len);
+        fflush(stdout);
+        fflush(stderr);
+        exit(ret);
+    }
+
+    int status = 0;
+    for (;;)
+    {
+        pid_t r = waitpid(pid, &status, WNOHANG);
+        if (r == pid)
+            break;
+        if (r < 0 && errno != EINTR)
+        {
+            fprintf(stderr, "[ERR] waitpid failed: %s\n", strerror(errno));
+            return -1;
+        }
+        if (timeout_ms > 0 && now_us() - t0 > timeout_ms * 1000LL)
+        {
+            *timed_out = 1;
+            kill(pid, SIGKILL);
+            while (waitpid(pid, &status, 0) < 0 && errno == EINTR)
+                ;
+            break;
+        }
+        usleep(1000);
+    }
+    *runtime_us = now_us() - t0;
+
+    if (WIFEXITED(status))
+        *exit_code = WEXITSTATUS(status);
+    else if (WIFSIGNALED(status))
+        *sig = WTERMSIG(status);
+    return 0;
+}
+
+static int fork_server_main(const char *dev_name)
+{
+    if (ibv_fork_init() != 0)
+        fprintf(stderr, "[WARN] ibv_fork_init failed, continuing\n");
+    if (rdma_init_context(dev_name) != 0)
+    {
+        fprintf(stderr, "[ERR] Failed to init RDMA context\n");
+        return 1;
+    }
+    // 调用方退出时不要被 SIGPIPE 直接杀掉，走正常的 teardown
+    signal(SIGPIPE, SIG_IGN);
+
+    printf("READY %d\n", (int)getpid());
+    fflush(stdout);
+
+    char line[8192];
+    while (fgets(line, sizeof(line), stdin))
+    {
+        if (strncmp(line, "QUIT", 4) == 0)
+            break;
+
+        char id[128], out_path[4096], err_path[4096];
+        long nbytes = 0, timeout_ms = 0;
+        if (sscanf(line, "RUN %127s %ld %ld %4095s %4095s", id, &nbytes, &timeout_ms, out_path, err_path) != 5 ||
+            nbytes < 0)
+        {
+            fprintf(stderr, "[ERR] bad fork-server request: %s", line);
+            printf("ERR bad-request\n");
+            fflush(stdout);
+            continue;
+        }
+
+        char *text = malloc((size_t)nbytes + 1);
+        if (!text || fread(text, 1, (size_t)nbytes, stdin) != (size_t)nbytes)
+        {
+            fprintf(stderr, "[ERR] short read of program %s\n", id);
+            free(text);
+            break;
+        }
+        text[nbytes] = '\0';
+
+        int exit_code, sig, timed_out;
+        long long runtime_us = 0;
+        if (fork_server_run_one(text, (size_t)nbytes, timeout_ms, out_path, err_path, &exit_code, &sig, &runtime_us, &timed_out) != 0)
+            printf("ERR %s fork\n", id);
+        else
+            printf("DONE %s %d %d %lld %d\n", id, exit_code, sig, runtime_us, timed_out);
+        fflush(stdout);
+        free(text);
+    }
+
+    rdma_teardown_context();
+    return 0;
+}
+
 int main(int argc, char **argv)
 {
+    if (argc >= 2 && strcmp(argv[1], "--fork-server") == 0)
+        return fork_server_main((argc >= 3) ? argv[2] : NULL);
+
     if (argc < 2)
     {
-        fprintf(stderr, "Usage: %s program.json [device_name]\n", argv[0]);
+        fprintf(stderr, "Usage: %s program.json|program.bin [device_name]\n"
+                        "       %s --fork-server [device_name]\n",
+                argv[0], argv[0]);
         return 1;
     }
     const char *json_path = argv[1];
@@ -82,7 +316,7 @@ int main(int argc, char **argv)
         return 1;
     }
 
-    int ret = run_program_from_json(text);
+    int ret = run_program(text, (size_t)len);
     free(text);
 
     rdma_teardown_context();
@@ -855,6 +855,64 @@ MrResource *env_find_mr(ResourceEnv *env, const char *name)
     return NULL;
 }
 
+// 从后往前找，name 为 NULL 时匹配该类型的任意对象（即最近登记的）
+static int env_find_obj_index(ResourceEnv *env, const char *type, const char *name)
+{
+    for (int i = env->obj_count - 1; i >= 0; i--)
+    {
+        if (strcmp(env->obj[i].type, type) == 0 && (!name || strcmp(env->obj[i].name, name) == 0))
+        {
+            return i;
+        }
+    }
+    return -1;
+}
+
+ObjResource *env_put_obj(ResourceEnv *env, const char *type, const char *name, void *obj)
+{
+    if (!env || !type || !name)
+        return NULL;
+    int idx = env_find_obj_index(env, type, name);
+    if (idx >= 0)
+    {
+        fprintf(stderr, "[EXEC] %s %s already exists, replacing\n", type, name);
+        env->obj[idx].obj = obj;
+        return &env->obj[idx];
+    }
+    if (env->obj_count >= (int)(sizeof(env->obj) / sizeof(env->obj[0])))
+    {
+        fprintf(stderr, "[EXEC] Too many objects, ignoring %s %s\n", type, name);
+        return NULL;
+    }
+    ObjResource *slot = &env->obj[env->obj_count++];
+    snprintf(slot->name, sizeof(slot->name), "%s", name);
+    snprintf(slot->type, sizeof(slot->type), "%s", type);
+    slot->obj = obj;
+    return slot;
+}
+
+void *env_find_obj(ResourceEnv *env, const char *type, const char *name)
+{
+    if (!env || !type)
+        return NULL;
+    int idx = env_find_obj_index(env, type, name);
+    return idx >= 0 ? env->obj[idx].obj : NULL;
+}
+
+void *env_take_obj(ResourceEnv *env, const char *type, const char *name)
+{
+    if (!env || !type)
+        return NULL;
+    int idx = env_find_obj_index(env, type, name);
+    if (idx < 0)
+        return NULL;
+    void *obj = env->obj[idx].obj;
+    // 保持登记顺序，name 为 NULL 时才能取到最近的
+    memmove(&env->obj[idx], &env->obj[idx + 1], (size_t)(env->obj_count - idx - 1) * sizeof(env->obj[0]));
+    env->obj_count--;
+    return obj;
+}
+
 int env_bind_mw(ResourceEnv *env,
                 const char *mw_name,
                 const char *qp_name,
@@ -118,6 +118,14 @@ typedef struct
 
 } FlowResource;
 
+// 生成的 verb handler（verb_schema.gen.c）创建的对象：按 类型 + 名字 登记，不区分具体结构
+typedef struct
+{
+    char name[64];
+    char type[16]; // "pd" / "cq_ex" / "ah" / "wq" ...（lib/exec_schema.py 的 RES_CTYPES）
+    void *obj;
+} ObjResource;
+
 typedef struct
 {
     PdResource pd[128];
@@ -153,6 +161,9 @@ typedef struct
     FlowResource flow[128];
     int flow_count;
 
+    ObjResource obj[256];
+    int obj_count;
+
     char trace_id[128]; // 从 meta 里读出来的可选信息
     int port_num;       // RDMA 端口号
     int gid_index;      // RDMA GID 索引
@@ -309,6 +320,12 @@ LocalBufferResource *env_find_local_buffer(ResourceEnv *env,
                                            const char *name);
 MrResource *env_find_mr(ResourceEnv *env, const char *name);
 
+// 同类型同名的对象已存在时覆盖；name 为 NULL 时按类型取最近登记的
+ObjResource *env_put_obj(ResourceEnv *env, const char *type, const char *name, void *obj);
+void *env_find_obj(ResourceEnv *env, const char *type, const char *name);
+// 注销并返回对象，没有时返回 NULL
+void *env_take_obj(ResourceEnv *env, const char *type, const char *name);
+
 int env_find_pd_index(ResourceEnv *env, const char *name);
 // int env_pd_in_use(ResourceEnv *env, struct ibv_pd *pd); // should not be made public
 int env_find_srq_index(ResourceEnv *env, const char *name);
@@ -0,0 +1,693 @@
+#include "verb_args.h"
+#include "verb_dispatch.h"
+#include "verb_schema.gen.h"
+
+#include <ctype.h>
+#include <errno.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define RDX_ARENA_BLOCK 16384
+#define RDX_MAX_SGE 256
+#define RDX_MAX_BUF (64u << 20)
+
+struct RdxArenaBlock
+{
+    RdxArenaBlock *next;
+    size_t used;
+    size_t cap;
+    max_align_t data[];
+};
+
+void *rdx_alloc(RdxArena *ar, size_t n)
+{
+    if (n > SIZE_MAX / 2)
+        return NULL;
+    n = (n + sizeof(max_align_t) - 1) & ~(sizeof(max_align_t) - 1);
+    if (n == 0)
+        n = sizeof(max_align_t);
+    RdxArenaBlock *b = ar->head;
+    if (!b || b->cap - b->used < n)
+    {
+        size_t cap = n > RDX_ARENA_BLOCK ? n : RDX_ARENA_BLOCK;
+        if (!(b = malloc(sizeof(*b) + cap)))
+            return NULL;
+        b->next = ar->head;
+        b->used = 0;
+        b->cap = cap;
+        ar->head = b;
+    }
+    void *p = (unsigned char *)b->data + b->used;
+    b->used += n;
+    memset(p, 0, n);
+    return p;
+}
+
+void rdx_arena_free(RdxArena *ar)
+{
+    while (ar->head)
+    {
+        RdxArenaBlock *next = ar->head->next;
+        free(ar->head);
+        ar->head = next;
+    }
+}
+
+/* ---------- program JSON -> RdxArg ---------- */
+
+static int rdx_class_id(const char *name)
+{
+    int id = rdx_verb_id(name);
+    for (int i = RDX_VERB_COUNT; id < 0 && i < RDX_CLASS_COUNT; i++)
+    {
+        if (strcmp(g_rdx_classes[i].name, name) == 0)
+            id = i;
+    }
+    return id;
+}
+
+static int rdx_value_type(const char *name)
+{
+    for (int t = 0; t < RDX_VALUE_TYPE_COUNT; t++)
+    {
+        if (strcmp(g_rdx_value_types[t], name) == 0)
+            return t;
+    }
+    return -1;
+}
+
+int rdx_arg_from_json(RdxArena *ar, const cJSON *item, RdxArg *out)
+{
+    memset(out, 0, sizeof(*out));
+    out->set = 1;
+    out->vtype = -1;
+    if (!item || cJSON_IsNull(item))
+    {
+        out->tag = RDX_TAG_NULL;
+        return 0;
+    }
+    if (cJSON_IsBool(item))
+    {
+        out->tag = cJSON_IsTrue(item) ? RDX_TAG_TRUE : RDX_TAG_FALSE;
+        return 0;
+    }
+    if (cJSON_IsNumber(item))
+    {
+        double d = item->valuedouble;
+        if (d >= -9.2e18 && d <= 9.2e18 && d == (double)(int64_t)d)
+        {
+            out->tag = RDX_TAG_INT;
+            out->u.i = (int64_t)d;
+        }
+        else
+        {
+            out->tag = RDX_TAG_FLOAT;
+            out->u.f = d;
+        }
+        return 0;
+    }
+    if (cJSON_IsString(item))
+    {
+        out->tag = RDX_TAG_STR;
+        out->u.s = item->valuestring;
+        return 0;
+    }
+    if (!cJSON_IsArray(item) && !cJSON_IsObject(item))
+        return -1;
+
+    int n = cJSON_GetArraySize(item);
+    if (cJSON_IsObject(item))
+    {
+        // {"type": T, "value": v}：拆掉 Value 包装
+        const cJSON *type = cJSON_GetObjectItemCaseSensitive(item, "type");
+        const cJSON *value = cJSON_GetObjectItemCaseSensitive(item, "value");
+        int t = (n == 2 && cJSON_IsString(type) && value) ? rdx_value_type(type->valuestring) : -1;
+        if (t >= 0)
+        {
+            if (rdx_arg_from_json(ar, value, out) != 0)
+                return -1;
+            out->vtype = (int8_t)t;
+            return 0;
+        }
+        // {"verb": Cls, ...}：按类解到 RdxArgs_<Cls>
+        const cJSON *verb = cJSON_GetObjectItemCaseSensitive(item, "verb");
+        int cid = cJSON_IsString(verb) ? rdx_class_id(verb->valuestring) : -1;
+        if (cid >= 0)
+        {
+            out->tag = RDX_TAG_SCHEMA;
+            out->cls = (uint16_t)cid;
+            return (out->u.obj = rdx_args_from_json(ar, cid, item)) ? 0 : -1;
+        }
+    }
+
+    out->tag = cJSON_IsArray(item) ? RDX_TAG_LIST : RDX_TAG_OBJ;
+    out->n = (uint32_t)n;
+    if (n == 0)
+        return 0;
+    if (!(out->u.items = rdx_alloc(ar, (size_t)n * sizeof(RdxArg))))
+        return -1;
+    if (out->tag == RDX_TAG_OBJ && !(out->keys = rdx_alloc(ar, (size_t)n * sizeof(char *))))
+        return -1;
+    int i = 0;
+    for (const cJSON *child = item->child; child && i < n; child = child->next, i++)
+    {
+        if (out->keys)
+            out->keys[i] = child->string;
+        if (rdx_arg_from_json(ar, child, &out->u.items[i]) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+int rdx_json_field(RdxArena *ar, const cJSON *obj, const char *key, RdxArg *out)
+{
+    const cJSON *item = cJSON_GetObjectItemCaseSensitive(obj, key);
+    return item ? rdx_arg_from_json(ar, item, out) : 0;
+}
+
+void *rdx_args_from_json(RdxArena *ar, int cls, const cJSON *obj)
+{
+    if (cls < 0 || cls >= RDX_CLASS_COUNT || !cJSON_IsObject(obj))
+        return NULL;
+    void *args = rdx_alloc(ar, g_rdx_classes[cls].args_size);
+    if (!args || g_rdx_classes[cls].from_json(ar, obj, args) != 0)
+        return NULL;
+    return args;
+}
+
+/* ---------- 取值 ---------- */
+
+const char *rdx_str(const RdxArg *arg)
+{
+    return (arg && arg->set && arg->tag == RDX_TAG_STR) ? arg->u.s : NULL;
+}
+
+const void *rdx_attr(const RdxArg *arg, int cls)
+{
+    if (!arg || !arg->set || arg->tag != RDX_TAG_SCHEMA || arg->cls != cls)
+        return NULL;
+    return arg->u.obj;
+}
+
+const RdxArg *rdx_obj_get(const RdxArg *arg, const char *key)
+{
+    if (!arg || !arg->set || arg->tag != RDX_TAG_OBJ)
+        return NULL;
+    for (uint32_t i = 0; i < arg->n; i++)
+    {
+        if (strcmp(arg->keys[i], key) == 0)
+            return &arg->u.items[i];
+    }
+    return NULL;
+}
+
+size_t rdx_count(int64_t n)
+{
+    if (n < 0)
+        return 0;
+    return n > RDX_MAX_ENTRIES ? RDX_MAX_ENTRIES : (size_t)n;
+}
+
+/*
+ * 字符串形式的整数表达式：Python 侧导出的是生成 C 代码用的片段，这里只认其中出现过的写法：
+ *   数字、NULL、枚举 / 标志名（g_rdx_consts）、"A | B"、(类型) 转换、括号、
+ *   <mr>->addr / length / lkey / rkey、std::min<T>(x, y)
+ */
+typedef struct
+{
+    const char *p;
+    ResourceEnv *env;
+} Expr;
+
+static void *res_find(ResourceEnv *env, const char *name, const char *type);
+static int ex_or(Expr *e, int64_t *out);
+
+static void ex_space(Expr *e)
+{
+    while (isspace((unsigned char)*e->p))
+        e->p++;
+}
+
+static int ex_expect(Expr *e, char c)
+{
+    ex_space(e);
+    if (*e->p != c)
+        return -1;
+    e->p++;
+    return 0;
+}
+
+static int ex_member(Expr *e, const char *name, int64_t *out)
+{
+    e->p += 2; // "->"
+    const char *m = e->p;
+    while (isalnum((unsigned char)*e->p) || *e->p == '_')
+        e->p++;
+    size_t len = (size_t)(e->p - m);
+    struct ibv_mr *mr = res_find(e->env, name, "mr");
+    if (!mr)
+        return -1;
+    if (len == 4 && strncmp(m, "addr", len) == 0)
+        *out = (int64_t)(uintptr_t)mr->addr;
+    else if (len == 6 && strncmp(m, "length", len) == 0)
+        *out = (int64_t)mr->length;
+    else if (len == 4 && strncmp(m, "lkey", len) == 0)
+        *out = mr->lkey;
+    else if (len == 4 && strncmp(m, "rkey", len) == 0)
+        *out = mr->rkey;
+    else
+        return -1;
+    return 0;
+}
+
+static int ex_primary(Expr *e, int64_t *out)
+{
+    ex_space(e);
+    const char *s = e->p;
+    if (*s == '(')
+    {
+        // "(uint64_t)x" 这样的转换直接跳过，其余按括号处理
+        const char *q = s + 1;
+        while (isalnum((unsigned char)*q) || *q == '_' || *q == ' ' || *q == '*')
+            q++;
+        if (*q == ')' && isalpha((unsigned char)s[1]))
+        {
+            const char *next = q + 1;
+            while (isspace((unsigned char)*next))
+                next++;
+            if (*next && !strchr("|),", *next))
+            {
+                e->p = next;
+                return ex_primary(e, out);
+            }
+        }
+        e->p++;
+        return (ex_or(e, out) == 0 && ex_expect(e, ')') == 0) ? 0 : -1;
+    }
+    if (isdigit((unsigned char)*s) || *s == '-')
+    {
+        char *end;
+        errno = 0;
+        *out = (*s == '-') ? strtoll(s, &end, 0) : (int64_t)strtoull(s, &end, 0);
+        if (end == s || errno == ERANGE)
+            return -1;
+        while (*end && strchr("uUlL", *end))
+            end++;
+        e->p = end;
+        return 0;
+    }
+    if (!isalpha((unsigned char)*s) && *s != '_')
+        return -1;
+
+    while (isalnum((unsigned char)*e->p) || *e->p == '_' || *e->p == ':')
+        e->p++;
+    size_t len = (size_t)(e->p - s);
+    if (len == 8 && strncmp(s, "std::min", len) == 0)
+    {
+        int64_t x, y;
+        ex_space(e);
+        if (*e->p == '<' && !(e->p = strchr(e->p, '>')))
+            return -1;
+        if (*e->p == '>')
+            e->p++;
+        if (ex_expect(e, '(') != 0 || ex_or(e, &x) != 0 || ex_expect(e, ',') != 0 || ex_or(e, &y) != 0 ||
+            ex_expect(e, ')') != 0)
+            return -1;
+        *out = (uint64_t)x < (uint64_t)y ? x : y;
+        return 0;
+    }
+    char name[128];
+    if (len >= sizeof(name))
+        return -1;
+    memcpy(name, s, len);
+    name[len] = '\0';
+    if (e->p[0] == '-' && e->p[1] == '>')
+        return ex_member(e, name, out);
+    if (strcmp(name, "NULL") == 0)
+    {
+        *out = 0;
+        return 0;
+    }
+    return rdx_const(name, out);
+}
+
+static int ex_or(Expr *e, int64_t *out)
+{
+    int64_t v = 0;
+    for (;;)
+    {
+        int64_t t;
+        if (ex_primary(e, &t) != 0)
+            return -1;
+        v |= t;
+        ex_space(e);
+        if (*e->p != '|')
+            break;
+        e->p++;
+    }
+    *out = v;
+    return 0;
+}
+
+static int rdx_eval(ResourceEnv *env, const char *s, int64_t *out)
+{
+    Expr e = {s, env};
+    int64_t v;
+    if (ex_or(&e, &v) != 0)
+        return -1;
+    ex_space(&e);
+    if (*e.p)
+        return -1;
+    *out = v;
+    return 0;
+}
+
+int64_t rdx_int(ResourceEnv *env, const RdxArg *arg, int64_t def)
+{
+    if (!arg || !arg->set)
+        return def;
+    switch (arg->tag)
+    {
+    case RDX_TAG_INT:
+        return arg->u.i;
+    case RDX_TAG_TRUE:
+        return 1;
+    case RDX_TAG_FALSE:
+        return 0;
+    case RDX_TAG_FLOAT:
+        return (int64_t)arg->u.f;
+    case RDX_TAG_STR:
+    {
+        int64_t v;
+        return rdx_eval(env, arg->u.s, &v) == 0 ? v : def;
+    }
+    default:
+        return def;
+    }
+}
+
+/* ---------- 资源 ---------- */
+
+static void *res_find(ResourceEnv *env, const char *name, const char *type)
+{
+    if (!env || !name)
+        return NULL;
+    void *obj = env_find_obj(env, type, name);
+    if (obj)
+        return obj;
+
+    // 手写 handler（program JSON）建的资源在各自的池里
+    if (strcmp(type, "pd") == 0)
+    {
+        PdResource *pd = env_find_pd(env, name);
+        return pd ? pd->pd : NULL;
+    }
+    if (strcmp(type, "qp") == 0)
+    {
+        QpResource *qp = env_find_qp(env, name);
+        return qp ? qp->qp : NULL;
+    }
+    if (strcmp(type, "qp_ex") == 0)
+    {
+        struct ibv_qp *qp = res_find(env, name, "qp");
+        return qp ? ibv_qp_to_qp_ex(qp) : NULL;
+    }
+    if (strcmp(type, "cq") == 0)
+    {
+        CqResource *cq = env_find_cq(env, name);
+        if (cq && cq->cq)
+            return cq->cq;
+        struct ibv_cq_ex *cq_ex = res_find(env, name, "cq_ex");
+        return cq_ex ? ibv_cq_ex_to_cq(cq_ex) : NULL;
+    }
+    if (strcmp(type, "cq_ex") == 0)
+    {
+        for (int i = 0; i < env->cq_ex_count; i++)
+        {
+            if (strcmp(env->cq_ex[i].name, name) == 0)
+                return env->cq_ex[i].cq_ex;
+        }
+        return NULL;
+    }
+    if (strcmp(type, "srq") == 0)
+    {
+        SrqResource *srq = env_find_srq(env, name);
+        return srq ? srq->srq : NULL;
+    }
+    if (strcmp(type, "mr") == 0)
+    {
+        MrResource *mr = env_find_mr(env, name);
+        return mr ? mr->mr : NULL;
+    }
+    if (strcmp(type, "mw") == 0)
+    {
+        MwResource *mw = env_find_mw(env, name);
+        return mw ? mw->mw : NULL;
+    }
+    if (strcmp(type, "dm") == 0)
+    {
+        DmResource *dm = env_find_dm(env, name);
+        return dm ? dm->dm : NULL;
+    }
+    if (strcmp(type, "td") == 0)
+    {
+        for (int i = 0; i < env->td_count; i++)
+        {
+            if (strcmp(env->td[i].name, name) == 0)
+                return env->td[i].td;
+        }
+        return NULL;
+    }
+    if (strcmp(type, "flow") == 0)
+    {
+        for (int i = 0; i < env->flow_count; i++)
+        {
+            if (strcmp(env->flow[i].name, name) == 0)
+                return env->flow[i].flow;
+        }
+        return NULL;
+    }
+    return NULL;
+}
+
+void *rdx_res(ResourceEnv *env, const RdxArg *arg, const char *type)
+{
+    return res_find(env, rdx_str(arg), type);
+}
+
+void rdx_put(ResourceEnv *env, const char *type, const RdxArg *name, void *obj)
+{
+    const char *s = rdx_str(name);
+    if (!s)
+    {
+        fprintf(stderr, "[EXEC] %s created without a name, not tracked\n", type);
+        return;
+    }
+    if (env_put_obj(env, type, s, obj))
+        fprintf(stderr, "[EXEC] %s -> %s\n", type, s);
+}
+
+void rdx_drop(ResourceEnv *env, const char *type, const RdxArg *name)
+{
+    const char *s = rdx_str(name);
+    if (!s || env_take_obj(env, type, s))
+        return;
+    // 池里的资源：清掉句柄，之后按名字查不到（生成的 handler 跳过）
+    if (strcmp(type, "pd") == 0 && env_find_pd(env, s))
+        env_find_pd(env, s)->pd = NULL;
+    else if (strcmp(type, "qp") == 0 && env_find_qp(env, s))
+        env_find_qp(env, s)->qp = NULL;
+    else if (strcmp(type, "cq") == 0 && env_find_cq(env, s))
+        env_find_cq(env, s)->cq = NULL;
+    else if (strcmp(type, "srq") == 0 && env_find_srq(env, s))
+        env_find_srq(env, s)->srq = NULL;
+    else if (strcmp(type, "mr") == 0 && env_find_mr(env, s))
+        env_find_mr(env, s)->mr = NULL;
+    else if (strcmp(type, "mw") == 0 && env_find_mw(env, s))
+        env_find_mw(env, s)->mw = NULL;
+    else if (strcmp(type, "dm") == 0 && env_find_dm(env, s))
+        env_find_dm(env, s)->dm = NULL;
+    else if (strcmp(type, "td") == 0)
+    {
+        for (int i = 0; i < env->td_count; i++)
+        {
+            if (strcmp(env->td[i].name, s) == 0)
+                env->td[i].td = NULL;
+        }
+    }
+    else if (strcmp(type, "flow") == 0)
+    {
+        for (int i = 0; i < env->flow_count; i++)
+        {
+            if (strcmp(env->flow[i].name, s) == 0)
+                env->flow[i].flow = NULL;
+        }
+    }
+}
+
+void *rdx_buf(ResourceEnv *env, const RdxArg *arg, int64_t length)
+{
+    const char *name = rdx_str(arg);
+    if (!name || strcmp(name, "NULL") == 0)
+        return NULL;
+    if (length < 0 || length > (int64_t)RDX_MAX_BUF)
+    {
+        fprintf(stderr, "[EXEC] buffer %s: length %lld out of range\n", name, (long long)length);
+        return NULL;
+    }
+    LocalBufferResource *buf = env_find_local_buffer(env, name);
+    if (buf)
+    {
+        if (buf->length < (size_t)length)
+        {
+            fprintf(stderr, "[EXEC] buffer %s: %zu bytes, %lld requested\n", name, buf->length, (long long)length);
+            return NULL;
+        }
+        return buf->addr;
+    }
+    buf = env_alloc_local_buffer(env, name, length ? (size_t)length : 1);
+    if (!buf || !buf->addr)
+        return NULL;
+    memset(buf->addr, 0, buf->length);
+    return buf->addr;
+}
+
+void rdx_gid(const RdxArg *arg, union ibv_gid *gid)
+{
+    memset(gid, 0, sizeof(*gid));
+    const RdxArgs_IbvGID *g = rdx_attr(arg, RDX_ATTR_IbvGID);
+    const RdxArg *raw = g ? &g->raw : arg;
+    if (!raw || !raw->set || raw->tag != RDX_TAG_LIST)
+        return;
+    for (uint32_t i = 0; i < raw->n && i < sizeof(gid->raw); i++)
+        gid->raw[i] = (uint8_t)rdx_int(NULL, &raw->u.items[i], 0);
+}
+
+struct ibv_sge *rdx_sge_list(ResourceEnv *env, const RdxArg *list, const RdxArg *num_sge, int *count)
+{
+    uint32_t have = (list && list->set && list->tag == RDX_TAG_LIST) ? list->n : 0;
+    int64_t want = rdx_int(env, num_sge, have);
+    if (want < 0)
+        want = 0;
+    if (want > RDX_MAX_SGE)
+        want = RDX_MAX_SGE;
+    *count = (int)want;
+
+    size_t cap = have > (uint64_t)want ? have : (size_t)want;
+    if (cap == 0)
+        return NULL;
+    struct ibv_sge *sge = rdx_scratch(cap * sizeof(*sge));
+    if (!sge)
+    {
+        *count = 0;
+        return NULL;
+    }
+    for (uint32_t i = 0; i < have; i++)
+    {
+        const RdxArgs_IbvSge *s = rdx_attr(&list->u.items[i], RDX_ATTR_IbvSge);
+        if (!s)
+            continue;
+        sge[i].addr = (uint64_t)rdx_int(env, &s->addr, 0);
+        sge[i].length = (uint32_t)rdx_int(env, &s->length, 0);
+        sge[i].lkey = (uint32_t)rdx_int(env, &s->lkey, 0);
+    }
+    return sge;
+}
+
+uint8_t *rdx_bytes(const RdxArg *arg, size_t len)
+{
+    if (len == 0)
+        return NULL;
+    uint8_t *out = rdx_scratch(len);
+    if (!out || !arg || !arg->set)
+        return out;
+    if (arg->tag == RDX_TAG_LIST)
+    {
+        for (uint32_t i = 0; i < arg->n && i < len; i++)
+            out[i] = (uint8_t)rdx_int(NULL, &arg->u.items[i], 0);
+    }
+    else if (arg->tag == RDX_TAG_STR)
+    {
+        size_t n = strlen(arg->u.s);
+        memcpy(out, arg->u.s, n < len ? n : len);
+    }
+    return out;
+}
+
+static struct ibv_device **g_rdx_dev_list = NULL;
+static int g_rdx_dev_count = 0;
+static struct ibv_wc g_rdx_wc;
+
+struct ibv_device **rdx_get_device_list(void)
+{
+    rdx_free_device_list();
+    g_rdx_dev_list = ibv_get_device_list(&g_rdx_dev_count);
+    if (!g_rdx_dev_list)
+        g_rdx_dev_count = 0;
+    return g_rdx_dev_list;
+}
+
+void rdx_free_device_list(void)
+{
+    if (g_rdx_dev_list)
+        ibv_free_device_list(g_rdx_dev_list);
+    g_rdx_dev_list = NULL;
+    g_rdx_dev_count = 0;
+}
+
+struct ibv_device *rdx_device(ResourceEnv *env, const RdxArg *arg)
+{
+    const char *s = rdx_str(arg);
+    if (!g_rdx_dev_list)
+        return (env && env->ctx) ? env->ctx->device : NULL;
+
+    const char *br = s ? strchr(s, '[') : NULL;
+    long idx = br ? strtol(br + 1, NULL, 10) : 0;
+    for (int i = 0; s && !br && i < g_rdx_dev_count; i++)
+    {
+        const char *name = ibv_get_device_name(g_rdx_dev_list[i]);
+        if (name && strcmp(name, s) == 0)
+            return g_rdx_dev_list[i];
+    }
+    return (idx >= 0 && idx < g_rdx_dev_count) ? g_rdx_dev_list[idx] : NULL;
+}
+
+struct ibv_wc *rdx_last_wc(void)
+{
+    return &g_rdx_wc;
+}
+
+/* ---------- 单个 verb 的临时内存 / 出口 ---------- */
+
+static RdxArena g_rdx_scratch;
+
+void *rdx_scratch(size_t n)
+{
+    return rdx_alloc(&g_rdx_scratch, n);
+}
+
+void rdx_scratch_reset(void)
+{
+    rdx_arena_free(&g_rdx_scratch);
+}
+
+int rdx_skip(const char *verb, const char *field, const RdxArg *arg)
+{
+    const char *name = rdx_str(arg);
+    fprintf(stderr, "[EXEC] %s: %s%s%s%s not available, skipped\n", verb, field, name ? " '" : "", name ? name : "",
+            name ? "'" : "");
+    return EXEC_VERB_SKIPPED;
+}
+
+int rdx_fail(const char *verb, const char *call, int rc)
+{
+    if (rc > 0)
+        errno = rc;
+    else if (rc < -1)
+        errno = -rc;
+    int err = errno;
+    fprintf(stderr, "[EXEC] %s: %s failed: %s\n", verb, call, strerror(err));
+    errno = err;
+    return -1;
+}
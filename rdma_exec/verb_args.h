@@ -0,0 +1,91 @@
+#pragma once
+#include <stddef.h>
+#include <stdint.h>
+#include <cjson/cJSON.h>
+#include <infiniband/verbs.h>
+
+#include "resource_env.h"
+
+/*
+ * 生成的 verb handler（verb_schema.gen.c 里的 rdx_exec_<Verb>）的参数表示和取值函数。
+ *
+ * 每个 verb / attr 的参数是一个 RdxArgs_<Cls> 结构（由 lib/exec_schema.py 按 EXPORT_FIELDS 生成），
+ * 成员都是 RdxArg：二进制程序由 program_bin.c 直接解码进来，program JSON 由 rdx_args_from_json 转换。
+ * Value 包装（{"type": T, "value": v}）在解码时拆掉，值类型记在 vtype。
+ */
+
+// 解码用的内存池：只分配、整体释放
+typedef struct RdxArenaBlock RdxArenaBlock;
+typedef struct
+{
+    RdxArenaBlock *head;
+} RdxArena;
+
+void *rdx_alloc(RdxArena *ar, size_t n); // 清零的内存，失败返回 NULL
+void rdx_arena_free(RdxArena *ar);
+
+typedef struct RdxArg
+{
+    uint8_t set;       // 程序里给出了这个字段
+    uint8_t tag;       // RDX_TAG_*（TYPED 已拆开）
+    int8_t vtype;      // g_rdx_value_types 的下标，没有 Value 包装时为 -1
+    uint16_t cls;      // tag == RDX_TAG_SCHEMA 时的类编号
+    uint32_t n;        // LIST / OBJ 的元素个数
+    const char **keys; // OBJ 的键
+    union
+    {
+        int64_t i;
+        double f;
+        const char *s;
+        struct RdxArg *items; // LIST / OBJ 的值
+        void *obj;            // SCHEMA：RdxArgs_<Cls>
+    } u;
+} RdxArg;
+
+// cJSON -> RdxArg；rdx_json_field 在键不存在时返回 0 并保持 set == 0
+int rdx_arg_from_json(RdxArena *ar, const cJSON *item, RdxArg *out);
+int rdx_json_field(RdxArena *ar, const cJSON *obj, const char *key, RdxArg *out);
+// program JSON 里的一个对象 -> 类 cls 的 RdxArgs，失败返回 NULL
+void *rdx_args_from_json(RdxArena *ar, int cls, const cJSON *obj);
+
+/* ---------- 取值 ---------- */
+
+// 整数 / 布尔 / 枚举名 / "A | B" 标志 / mr0->lkey、(uint64_t)mr0->addr、std::min<size_t>(n, mr0->length)；
+// 字段缺省或无法求值时返回 def
+int64_t rdx_int(ResourceEnv *env, const RdxArg *arg, int64_t def);
+const char *rdx_str(const RdxArg *arg);
+// 类 cls 的 attr 参数，字段缺省或类型不符返回 NULL
+const void *rdx_attr(const RdxArg *arg, int cls);
+// OBJ 里按键取值（meta）
+const RdxArg *rdx_obj_get(const RdxArg *arg, const char *key);
+// 0 <= n <= RDX_MAX_ENTRIES
+#define RDX_MAX_ENTRIES 4096
+size_t rdx_count(int64_t n);
+
+/* ---------- 资源 ---------- */
+
+// 按名字查资源：先查生成的 handler 登记的对象，再查手写 handler 用的 env->pd / cq / qp ... 池
+void *rdx_res(ResourceEnv *env, const RdxArg *arg, const char *type);
+void rdx_put(ResourceEnv *env, const char *type, const RdxArg *name, void *obj);
+void rdx_drop(ResourceEnv *env, const char *type, const RdxArg *name);
+// 按名字取本地缓冲区，没有就分配 length 字节；已有的比 length 小时返回 NULL
+void *rdx_buf(ResourceEnv *env, const RdxArg *arg, int64_t length);
+void rdx_gid(const RdxArg *arg, union ibv_gid *gid);
+// IbvSge 列表 -> ibv_sge 数组，*count 为 num_sge（缺省时为列表长度），数组长度不小于它
+struct ibv_sge *rdx_sge_list(ResourceEnv *env, const RdxArg *list, const RdxArg *num_sge, int *count);
+// 整数列表 / 字符串 -> len 字节（不足补 0）
+uint8_t *rdx_bytes(const RdxArg *arg, size_t len);
+// "dev_list[1]"、设备名；没有 GetDeviceList 时退回当前 context 的设备
+struct ibv_device *rdx_device(ResourceEnv *env, const RdxArg *arg);
+struct ibv_device **rdx_get_device_list(void);
+void rdx_free_device_list(void);
+// PollCQ 最近一次取到的 wc（CreateAHFromWC 使用）
+struct ibv_wc *rdx_last_wc(void);
+
+// 单个 verb 的临时内存（attr 结构体、sge 数组等），exec_verb_args 执行完一个 verb 后释放
+void *rdx_scratch(size_t n);
+void rdx_scratch_reset(void);
+
+// 生成的 handler 的两种出口：缺资源跳过（返回 EXEC_VERB_SKIPPED），调用失败（errno 为 rc 或调用设置的值，返回 -1）
+int rdx_skip(const char *verb, const char *field, const RdxArg *arg);
+int rdx_fail(const char *verb, const char *call, int rc);
@@ -1,51 +1,48 @@
 #include "verb_dispatch.h"
-#include "verb_pd.h"
-#include "verb_dm.h"
-#include "verb_qp.h"
-#include "verb_mw.h"
-#include "verb_mr.h"
-#include "verb_td.h"
-#include "verb_srq.h"
-#include "verb_cq.h"
-#include "verb_flow.h"
-// 如果有其他模块，比如 verb_cq.h，也在这里 include
+#include "verb_schema.gen.h"
 
+#include <errno.h>
 #include <stdio.h>
 
-// 中央路由表
-static VerbEntry g_verb_table[] = {
-    {"AllocPD", handle_AllocPD},
-    {"AllocDM", handle_AllocDM},
-    {"CreateQP", handle_CreateQP},
-    {"ModifyQP", handle_ModifyQP},
-    {"DestroyQP", handle_DestroyQP},
-    {"PostSend", handle_PostSend},
-    {"PostRecv", handle_PostRecv},
-    {"AllocMW", handle_AllocMW},
-    {"DeallocPD", handle_DeallocPD},
-    {"DeallocMW", handle_DeallocMW},
-    {"AllocNullMR", handle_AllocNullMR},
-    {"AllocTD", handle_AllocTD},
-    {"CreateSRQ", handle_CreateSRQ},
-    {"DestroySRQ", handle_DestroySRQ},
-    {"CreateCQ", handle_CreateCQ},
-    {"CreateCQEx", handle_CreateCQEx},
-    {"ModifyCQ", handle_ModifyCQ},
-    {"RegMR", handle_RegMR},
-    {"CreateQP", handle_CreateQP},
-    {"DeregMR", handle_DeregMR},
-    {"FreeDM", handle_FreeDM},
-    {"DestroyQP", handle_DestroyQP},
-    {"DestroyCQ", handle_DestroyCQ},
-    {"CreateQPEx", handle_CreateQPEx},
-    {"CreateFlow", handle_CreateFlow},
-    {"ModifyQP", handle_ModifyQP},
-    {"ModifySRQ", handle_ModifySRQ},
-    {"BindMW", handle_BindMW},
-    {"PostSend", handle_PostSend},
-    {"PollCQ", handle_PollCQ},
-    // ... 后面慢慢加
-};
+// 路由表由 lib/exec_schema.py 按 verb id 生成（verb_schema.gen.c），每个 verb 都有生成的 handler
+int exec_verb_args(int verb_id, const void *args, ResourceEnv *env)
+{
+    if (verb_id < 0 || verb_id >= RDX_VERB_COUNT || !args)
+    {
+        fprintf(stderr, "[WARN] Unknown verb id %d\n", verb_id);
+        return EXEC_VERB_UNSUPPORTED;
+    }
+    int rc = g_rdx_handlers[verb_id](args, env);
+    int err = errno;
+    rdx_scratch_reset();
+    errno = err;
+    return rc;
+}
+
+// program JSON：有手写的 handle_<Verb> 时用它，否则转成 RdxArgs 交给生成的 handler
+int exec_verb_id(int verb_id, cJSON *verb_obj, ResourceEnv *env)
+{
+    if (verb_id < 0 || verb_id >= RDX_VERB_COUNT)
+    {
+        fprintf(stderr, "[WARN] Unknown verb id %d\n", verb_id);
+        return EXEC_VERB_UNSUPPORTED;
+    }
+    VerbHandler handler = g_rdx_json_handlers[verb_id];
+    if (handler)
+        return handler(verb_obj, env);
+
+    RdxArena arena = {0};
+    void *args = rdx_args_from_json(&arena, verb_id, verb_obj);
+    int rc = EXEC_VERB_UNSUPPORTED;
+    if (args)
+        rc = exec_verb_args(verb_id, args, env);
+    else
+        fprintf(stderr, "[WARN] Bad arguments for verb '%s'\n", g_rdx_classes[verb_id].name);
+    int err = errno;
+    rdx_arena_free(&arena);
+    errno = err;
+    return rc;
+}
 
 void exec_verb(cJSON *verb_obj, ResourceEnv *env)
 {
@@ -60,14 +57,11 @@ void exec_verb(cJSON *verb_obj, ResourceEnv *env)
     }
     const char *verb_name = verb_item->valuestring;
 
-    for (size_t i = 0; i < sizeof(g_verb_table) / sizeof(g_verb_table[0]); i++)
+    int verb_id = rdx_verb_id(verb_name);
+    if (verb_id < 0)
     {
-        if (strcmp(verb_name, g_verb_table[i].name) == 0)
-        {
-            g_verb_table[i].handler(verb_obj, env);
-            return;
-        }
+        fprintf(stderr, "[WARN] Unsupported verb '%s'\n", verb_name);
+        return;
     }
-
-    fprintf(stderr, "[WARN] Unsupported verb '%s'\n", verb_name);
-}
\ No newline at end of file
+    exec_verb_id(verb_id, verb_obj, env);
+}
@@ -3,12 +3,15 @@
 #include "resource_env.h"
 
 typedef int (*VerbHandler)(cJSON *verb_obj, ResourceEnv *env);
+// 生成的 handler（verb_schema.gen.c）：args 是 RdxArgs_<Verb>
+typedef int (*RdxVerbHandler)(const void *args, ResourceEnv *env);
 
-typedef struct
-{
-    const char *name; // "AllocPD", "AllocDM", "CreateQP", ...
-    VerbHandler handler;
-} VerbEntry;
-
-// 对外只暴露这个函数
-void exec_verb(cJSON *verb_obj, ResourceEnv *env);
\ No newline at end of file
+// 按 verb_obj["verb"] 的名字分发
+void exec_verb(cJSON *verb_obj, ResourceEnv *env);
+// 按 verb id（verb_schema.gen.h 里的 RDX_VERB_*）分发，返回 handler 的返回值（0 成功）；
+// 没有对应 handler 时返回 EXEC_VERB_UNSUPPORTED，缺少要用的资源而没有调用时返回 EXEC_VERB_SKIPPED
+#define EXEC_VERB_UNSUPPORTED (-1000)
+#define EXEC_VERB_SKIPPED (-1001)
+int exec_verb_id(int verb_id, cJSON *verb_obj, ResourceEnv *env);
+// 二进制程序：直接用解码好的 RdxArgs_<Verb> 调生成的 handler
+int exec_verb_args(int verb_id, const void *args, ResourceEnv *env);
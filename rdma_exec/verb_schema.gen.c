@@ -0,0 +1,7062 @@
+/* Auto-generated by lib/exec_schema.py from VerbCall / Attr EXPORT_FIELDS; do not edit manually. */
+#include "verb_schema.gen.h"
+#include "verb_cq.h"
+#include "verb_dm.h"
+#include "verb_flow.h"
+#include "verb_mr.h"
+#include "verb_mw.h"
+#include "verb_pd.h"
+#include "verb_qp.h"
+#include "verb_srq.h"
+#include "verb_td.h"
+#include "server_conn.h"
+
+#include <errno.h>
+#include <stdlib.h>
+#include <string.h>
+
+static const char *const k_fields_0[] = {"qp_ex"};
+static const char *const k_fields_1[] = {"cq", "nevents"};
+static const char *const k_fields_2[] = {"pd", "advice", "flags", "sg_list", "num_sge"};
+static const char *const k_fields_3[] = {"dm", "attr_obj"};
+static const char *const k_fields_4[] = {"pd", "mw", "mw_type"};
+static const char *const k_fields_5[] = {"pd", "mr"};
+static const char *const k_fields_6[] = {"pd"};
+static const char *const k_fields_7[] = {"context", "pd", "parent_pd", "attr_obj"};
+static const char *const k_fields_8[] = {"td", "attr_obj"};
+static const char *const k_fields_9[] = {"qp", "gid", "lid"};
+static const char *const k_fields_10[] = {"qp", "mw", "mw_bind_obj"};
+static const char *const k_fields_12[] = {"xrcd"};
+static const char *const k_fields_13[] = {"pd", "ah", "attr_obj"};
+static const char *const k_fields_14[] = {"pd", "wc", "grh", "port_num", "ah"};
+static const char *const k_fields_15[] = {"cqe", "cq_context", "channel", "comp_vector", "cq"};
+static const char *const k_fields_16[] = {"cq_ex", "cq_attr_obj"};
+static const char *const k_fields_17[] = {"channel"};
+static const char *const k_fields_18[] = {"qp", "flow", "flow_attr_obj"};
+static const char *const k_fields_19[] = {"pd", "qp", "init_attr_obj", "remote_qp"};
+static const char *const k_fields_20[] = {"qp", "qp_attr_obj"};
+static const char *const k_fields_21[] = {"pd", "srq", "srq_init_obj"};
+static const char *const k_fields_22[] = {"srq", "srq_attr_obj"};
+static const char *const k_fields_23[] = {"wq", "wq_attr_obj"};
+static const char *const k_fields_24[] = {"mw"};
+static const char *const k_fields_25[] = {"pd"};
+static const char *const k_fields_26[] = {"td"};
+static const char *const k_fields_27[] = {"mr"};
+static const char *const k_fields_28[] = {"ah"};
+static const char *const k_fields_29[] = {"cq"};
+static const char *const k_fields_30[] = {"channel"};
+static const char *const k_fields_31[] = {"flow"};
+static const char *const k_fields_32[] = {"qp"};
+static const char *const k_fields_33[] = {"srq"};
+static const char *const k_fields_34[] = {"wq"};
+static const char *const k_fields_35[] = {"qp", "gid", "lid"};
+static const char *const k_fields_37[] = {"dm"};
+static const char *const k_fields_39[] = {"device", "output"};
+static const char *const k_fields_40[] = {"device_name", "output"};
+static const char *const k_fields_42[] = {"device", "output"};
+static const char *const k_fields_43[] = {"port_num", "pkey", "output"};
+static const char *const k_fields_44[] = {"srq"};
+static const char *const k_fields_45[] = {"dm_handle", "dm"};
+static const char *const k_fields_46[] = {"pd", "mr_handle", "mr"};
+static const char *const k_fields_47[] = {"pd", "pd_handle"};
+static const char *const k_fields_48[] = {"host", "dm", "dm_offset", "length"};
+static const char *const k_fields_49[] = {"dm", "dm_offset", "host", "length"};
+static const char *const k_fields_50[] = {"cq", "attr_obj"};
+static const char *const k_fields_51[] = {"qp", "attr_obj", "attr_mask"};
+static const char *const k_fields_52[] = {"qp", "attr_obj"};
+static const char *const k_fields_53[] = {"srq", "attr_obj", "attr_mask"};
+static const char *const k_fields_54[] = {"wq", "attr_obj"};
+static const char *const k_fields_55[] = {"device"};
+static const char *const k_fields_56[] = {"ctx_var", "qp", "attr_var", "attr_obj"};
+static const char *const k_fields_57[] = {"ctx_var", "xrcd", "attr_var", "attr_obj"};
+static const char *const k_fields_58[] = {"cq"};
+static const char *const k_fields_59[] = {"qp", "wr_obj", "wr_var", "bad_wr_var"};
+static const char *const k_fields_60[] = {"srq", "wr_obj", "wr_var", "bad_wr_var"};
+static const char *const k_fields_61[] = {"qp", "wr_obj"};
+static const char *const k_fields_62[] = {"output"};
+static const char *const k_fields_63[] = {"ctx_var", "attr_var", "comp_mask", "input_var"};
+static const char *const k_fields_64[] = {"qp", "output"};
+static const char *const k_fields_65[] = {"port_num", "index"};
+static const char *const k_fields_66[] = {"port_num", "gid_index", "flags", "output"};
+static const char *const k_fields_67[] = {"max_entries", "output"};
+static const char *const k_fields_68[] = {"port_num", "index", "pkey"};
+static const char *const k_fields_69[] = {"port_num", "port_attr"};
+static const char *const k_fields_70[] = {"qp", "attr_mask"};
+static const char *const k_fields_71[] = {"srq"};
+static const char *const k_fields_72[] = {"mr", "flags", "pd", "addr", "length", "access"};
+static const char *const k_fields_73[] = {"pd", "mr", "offset", "length", "iova", "fd", "access"};
+static const char *const k_fields_74[] = {"pd", "mr", "addr", "length", "access"};
+static const char *const k_fields_75[] = {"pd", "mr", "buf", "length", "iova", "access"};
+static const char *const k_fields_76[] = {"cq", "solicited_only"};
+static const char *const k_fields_77[] = {"cq", "cqe"};
+static const char *const k_fields_78[] = {"qp", "ece_obj", "ece_var"};
+static const char *const k_fields_79[] = {"qp_ex"};
+static const char *const k_fields_80[] = {"qp_ex"};
+static const char *const k_fields_81[] = {"grh", "dlid", "sl", "src_path_bits", "static_rate", "is_global", "port_num"};
+static const char *const k_fields_82[] = {"length", "log_align_req", "comp_mask"};
+static const char *const k_fields_83[] = {"remote_addr", "compare_add", "swap", "rkey"};
+static const char *const k_fields_84[] = {"mw", "rkey", "bind_info"};
+static const char *const k_fields_85[] = {"cqe", "cq_context", "channel", "comp_vector", "wc_flags", "comp_mask", "flags", "parent_domain"};
+static const char *const k_fields_86[] = {"vendor_id", "options", "comp_mask"};
+static const char *const k_fields_87[] = {"comp_mask", "type", "size", "priority", "num_of_specs", "port", "flags"};
+static const char *const k_fields_88[] = {"raw", "src_var"};
+static const char *const k_fields_89[] = {"dgid", "flow_label", "sgid_index", "hop_limit", "traffic_class"};
+static const char *const k_fields_90[] = {"cq_count", "cq_period"};
+static const char *const k_fields_91[] = {"attr_mask", "moderate"};
+static const char *const k_fields_92[] = {"wr_id", "send_flags", "bind_info"};
+static const char *const k_fields_93[] = {"mr", "addr", "length", "mw_access_flags"};
+static const char *const k_fields_94[] = {"pd", "td", "comp_mask", "alloc", "free", "pd_context"};
+static const char *const k_fields_95[] = {"qp_state", "cur_qp_state", "path_mtu", "path_mig_state", "qkey", "rq_psn", "sq_psn", "dest_qp_num", "qp_access_flags", "cap", "ah_attr", "alt_ah_attr", "pkey_index", "alt_pkey_index", "en_sqd_async_notify", "sq_draining", "max_rd_atomic", "max_dest_rd_atomic", "min_rnr_timer", "port_num", "timeout", "retry_cnt", "rnr_retry", "alt_port_num", "alt_timeout", "rate_limit"};
+static const char *const k_fields_96[] = {"max_send_wr", "max_recv_wr", "max_send_sge", "max_recv_sge", "max_inline_data"};
+static const char *const k_fields_97[] = {"qp_context", "send_cq", "recv_cq", "srq", "cap", "qp_type", "sq_sig_all"};
+static const char *const k_fields_98[] = {"qp_context", "send_cq", "recv_cq", "srq", "cap", "qp_type", "sq_sig_all", "comp_mask", "pd", "xrcd", "create_flags", "max_tso_header", "rwq_ind_tbl", "rx_hash_conf", "source_qpn", "send_ops_flags"};
+static const char *const k_fields_99[] = {"comp_mask", "qp_num", "xrcd", "qp_context", "qp_type"};
+static const char *const k_fields_100[] = {"rate_limit", "max_burst_sz", "typical_pkt_sz", "comp_mask"};
+static const char *const k_fields_101[] = {"remote_addr", "rkey"};
+static const char *const k_fields_102[] = {"wr_id", "next", "sg_list", "num_sge"};
+static const char *const k_fields_103[] = {"rx_hash_function", "rx_hash_key_len", "rx_hash_key", "rx_hash_fields_mask"};
+static const char *const k_fields_104[] = {"wr_id", "next", "sg_list", "num_sge", "opcode", "send_flags", "imm_data", "invalidate_rkey", "rdma", "atomic", "ud", "xrc", "bind_mw", "tso"};
+static const char *const k_fields_105[] = {"addr", "length", "lkey"};
+static const char *const k_fields_106[] = {"max_wr", "max_sge", "srq_limit"};
+static const char *const k_fields_107[] = {"srq_context", "attr"};
+static const char *const k_fields_108[] = {"srq_context", "attr", "comp_mask", "srq_type", "pd", "xrcd", "cq", "tm_cap"};
+static const char *const k_fields_109[] = {"max_num_tags", "max_ops"};
+static const char *const k_fields_110[] = {"comp_mask"};
+static const char *const k_fields_111[] = {"hdr", "hdr_sz", "mss"};
+static const char *const k_fields_112[] = {"ah", "remote_qpn", "remote_qkey"};
+static const char *const k_fields_113[] = {"attr_mask", "wq_state", "curr_wq_state", "flags", "flags_mask"};
+static const char *const k_fields_114[] = {"wq_context", "wq_type", "max_wr", "max_sge", "pd", "cq", "comp_mask", "create_flags"};
+static const char *const k_fields_115[] = {"comp_mask", "fd", "oflags"};
+
+/* ---------- 二进制程序 -> RdxArgs ---------- */
+
+static int rdx_decode_AbortWR(RdxReader *r, void *args)
+{
+    RdxArgs_AbortWR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp_ex;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AckCQEvents(RdxReader *r, void *args)
+{
+    RdxArgs_AckCQEvents *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cq;
+            break;
+        case 1:
+            f = &a->nevents;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AdviseMR(RdxReader *r, void *args)
+{
+    RdxArgs_AdviseMR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->advice;
+            break;
+        case 2:
+            f = &a->flags;
+            break;
+        case 3:
+            f = &a->sg_list;
+            break;
+        case 4:
+            f = &a->num_sge;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AllocDM(RdxReader *r, void *args)
+{
+    RdxArgs_AllocDM *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->dm;
+            break;
+        case 1:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AllocMW(RdxReader *r, void *args)
+{
+    RdxArgs_AllocMW *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->mw;
+            break;
+        case 2:
+            f = &a->mw_type;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AllocNullMR(RdxReader *r, void *args)
+{
+    RdxArgs_AllocNullMR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->mr;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AllocPD(RdxReader *r, void *args)
+{
+    RdxArgs_AllocPD *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AllocParentDomain(RdxReader *r, void *args)
+{
+    RdxArgs_AllocParentDomain *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->context;
+            break;
+        case 1:
+            f = &a->pd;
+            break;
+        case 2:
+            f = &a->parent_pd;
+            break;
+        case 3:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AllocTD(RdxReader *r, void *args)
+{
+    RdxArgs_AllocTD *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->td;
+            break;
+        case 1:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_AttachMcast(RdxReader *r, void *args)
+{
+    RdxArgs_AttachMcast *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->gid;
+            break;
+        case 2:
+            f = &a->lid;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_BindMW(RdxReader *r, void *args)
+{
+    RdxArgs_BindMW *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->mw;
+            break;
+        case 2:
+            f = &a->mw_bind_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CloseDevice(RdxReader *r, void *args)
+{
+    uint64_t n;
+    (void)args;
+    return (rdx_rd_varint(r, &n) != 0 || n != 0) ? -1 : 0;
+}
+
+static int rdx_decode_CloseXRCD(RdxReader *r, void *args)
+{
+    RdxArgs_CloseXRCD *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->xrcd;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateAH(RdxReader *r, void *args)
+{
+    RdxArgs_CreateAH *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->ah;
+            break;
+        case 2:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateAHFromWC(RdxReader *r, void *args)
+{
+    RdxArgs_CreateAHFromWC *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->wc;
+            break;
+        case 2:
+            f = &a->grh;
+            break;
+        case 3:
+            f = &a->port_num;
+            break;
+        case 4:
+            f = &a->ah;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateCQ(RdxReader *r, void *args)
+{
+    RdxArgs_CreateCQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cqe;
+            break;
+        case 1:
+            f = &a->cq_context;
+            break;
+        case 2:
+            f = &a->channel;
+            break;
+        case 3:
+            f = &a->comp_vector;
+            break;
+        case 4:
+            f = &a->cq;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateCQEx(RdxReader *r, void *args)
+{
+    RdxArgs_CreateCQEx *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cq_ex;
+            break;
+        case 1:
+            f = &a->cq_attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateCompChannel(RdxReader *r, void *args)
+{
+    RdxArgs_CreateCompChannel *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->channel;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateFlow(RdxReader *r, void *args)
+{
+    RdxArgs_CreateFlow *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->flow;
+            break;
+        case 2:
+            f = &a->flow_attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateQP(RdxReader *r, void *args)
+{
+    RdxArgs_CreateQP *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->qp;
+            break;
+        case 2:
+            f = &a->init_attr_obj;
+            break;
+        case 3:
+            f = &a->remote_qp;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateQPEx(RdxReader *r, void *args)
+{
+    RdxArgs_CreateQPEx *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->qp_attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateSRQ(RdxReader *r, void *args)
+{
+    RdxArgs_CreateSRQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->srq;
+            break;
+        case 2:
+            f = &a->srq_init_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateSRQEx(RdxReader *r, void *args)
+{
+    RdxArgs_CreateSRQEx *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->srq;
+            break;
+        case 1:
+            f = &a->srq_attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_CreateWQ(RdxReader *r, void *args)
+{
+    RdxArgs_CreateWQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->wq;
+            break;
+        case 1:
+            f = &a->wq_attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DeallocMW(RdxReader *r, void *args)
+{
+    RdxArgs_DeallocMW *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->mw;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DeallocPD(RdxReader *r, void *args)
+{
+    RdxArgs_DeallocPD *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DeallocTD(RdxReader *r, void *args)
+{
+    RdxArgs_DeallocTD *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->td;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DeregMR(RdxReader *r, void *args)
+{
+    RdxArgs_DeregMR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->mr;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DestroyAH(RdxReader *r, void *args)
+{
+    RdxArgs_DestroyAH *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->ah;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DestroyCQ(RdxReader *r, void *args)
+{
+    RdxArgs_DestroyCQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cq;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DestroyCompChannel(RdxReader *r, void *args)
+{
+    RdxArgs_DestroyCompChannel *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->channel;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DestroyFlow(RdxReader *r, void *args)
+{
+    RdxArgs_DestroyFlow *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->flow;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DestroyQP(RdxReader *r, void *args)
+{
+    RdxArgs_DestroyQP *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DestroySRQ(RdxReader *r, void *args)
+{
+    RdxArgs_DestroySRQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->srq;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DestroyWQ(RdxReader *r, void *args)
+{
+    RdxArgs_DestroyWQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->wq;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_DetachMcast(RdxReader *r, void *args)
+{
+    RdxArgs_DetachMcast *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->gid;
+            break;
+        case 2:
+            f = &a->lid;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ForkInit(RdxReader *r, void *args)
+{
+    uint64_t n;
+    (void)args;
+    return (rdx_rd_varint(r, &n) != 0 || n != 0) ? -1 : 0;
+}
+
+static int rdx_decode_FreeDM(RdxReader *r, void *args)
+{
+    RdxArgs_FreeDM *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->dm;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_FreeDeviceList(RdxReader *r, void *args)
+{
+    uint64_t n;
+    (void)args;
+    return (rdx_rd_varint(r, &n) != 0 || n != 0) ? -1 : 0;
+}
+
+static int rdx_decode_GetDeviceGUID(RdxReader *r, void *args)
+{
+    RdxArgs_GetDeviceGUID *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->device;
+            break;
+        case 1:
+            f = &a->output;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_GetDeviceIndex(RdxReader *r, void *args)
+{
+    RdxArgs_GetDeviceIndex *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->device_name;
+            break;
+        case 1:
+            f = &a->output;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_GetDeviceList(RdxReader *r, void *args)
+{
+    uint64_t n;
+    (void)args;
+    return (rdx_rd_varint(r, &n) != 0 || n != 0) ? -1 : 0;
+}
+
+static int rdx_decode_GetDeviceName(RdxReader *r, void *args)
+{
+    RdxArgs_GetDeviceName *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->device;
+            break;
+        case 1:
+            f = &a->output;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_GetPKeyIndex(RdxReader *r, void *args)
+{
+    RdxArgs_GetPKeyIndex *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->port_num;
+            break;
+        case 1:
+            f = &a->pkey;
+            break;
+        case 2:
+            f = &a->output;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_GetSRQNum(RdxReader *r, void *args)
+{
+    RdxArgs_GetSRQNum *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->srq;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ImportDM(RdxReader *r, void *args)
+{
+    RdxArgs_ImportDM *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->dm_handle;
+            break;
+        case 1:
+            f = &a->dm;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ImportMR(RdxReader *r, void *args)
+{
+    RdxArgs_ImportMR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->mr_handle;
+            break;
+        case 2:
+            f = &a->mr;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ImportPD(RdxReader *r, void *args)
+{
+    RdxArgs_ImportPD *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->pd_handle;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_MemcpyFromDM(RdxReader *r, void *args)
+{
+    RdxArgs_MemcpyFromDM *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->host;
+            break;
+        case 1:
+            f = &a->dm;
+            break;
+        case 2:
+            f = &a->dm_offset;
+            break;
+        case 3:
+            f = &a->length;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_MemcpyToDM(RdxReader *r, void *args)
+{
+    RdxArgs_MemcpyToDM *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->dm;
+            break;
+        case 1:
+            f = &a->dm_offset;
+            break;
+        case 2:
+            f = &a->host;
+            break;
+        case 3:
+            f = &a->length;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ModifyCQ(RdxReader *r, void *args)
+{
+    RdxArgs_ModifyCQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cq;
+            break;
+        case 1:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ModifyQP(RdxReader *r, void *args)
+{
+    RdxArgs_ModifyQP *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->attr_obj;
+            break;
+        case 2:
+            f = &a->attr_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ModifyQPRateLimit(RdxReader *r, void *args)
+{
+    RdxArgs_ModifyQPRateLimit *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ModifySRQ(RdxReader *r, void *args)
+{
+    RdxArgs_ModifySRQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->srq;
+            break;
+        case 1:
+            f = &a->attr_obj;
+            break;
+        case 2:
+            f = &a->attr_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ModifyWQ(RdxReader *r, void *args)
+{
+    RdxArgs_ModifyWQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->wq;
+            break;
+        case 1:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_OpenDevice(RdxReader *r, void *args)
+{
+    RdxArgs_OpenDevice *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->device;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_OpenQP(RdxReader *r, void *args)
+{
+    RdxArgs_OpenQP *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->ctx_var;
+            break;
+        case 1:
+            f = &a->qp;
+            break;
+        case 2:
+            f = &a->attr_var;
+            break;
+        case 3:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_OpenXRCD(RdxReader *r, void *args)
+{
+    RdxArgs_OpenXRCD *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->ctx_var;
+            break;
+        case 1:
+            f = &a->xrcd;
+            break;
+        case 2:
+            f = &a->attr_var;
+            break;
+        case 3:
+            f = &a->attr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_PollCQ(RdxReader *r, void *args)
+{
+    RdxArgs_PollCQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cq;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_PostRecv(RdxReader *r, void *args)
+{
+    RdxArgs_PostRecv *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->wr_obj;
+            break;
+        case 2:
+            f = &a->wr_var;
+            break;
+        case 3:
+            f = &a->bad_wr_var;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_PostSRQRecv(RdxReader *r, void *args)
+{
+    RdxArgs_PostSRQRecv *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->srq;
+            break;
+        case 1:
+            f = &a->wr_obj;
+            break;
+        case 2:
+            f = &a->wr_var;
+            break;
+        case 3:
+            f = &a->bad_wr_var;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_PostSend(RdxReader *r, void *args)
+{
+    RdxArgs_PostSend *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->wr_obj;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryDeviceAttr(RdxReader *r, void *args)
+{
+    RdxArgs_QueryDeviceAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->output;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryDeviceEx(RdxReader *r, void *args)
+{
+    RdxArgs_QueryDeviceEx *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->ctx_var;
+            break;
+        case 1:
+            f = &a->attr_var;
+            break;
+        case 2:
+            f = &a->comp_mask;
+            break;
+        case 3:
+            f = &a->input_var;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryECE(RdxReader *r, void *args)
+{
+    RdxArgs_QueryECE *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->output;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryGID(RdxReader *r, void *args)
+{
+    RdxArgs_QueryGID *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->port_num;
+            break;
+        case 1:
+            f = &a->index;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryGIDEx(RdxReader *r, void *args)
+{
+    RdxArgs_QueryGIDEx *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->port_num;
+            break;
+        case 1:
+            f = &a->gid_index;
+            break;
+        case 2:
+            f = &a->flags;
+            break;
+        case 3:
+            f = &a->output;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryGIDTable(RdxReader *r, void *args)
+{
+    RdxArgs_QueryGIDTable *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->max_entries;
+            break;
+        case 1:
+            f = &a->output;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryPKey(RdxReader *r, void *args)
+{
+    RdxArgs_QueryPKey *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->port_num;
+            break;
+        case 1:
+            f = &a->index;
+            break;
+        case 2:
+            f = &a->pkey;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryPortAttr(RdxReader *r, void *args)
+{
+    RdxArgs_QueryPortAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->port_num;
+            break;
+        case 1:
+            f = &a->port_attr;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QueryQP(RdxReader *r, void *args)
+{
+    RdxArgs_QueryQP *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->attr_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_QuerySRQ(RdxReader *r, void *args)
+{
+    RdxArgs_QuerySRQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->srq;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ReRegMR(RdxReader *r, void *args)
+{
+    RdxArgs_ReRegMR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->mr;
+            break;
+        case 1:
+            f = &a->flags;
+            break;
+        case 2:
+            f = &a->pd;
+            break;
+        case 3:
+            f = &a->addr;
+            break;
+        case 4:
+            f = &a->length;
+            break;
+        case 5:
+            f = &a->access;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_RegDmaBufMR(RdxReader *r, void *args)
+{
+    RdxArgs_RegDmaBufMR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->mr;
+            break;
+        case 2:
+            f = &a->offset;
+            break;
+        case 3:
+            f = &a->length;
+            break;
+        case 4:
+            f = &a->iova;
+            break;
+        case 5:
+            f = &a->fd;
+            break;
+        case 6:
+            f = &a->access;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_RegMR(RdxReader *r, void *args)
+{
+    RdxArgs_RegMR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->mr;
+            break;
+        case 2:
+            f = &a->addr;
+            break;
+        case 3:
+            f = &a->length;
+            break;
+        case 4:
+            f = &a->access;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_RegMRIova(RdxReader *r, void *args)
+{
+    RdxArgs_RegMRIova *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->mr;
+            break;
+        case 2:
+            f = &a->buf;
+            break;
+        case 3:
+            f = &a->length;
+            break;
+        case 4:
+            f = &a->iova;
+            break;
+        case 5:
+            f = &a->access;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ReqNotifyCQ(RdxReader *r, void *args)
+{
+    RdxArgs_ReqNotifyCQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cq;
+            break;
+        case 1:
+            f = &a->solicited_only;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_ResizeCQ(RdxReader *r, void *args)
+{
+    RdxArgs_ResizeCQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cq;
+            break;
+        case 1:
+            f = &a->cqe;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_SetECE(RdxReader *r, void *args)
+{
+    RdxArgs_SetECE *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp;
+            break;
+        case 1:
+            f = &a->ece_obj;
+            break;
+        case 2:
+            f = &a->ece_var;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_WRComplete(RdxReader *r, void *args)
+{
+    RdxArgs_WRComplete *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp_ex;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_WrStart(RdxReader *r, void *args)
+{
+    RdxArgs_WrStart *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp_ex;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvAHAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvAHAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->grh;
+            break;
+        case 1:
+            f = &a->dlid;
+            break;
+        case 2:
+            f = &a->sl;
+            break;
+        case 3:
+            f = &a->src_path_bits;
+            break;
+        case 4:
+            f = &a->static_rate;
+            break;
+        case 5:
+            f = &a->is_global;
+            break;
+        case 6:
+            f = &a->port_num;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvAllocDmAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvAllocDmAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->length;
+            break;
+        case 1:
+            f = &a->log_align_req;
+            break;
+        case 2:
+            f = &a->comp_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvAtomicInfo(RdxReader *r, void *args)
+{
+    RdxArgs_IbvAtomicInfo *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->remote_addr;
+            break;
+        case 1:
+            f = &a->compare_add;
+            break;
+        case 2:
+            f = &a->swap;
+            break;
+        case 3:
+            f = &a->rkey;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvBindMwInfo(RdxReader *r, void *args)
+{
+    RdxArgs_IbvBindMwInfo *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->mw;
+            break;
+        case 1:
+            f = &a->rkey;
+            break;
+        case 2:
+            f = &a->bind_info;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvCQInitAttrEx(RdxReader *r, void *args)
+{
+    RdxArgs_IbvCQInitAttrEx *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cqe;
+            break;
+        case 1:
+            f = &a->cq_context;
+            break;
+        case 2:
+            f = &a->channel;
+            break;
+        case 3:
+            f = &a->comp_vector;
+            break;
+        case 4:
+            f = &a->wc_flags;
+            break;
+        case 5:
+            f = &a->comp_mask;
+            break;
+        case 6:
+            f = &a->flags;
+            break;
+        case 7:
+            f = &a->parent_domain;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvECE(RdxReader *r, void *args)
+{
+    RdxArgs_IbvECE *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->vendor_id;
+            break;
+        case 1:
+            f = &a->options;
+            break;
+        case 2:
+            f = &a->comp_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvFlowAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvFlowAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->comp_mask;
+            break;
+        case 1:
+            f = &a->type;
+            break;
+        case 2:
+            f = &a->size;
+            break;
+        case 3:
+            f = &a->priority;
+            break;
+        case 4:
+            f = &a->num_of_specs;
+            break;
+        case 5:
+            f = &a->port;
+            break;
+        case 6:
+            f = &a->flags;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvGID(RdxReader *r, void *args)
+{
+    RdxArgs_IbvGID *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->raw;
+            break;
+        case 1:
+            f = &a->src_var;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvGlobalRoute(RdxReader *r, void *args)
+{
+    RdxArgs_IbvGlobalRoute *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->dgid;
+            break;
+        case 1:
+            f = &a->flow_label;
+            break;
+        case 2:
+            f = &a->sgid_index;
+            break;
+        case 3:
+            f = &a->hop_limit;
+            break;
+        case 4:
+            f = &a->traffic_class;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvModerateCQ(RdxReader *r, void *args)
+{
+    RdxArgs_IbvModerateCQ *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->cq_count;
+            break;
+        case 1:
+            f = &a->cq_period;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvModifyCQAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvModifyCQAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->attr_mask;
+            break;
+        case 1:
+            f = &a->moderate;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvMwBind(RdxReader *r, void *args)
+{
+    RdxArgs_IbvMwBind *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->wr_id;
+            break;
+        case 1:
+            f = &a->send_flags;
+            break;
+        case 2:
+            f = &a->bind_info;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvMwBindInfo(RdxReader *r, void *args)
+{
+    RdxArgs_IbvMwBindInfo *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->mr;
+            break;
+        case 1:
+            f = &a->addr;
+            break;
+        case 2:
+            f = &a->length;
+            break;
+        case 3:
+            f = &a->mw_access_flags;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvParentDomainInitAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvParentDomainInitAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->pd;
+            break;
+        case 1:
+            f = &a->td;
+            break;
+        case 2:
+            f = &a->comp_mask;
+            break;
+        case 3:
+            f = &a->alloc;
+            break;
+        case 4:
+            f = &a->free;
+            break;
+        case 5:
+            f = &a->pd_context;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvQPAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvQPAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp_state;
+            break;
+        case 1:
+            f = &a->cur_qp_state;
+            break;
+        case 2:
+            f = &a->path_mtu;
+            break;
+        case 3:
+            f = &a->path_mig_state;
+            break;
+        case 4:
+            f = &a->qkey;
+            break;
+        case 5:
+            f = &a->rq_psn;
+            break;
+        case 6:
+            f = &a->sq_psn;
+            break;
+        case 7:
+            f = &a->dest_qp_num;
+            break;
+        case 8:
+            f = &a->qp_access_flags;
+            break;
+        case 9:
+            f = &a->cap;
+            break;
+        case 10:
+            f = &a->ah_attr;
+            break;
+        case 11:
+            f = &a->alt_ah_attr;
+            break;
+        case 12:
+            f = &a->pkey_index;
+            break;
+        case 13:
+            f = &a->alt_pkey_index;
+            break;
+        case 14:
+            f = &a->en_sqd_async_notify;
+            break;
+        case 15:
+            f = &a->sq_draining;
+            break;
+        case 16:
+            f = &a->max_rd_atomic;
+            break;
+        case 17:
+            f = &a->max_dest_rd_atomic;
+            break;
+        case 18:
+            f = &a->min_rnr_timer;
+            break;
+        case 19:
+            f = &a->port_num;
+            break;
+        case 20:
+            f = &a->timeout;
+            break;
+        case 21:
+            f = &a->retry_cnt;
+            break;
+        case 22:
+            f = &a->rnr_retry;
+            break;
+        case 23:
+            f = &a->alt_port_num;
+            break;
+        case 24:
+            f = &a->alt_timeout;
+            break;
+        case 25:
+            f = &a->rate_limit;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvQPCap(RdxReader *r, void *args)
+{
+    RdxArgs_IbvQPCap *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->max_send_wr;
+            break;
+        case 1:
+            f = &a->max_recv_wr;
+            break;
+        case 2:
+            f = &a->max_send_sge;
+            break;
+        case 3:
+            f = &a->max_recv_sge;
+            break;
+        case 4:
+            f = &a->max_inline_data;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvQPInitAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvQPInitAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp_context;
+            break;
+        case 1:
+            f = &a->send_cq;
+            break;
+        case 2:
+            f = &a->recv_cq;
+            break;
+        case 3:
+            f = &a->srq;
+            break;
+        case 4:
+            f = &a->cap;
+            break;
+        case 5:
+            f = &a->qp_type;
+            break;
+        case 6:
+            f = &a->sq_sig_all;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvQPInitAttrEx(RdxReader *r, void *args)
+{
+    RdxArgs_IbvQPInitAttrEx *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->qp_context;
+            break;
+        case 1:
+            f = &a->send_cq;
+            break;
+        case 2:
+            f = &a->recv_cq;
+            break;
+        case 3:
+            f = &a->srq;
+            break;
+        case 4:
+            f = &a->cap;
+            break;
+        case 5:
+            f = &a->qp_type;
+            break;
+        case 6:
+            f = &a->sq_sig_all;
+            break;
+        case 7:
+            f = &a->comp_mask;
+            break;
+        case 8:
+            f = &a->pd;
+            break;
+        case 9:
+            f = &a->xrcd;
+            break;
+        case 10:
+            f = &a->create_flags;
+            break;
+        case 11:
+            f = &a->max_tso_header;
+            break;
+        case 12:
+            f = &a->rwq_ind_tbl;
+            break;
+        case 13:
+            f = &a->rx_hash_conf;
+            break;
+        case 14:
+            f = &a->source_qpn;
+            break;
+        case 15:
+            f = &a->send_ops_flags;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvQPOpenAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvQPOpenAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->comp_mask;
+            break;
+        case 1:
+            f = &a->qp_num;
+            break;
+        case 2:
+            f = &a->xrcd;
+            break;
+        case 3:
+            f = &a->qp_context;
+            break;
+        case 4:
+            f = &a->qp_type;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvQPRateLimitAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvQPRateLimitAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->rate_limit;
+            break;
+        case 1:
+            f = &a->max_burst_sz;
+            break;
+        case 2:
+            f = &a->typical_pkt_sz;
+            break;
+        case 3:
+            f = &a->comp_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvRdmaInfo(RdxReader *r, void *args)
+{
+    RdxArgs_IbvRdmaInfo *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->remote_addr;
+            break;
+        case 1:
+            f = &a->rkey;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvRecvWR(RdxReader *r, void *args)
+{
+    RdxArgs_IbvRecvWR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->wr_id;
+            break;
+        case 1:
+            f = &a->next;
+            break;
+        case 2:
+            f = &a->sg_list;
+            break;
+        case 3:
+            f = &a->num_sge;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvRxHashConf(RdxReader *r, void *args)
+{
+    RdxArgs_IbvRxHashConf *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->rx_hash_function;
+            break;
+        case 1:
+            f = &a->rx_hash_key_len;
+            break;
+        case 2:
+            f = &a->rx_hash_key;
+            break;
+        case 3:
+            f = &a->rx_hash_fields_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvSendWR(RdxReader *r, void *args)
+{
+    RdxArgs_IbvSendWR *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->wr_id;
+            break;
+        case 1:
+            f = &a->next;
+            break;
+        case 2:
+            f = &a->sg_list;
+            break;
+        case 3:
+            f = &a->num_sge;
+            break;
+        case 4:
+            f = &a->opcode;
+            break;
+        case 5:
+            f = &a->send_flags;
+            break;
+        case 6:
+            f = &a->imm_data;
+            break;
+        case 7:
+            f = &a->invalidate_rkey;
+            break;
+        case 8:
+            f = &a->rdma;
+            break;
+        case 9:
+            f = &a->atomic;
+            break;
+        case 10:
+            f = &a->ud;
+            break;
+        case 11:
+            f = &a->xrc;
+            break;
+        case 12:
+            f = &a->bind_mw;
+            break;
+        case 13:
+            f = &a->tso;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvSge(RdxReader *r, void *args)
+{
+    RdxArgs_IbvSge *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->addr;
+            break;
+        case 1:
+            f = &a->length;
+            break;
+        case 2:
+            f = &a->lkey;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvSrqAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvSrqAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->max_wr;
+            break;
+        case 1:
+            f = &a->max_sge;
+            break;
+        case 2:
+            f = &a->srq_limit;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvSrqInitAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvSrqInitAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->srq_context;
+            break;
+        case 1:
+            f = &a->attr;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvSrqInitAttrEx(RdxReader *r, void *args)
+{
+    RdxArgs_IbvSrqInitAttrEx *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->srq_context;
+            break;
+        case 1:
+            f = &a->attr;
+            break;
+        case 2:
+            f = &a->comp_mask;
+            break;
+        case 3:
+            f = &a->srq_type;
+            break;
+        case 4:
+            f = &a->pd;
+            break;
+        case 5:
+            f = &a->xrcd;
+            break;
+        case 6:
+            f = &a->cq;
+            break;
+        case 7:
+            f = &a->tm_cap;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvTMCap(RdxReader *r, void *args)
+{
+    RdxArgs_IbvTMCap *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->max_num_tags;
+            break;
+        case 1:
+            f = &a->max_ops;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvTdInitAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvTdInitAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->comp_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvTsoInfo(RdxReader *r, void *args)
+{
+    RdxArgs_IbvTsoInfo *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->hdr;
+            break;
+        case 1:
+            f = &a->hdr_sz;
+            break;
+        case 2:
+            f = &a->mss;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvUdInfo(RdxReader *r, void *args)
+{
+    RdxArgs_IbvUdInfo *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->ah;
+            break;
+        case 1:
+            f = &a->remote_qpn;
+            break;
+        case 2:
+            f = &a->remote_qkey;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvWQAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvWQAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->attr_mask;
+            break;
+        case 1:
+            f = &a->wq_state;
+            break;
+        case 2:
+            f = &a->curr_wq_state;
+            break;
+        case 3:
+            f = &a->flags;
+            break;
+        case 4:
+            f = &a->flags_mask;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvWQInitAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvWQInitAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->wq_context;
+            break;
+        case 1:
+            f = &a->wq_type;
+            break;
+        case 2:
+            f = &a->max_wr;
+            break;
+        case 3:
+            f = &a->max_sge;
+            break;
+        case 4:
+            f = &a->pd;
+            break;
+        case 5:
+            f = &a->cq;
+            break;
+        case 6:
+            f = &a->comp_mask;
+            break;
+        case 7:
+            f = &a->create_flags;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvXRCDInitAttr(RdxReader *r, void *args)
+{
+    RdxArgs_IbvXRCDInitAttr *a = args;
+    uint64_t n;
+    if (rdx_rd_varint(r, &n) != 0)
+        return -1;
+    for (uint64_t i = 0; i < n; i++)
+    {
+        uint64_t j;
+        RdxArg *f;
+        if (rdx_rd_varint(r, &j) != 0)
+            return -1;
+        switch (j)
+        {
+        case 0:
+            f = &a->comp_mask;
+            break;
+        case 1:
+            f = &a->fd;
+            break;
+        case 2:
+            f = &a->oflags;
+            break;
+        default:
+            return -1;
+        }
+        if (f->set || rdx_rd_arg(r, f) != 0)
+            return -1;
+    }
+    return 0;
+}
+
+static int rdx_decode_IbvXrcInfo(RdxReader *r, void *args)
+{
+    uint64_t n;
+    (void)args;
+    return (rdx_rd_varint(r, &n) != 0 || n != 0) ? -1 : 0;
+}
+
+/* ---------- program JSON -> RdxArgs（没有手写 handler 的 verb） ---------- */
+
+static int rdx_json_AbortWR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AbortWR *a = args;
+    if (rdx_json_field(ar, obj, "qp_ex", &a->qp_ex) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AckCQEvents(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AckCQEvents *a = args;
+    if (rdx_json_field(ar, obj, "cq", &a->cq) != 0 ||
+        rdx_json_field(ar, obj, "nevents", &a->nevents) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AdviseMR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AdviseMR *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "advice", &a->advice) != 0 ||
+        rdx_json_field(ar, obj, "flags", &a->flags) != 0 ||
+        rdx_json_field(ar, obj, "sg_list", &a->sg_list) != 0 ||
+        rdx_json_field(ar, obj, "num_sge", &a->num_sge) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AllocDM(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AllocDM *a = args;
+    if (rdx_json_field(ar, obj, "dm", &a->dm) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AllocMW(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AllocMW *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "mw", &a->mw) != 0 ||
+        rdx_json_field(ar, obj, "mw_type", &a->mw_type) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AllocNullMR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AllocNullMR *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "mr", &a->mr) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AllocPD(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AllocPD *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AllocParentDomain(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AllocParentDomain *a = args;
+    if (rdx_json_field(ar, obj, "context", &a->context) != 0 ||
+        rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "parent_pd", &a->parent_pd) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AllocTD(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AllocTD *a = args;
+    if (rdx_json_field(ar, obj, "td", &a->td) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_AttachMcast(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_AttachMcast *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "gid", &a->gid) != 0 ||
+        rdx_json_field(ar, obj, "lid", &a->lid) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_BindMW(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_BindMW *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "mw", &a->mw) != 0 ||
+        rdx_json_field(ar, obj, "mw_bind_obj", &a->mw_bind_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CloseDevice(RdxArena *ar, const cJSON *obj, void *args)
+{
+    (void)ar;
+    (void)obj;
+    (void)args;
+    return 0;
+}
+
+static int rdx_json_CloseXRCD(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CloseXRCD *a = args;
+    if (rdx_json_field(ar, obj, "xrcd", &a->xrcd) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateAH(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateAH *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "ah", &a->ah) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateAHFromWC(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateAHFromWC *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "wc", &a->wc) != 0 ||
+        rdx_json_field(ar, obj, "grh", &a->grh) != 0 ||
+        rdx_json_field(ar, obj, "port_num", &a->port_num) != 0 ||
+        rdx_json_field(ar, obj, "ah", &a->ah) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateCQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateCQ *a = args;
+    if (rdx_json_field(ar, obj, "cqe", &a->cqe) != 0 ||
+        rdx_json_field(ar, obj, "cq_context", &a->cq_context) != 0 ||
+        rdx_json_field(ar, obj, "channel", &a->channel) != 0 ||
+        rdx_json_field(ar, obj, "comp_vector", &a->comp_vector) != 0 ||
+        rdx_json_field(ar, obj, "cq", &a->cq) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateCQEx(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateCQEx *a = args;
+    if (rdx_json_field(ar, obj, "cq_ex", &a->cq_ex) != 0 ||
+        rdx_json_field(ar, obj, "cq_attr_obj", &a->cq_attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateCompChannel(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateCompChannel *a = args;
+    if (rdx_json_field(ar, obj, "channel", &a->channel) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateFlow(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateFlow *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "flow", &a->flow) != 0 ||
+        rdx_json_field(ar, obj, "flow_attr_obj", &a->flow_attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateQP(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateQP *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "init_attr_obj", &a->init_attr_obj) != 0 ||
+        rdx_json_field(ar, obj, "remote_qp", &a->remote_qp) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateQPEx(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateQPEx *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "qp_attr_obj", &a->qp_attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateSRQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateSRQ *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "srq", &a->srq) != 0 ||
+        rdx_json_field(ar, obj, "srq_init_obj", &a->srq_init_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateSRQEx(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateSRQEx *a = args;
+    if (rdx_json_field(ar, obj, "srq", &a->srq) != 0 ||
+        rdx_json_field(ar, obj, "srq_attr_obj", &a->srq_attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_CreateWQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_CreateWQ *a = args;
+    if (rdx_json_field(ar, obj, "wq", &a->wq) != 0 ||
+        rdx_json_field(ar, obj, "wq_attr_obj", &a->wq_attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DeallocMW(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DeallocMW *a = args;
+    if (rdx_json_field(ar, obj, "mw", &a->mw) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DeallocPD(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DeallocPD *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DeallocTD(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DeallocTD *a = args;
+    if (rdx_json_field(ar, obj, "td", &a->td) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DeregMR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DeregMR *a = args;
+    if (rdx_json_field(ar, obj, "mr", &a->mr) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DestroyAH(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DestroyAH *a = args;
+    if (rdx_json_field(ar, obj, "ah", &a->ah) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DestroyCQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DestroyCQ *a = args;
+    if (rdx_json_field(ar, obj, "cq", &a->cq) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DestroyCompChannel(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DestroyCompChannel *a = args;
+    if (rdx_json_field(ar, obj, "channel", &a->channel) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DestroyFlow(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DestroyFlow *a = args;
+    if (rdx_json_field(ar, obj, "flow", &a->flow) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DestroyQP(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DestroyQP *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DestroySRQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DestroySRQ *a = args;
+    if (rdx_json_field(ar, obj, "srq", &a->srq) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DestroyWQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DestroyWQ *a = args;
+    if (rdx_json_field(ar, obj, "wq", &a->wq) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_DetachMcast(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_DetachMcast *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "gid", &a->gid) != 0 ||
+        rdx_json_field(ar, obj, "lid", &a->lid) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ForkInit(RdxArena *ar, const cJSON *obj, void *args)
+{
+    (void)ar;
+    (void)obj;
+    (void)args;
+    return 0;
+}
+
+static int rdx_json_FreeDM(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_FreeDM *a = args;
+    if (rdx_json_field(ar, obj, "dm", &a->dm) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_FreeDeviceList(RdxArena *ar, const cJSON *obj, void *args)
+{
+    (void)ar;
+    (void)obj;
+    (void)args;
+    return 0;
+}
+
+static int rdx_json_GetDeviceGUID(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_GetDeviceGUID *a = args;
+    if (rdx_json_field(ar, obj, "device", &a->device) != 0 ||
+        rdx_json_field(ar, obj, "output", &a->output) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_GetDeviceIndex(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_GetDeviceIndex *a = args;
+    if (rdx_json_field(ar, obj, "device_name", &a->device_name) != 0 ||
+        rdx_json_field(ar, obj, "output", &a->output) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_GetDeviceList(RdxArena *ar, const cJSON *obj, void *args)
+{
+    (void)ar;
+    (void)obj;
+    (void)args;
+    return 0;
+}
+
+static int rdx_json_GetDeviceName(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_GetDeviceName *a = args;
+    if (rdx_json_field(ar, obj, "device", &a->device) != 0 ||
+        rdx_json_field(ar, obj, "output", &a->output) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_GetPKeyIndex(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_GetPKeyIndex *a = args;
+    if (rdx_json_field(ar, obj, "port_num", &a->port_num) != 0 ||
+        rdx_json_field(ar, obj, "pkey", &a->pkey) != 0 ||
+        rdx_json_field(ar, obj, "output", &a->output) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_GetSRQNum(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_GetSRQNum *a = args;
+    if (rdx_json_field(ar, obj, "srq", &a->srq) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ImportDM(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ImportDM *a = args;
+    if (rdx_json_field(ar, obj, "dm_handle", &a->dm_handle) != 0 ||
+        rdx_json_field(ar, obj, "dm", &a->dm) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ImportMR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ImportMR *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "mr_handle", &a->mr_handle) != 0 ||
+        rdx_json_field(ar, obj, "mr", &a->mr) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ImportPD(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ImportPD *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "pd_handle", &a->pd_handle) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_MemcpyFromDM(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_MemcpyFromDM *a = args;
+    if (rdx_json_field(ar, obj, "host", &a->host) != 0 ||
+        rdx_json_field(ar, obj, "dm", &a->dm) != 0 ||
+        rdx_json_field(ar, obj, "dm_offset", &a->dm_offset) != 0 ||
+        rdx_json_field(ar, obj, "length", &a->length) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_MemcpyToDM(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_MemcpyToDM *a = args;
+    if (rdx_json_field(ar, obj, "dm", &a->dm) != 0 ||
+        rdx_json_field(ar, obj, "dm_offset", &a->dm_offset) != 0 ||
+        rdx_json_field(ar, obj, "host", &a->host) != 0 ||
+        rdx_json_field(ar, obj, "length", &a->length) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ModifyCQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ModifyCQ *a = args;
+    if (rdx_json_field(ar, obj, "cq", &a->cq) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ModifyQP(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ModifyQP *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0 ||
+        rdx_json_field(ar, obj, "attr_mask", &a->attr_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ModifyQPRateLimit(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ModifyQPRateLimit *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ModifySRQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ModifySRQ *a = args;
+    if (rdx_json_field(ar, obj, "srq", &a->srq) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0 ||
+        rdx_json_field(ar, obj, "attr_mask", &a->attr_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ModifyWQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ModifyWQ *a = args;
+    if (rdx_json_field(ar, obj, "wq", &a->wq) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_OpenDevice(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_OpenDevice *a = args;
+    if (rdx_json_field(ar, obj, "device", &a->device) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_OpenQP(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_OpenQP *a = args;
+    if (rdx_json_field(ar, obj, "ctx_var", &a->ctx_var) != 0 ||
+        rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "attr_var", &a->attr_var) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_OpenXRCD(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_OpenXRCD *a = args;
+    if (rdx_json_field(ar, obj, "ctx_var", &a->ctx_var) != 0 ||
+        rdx_json_field(ar, obj, "xrcd", &a->xrcd) != 0 ||
+        rdx_json_field(ar, obj, "attr_var", &a->attr_var) != 0 ||
+        rdx_json_field(ar, obj, "attr_obj", &a->attr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_PollCQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_PollCQ *a = args;
+    if (rdx_json_field(ar, obj, "cq", &a->cq) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_PostRecv(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_PostRecv *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "wr_obj", &a->wr_obj) != 0 ||
+        rdx_json_field(ar, obj, "wr_var", &a->wr_var) != 0 ||
+        rdx_json_field(ar, obj, "bad_wr_var", &a->bad_wr_var) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_PostSRQRecv(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_PostSRQRecv *a = args;
+    if (rdx_json_field(ar, obj, "srq", &a->srq) != 0 ||
+        rdx_json_field(ar, obj, "wr_obj", &a->wr_obj) != 0 ||
+        rdx_json_field(ar, obj, "wr_var", &a->wr_var) != 0 ||
+        rdx_json_field(ar, obj, "bad_wr_var", &a->bad_wr_var) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_PostSend(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_PostSend *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "wr_obj", &a->wr_obj) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryDeviceAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryDeviceAttr *a = args;
+    if (rdx_json_field(ar, obj, "output", &a->output) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryDeviceEx(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryDeviceEx *a = args;
+    if (rdx_json_field(ar, obj, "ctx_var", &a->ctx_var) != 0 ||
+        rdx_json_field(ar, obj, "attr_var", &a->attr_var) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "input_var", &a->input_var) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryECE(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryECE *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "output", &a->output) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryGID(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryGID *a = args;
+    if (rdx_json_field(ar, obj, "port_num", &a->port_num) != 0 ||
+        rdx_json_field(ar, obj, "index", &a->index) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryGIDEx(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryGIDEx *a = args;
+    if (rdx_json_field(ar, obj, "port_num", &a->port_num) != 0 ||
+        rdx_json_field(ar, obj, "gid_index", &a->gid_index) != 0 ||
+        rdx_json_field(ar, obj, "flags", &a->flags) != 0 ||
+        rdx_json_field(ar, obj, "output", &a->output) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryGIDTable(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryGIDTable *a = args;
+    if (rdx_json_field(ar, obj, "max_entries", &a->max_entries) != 0 ||
+        rdx_json_field(ar, obj, "output", &a->output) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryPKey(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryPKey *a = args;
+    if (rdx_json_field(ar, obj, "port_num", &a->port_num) != 0 ||
+        rdx_json_field(ar, obj, "index", &a->index) != 0 ||
+        rdx_json_field(ar, obj, "pkey", &a->pkey) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryPortAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryPortAttr *a = args;
+    if (rdx_json_field(ar, obj, "port_num", &a->port_num) != 0 ||
+        rdx_json_field(ar, obj, "port_attr", &a->port_attr) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QueryQP(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QueryQP *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "attr_mask", &a->attr_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_QuerySRQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_QuerySRQ *a = args;
+    if (rdx_json_field(ar, obj, "srq", &a->srq) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ReRegMR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ReRegMR *a = args;
+    if (rdx_json_field(ar, obj, "mr", &a->mr) != 0 ||
+        rdx_json_field(ar, obj, "flags", &a->flags) != 0 ||
+        rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "addr", &a->addr) != 0 ||
+        rdx_json_field(ar, obj, "length", &a->length) != 0 ||
+        rdx_json_field(ar, obj, "access", &a->access) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_RegDmaBufMR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_RegDmaBufMR *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "mr", &a->mr) != 0 ||
+        rdx_json_field(ar, obj, "offset", &a->offset) != 0 ||
+        rdx_json_field(ar, obj, "length", &a->length) != 0 ||
+        rdx_json_field(ar, obj, "iova", &a->iova) != 0 ||
+        rdx_json_field(ar, obj, "fd", &a->fd) != 0 ||
+        rdx_json_field(ar, obj, "access", &a->access) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_RegMR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_RegMR *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "mr", &a->mr) != 0 ||
+        rdx_json_field(ar, obj, "addr", &a->addr) != 0 ||
+        rdx_json_field(ar, obj, "length", &a->length) != 0 ||
+        rdx_json_field(ar, obj, "access", &a->access) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_RegMRIova(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_RegMRIova *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "mr", &a->mr) != 0 ||
+        rdx_json_field(ar, obj, "buf", &a->buf) != 0 ||
+        rdx_json_field(ar, obj, "length", &a->length) != 0 ||
+        rdx_json_field(ar, obj, "iova", &a->iova) != 0 ||
+        rdx_json_field(ar, obj, "access", &a->access) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ReqNotifyCQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ReqNotifyCQ *a = args;
+    if (rdx_json_field(ar, obj, "cq", &a->cq) != 0 ||
+        rdx_json_field(ar, obj, "solicited_only", &a->solicited_only) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_ResizeCQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_ResizeCQ *a = args;
+    if (rdx_json_field(ar, obj, "cq", &a->cq) != 0 ||
+        rdx_json_field(ar, obj, "cqe", &a->cqe) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_SetECE(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_SetECE *a = args;
+    if (rdx_json_field(ar, obj, "qp", &a->qp) != 0 ||
+        rdx_json_field(ar, obj, "ece_obj", &a->ece_obj) != 0 ||
+        rdx_json_field(ar, obj, "ece_var", &a->ece_var) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_WRComplete(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_WRComplete *a = args;
+    if (rdx_json_field(ar, obj, "qp_ex", &a->qp_ex) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_WrStart(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_WrStart *a = args;
+    if (rdx_json_field(ar, obj, "qp_ex", &a->qp_ex) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvAHAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvAHAttr *a = args;
+    if (rdx_json_field(ar, obj, "grh", &a->grh) != 0 ||
+        rdx_json_field(ar, obj, "dlid", &a->dlid) != 0 ||
+        rdx_json_field(ar, obj, "sl", &a->sl) != 0 ||
+        rdx_json_field(ar, obj, "src_path_bits", &a->src_path_bits) != 0 ||
+        rdx_json_field(ar, obj, "static_rate", &a->static_rate) != 0 ||
+        rdx_json_field(ar, obj, "is_global", &a->is_global) != 0 ||
+        rdx_json_field(ar, obj, "port_num", &a->port_num) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvAllocDmAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvAllocDmAttr *a = args;
+    if (rdx_json_field(ar, obj, "length", &a->length) != 0 ||
+        rdx_json_field(ar, obj, "log_align_req", &a->log_align_req) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvAtomicInfo(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvAtomicInfo *a = args;
+    if (rdx_json_field(ar, obj, "remote_addr", &a->remote_addr) != 0 ||
+        rdx_json_field(ar, obj, "compare_add", &a->compare_add) != 0 ||
+        rdx_json_field(ar, obj, "swap", &a->swap) != 0 ||
+        rdx_json_field(ar, obj, "rkey", &a->rkey) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvBindMwInfo(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvBindMwInfo *a = args;
+    if (rdx_json_field(ar, obj, "mw", &a->mw) != 0 ||
+        rdx_json_field(ar, obj, "rkey", &a->rkey) != 0 ||
+        rdx_json_field(ar, obj, "bind_info", &a->bind_info) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvCQInitAttrEx(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvCQInitAttrEx *a = args;
+    if (rdx_json_field(ar, obj, "cqe", &a->cqe) != 0 ||
+        rdx_json_field(ar, obj, "cq_context", &a->cq_context) != 0 ||
+        rdx_json_field(ar, obj, "channel", &a->channel) != 0 ||
+        rdx_json_field(ar, obj, "comp_vector", &a->comp_vector) != 0 ||
+        rdx_json_field(ar, obj, "wc_flags", &a->wc_flags) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "flags", &a->flags) != 0 ||
+        rdx_json_field(ar, obj, "parent_domain", &a->parent_domain) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvECE(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvECE *a = args;
+    if (rdx_json_field(ar, obj, "vendor_id", &a->vendor_id) != 0 ||
+        rdx_json_field(ar, obj, "options", &a->options) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvFlowAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvFlowAttr *a = args;
+    if (rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "type", &a->type) != 0 ||
+        rdx_json_field(ar, obj, "size", &a->size) != 0 ||
+        rdx_json_field(ar, obj, "priority", &a->priority) != 0 ||
+        rdx_json_field(ar, obj, "num_of_specs", &a->num_of_specs) != 0 ||
+        rdx_json_field(ar, obj, "port", &a->port) != 0 ||
+        rdx_json_field(ar, obj, "flags", &a->flags) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvGID(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvGID *a = args;
+    if (rdx_json_field(ar, obj, "raw", &a->raw) != 0 ||
+        rdx_json_field(ar, obj, "src_var", &a->src_var) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvGlobalRoute(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvGlobalRoute *a = args;
+    if (rdx_json_field(ar, obj, "dgid", &a->dgid) != 0 ||
+        rdx_json_field(ar, obj, "flow_label", &a->flow_label) != 0 ||
+        rdx_json_field(ar, obj, "sgid_index", &a->sgid_index) != 0 ||
+        rdx_json_field(ar, obj, "hop_limit", &a->hop_limit) != 0 ||
+        rdx_json_field(ar, obj, "traffic_class", &a->traffic_class) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvModerateCQ(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvModerateCQ *a = args;
+    if (rdx_json_field(ar, obj, "cq_count", &a->cq_count) != 0 ||
+        rdx_json_field(ar, obj, "cq_period", &a->cq_period) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvModifyCQAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvModifyCQAttr *a = args;
+    if (rdx_json_field(ar, obj, "attr_mask", &a->attr_mask) != 0 ||
+        rdx_json_field(ar, obj, "moderate", &a->moderate) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvMwBind(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvMwBind *a = args;
+    if (rdx_json_field(ar, obj, "wr_id", &a->wr_id) != 0 ||
+        rdx_json_field(ar, obj, "send_flags", &a->send_flags) != 0 ||
+        rdx_json_field(ar, obj, "bind_info", &a->bind_info) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvMwBindInfo(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvMwBindInfo *a = args;
+    if (rdx_json_field(ar, obj, "mr", &a->mr) != 0 ||
+        rdx_json_field(ar, obj, "addr", &a->addr) != 0 ||
+        rdx_json_field(ar, obj, "length", &a->length) != 0 ||
+        rdx_json_field(ar, obj, "mw_access_flags", &a->mw_access_flags) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvParentDomainInitAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvParentDomainInitAttr *a = args;
+    if (rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "td", &a->td) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "alloc", &a->alloc) != 0 ||
+        rdx_json_field(ar, obj, "free", &a->free) != 0 ||
+        rdx_json_field(ar, obj, "pd_context", &a->pd_context) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvQPAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvQPAttr *a = args;
+    if (rdx_json_field(ar, obj, "qp_state", &a->qp_state) != 0 ||
+        rdx_json_field(ar, obj, "cur_qp_state", &a->cur_qp_state) != 0 ||
+        rdx_json_field(ar, obj, "path_mtu", &a->path_mtu) != 0 ||
+        rdx_json_field(ar, obj, "path_mig_state", &a->path_mig_state) != 0 ||
+        rdx_json_field(ar, obj, "qkey", &a->qkey) != 0 ||
+        rdx_json_field(ar, obj, "rq_psn", &a->rq_psn) != 0 ||
+        rdx_json_field(ar, obj, "sq_psn", &a->sq_psn) != 0 ||
+        rdx_json_field(ar, obj, "dest_qp_num", &a->dest_qp_num) != 0 ||
+        rdx_json_field(ar, obj, "qp_access_flags", &a->qp_access_flags) != 0 ||
+        rdx_json_field(ar, obj, "cap", &a->cap) != 0 ||
+        rdx_json_field(ar, obj, "ah_attr", &a->ah_attr) != 0 ||
+        rdx_json_field(ar, obj, "alt_ah_attr", &a->alt_ah_attr) != 0 ||
+        rdx_json_field(ar, obj, "pkey_index", &a->pkey_index) != 0 ||
+        rdx_json_field(ar, obj, "alt_pkey_index", &a->alt_pkey_index) != 0 ||
+        rdx_json_field(ar, obj, "en_sqd_async_notify", &a->en_sqd_async_notify) != 0 ||
+        rdx_json_field(ar, obj, "sq_draining", &a->sq_draining) != 0 ||
+        rdx_json_field(ar, obj, "max_rd_atomic", &a->max_rd_atomic) != 0 ||
+        rdx_json_field(ar, obj, "max_dest_rd_atomic", &a->max_dest_rd_atomic) != 0 ||
+        rdx_json_field(ar, obj, "min_rnr_timer", &a->min_rnr_timer) != 0 ||
+        rdx_json_field(ar, obj, "port_num", &a->port_num) != 0 ||
+        rdx_json_field(ar, obj, "timeout", &a->timeout) != 0 ||
+        rdx_json_field(ar, obj, "retry_cnt", &a->retry_cnt) != 0 ||
+        rdx_json_field(ar, obj, "rnr_retry", &a->rnr_retry) != 0 ||
+        rdx_json_field(ar, obj, "alt_port_num", &a->alt_port_num) != 0 ||
+        rdx_json_field(ar, obj, "alt_timeout", &a->alt_timeout) != 0 ||
+        rdx_json_field(ar, obj, "rate_limit", &a->rate_limit) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvQPCap(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvQPCap *a = args;
+    if (rdx_json_field(ar, obj, "max_send_wr", &a->max_send_wr) != 0 ||
+        rdx_json_field(ar, obj, "max_recv_wr", &a->max_recv_wr) != 0 ||
+        rdx_json_field(ar, obj, "max_send_sge", &a->max_send_sge) != 0 ||
+        rdx_json_field(ar, obj, "max_recv_sge", &a->max_recv_sge) != 0 ||
+        rdx_json_field(ar, obj, "max_inline_data", &a->max_inline_data) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvQPInitAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvQPInitAttr *a = args;
+    if (rdx_json_field(ar, obj, "qp_context", &a->qp_context) != 0 ||
+        rdx_json_field(ar, obj, "send_cq", &a->send_cq) != 0 ||
+        rdx_json_field(ar, obj, "recv_cq", &a->recv_cq) != 0 ||
+        rdx_json_field(ar, obj, "srq", &a->srq) != 0 ||
+        rdx_json_field(ar, obj, "cap", &a->cap) != 0 ||
+        rdx_json_field(ar, obj, "qp_type", &a->qp_type) != 0 ||
+        rdx_json_field(ar, obj, "sq_sig_all", &a->sq_sig_all) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvQPInitAttrEx(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvQPInitAttrEx *a = args;
+    if (rdx_json_field(ar, obj, "qp_context", &a->qp_context) != 0 ||
+        rdx_json_field(ar, obj, "send_cq", &a->send_cq) != 0 ||
+        rdx_json_field(ar, obj, "recv_cq", &a->recv_cq) != 0 ||
+        rdx_json_field(ar, obj, "srq", &a->srq) != 0 ||
+        rdx_json_field(ar, obj, "cap", &a->cap) != 0 ||
+        rdx_json_field(ar, obj, "qp_type", &a->qp_type) != 0 ||
+        rdx_json_field(ar, obj, "sq_sig_all", &a->sq_sig_all) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "xrcd", &a->xrcd) != 0 ||
+        rdx_json_field(ar, obj, "create_flags", &a->create_flags) != 0 ||
+        rdx_json_field(ar, obj, "max_tso_header", &a->max_tso_header) != 0 ||
+        rdx_json_field(ar, obj, "rwq_ind_tbl", &a->rwq_ind_tbl) != 0 ||
+        rdx_json_field(ar, obj, "rx_hash_conf", &a->rx_hash_conf) != 0 ||
+        rdx_json_field(ar, obj, "source_qpn", &a->source_qpn) != 0 ||
+        rdx_json_field(ar, obj, "send_ops_flags", &a->send_ops_flags) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvQPOpenAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvQPOpenAttr *a = args;
+    if (rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "qp_num", &a->qp_num) != 0 ||
+        rdx_json_field(ar, obj, "xrcd", &a->xrcd) != 0 ||
+        rdx_json_field(ar, obj, "qp_context", &a->qp_context) != 0 ||
+        rdx_json_field(ar, obj, "qp_type", &a->qp_type) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvQPRateLimitAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvQPRateLimitAttr *a = args;
+    if (rdx_json_field(ar, obj, "rate_limit", &a->rate_limit) != 0 ||
+        rdx_json_field(ar, obj, "max_burst_sz", &a->max_burst_sz) != 0 ||
+        rdx_json_field(ar, obj, "typical_pkt_sz", &a->typical_pkt_sz) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvRdmaInfo(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvRdmaInfo *a = args;
+    if (rdx_json_field(ar, obj, "remote_addr", &a->remote_addr) != 0 ||
+        rdx_json_field(ar, obj, "rkey", &a->rkey) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvRecvWR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvRecvWR *a = args;
+    if (rdx_json_field(ar, obj, "wr_id", &a->wr_id) != 0 ||
+        rdx_json_field(ar, obj, "next", &a->next) != 0 ||
+        rdx_json_field(ar, obj, "sg_list", &a->sg_list) != 0 ||
+        rdx_json_field(ar, obj, "num_sge", &a->num_sge) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvRxHashConf(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvRxHashConf *a = args;
+    if (rdx_json_field(ar, obj, "rx_hash_function", &a->rx_hash_function) != 0 ||
+        rdx_json_field(ar, obj, "rx_hash_key_len", &a->rx_hash_key_len) != 0 ||
+        rdx_json_field(ar, obj, "rx_hash_key", &a->rx_hash_key) != 0 ||
+        rdx_json_field(ar, obj, "rx_hash_fields_mask", &a->rx_hash_fields_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvSendWR(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvSendWR *a = args;
+    if (rdx_json_field(ar, obj, "wr_id", &a->wr_id) != 0 ||
+        rdx_json_field(ar, obj, "next", &a->next) != 0 ||
+        rdx_json_field(ar, obj, "sg_list", &a->sg_list) != 0 ||
+        rdx_json_field(ar, obj, "num_sge", &a->num_sge) != 0 ||
+        rdx_json_field(ar, obj, "opcode", &a->opcode) != 0 ||
+        rdx_json_field(ar, obj, "send_flags", &a->send_flags) != 0 ||
+        rdx_json_field(ar, obj, "imm_data", &a->imm_data) != 0 ||
+        rdx_json_field(ar, obj, "invalidate_rkey", &a->invalidate_rkey) != 0 ||
+        rdx_json_field(ar, obj, "rdma", &a->rdma) != 0 ||
+        rdx_json_field(ar, obj, "atomic", &a->atomic) != 0 ||
+        rdx_json_field(ar, obj, "ud", &a->ud) != 0 ||
+        rdx_json_field(ar, obj, "xrc", &a->xrc) != 0 ||
+        rdx_json_field(ar, obj, "bind_mw", &a->bind_mw) != 0 ||
+        rdx_json_field(ar, obj, "tso", &a->tso) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvSge(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvSge *a = args;
+    if (rdx_json_field(ar, obj, "addr", &a->addr) != 0 ||
+        rdx_json_field(ar, obj, "length", &a->length) != 0 ||
+        rdx_json_field(ar, obj, "lkey", &a->lkey) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvSrqAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvSrqAttr *a = args;
+    if (rdx_json_field(ar, obj, "max_wr", &a->max_wr) != 0 ||
+        rdx_json_field(ar, obj, "max_sge", &a->max_sge) != 0 ||
+        rdx_json_field(ar, obj, "srq_limit", &a->srq_limit) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvSrqInitAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvSrqInitAttr *a = args;
+    if (rdx_json_field(ar, obj, "srq_context", &a->srq_context) != 0 ||
+        rdx_json_field(ar, obj, "attr", &a->attr) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvSrqInitAttrEx(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvSrqInitAttrEx *a = args;
+    if (rdx_json_field(ar, obj, "srq_context", &a->srq_context) != 0 ||
+        rdx_json_field(ar, obj, "attr", &a->attr) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "srq_type", &a->srq_type) != 0 ||
+        rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "xrcd", &a->xrcd) != 0 ||
+        rdx_json_field(ar, obj, "cq", &a->cq) != 0 ||
+        rdx_json_field(ar, obj, "tm_cap", &a->tm_cap) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvTMCap(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvTMCap *a = args;
+    if (rdx_json_field(ar, obj, "max_num_tags", &a->max_num_tags) != 0 ||
+        rdx_json_field(ar, obj, "max_ops", &a->max_ops) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvTdInitAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvTdInitAttr *a = args;
+    if (rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvTsoInfo(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvTsoInfo *a = args;
+    if (rdx_json_field(ar, obj, "hdr", &a->hdr) != 0 ||
+        rdx_json_field(ar, obj, "hdr_sz", &a->hdr_sz) != 0 ||
+        rdx_json_field(ar, obj, "mss", &a->mss) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvUdInfo(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvUdInfo *a = args;
+    if (rdx_json_field(ar, obj, "ah", &a->ah) != 0 ||
+        rdx_json_field(ar, obj, "remote_qpn", &a->remote_qpn) != 0 ||
+        rdx_json_field(ar, obj, "remote_qkey", &a->remote_qkey) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvWQAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvWQAttr *a = args;
+    if (rdx_json_field(ar, obj, "attr_mask", &a->attr_mask) != 0 ||
+        rdx_json_field(ar, obj, "wq_state", &a->wq_state) != 0 ||
+        rdx_json_field(ar, obj, "curr_wq_state", &a->curr_wq_state) != 0 ||
+        rdx_json_field(ar, obj, "flags", &a->flags) != 0 ||
+        rdx_json_field(ar, obj, "flags_mask", &a->flags_mask) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvWQInitAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvWQInitAttr *a = args;
+    if (rdx_json_field(ar, obj, "wq_context", &a->wq_context) != 0 ||
+        rdx_json_field(ar, obj, "wq_type", &a->wq_type) != 0 ||
+        rdx_json_field(ar, obj, "max_wr", &a->max_wr) != 0 ||
+        rdx_json_field(ar, obj, "max_sge", &a->max_sge) != 0 ||
+        rdx_json_field(ar, obj, "pd", &a->pd) != 0 ||
+        rdx_json_field(ar, obj, "cq", &a->cq) != 0 ||
+        rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "create_flags", &a->create_flags) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvXRCDInitAttr(RdxArena *ar, const cJSON *obj, void *args)
+{
+    RdxArgs_IbvXRCDInitAttr *a = args;
+    if (rdx_json_field(ar, obj, "comp_mask", &a->comp_mask) != 0 ||
+        rdx_json_field(ar, obj, "fd", &a->fd) != 0 ||
+        rdx_json_field(ar, obj, "oflags", &a->oflags) != 0)
+        return -1;
+    return 0;
+}
+
+static int rdx_json_IbvXrcInfo(RdxArena *ar, const cJSON *obj, void *args)
+{
+    (void)ar;
+    (void)obj;
+    (void)args;
+    return 0;
+}
+
+const RdxClassSchema g_rdx_classes[RDX_CLASS_COUNT] = {
+    {"AbortWR", 1, k_fields_0, sizeof(RdxArgs_AbortWR), rdx_decode_AbortWR, rdx_json_AbortWR},
+    {"AckCQEvents", 2, k_fields_1, sizeof(RdxArgs_AckCQEvents), rdx_decode_AckCQEvents, rdx_json_AckCQEvents},
+    {"AdviseMR", 5, k_fields_2, sizeof(RdxArgs_AdviseMR), rdx_decode_AdviseMR, rdx_json_AdviseMR},
+    {"AllocDM", 2, k_fields_3, sizeof(RdxArgs_AllocDM), rdx_decode_AllocDM, rdx_json_AllocDM},
+    {"AllocMW", 3, k_fields_4, sizeof(RdxArgs_AllocMW), rdx_decode_AllocMW, rdx_json_AllocMW},
+    {"AllocNullMR", 2, k_fields_5, sizeof(RdxArgs_AllocNullMR), rdx_decode_AllocNullMR, rdx_json_AllocNullMR},
+    {"AllocPD", 1, k_fields_6, sizeof(RdxArgs_AllocPD), rdx_decode_AllocPD, rdx_json_AllocPD},
+    {"AllocParentDomain", 4, k_fields_7, sizeof(RdxArgs_AllocParentDomain), rdx_decode_AllocParentDomain, rdx_json_AllocParentDomain},
+    {"AllocTD", 2, k_fields_8, sizeof(RdxArgs_AllocTD), rdx_decode_AllocTD, rdx_json_AllocTD},
+    {"AttachMcast", 3, k_fields_9, sizeof(RdxArgs_AttachMcast), rdx_decode_AttachMcast, rdx_json_AttachMcast},
+    {"BindMW", 3, k_fields_10, sizeof(RdxArgs_BindMW), rdx_decode_BindMW, rdx_json_BindMW},
+    {"CloseDevice", 0, NULL, sizeof(RdxArgs_CloseDevice), rdx_decode_CloseDevice, rdx_json_CloseDevice},
+    {"CloseXRCD", 1, k_fields_12, sizeof(RdxArgs_CloseXRCD), rdx_decode_CloseXRCD, rdx_json_CloseXRCD},
+    {"CreateAH", 3, k_fields_13, sizeof(RdxArgs_CreateAH), rdx_decode_CreateAH, rdx_json_CreateAH},
+    {"CreateAHFromWC", 5, k_fields_14, sizeof(RdxArgs_CreateAHFromWC), rdx_decode_CreateAHFromWC, rdx_json_CreateAHFromWC},
+    {"CreateCQ", 5, k_fields_15, sizeof(RdxArgs_CreateCQ), rdx_decode_CreateCQ, rdx_json_CreateCQ},
+    {"CreateCQEx", 2, k_fields_16, sizeof(RdxArgs_CreateCQEx), rdx_decode_CreateCQEx, rdx_json_CreateCQEx},
+    {"CreateCompChannel", 1, k_fields_17, sizeof(RdxArgs_CreateCompChannel), rdx_decode_CreateCompChannel, rdx_json_CreateCompChannel},
+    {"CreateFlow", 3, k_fields_18, sizeof(RdxArgs_CreateFlow), rdx_decode_CreateFlow, rdx_json_CreateFlow},
+    {"CreateQP", 4, k_fields_19, sizeof(RdxArgs_CreateQP), rdx_decode_CreateQP, rdx_json_CreateQP},
+    {"CreateQPEx", 2, k_fields_20, sizeof(RdxArgs_CreateQPEx), rdx_decode_CreateQPEx, rdx_json_CreateQPEx},
+    {"CreateSRQ", 3, k_fields_21, sizeof(RdxArgs_CreateSRQ), rdx_decode_CreateSRQ, rdx_json_CreateSRQ},
+    {"CreateSRQEx", 2, k_fields_22, sizeof(RdxArgs_CreateSRQEx), rdx_decode_CreateSRQEx, rdx_json_CreateSRQEx},
+    {"CreateWQ", 2, k_fields_23, sizeof(RdxArgs_CreateWQ), rdx_decode_CreateWQ, rdx_json_CreateWQ},
+    {"DeallocMW", 1, k_fields_24, sizeof(RdxArgs_DeallocMW), rdx_decode_DeallocMW, rdx_json_DeallocMW},
+    {"DeallocPD", 1, k_fields_25, sizeof(RdxArgs_DeallocPD), rdx_decode_DeallocPD, rdx_json_DeallocPD},
+    {"DeallocTD", 1, k_fields_26, sizeof(RdxArgs_DeallocTD), rdx_decode_DeallocTD, rdx_json_DeallocTD},
+    {"DeregMR", 1, k_fields_27, sizeof(RdxArgs_DeregMR), rdx_decode_DeregMR, rdx_json_DeregMR},
+    {"DestroyAH", 1, k_fields_28, sizeof(RdxArgs_DestroyAH), rdx_decode_DestroyAH, rdx_json_DestroyAH},
+    {"DestroyCQ", 1, k_fields_29, sizeof(RdxArgs_DestroyCQ), rdx_decode_DestroyCQ, rdx_json_DestroyCQ},
+    {"DestroyCompChannel", 1, k_fields_30, sizeof(RdxArgs_DestroyCompChannel), rdx_decode_DestroyCompChannel, rdx_json_DestroyCompChannel},
+    {"DestroyFlow", 1, k_fields_31, sizeof(RdxArgs_DestroyFlow), rdx_decode_DestroyFlow, rdx_json_DestroyFlow},
+    {"DestroyQP", 1, k_fields_32, sizeof(RdxArgs_DestroyQP), rdx_decode_DestroyQP, rdx_json_DestroyQP},
+    {"DestroySRQ", 1, k_fields_33, sizeof(RdxArgs_DestroySRQ), rdx_decode_DestroySRQ, rdx_json_DestroySRQ},
+    {"DestroyWQ", 1, k_fields_34, sizeof(RdxArgs_DestroyWQ), rdx_decode_DestroyWQ, rdx_json_DestroyWQ},
+    {"DetachMcast", 3, k_fields_35, sizeof(RdxArgs_DetachMcast), rdx_decode_DetachMcast, rdx_json_DetachMcast},
+    {"ForkInit", 0, NULL, sizeof(RdxArgs_ForkInit), rdx_decode_ForkInit, rdx_json_ForkInit},
+    {"FreeDM", 1, k_fields_37, sizeof(RdxArgs_FreeDM), rdx_decode_FreeDM, rdx_json_FreeDM},
+    {"FreeDeviceList", 0, NULL, sizeof(RdxArgs_FreeDeviceList), rdx_decode_FreeDeviceList, rdx_json_FreeDeviceList},
+    {"GetDeviceGUID", 2, k_fields_39, sizeof(RdxArgs_GetDeviceGUID), rdx_decode_GetDeviceGUID, rdx_json_GetDeviceGUID},
+    {"GetDeviceIndex", 2, k_fields_40, sizeof(RdxArgs_GetDeviceIndex), rdx_decode_GetDeviceIndex, rdx_json_GetDeviceIndex},
+    {"GetDeviceList", 0, NULL, sizeof(RdxArgs_GetDeviceList), rdx_decode_GetDeviceList, rdx_json_GetDeviceList},
+    {"GetDeviceName", 2, k_fields_42, sizeof(RdxArgs_GetDeviceName), rdx_decode_GetDeviceName, rdx_json_GetDeviceName},
+    {"GetPKeyIndex", 3, k_fields_43, sizeof(RdxArgs_GetPKeyIndex), rdx_decode_GetPKeyIndex, rdx_json_GetPKeyIndex},
+    {"GetSRQNum", 1, k_fields_44, sizeof(RdxArgs_GetSRQNum), rdx_decode_GetSRQNum, rdx_json_GetSRQNum},
+    {"ImportDM", 2, k_fields_45, sizeof(RdxArgs_ImportDM), rdx_decode_ImportDM, rdx_json_ImportDM},
+    {"ImportMR", 3, k_fields_46, sizeof(RdxArgs_ImportMR), rdx_decode_ImportMR, rdx_json_ImportMR},
+    {"ImportPD", 2, k_fields_47, sizeof(RdxArgs_ImportPD), rdx_decode_ImportPD, rdx_json_ImportPD},
+    {"MemcpyFromDM", 4, k_fields_48, sizeof(RdxArgs_MemcpyFromDM), rdx_decode_MemcpyFromDM, rdx_json_MemcpyFromDM},
+    {"MemcpyToDM", 4, k_fields_49, sizeof(RdxArgs_MemcpyToDM), rdx_decode_MemcpyToDM, rdx_json_MemcpyToDM},
+    {"ModifyCQ", 2, k_fields_50, sizeof(RdxArgs_ModifyCQ), rdx_decode_ModifyCQ, rdx_json_ModifyCQ},
+    {"ModifyQP", 3, k_fields_51, sizeof(RdxArgs_ModifyQP), rdx_decode_ModifyQP, rdx_json_ModifyQP},
+    {"ModifyQPRateLimit", 2, k_fields_52, sizeof(RdxArgs_ModifyQPRateLimit), rdx_decode_ModifyQPRateLimit, rdx_json_ModifyQPRateLimit},
+    {"ModifySRQ", 3, k_fields_53, sizeof(RdxArgs_ModifySRQ), rdx_decode_ModifySRQ, rdx_json_ModifySRQ},
+    {"ModifyWQ", 2, k_fields_54, sizeof(RdxArgs_ModifyWQ), rdx_decode_ModifyWQ, rdx_json_ModifyWQ},
+    {"OpenDevice", 1, k_fields_55, sizeof(RdxArgs_OpenDevice), rdx_decode_OpenDevice, rdx_json_OpenDevice},
+    {"OpenQP", 4, k_fields_56, sizeof(RdxArgs_OpenQP), rdx_decode_OpenQP, rdx_json_OpenQP},
+    {"OpenXRCD", 4, k_fields_57, sizeof(RdxArgs_OpenXRCD), rdx_decode_OpenXRCD, rdx_json_OpenXRCD},
+    {"PollCQ", 1, k_fields_58, sizeof(RdxArgs_PollCQ), rdx_decode_PollCQ, rdx_json_PollCQ},
+    {"PostRecv", 4, k_fields_59, sizeof(RdxArgs_PostRecv), rdx_decode_PostRecv, rdx_json_PostRecv},
+    {"PostSRQRecv", 4, k_fields_60, sizeof(RdxArgs_PostSRQRecv), rdx_decode_PostSRQRecv, rdx_json_PostSRQRecv},
+    {"PostSend", 2, k_fields_61, sizeof(RdxArgs_PostSend), rdx_decode_PostSend, rdx_json_PostSend},
+    {"QueryDeviceAttr", 1, k_fields_62, sizeof(RdxArgs_QueryDeviceAttr), rdx_decode_QueryDeviceAttr, rdx_json_QueryDeviceAttr},
+    {"QueryDeviceEx", 4, k_fields_63, sizeof(RdxArgs_QueryDeviceEx), rdx_decode_QueryDeviceEx, rdx_json_QueryDeviceEx},
+    {"QueryECE", 2, k_fields_64, sizeof(RdxArgs_QueryECE), rdx_decode_QueryECE, rdx_json_QueryECE},
+    {"QueryGID", 2, k_fields_65, sizeof(RdxArgs_QueryGID), rdx_decode_QueryGID, rdx_json_QueryGID},
+    {"QueryGIDEx", 4, k_fields_66, sizeof(RdxArgs_QueryGIDEx), rdx_decode_QueryGIDEx, rdx_json_QueryGIDEx},
+    {"QueryGIDTable", 2, k_fields_67, sizeof(RdxArgs_QueryGIDTable), rdx_decode_QueryGIDTable, rdx_json_QueryGIDTable},
+    {"QueryPKey", 3, k_fields_68, sizeof(RdxArgs_QueryPKey), rdx_decode_QueryPKey, rdx_json_QueryPKey},
+    {"QueryPortAttr", 2, k_fields_69, sizeof(RdxArgs_QueryPortAttr), rdx_decode_QueryPortAttr, rdx_json_QueryPortAttr},
+    {"QueryQP", 2, k_fields_70, sizeof(RdxArgs_QueryQP), rdx_decode_QueryQP, rdx_json_QueryQP},
+    {"QuerySRQ", 1, k_fields_71, sizeof(RdxArgs_QuerySRQ), rdx_decode_QuerySRQ, rdx_json_QuerySRQ},
+    {"ReRegMR", 6, k_fields_72, sizeof(RdxArgs_ReRegMR), rdx_decode_ReRegMR, rdx_json_ReRegMR},
+    {"RegDmaBufMR", 7, k_fields_73, sizeof(RdxArgs_RegDmaBufMR), rdx_decode_RegDmaBufMR, rdx_json_RegDmaBufMR},
+    {"RegMR", 5, k_fields_74, sizeof(RdxArgs_RegMR), rdx_decode_RegMR, rdx_json_RegMR},
+    {"RegMRIova", 6, k_fields_75, sizeof(RdxArgs_RegMRIova), rdx_decode_RegMRIova, rdx_json_RegMRIova},
+    {"ReqNotifyCQ", 2, k_fields_76, sizeof(RdxArgs_ReqNotifyCQ), rdx_decode_ReqNotifyCQ, rdx_json_ReqNotifyCQ},
+    {"ResizeCQ", 2, k_fields_77, sizeof(RdxArgs_ResizeCQ), rdx_decode_ResizeCQ, rdx_json_ResizeCQ},
+    {"SetECE", 3, k_fields_78, sizeof(RdxArgs_SetECE), rdx_decode_SetECE, rdx_json_SetECE},
+    {"WRComplete", 1, k_fields_79, sizeof(RdxArgs_WRComplete), rdx_decode_WRComplete, rdx_json_WRComplete},
+    {"WrStart", 1, k_fields_80, sizeof(RdxArgs_WrStart), rdx_decode_WrStart, rdx_json_WrStart},
+    {"IbvAHAttr", 7, k_fields_81, sizeof(RdxArgs_IbvAHAttr), rdx_decode_IbvAHAttr, rdx_json_IbvAHAttr},
+    {"IbvAllocDmAttr", 3, k_fields_82, sizeof(RdxArgs_IbvAllocDmAttr), rdx_decode_IbvAllocDmAttr, rdx_json_IbvAllocDmAttr},
+    {"IbvAtomicInfo", 4, k_fields_83, sizeof(RdxArgs_IbvAtomicInfo), rdx_decode_IbvAtomicInfo, rdx_json_IbvAtomicInfo},
+    {"IbvBindMwInfo", 3, k_fields_84, sizeof(RdxArgs_IbvBindMwInfo), rdx_decode_IbvBindMwInfo, rdx_json_IbvBindMwInfo},
+    {"IbvCQInitAttrEx", 8, k_fields_85, sizeof(RdxArgs_IbvCQInitAttrEx), rdx_decode_IbvCQInitAttrEx, rdx_json_IbvCQInitAttrEx},
+    {"IbvECE", 3, k_fields_86, sizeof(RdxArgs_IbvECE), rdx_decode_IbvECE, rdx_json_IbvECE},
+    {"IbvFlowAttr", 7, k_fields_87, sizeof(RdxArgs_IbvFlowAttr), rdx_decode_IbvFlowAttr, rdx_json_IbvFlowAttr},
+    {"IbvGID", 2, k_fields_88, sizeof(RdxArgs_IbvGID), rdx_decode_IbvGID, rdx_json_IbvGID},
+    {"IbvGlobalRoute", 5, k_fields_89, sizeof(RdxArgs_IbvGlobalRoute), rdx_decode_IbvGlobalRoute, rdx_json_IbvGlobalRoute},
+    {"IbvModerateCQ", 2, k_fields_90, sizeof(RdxArgs_IbvModerateCQ), rdx_decode_IbvModerateCQ, rdx_json_IbvModerateCQ},
+    {"IbvModifyCQAttr", 2, k_fields_91, sizeof(RdxArgs_IbvModifyCQAttr), rdx_decode_IbvModifyCQAttr, rdx_json_IbvModifyCQAttr},
+    {"IbvMwBind", 3, k_fields_92, sizeof(RdxArgs_IbvMwBind), rdx_decode_IbvMwBind, rdx_json_IbvMwBind},
+    {"IbvMwBindInfo", 4, k_fields_93, sizeof(RdxArgs_IbvMwBindInfo), rdx_decode_IbvMwBindInfo, rdx_json_IbvMwBindInfo},
+    {"IbvParentDomainInitAttr", 6, k_fields_94, sizeof(RdxArgs_IbvParentDomainInitAttr), rdx_decode_IbvParentDomainInitAttr, rdx_json_IbvParentDomainInitAttr},
+    {"IbvQPAttr", 26, k_fields_95, sizeof(RdxArgs_IbvQPAttr), rdx_decode_IbvQPAttr, rdx_json_IbvQPAttr},
+    {"IbvQPCap", 5, k_fields_96, sizeof(RdxArgs_IbvQPCap), rdx_decode_IbvQPCap, rdx_json_IbvQPCap},
+    {"IbvQPInitAttr", 7, k_fields_97, sizeof(RdxArgs_IbvQPInitAttr), rdx_decode_IbvQPInitAttr, rdx_json_IbvQPInitAttr},
+    {"IbvQPInitAttrEx", 16, k_fields_98, sizeof(RdxArgs_IbvQPInitAttrEx), rdx_decode_IbvQPInitAttrEx, rdx_json_IbvQPInitAttrEx},
+    {"IbvQPOpenAttr", 5, k_fields_99, sizeof(RdxArgs_IbvQPOpenAttr), rdx_decode_IbvQPOpenAttr, rdx_json_IbvQPOpenAttr},
+    {"IbvQPRateLimitAttr", 4, k_fields_100, sizeof(RdxArgs_IbvQPRateLimitAttr), rdx_decode_IbvQPRateLimitAttr, rdx_json_IbvQPRateLimitAttr},
+    {"IbvRdmaInfo", 2, k_fields_101, sizeof(RdxArgs_IbvRdmaInfo), rdx_decode_IbvRdmaInfo, rdx_json_IbvRdmaInfo},
+    {"IbvRecvWR", 4, k_fields_102, sizeof(RdxArgs_IbvRecvWR), rdx_decode_IbvRecvWR, rdx_json_IbvRecvWR},
+    {"IbvRxHashConf", 4, k_fields_103, sizeof(RdxArgs_IbvRxHashConf), rdx_decode_IbvRxHashConf, rdx_json_IbvRxHashConf},
+    {"IbvSendWR", 14, k_fields_104, sizeof(RdxArgs_IbvSendWR), rdx_decode_IbvSendWR, rdx_json_IbvSendWR},
+    {"IbvSge", 3, k_fields_105, sizeof(RdxArgs_IbvSge), rdx_decode_IbvSge, rdx_json_IbvSge},
+    {"IbvSrqAttr", 3, k_fields_106, sizeof(RdxArgs_IbvSrqAttr), rdx_decode_IbvSrqAttr, rdx_json_IbvSrqAttr},
+    {"IbvSrqInitAttr", 2, k_fields_107, sizeof(RdxArgs_IbvSrqInitAttr), rdx_decode_IbvSrqInitAttr, rdx_json_IbvSrqInitAttr},
+    {"IbvSrqInitAttrEx", 8, k_fields_108, sizeof(RdxArgs_IbvSrqInitAttrEx), rdx_decode_IbvSrqInitAttrEx, rdx_json_IbvSrqInitAttrEx},
+    {"IbvTMCap", 2, k_fields_109, sizeof(RdxArgs_IbvTMCap), rdx_decode_IbvTMCap, rdx_json_IbvTMCap},
+    {"IbvTdInitAttr", 1, k_fields_110, sizeof(RdxArgs_IbvTdInitAttr), rdx_decode_IbvTdInitAttr, rdx_json_IbvTdInitAttr},
+    {"IbvTsoInfo", 3, k_fields_111, sizeof(RdxArgs_IbvTsoInfo), rdx_decode_IbvTsoInfo, rdx_json_IbvTsoInfo},
+    {"IbvUdInfo", 3, k_fields_112, sizeof(RdxArgs_IbvUdInfo), rdx_decode_IbvUdInfo, rdx_json_IbvUdInfo},
+    {"IbvWQAttr", 5, k_fields_113, sizeof(RdxArgs_IbvWQAttr), rdx_decode_IbvWQAttr, rdx_json_IbvWQAttr},
+    {"IbvWQInitAttr", 8, k_fields_114, sizeof(RdxArgs_IbvWQInitAttr), rdx_decode_IbvWQInitAttr, rdx_json_IbvWQInitAttr},
+    {"IbvXRCDInitAttr", 3, k_fields_115, sizeof(RdxArgs_IbvXRCDInitAttr), rdx_decode_IbvXRCDInitAttr, rdx_json_IbvXRCDInitAttr},
+    {"IbvXrcInfo", 0, NULL, sizeof(RdxArgs_IbvXrcInfo), rdx_decode_IbvXrcInfo, rdx_json_IbvXrcInfo},
+};
+
+const char *const g_rdx_value_types[RDX_VALUE_TYPE_COUNT] = {
+    "BoolValue",
+    "ConstantValue",
+    "DeferredValue",
+    "EnumValue",
+    "FlagValue",
+    "IntValue",
+    "ListValue",
+    "LocalResourceValue",
+    "None",
+    "OptionalValue",
+    "ResourceValue",
+};
+
+/* 取自 lib/value.py，按名字排序 */
+const RdxConst g_rdx_consts[RDX_CONST_COUNT] = {
+    {"IBV_ACCESS_FLUSH_GLOBAL", 256},
+    {"IBV_ACCESS_FLUSH_PERSISTENT", 512},
+    {"IBV_ACCESS_HUGETLB", 128},
+    {"IBV_ACCESS_LOCAL_WRITE", 1},
+    {"IBV_ACCESS_MW_BIND", 16},
+    {"IBV_ACCESS_ON_DEMAND", 64},
+    {"IBV_ACCESS_RELAXED_ORDERING", 1048576},
+    {"IBV_ACCESS_REMOTE_ATOMIC", 8},
+    {"IBV_ACCESS_REMOTE_READ", 4},
+    {"IBV_ACCESS_REMOTE_WRITE", 2},
+    {"IBV_ACCESS_ZERO_BASED", 32},
+    {"IBV_FLOW_ATTR_ALL_DEFAULT", 1},
+    {"IBV_FLOW_ATTR_MC_DEFAULT", 2},
+    {"IBV_FLOW_ATTR_NORMAL", 0},
+    {"IBV_FLOW_ATTR_SNIFFER", 3},
+    {"IBV_MIG_ARMED", 2},
+    {"IBV_MIG_MIGRATED", 0},
+    {"IBV_MIG_REARM", 1},
+    {"IBV_MTU_1024", 3},
+    {"IBV_MTU_2048", 4},
+    {"IBV_MTU_256", 1},
+    {"IBV_MTU_4096", 5},
+    {"IBV_MTU_512", 2},
+    {"IBV_MW_TYPE_1", 1},
+    {"IBV_MW_TYPE_2", 2},
+    {"IBV_QPS_ERR", 6},
+    {"IBV_QPS_INIT", 1},
+    {"IBV_QPS_RESET", 0},
+    {"IBV_QPS_RTR", 2},
+    {"IBV_QPS_RTS", 3},
+    {"IBV_QPS_SQD", 4},
+    {"IBV_QPS_SQE", 5},
+    {"IBV_QPS_UNKNOWN", 7},
+    {"IBV_QPT_DRIVER", 255},
+    {"IBV_QPT_RAW_PACKET", 8},
+    {"IBV_QPT_RC", 2},
+    {"IBV_QPT_UC", 3},
+    {"IBV_QPT_UD", 4},
+    {"IBV_QPT_XRC_RECV", 10},
+    {"IBV_QPT_XRC_SEND", 9},
+    {"IBV_QP_ACCESS_FLAGS", 8},
+    {"IBV_QP_ALT_PATH", 16384},
+    {"IBV_QP_AV", 128},
+    {"IBV_QP_CAP", 524288},
+    {"IBV_QP_CUR_STATE", 2},
+    {"IBV_QP_DEST_QPN", 1048576},
+    {"IBV_QP_EN_SQD_ASYNC_NOTIFY", 4},
+    {"IBV_QP_EX_WITH_ATOMIC_CMP_AND_SWP", 32},
+    {"IBV_QP_EX_WITH_ATOMIC_FETCH_AND_ADD", 64},
+    {"IBV_QP_EX_WITH_ATOMIC_WRITE", 4096},
+    {"IBV_QP_EX_WITH_BIND_MW", 256},
+    {"IBV_QP_EX_WITH_FLUSH", 2048},
+    {"IBV_QP_EX_WITH_LOCAL_INV", 128},
+    {"IBV_QP_EX_WITH_RDMA_READ", 16},
+    {"IBV_QP_EX_WITH_RDMA_WRITE", 1},
+    {"IBV_QP_EX_WITH_RDMA_WRITE_WITH_IMM", 2},
+    {"IBV_QP_EX_WITH_SEND", 4},
+    {"IBV_QP_EX_WITH_SEND_WITH_IMM", 8},
+    {"IBV_QP_EX_WITH_SEND_WITH_INV", 512},
+    {"IBV_QP_EX_WITH_TSO", 1024},
+    {"IBV_QP_MAX_DEST_RD_ATOMIC", 131072},
+    {"IBV_QP_MAX_QP_RD_ATOMIC", 8192},
+    {"IBV_QP_MIN_RNR_TIMER", 32768},
+    {"IBV_QP_PATH_MIG_STATE", 262144},
+    {"IBV_QP_PATH_MTU", 256},
+    {"IBV_QP_PKEY_INDEX", 16},
+    {"IBV_QP_PORT", 32},
+    {"IBV_QP_QKEY", 64},
+    {"IBV_QP_RATE_LIMIT", 33554432},
+    {"IBV_QP_RETRY_CNT", 1024},
+    {"IBV_QP_RNR_RETRY", 2048},
+    {"IBV_QP_RQ_PSN", 4096},
+    {"IBV_QP_SQ_PSN", 65536},
+    {"IBV_QP_STATE", 1},
+    {"IBV_QP_TIMEOUT", 512},
+    {"IBV_REREG_MR_CHANGE_ACCESS", 4},
+    {"IBV_REREG_MR_CHANGE_PD", 2},
+    {"IBV_REREG_MR_CHANGE_TRANSLATION", 1},
+    {"IBV_REREG_MR_FLAGS_SUPPORTED", 7},
+    {"IBV_SEND_FENCE", 1},
+    {"IBV_SEND_INLINE", 8},
+    {"IBV_SEND_IP_CSUM", 16},
+    {"IBV_SEND_SIGNALED", 2},
+    {"IBV_SEND_SOLICITED", 4},
+    {"IBV_SRQT_BASIC", 0},
+    {"IBV_SRQT_TM", 2},
+    {"IBV_SRQT_XRC", 1},
+    {"IBV_SRQ_LIMIT", 2},
+    {"IBV_SRQ_MAX_WR", 1},
+    {"IBV_WQS_ERR", 2},
+    {"IBV_WQS_RDY", 1},
+    {"IBV_WQS_RESET", 0},
+    {"IBV_WQS_UNKNOWN", 3},
+    {"IBV_WQT_RQ", 0},
+    {"IBV_WQT_RQ_WITH_SRQ", 1},
+    {"IBV_WQT_SRQ", 2},
+    {"IBV_WQ_ATTR_CUR_STATE", 2},
+    {"IBV_WQ_ATTR_FLAGS", 4},
+    {"IBV_WQ_ATTR_RESERVED", 8},
+    {"IBV_WQ_ATTR_STATE", 1},
+    {"IBV_WQ_FLAGS_CVLAN_STRIPPING", 1},
+    {"IBV_WQ_FLAGS_CVLAN_STRIPPING_MASK", 16},
+    {"IBV_WQ_FLAGS_DELAY_DROP", 4},
+    {"IBV_WQ_FLAGS_SCATTER_FCS", 2},
+    {"IBV_WQ_FLAGS_SCATTER_FCS_MASK", 8},
+    {"IBV_WR_ATOMIC_CMP_AND_SWP", 5},
+    {"IBV_WR_ATOMIC_FETCH_AND_ADD", 6},
+    {"IBV_WR_ATOMIC_WRITE", 15},
+    {"IBV_WR_BIND_MW", 8},
+    {"IBV_WR_DRIVER1", 11},
+    {"IBV_WR_FLUSH", 14},
+    {"IBV_WR_LOCAL_INV", 7},
+    {"IBV_WR_RDMA_READ", 4},
+    {"IBV_WR_RDMA_WRITE", 0},
+    {"IBV_WR_RDMA_WRITE_WITH_IMM", 1},
+    {"IBV_WR_SEND", 2},
+    {"IBV_WR_SEND_WITH_IMM", 3},
+    {"IBV_WR_SEND_WITH_INV", 9},
+    {"IBV_WR_TSO", 10},
+    {"IB_UVERBS_ADVISE_MR_ADVICE_PREFETCH", 0},
+    {"IB_UVERBS_ADVISE_MR_ADVICE_PREFETCH_NO_FAULT", 2},
+    {"IB_UVERBS_ADVISE_MR_ADVICE_PREFETCH_WRITE", 1},
+    {"RDMA_PS_IB", 319},
+    {"RDMA_PS_IPOIB", 2},
+    {"RDMA_PS_TCP", 262},
+    {"RDMA_PS_UDP", 273},
+};
+
+/* ---------- attr -> libibverbs 结构体 ---------- */
+
+static void rdx_fill_IbvAHAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_ah_attr *o);
+static void rdx_fill_IbvAllocDmAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_alloc_dm_attr *o);
+static void rdx_fill_IbvCQInitAttrEx(ResourceEnv *env, const RdxArg *arg, struct ibv_cq_init_attr_ex *o);
+static void rdx_fill_IbvECE(ResourceEnv *env, const RdxArg *arg, struct ibv_ece *o);
+static void rdx_fill_IbvFlowAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_flow_attr *o);
+static void rdx_fill_IbvGlobalRoute(ResourceEnv *env, const RdxArg *arg, struct ibv_global_route *o);
+static void rdx_fill_IbvModerateCQ(ResourceEnv *env, const RdxArg *arg, struct ibv_moderate_cq *o);
+static void rdx_fill_IbvModifyCQAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_modify_cq_attr *o);
+static void rdx_fill_IbvMwBind(ResourceEnv *env, const RdxArg *arg, struct ibv_mw_bind *o);
+static void rdx_fill_IbvMwBindInfo(ResourceEnv *env, const RdxArg *arg, struct ibv_mw_bind_info *o);
+static void rdx_fill_IbvParentDomainInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_parent_domain_init_attr *o);
+static void rdx_fill_IbvQPAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_attr *o);
+static void rdx_fill_IbvQPCap(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_cap *o);
+static void rdx_fill_IbvQPInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_init_attr *o);
+static void rdx_fill_IbvQPInitAttrEx(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_init_attr_ex *o);
+static void rdx_fill_IbvQPOpenAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_open_attr *o);
+static void rdx_fill_IbvQPRateLimitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_rate_limit_attr *o);
+static void rdx_fill_IbvRecvWR(ResourceEnv *env, const RdxArg *arg, struct ibv_recv_wr *o);
+static void rdx_fill_IbvRxHashConf(ResourceEnv *env, const RdxArg *arg, struct ibv_rx_hash_conf *o);
+static void rdx_fill_IbvSendWR(ResourceEnv *env, const RdxArg *arg, struct ibv_send_wr *o);
+static void rdx_fill_IbvSrqAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_srq_attr *o);
+static void rdx_fill_IbvSrqInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_srq_init_attr *o);
+static void rdx_fill_IbvSrqInitAttrEx(ResourceEnv *env, const RdxArg *arg, struct ibv_srq_init_attr_ex *o);
+static void rdx_fill_IbvTMCap(ResourceEnv *env, const RdxArg *arg, struct ibv_tm_cap *o);
+static void rdx_fill_IbvTdInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_td_init_attr *o);
+static void rdx_fill_IbvWQAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_wq_attr *o);
+static void rdx_fill_IbvWQInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_wq_init_attr *o);
+static void rdx_fill_IbvXRCDInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_xrcd_init_attr *o);
+
+static void rdx_fill_IbvAHAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_ah_attr *o)
+{
+    const RdxArgs_IbvAHAttr *a = rdx_attr(arg, RDX_ATTR_IbvAHAttr);
+    if (!a)
+        return;
+    rdx_fill_IbvGlobalRoute(env, &a->grh, &o->grh);
+    o->dlid = rdx_int(env, &a->dlid, o->dlid);
+    o->sl = rdx_int(env, &a->sl, o->sl);
+    o->src_path_bits = rdx_int(env, &a->src_path_bits, o->src_path_bits);
+    o->static_rate = rdx_int(env, &a->static_rate, o->static_rate);
+    o->is_global = rdx_int(env, &a->is_global, o->is_global);
+    o->port_num = rdx_int(env, &a->port_num, o->port_num);
+}
+
+static void rdx_fill_IbvAllocDmAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_alloc_dm_attr *o)
+{
+    const RdxArgs_IbvAllocDmAttr *a = rdx_attr(arg, RDX_ATTR_IbvAllocDmAttr);
+    if (!a)
+        return;
+    o->length = rdx_int(env, &a->length, o->length);
+    o->log_align_req = rdx_int(env, &a->log_align_req, o->log_align_req);
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+}
+
+static void rdx_fill_IbvCQInitAttrEx(ResourceEnv *env, const RdxArg *arg, struct ibv_cq_init_attr_ex *o)
+{
+    const RdxArgs_IbvCQInitAttrEx *a = rdx_attr(arg, RDX_ATTR_IbvCQInitAttrEx);
+    if (!a)
+        return;
+    o->cqe = rdx_int(env, &a->cqe, o->cqe);
+    o->channel = rdx_res(env, &a->channel, "channel");
+    o->comp_vector = rdx_int(env, &a->comp_vector, o->comp_vector);
+    o->wc_flags = rdx_int(env, &a->wc_flags, o->wc_flags);
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+    o->flags = rdx_int(env, &a->flags, o->flags);
+    o->parent_domain = rdx_res(env, &a->parent_domain, "pd");
+}
+
+static void rdx_fill_IbvECE(ResourceEnv *env, const RdxArg *arg, struct ibv_ece *o)
+{
+    const RdxArgs_IbvECE *a = rdx_attr(arg, RDX_ATTR_IbvECE);
+    if (!a)
+        return;
+    o->vendor_id = rdx_int(env, &a->vendor_id, o->vendor_id);
+    o->options = rdx_int(env, &a->options, o->options);
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+}
+
+static void rdx_fill_IbvFlowAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_flow_attr *o)
+{
+    const RdxArgs_IbvFlowAttr *a = rdx_attr(arg, RDX_ATTR_IbvFlowAttr);
+    if (!a)
+        return;
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+    o->type = rdx_int(env, &a->type, o->type);
+    o->size = rdx_int(env, &a->size, o->size);
+    o->priority = rdx_int(env, &a->priority, o->priority);
+    o->num_of_specs = rdx_int(env, &a->num_of_specs, o->num_of_specs);
+    o->port = rdx_int(env, &a->port, o->port);
+    o->flags = rdx_int(env, &a->flags, o->flags);
+}
+
+static void rdx_fill_IbvGlobalRoute(ResourceEnv *env, const RdxArg *arg, struct ibv_global_route *o)
+{
+    const RdxArgs_IbvGlobalRoute *a = rdx_attr(arg, RDX_ATTR_IbvGlobalRoute);
+    if (!a)
+        return;
+    rdx_gid(&a->dgid, &o->dgid);
+    o->flow_label = rdx_int(env, &a->flow_label, o->flow_label);
+    o->sgid_index = rdx_int(env, &a->sgid_index, o->sgid_index);
+    o->hop_limit = rdx_int(env, &a->hop_limit, o->hop_limit);
+    o->traffic_class = rdx_int(env, &a->traffic_class, o->traffic_class);
+}
+
+static void rdx_fill_IbvModerateCQ(ResourceEnv *env, const RdxArg *arg, struct ibv_moderate_cq *o)
+{
+    const RdxArgs_IbvModerateCQ *a = rdx_attr(arg, RDX_ATTR_IbvModerateCQ);
+    if (!a)
+        return;
+    o->cq_count = rdx_int(env, &a->cq_count, o->cq_count);
+    o->cq_period = rdx_int(env, &a->cq_period, o->cq_period);
+}
+
+static void rdx_fill_IbvModifyCQAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_modify_cq_attr *o)
+{
+    const RdxArgs_IbvModifyCQAttr *a = rdx_attr(arg, RDX_ATTR_IbvModifyCQAttr);
+    if (!a)
+        return;
+    o->attr_mask = rdx_int(env, &a->attr_mask, o->attr_mask);
+    rdx_fill_IbvModerateCQ(env, &a->moderate, &o->moderate);
+}
+
+static void rdx_fill_IbvMwBind(ResourceEnv *env, const RdxArg *arg, struct ibv_mw_bind *o)
+{
+    const RdxArgs_IbvMwBind *a = rdx_attr(arg, RDX_ATTR_IbvMwBind);
+    if (!a)
+        return;
+    o->wr_id = rdx_int(env, &a->wr_id, o->wr_id);
+    o->send_flags = rdx_int(env, &a->send_flags, o->send_flags);
+    rdx_fill_IbvMwBindInfo(env, &a->bind_info, &o->bind_info);
+}
+
+static void rdx_fill_IbvMwBindInfo(ResourceEnv *env, const RdxArg *arg, struct ibv_mw_bind_info *o)
+{
+    const RdxArgs_IbvMwBindInfo *a = rdx_attr(arg, RDX_ATTR_IbvMwBindInfo);
+    if (!a)
+        return;
+    o->mr = rdx_res(env, &a->mr, "mr");
+    o->addr = rdx_int(env, &a->addr, o->addr);
+    o->length = rdx_int(env, &a->length, o->length);
+    o->mw_access_flags = rdx_int(env, &a->mw_access_flags, o->mw_access_flags);
+}
+
+static void rdx_fill_IbvParentDomainInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_parent_domain_init_attr *o)
+{
+    const RdxArgs_IbvParentDomainInitAttr *a = rdx_attr(arg, RDX_ATTR_IbvParentDomainInitAttr);
+    if (!a)
+        return;
+    o->pd = rdx_res(env, &a->pd, "pd");
+    o->td = rdx_res(env, &a->td, "td");
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+}
+
+static void rdx_fill_IbvQPAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_attr *o)
+{
+    const RdxArgs_IbvQPAttr *a = rdx_attr(arg, RDX_ATTR_IbvQPAttr);
+    if (!a)
+        return;
+    o->qp_state = rdx_int(env, &a->qp_state, o->qp_state);
+    o->cur_qp_state = rdx_int(env, &a->cur_qp_state, o->cur_qp_state);
+    o->path_mtu = rdx_int(env, &a->path_mtu, o->path_mtu);
+    o->path_mig_state = rdx_int(env, &a->path_mig_state, o->path_mig_state);
+    o->qkey = rdx_int(env, &a->qkey, o->qkey);
+    o->rq_psn = rdx_int(env, &a->rq_psn, o->rq_psn);
+    o->sq_psn = rdx_int(env, &a->sq_psn, o->sq_psn);
+    o->dest_qp_num = rdx_int(env, &a->dest_qp_num, o->dest_qp_num);
+    o->qp_access_flags = rdx_int(env, &a->qp_access_flags, o->qp_access_flags);
+    rdx_fill_IbvQPCap(env, &a->cap, &o->cap);
+    rdx_fill_IbvAHAttr(env, &a->ah_attr, &o->ah_attr);
+    rdx_fill_IbvAHAttr(env, &a->alt_ah_attr, &o->alt_ah_attr);
+    o->pkey_index = rdx_int(env, &a->pkey_index, o->pkey_index);
+    o->alt_pkey_index = rdx_int(env, &a->alt_pkey_index, o->alt_pkey_index);
+    o->en_sqd_async_notify = rdx_int(env, &a->en_sqd_async_notify, o->en_sqd_async_notify);
+    o->sq_draining = rdx_int(env, &a->sq_draining, o->sq_draining);
+    o->max_rd_atomic = rdx_int(env, &a->max_rd_atomic, o->max_rd_atomic);
+    o->max_dest_rd_atomic = rdx_int(env, &a->max_dest_rd_atomic, o->max_dest_rd_atomic);
+    o->min_rnr_timer = rdx_int(env, &a->min_rnr_timer, o->min_rnr_timer);
+    o->port_num = rdx_int(env, &a->port_num, o->port_num);
+    o->timeout = rdx_int(env, &a->timeout, o->timeout);
+    o->retry_cnt = rdx_int(env, &a->retry_cnt, o->retry_cnt);
+    o->rnr_retry = rdx_int(env, &a->rnr_retry, o->rnr_retry);
+    o->alt_port_num = rdx_int(env, &a->alt_port_num, o->alt_port_num);
+    o->alt_timeout = rdx_int(env, &a->alt_timeout, o->alt_timeout);
+    o->rate_limit = rdx_int(env, &a->rate_limit, o->rate_limit);
+}
+
+static void rdx_fill_IbvQPCap(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_cap *o)
+{
+    const RdxArgs_IbvQPCap *a = rdx_attr(arg, RDX_ATTR_IbvQPCap);
+    if (!a)
+        return;
+    o->max_send_wr = rdx_int(env, &a->max_send_wr, o->max_send_wr);
+    o->max_recv_wr = rdx_int(env, &a->max_recv_wr, o->max_recv_wr);
+    o->max_send_sge = rdx_int(env, &a->max_send_sge, o->max_send_sge);
+    o->max_recv_sge = rdx_int(env, &a->max_recv_sge, o->max_recv_sge);
+    o->max_inline_data = rdx_int(env, &a->max_inline_data, o->max_inline_data);
+}
+
+static void rdx_fill_IbvQPInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_init_attr *o)
+{
+    const RdxArgs_IbvQPInitAttr *a = rdx_attr(arg, RDX_ATTR_IbvQPInitAttr);
+    if (!a)
+        return;
+    o->send_cq = rdx_res(env, &a->send_cq, "cq");
+    o->recv_cq = rdx_res(env, &a->recv_cq, "cq");
+    o->srq = rdx_res(env, &a->srq, "srq");
+    rdx_fill_IbvQPCap(env, &a->cap, &o->cap);
+    o->qp_type = rdx_int(env, &a->qp_type, o->qp_type);
+    o->sq_sig_all = rdx_int(env, &a->sq_sig_all, o->sq_sig_all);
+}
+
+static void rdx_fill_IbvQPInitAttrEx(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_init_attr_ex *o)
+{
+    const RdxArgs_IbvQPInitAttrEx *a = rdx_attr(arg, RDX_ATTR_IbvQPInitAttrEx);
+    if (!a)
+        return;
+    o->send_cq = rdx_res(env, &a->send_cq, "cq");
+    o->recv_cq = rdx_res(env, &a->recv_cq, "cq");
+    o->srq = rdx_res(env, &a->srq, "srq");
+    rdx_fill_IbvQPCap(env, &a->cap, &o->cap);
+    o->qp_type = rdx_int(env, &a->qp_type, o->qp_type);
+    o->sq_sig_all = rdx_int(env, &a->sq_sig_all, o->sq_sig_all);
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+    o->pd = rdx_res(env, &a->pd, "pd");
+    o->xrcd = rdx_res(env, &a->xrcd, "xrcd");
+    o->create_flags = rdx_int(env, &a->create_flags, o->create_flags);
+    o->max_tso_header = rdx_int(env, &a->max_tso_header, o->max_tso_header);
+    rdx_fill_IbvRxHashConf(env, &a->rx_hash_conf, &o->rx_hash_conf);
+    o->source_qpn = rdx_int(env, &a->source_qpn, o->source_qpn);
+    o->send_ops_flags = rdx_int(env, &a->send_ops_flags, o->send_ops_flags);
+}
+
+static void rdx_fill_IbvQPOpenAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_open_attr *o)
+{
+    const RdxArgs_IbvQPOpenAttr *a = rdx_attr(arg, RDX_ATTR_IbvQPOpenAttr);
+    if (!a)
+        return;
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+    o->qp_num = rdx_int(env, &a->qp_num, o->qp_num);
+    o->xrcd = rdx_res(env, &a->xrcd, "xrcd");
+    o->qp_type = rdx_int(env, &a->qp_type, o->qp_type);
+}
+
+static void rdx_fill_IbvQPRateLimitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_qp_rate_limit_attr *o)
+{
+    const RdxArgs_IbvQPRateLimitAttr *a = rdx_attr(arg, RDX_ATTR_IbvQPRateLimitAttr);
+    if (!a)
+        return;
+    o->rate_limit = rdx_int(env, &a->rate_limit, o->rate_limit);
+    o->max_burst_sz = rdx_int(env, &a->max_burst_sz, o->max_burst_sz);
+    o->typical_pkt_sz = rdx_int(env, &a->typical_pkt_sz, o->typical_pkt_sz);
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+}
+
+static void rdx_fill_IbvRecvWR(ResourceEnv *env, const RdxArg *arg, struct ibv_recv_wr *o)
+{
+    const RdxArgs_IbvRecvWR *a = rdx_attr(arg, RDX_ATTR_IbvRecvWR);
+    if (!a)
+        return;
+    o->wr_id = rdx_int(env, &a->wr_id, o->wr_id);
+    o->next = rdx_attr(&a->next, RDX_ATTR_IbvRecvWR) ? rdx_scratch(sizeof(*o->next)) : NULL;
+    if (o->next)
+        rdx_fill_IbvRecvWR(env, &a->next, o->next);
+    o->sg_list = rdx_sge_list(env, &a->sg_list, &a->num_sge, &o->num_sge);
+}
+
+static void rdx_fill_IbvRxHashConf(ResourceEnv *env, const RdxArg *arg, struct ibv_rx_hash_conf *o)
+{
+    const RdxArgs_IbvRxHashConf *a = rdx_attr(arg, RDX_ATTR_IbvRxHashConf);
+    if (!a)
+        return;
+    o->rx_hash_function = rdx_int(env, &a->rx_hash_function, o->rx_hash_function);
+    o->rx_hash_key_len = rdx_int(env, &a->rx_hash_key_len, o->rx_hash_key_len);
+    o->rx_hash_key = rdx_bytes(&a->rx_hash_key, o->rx_hash_key_len);
+    o->rx_hash_fields_mask = rdx_int(env, &a->rx_hash_fields_mask, o->rx_hash_fields_mask);
+}
+
+static void rdx_fill_IbvSendWR(ResourceEnv *env, const RdxArg *arg, struct ibv_send_wr *o)
+{
+    const RdxArgs_IbvSendWR *a = rdx_attr(arg, RDX_ATTR_IbvSendWR);
+    if (!a)
+        return;
+    o->wr_id = rdx_int(env, &a->wr_id, o->wr_id);
+    o->next = rdx_attr(&a->next, RDX_ATTR_IbvSendWR) ? rdx_scratch(sizeof(*o->next)) : NULL;
+    if (o->next)
+        rdx_fill_IbvSendWR(env, &a->next, o->next);
+    o->sg_list = rdx_sge_list(env, &a->sg_list, &a->num_sge, &o->num_sge);
+    o->opcode = rdx_int(env, &a->opcode, o->opcode);
+    o->send_flags = rdx_int(env, &a->send_flags, o->send_flags);
+    o->imm_data = rdx_int(env, &a->imm_data, o->imm_data);
+    o->invalidate_rkey = rdx_int(env, &a->invalidate_rkey, o->invalidate_rkey);
+    const RdxArgs_IbvRdmaInfo *s_rdma = rdx_attr(&a->rdma, RDX_ATTR_IbvRdmaInfo);
+    if (s_rdma)
+    {
+        o->wr.rdma.remote_addr = rdx_int(env, &s_rdma->remote_addr, o->wr.rdma.remote_addr);
+        o->wr.rdma.rkey = rdx_int(env, &s_rdma->rkey, o->wr.rdma.rkey);
+    }
+    const RdxArgs_IbvAtomicInfo *s_atomic = rdx_attr(&a->atomic, RDX_ATTR_IbvAtomicInfo);
+    if (s_atomic)
+    {
+        o->wr.atomic.remote_addr = rdx_int(env, &s_atomic->remote_addr, o->wr.atomic.remote_addr);
+        o->wr.atomic.compare_add = rdx_int(env, &s_atomic->compare_add, o->wr.atomic.compare_add);
+        o->wr.atomic.swap = rdx_int(env, &s_atomic->swap, o->wr.atomic.swap);
+        o->wr.atomic.rkey = rdx_int(env, &s_atomic->rkey, o->wr.atomic.rkey);
+    }
+    const RdxArgs_IbvUdInfo *s_ud = rdx_attr(&a->ud, RDX_ATTR_IbvUdInfo);
+    if (s_ud)
+    {
+        o->wr.ud.ah = rdx_res(env, &s_ud->ah, "ah");
+        o->wr.ud.remote_qpn = rdx_int(env, &s_ud->remote_qpn, o->wr.ud.remote_qpn);
+        o->wr.ud.remote_qkey = rdx_int(env, &s_ud->remote_qkey, o->wr.ud.remote_qkey);
+    }
+    const RdxArgs_IbvBindMwInfo *s_bind_mw = rdx_attr(&a->bind_mw, RDX_ATTR_IbvBindMwInfo);
+    if (s_bind_mw)
+    {
+        o->bind_mw.mw = rdx_res(env, &s_bind_mw->mw, "mw");
+        o->bind_mw.rkey = rdx_int(env, &s_bind_mw->rkey, o->bind_mw.rkey);
+        rdx_fill_IbvMwBindInfo(env, &s_bind_mw->bind_info, &o->bind_mw.bind_info);
+    }
+    const RdxArgs_IbvTsoInfo *s_tso = rdx_attr(&a->tso, RDX_ATTR_IbvTsoInfo);
+    if (s_tso)
+    {
+        o->tso.hdr = rdx_buf(env, &s_tso->hdr, rdx_int(env, &s_tso->hdr_sz, 0));
+        o->tso.hdr_sz = rdx_int(env, &s_tso->hdr_sz, o->tso.hdr_sz);
+        o->tso.mss = rdx_int(env, &s_tso->mss, o->tso.mss);
+    }
+}
+
+static void rdx_fill_IbvSrqAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_srq_attr *o)
+{
+    const RdxArgs_IbvSrqAttr *a = rdx_attr(arg, RDX_ATTR_IbvSrqAttr);
+    if (!a)
+        return;
+    o->max_wr = rdx_int(env, &a->max_wr, o->max_wr);
+    o->max_sge = rdx_int(env, &a->max_sge, o->max_sge);
+    o->srq_limit = rdx_int(env, &a->srq_limit, o->srq_limit);
+}
+
+static void rdx_fill_IbvSrqInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_srq_init_attr *o)
+{
+    const RdxArgs_IbvSrqInitAttr *a = rdx_attr(arg, RDX_ATTR_IbvSrqInitAttr);
+    if (!a)
+        return;
+    rdx_fill_IbvSrqAttr(env, &a->attr, &o->attr);
+}
+
+static void rdx_fill_IbvSrqInitAttrEx(ResourceEnv *env, const RdxArg *arg, struct ibv_srq_init_attr_ex *o)
+{
+    const RdxArgs_IbvSrqInitAttrEx *a = rdx_attr(arg, RDX_ATTR_IbvSrqInitAttrEx);
+    if (!a)
+        return;
+    rdx_fill_IbvSrqAttr(env, &a->attr, &o->attr);
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+    o->srq_type = rdx_int(env, &a->srq_type, o->srq_type);
+    o->pd = rdx_res(env, &a->pd, "pd");
+    o->xrcd = rdx_res(env, &a->xrcd, "xrcd");
+    o->cq = rdx_res(env, &a->cq, "cq");
+    rdx_fill_IbvTMCap(env, &a->tm_cap, &o->tm_cap);
+}
+
+static void rdx_fill_IbvTMCap(ResourceEnv *env, const RdxArg *arg, struct ibv_tm_cap *o)
+{
+    const RdxArgs_IbvTMCap *a = rdx_attr(arg, RDX_ATTR_IbvTMCap);
+    if (!a)
+        return;
+    o->max_num_tags = rdx_int(env, &a->max_num_tags, o->max_num_tags);
+    o->max_ops = rdx_int(env, &a->max_ops, o->max_ops);
+}
+
+static void rdx_fill_IbvTdInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_td_init_attr *o)
+{
+    const RdxArgs_IbvTdInitAttr *a = rdx_attr(arg, RDX_ATTR_IbvTdInitAttr);
+    if (!a)
+        return;
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+}
+
+static void rdx_fill_IbvWQAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_wq_attr *o)
+{
+    const RdxArgs_IbvWQAttr *a = rdx_attr(arg, RDX_ATTR_IbvWQAttr);
+    if (!a)
+        return;
+    o->attr_mask = rdx_int(env, &a->attr_mask, o->attr_mask);
+    o->wq_state = rdx_int(env, &a->wq_state, o->wq_state);
+    o->curr_wq_state = rdx_int(env, &a->curr_wq_state, o->curr_wq_state);
+    o->flags = rdx_int(env, &a->flags, o->flags);
+    o->flags_mask = rdx_int(env, &a->flags_mask, o->flags_mask);
+}
+
+static void rdx_fill_IbvWQInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_wq_init_attr *o)
+{
+    const RdxArgs_IbvWQInitAttr *a = rdx_attr(arg, RDX_ATTR_IbvWQInitAttr);
+    if (!a)
+        return;
+    o->wq_type = rdx_int(env, &a->wq_type, o->wq_type);
+    o->max_wr = rdx_int(env, &a->max_wr, o->max_wr);
+    o->max_sge = rdx_int(env, &a->max_sge, o->max_sge);
+    o->pd = rdx_res(env, &a->pd, "pd");
+    o->cq = rdx_res(env, &a->cq, "cq");
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+    o->create_flags = rdx_int(env, &a->create_flags, o->create_flags);
+}
+
+static void rdx_fill_IbvXRCDInitAttr(ResourceEnv *env, const RdxArg *arg, struct ibv_xrcd_init_attr *o)
+{
+    const RdxArgs_IbvXRCDInitAttr *a = rdx_attr(arg, RDX_ATTR_IbvXRCDInitAttr);
+    if (!a)
+        return;
+    o->comp_mask = rdx_int(env, &a->comp_mask, o->comp_mask);
+    o->fd = rdx_int(env, &a->fd, o->fd);
+    o->oflags = rdx_int(env, &a->oflags, o->oflags);
+}
+
+/* ---------- 每个 verb 的 handler ---------- */
+
+static int rdx_exec_AbortWR(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AbortWR *a = args;
+    struct ibv_qp_ex *r_qp_ex = rdx_res(env, &a->qp_ex, "qp_ex");
+    if (!r_qp_ex)
+        return rdx_skip("AbortWR", "qp_ex", &a->qp_ex);
+    (void)ibv_wr_abort(r_qp_ex);
+    return 0;
+}
+
+static int rdx_exec_AckCQEvents(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AckCQEvents *a = args;
+    struct ibv_cq *r_cq = rdx_res(env, &a->cq, "cq");
+    if (!r_cq)
+        return rdx_skip("AckCQEvents", "cq", &a->cq);
+    (void)ibv_ack_cq_events(r_cq, rdx_int(env, &a->nevents, 0));
+    return 0;
+}
+
+static int rdx_exec_AdviseMR(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AdviseMR *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("AdviseMR", "pd", &a->pd);
+    int n_sg_list = 0;
+    struct ibv_sge *l_sg_list = rdx_sge_list(env, &a->sg_list, &a->num_sge, &n_sg_list);
+    int rc = ibv_advise_mr(r_pd, rdx_int(env, &a->advice, 0), rdx_int(env, &a->flags, 0), l_sg_list, n_sg_list);
+    if (rc != 0)
+        return rdx_fail("AdviseMR", "ibv_advise_mr", rc);
+    return 0;
+}
+
+static int rdx_exec_AllocDM(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AllocDM *a = args;
+    if (!env->ctx)
+        return rdx_skip("AllocDM", "ctx", NULL);
+    struct ibv_alloc_dm_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("AllocDM", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvAllocDmAttr(env, &a->attr_obj, at_attr_obj);
+    struct ibv_dm *obj = ibv_alloc_dm(env->ctx, at_attr_obj);
+    if (!obj)
+        return rdx_fail("AllocDM", "ibv_alloc_dm", 0);
+    rdx_put(env, "dm", &a->dm, obj);
+    return 0;
+}
+
+static int rdx_exec_AllocMW(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AllocMW *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("AllocMW", "pd", &a->pd);
+    struct ibv_mw *obj = ibv_alloc_mw(r_pd, rdx_int(env, &a->mw_type, IBV_MW_TYPE_1));
+    if (!obj)
+        return rdx_fail("AllocMW", "ibv_alloc_mw", 0);
+    rdx_put(env, "mw", &a->mw, obj);
+    return 0;
+}
+
+static int rdx_exec_AllocNullMR(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AllocNullMR *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("AllocNullMR", "pd", &a->pd);
+    struct ibv_mr *obj = ibv_alloc_null_mr(r_pd);
+    if (!obj)
+        return rdx_fail("AllocNullMR", "ibv_alloc_null_mr", 0);
+    rdx_put(env, "mr", &a->mr, obj);
+    return 0;
+}
+
+static int rdx_exec_AllocPD(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AllocPD *a = args;
+    if (!env->ctx)
+        return rdx_skip("AllocPD", "ctx", NULL);
+    struct ibv_pd *obj = ibv_alloc_pd(env->ctx);
+    if (!obj)
+        return rdx_fail("AllocPD", "ibv_alloc_pd", 0);
+    rdx_put(env, "pd", &a->pd, obj);
+    return 0;
+}
+
+static int rdx_exec_AllocParentDomain(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AllocParentDomain *a = args;
+    if (!env->ctx)
+        return rdx_skip("AllocParentDomain", "ctx", NULL);
+    struct ibv_parent_domain_init_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("AllocParentDomain", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvParentDomainInitAttr(env, &a->attr_obj, at_attr_obj);
+    struct ibv_pd *obj = ibv_alloc_parent_domain(env->ctx, at_attr_obj);
+    if (!obj)
+        return rdx_fail("AllocParentDomain", "ibv_alloc_parent_domain", 0);
+    rdx_put(env, "pd", &a->parent_pd, obj);
+    return 0;
+}
+
+static int rdx_exec_AllocTD(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AllocTD *a = args;
+    if (!env->ctx)
+        return rdx_skip("AllocTD", "ctx", NULL);
+    struct ibv_td_init_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("AllocTD", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvTdInitAttr(env, &a->attr_obj, at_attr_obj);
+    struct ibv_td *obj = ibv_alloc_td(env->ctx, at_attr_obj);
+    if (!obj)
+        return rdx_fail("AllocTD", "ibv_alloc_td", 0);
+    rdx_put(env, "td", &a->td, obj);
+    return 0;
+}
+
+static int rdx_exec_AttachMcast(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_AttachMcast *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("AttachMcast", "qp", &a->qp);
+    union ibv_gid g_gid;
+    rdx_gid(&a->gid, &g_gid);
+    int rc = ibv_attach_mcast(r_qp, &g_gid, rdx_int(env, &a->lid, 0));
+    if (rc != 0)
+        return rdx_fail("AttachMcast", "ibv_attach_mcast", rc);
+    return 0;
+}
+
+static int rdx_exec_BindMW(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_BindMW *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("BindMW", "qp", &a->qp);
+    struct ibv_mw *r_mw = rdx_res(env, &a->mw, "mw");
+    if (!r_mw)
+        return rdx_skip("BindMW", "mw", &a->mw);
+    struct ibv_mw_bind *at_mw_bind_obj = rdx_scratch(sizeof(*at_mw_bind_obj));
+    if (!at_mw_bind_obj)
+        return rdx_fail("BindMW", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvMwBind(env, &a->mw_bind_obj, at_mw_bind_obj);
+    int rc = ibv_bind_mw(r_qp, r_mw, at_mw_bind_obj);
+    if (rc != 0)
+        return rdx_fail("BindMW", "ibv_bind_mw", rc);
+    return 0;
+}
+
+static int rdx_exec_CloseDevice(const void *args, ResourceEnv *env)
+{
+    (void)args;
+    struct ibv_context *r_last_context = env_take_obj(env, "context", NULL);
+    if (!r_last_context)
+        return rdx_skip("CloseDevice", "context", NULL);
+    int rc = ibv_close_device(r_last_context);
+    if (rc != 0)
+        return rdx_fail("CloseDevice", "ibv_close_device", rc);
+    return 0;
+}
+
+static int rdx_exec_CloseXRCD(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CloseXRCD *a = args;
+    struct ibv_xrcd *r_xrcd = rdx_res(env, &a->xrcd, "xrcd");
+    if (!r_xrcd)
+        return rdx_skip("CloseXRCD", "xrcd", &a->xrcd);
+    int rc = ibv_close_xrcd(r_xrcd);
+    if (rc != 0)
+        return rdx_fail("CloseXRCD", "ibv_close_xrcd", rc);
+    rdx_drop(env, "xrcd", &a->xrcd);
+    return 0;
+}
+
+static int rdx_exec_CreateAH(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateAH *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("CreateAH", "pd", &a->pd);
+    struct ibv_ah_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("CreateAH", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvAHAttr(env, &a->attr_obj, at_attr_obj);
+    struct ibv_ah *obj = ibv_create_ah(r_pd, at_attr_obj);
+    if (!obj)
+        return rdx_fail("CreateAH", "ibv_create_ah", 0);
+    rdx_put(env, "ah", &a->ah, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateAHFromWC(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateAHFromWC *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("CreateAHFromWC", "pd", &a->pd);
+    struct ibv_grh grh;
+    memset(&grh, 0, sizeof(grh));
+    struct ibv_ah *obj = ibv_create_ah_from_wc(r_pd, rdx_last_wc(), &grh, rdx_int(env, &a->port_num, 1));
+    if (!obj)
+        return rdx_fail("CreateAHFromWC", "ibv_create_ah_from_wc", 0);
+    rdx_put(env, "ah", &a->ah, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateCQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateCQ *a = args;
+    if (!env->ctx)
+        return rdx_skip("CreateCQ", "ctx", NULL);
+    struct ibv_comp_channel *r_channel = rdx_res(env, &a->channel, "channel");
+    struct ibv_cq *obj = ibv_create_cq(env->ctx, rdx_int(env, &a->cqe, 0), NULL, r_channel, rdx_int(env, &a->comp_vector, 0));
+    if (!obj)
+        return rdx_fail("CreateCQ", "ibv_create_cq", 0);
+    rdx_put(env, "cq", &a->cq, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateCQEx(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateCQEx *a = args;
+    if (!env->ctx)
+        return rdx_skip("CreateCQEx", "ctx", NULL);
+    struct ibv_cq_init_attr_ex *at_cq_attr_obj = rdx_scratch(sizeof(*at_cq_attr_obj));
+    if (!at_cq_attr_obj)
+        return rdx_fail("CreateCQEx", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvCQInitAttrEx(env, &a->cq_attr_obj, at_cq_attr_obj);
+    struct ibv_cq_ex *obj = ibv_create_cq_ex(env->ctx, at_cq_attr_obj);
+    if (!obj)
+        return rdx_fail("CreateCQEx", "ibv_create_cq_ex", 0);
+    rdx_put(env, "cq_ex", &a->cq_ex, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateCompChannel(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateCompChannel *a = args;
+    if (!env->ctx)
+        return rdx_skip("CreateCompChannel", "ctx", NULL);
+    struct ibv_comp_channel *obj = ibv_create_comp_channel(env->ctx);
+    if (!obj)
+        return rdx_fail("CreateCompChannel", "ibv_create_comp_channel", 0);
+    rdx_put(env, "channel", &a->channel, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateFlow(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateFlow *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("CreateFlow", "qp", &a->qp);
+    struct ibv_flow_attr *at_flow_attr_obj = rdx_scratch(sizeof(*at_flow_attr_obj));
+    if (!at_flow_attr_obj)
+        return rdx_fail("CreateFlow", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvFlowAttr(env, &a->flow_attr_obj, at_flow_attr_obj);
+    struct ibv_flow *obj = ibv_create_flow(r_qp, at_flow_attr_obj);
+    if (!obj)
+        return rdx_fail("CreateFlow", "ibv_create_flow", 0);
+    rdx_put(env, "flow", &a->flow, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateQP(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateQP *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("CreateQP", "pd", &a->pd);
+    struct ibv_qp_init_attr *at_init_attr_obj = rdx_scratch(sizeof(*at_init_attr_obj));
+    if (!at_init_attr_obj)
+        return rdx_fail("CreateQP", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvQPInitAttr(env, &a->init_attr_obj, at_init_attr_obj);
+    struct ibv_qp *obj = ibv_create_qp(r_pd, at_init_attr_obj);
+    if (!obj)
+        return rdx_fail("CreateQP", "ibv_create_qp", 0);
+    rdx_put(env, "qp", &a->qp, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateQPEx(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateQPEx *a = args;
+    if (!env->ctx)
+        return rdx_skip("CreateQPEx", "ctx", NULL);
+    struct ibv_qp_init_attr_ex *at_qp_attr_obj = rdx_scratch(sizeof(*at_qp_attr_obj));
+    if (!at_qp_attr_obj)
+        return rdx_fail("CreateQPEx", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvQPInitAttrEx(env, &a->qp_attr_obj, at_qp_attr_obj);
+    struct ibv_qp *obj = ibv_create_qp_ex(env->ctx, at_qp_attr_obj);
+    if (!obj)
+        return rdx_fail("CreateQPEx", "ibv_create_qp_ex", 0);
+    rdx_put(env, "qp", &a->qp, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateSRQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateSRQ *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("CreateSRQ", "pd", &a->pd);
+    struct ibv_srq_init_attr *at_srq_init_obj = rdx_scratch(sizeof(*at_srq_init_obj));
+    if (!at_srq_init_obj)
+        return rdx_fail("CreateSRQ", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvSrqInitAttr(env, &a->srq_init_obj, at_srq_init_obj);
+    struct ibv_srq *obj = ibv_create_srq(r_pd, at_srq_init_obj);
+    if (!obj)
+        return rdx_fail("CreateSRQ", "ibv_create_srq", 0);
+    rdx_put(env, "srq", &a->srq, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateSRQEx(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateSRQEx *a = args;
+    if (!env->ctx)
+        return rdx_skip("CreateSRQEx", "ctx", NULL);
+    struct ibv_srq_init_attr_ex *at_srq_attr_obj = rdx_scratch(sizeof(*at_srq_attr_obj));
+    if (!at_srq_attr_obj)
+        return rdx_fail("CreateSRQEx", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvSrqInitAttrEx(env, &a->srq_attr_obj, at_srq_attr_obj);
+    struct ibv_srq *obj = ibv_create_srq_ex(env->ctx, at_srq_attr_obj);
+    if (!obj)
+        return rdx_fail("CreateSRQEx", "ibv_create_srq_ex", 0);
+    rdx_put(env, "srq", &a->srq, obj);
+    return 0;
+}
+
+static int rdx_exec_CreateWQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_CreateWQ *a = args;
+    if (!env->ctx)
+        return rdx_skip("CreateWQ", "ctx", NULL);
+    struct ibv_wq_init_attr *at_wq_attr_obj = rdx_scratch(sizeof(*at_wq_attr_obj));
+    if (!at_wq_attr_obj)
+        return rdx_fail("CreateWQ", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvWQInitAttr(env, &a->wq_attr_obj, at_wq_attr_obj);
+    struct ibv_wq *obj = ibv_create_wq(env->ctx, at_wq_attr_obj);
+    if (!obj)
+        return rdx_fail("CreateWQ", "ibv_create_wq", 0);
+    rdx_put(env, "wq", &a->wq, obj);
+    return 0;
+}
+
+static int rdx_exec_DeallocMW(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DeallocMW *a = args;
+    struct ibv_mw *r_mw = rdx_res(env, &a->mw, "mw");
+    if (!r_mw)
+        return rdx_skip("DeallocMW", "mw", &a->mw);
+    int rc = ibv_dealloc_mw(r_mw);
+    if (rc != 0)
+        return rdx_fail("DeallocMW", "ibv_dealloc_mw", rc);
+    rdx_drop(env, "mw", &a->mw);
+    return 0;
+}
+
+static int rdx_exec_DeallocPD(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DeallocPD *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("DeallocPD", "pd", &a->pd);
+    int rc = ibv_dealloc_pd(r_pd);
+    if (rc != 0)
+        return rdx_fail("DeallocPD", "ibv_dealloc_pd", rc);
+    rdx_drop(env, "pd", &a->pd);
+    return 0;
+}
+
+static int rdx_exec_DeallocTD(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DeallocTD *a = args;
+    struct ibv_td *r_td = rdx_res(env, &a->td, "td");
+    if (!r_td)
+        return rdx_skip("DeallocTD", "td", &a->td);
+    int rc = ibv_dealloc_td(r_td);
+    if (rc != 0)
+        return rdx_fail("DeallocTD", "ibv_dealloc_td", rc);
+    rdx_drop(env, "td", &a->td);
+    return 0;
+}
+
+static int rdx_exec_DeregMR(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DeregMR *a = args;
+    struct ibv_mr *r_mr = rdx_res(env, &a->mr, "mr");
+    if (!r_mr)
+        return rdx_skip("DeregMR", "mr", &a->mr);
+    int rc = ibv_dereg_mr(r_mr);
+    if (rc != 0)
+        return rdx_fail("DeregMR", "ibv_dereg_mr", rc);
+    rdx_drop(env, "mr", &a->mr);
+    return 0;
+}
+
+static int rdx_exec_DestroyAH(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DestroyAH *a = args;
+    struct ibv_ah *r_ah = rdx_res(env, &a->ah, "ah");
+    if (!r_ah)
+        return rdx_skip("DestroyAH", "ah", &a->ah);
+    int rc = ibv_destroy_ah(r_ah);
+    if (rc != 0)
+        return rdx_fail("DestroyAH", "ibv_destroy_ah", rc);
+    rdx_drop(env, "ah", &a->ah);
+    return 0;
+}
+
+static int rdx_exec_DestroyCQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DestroyCQ *a = args;
+    struct ibv_cq *r_cq = rdx_res(env, &a->cq, "cq");
+    if (!r_cq)
+        return rdx_skip("DestroyCQ", "cq", &a->cq);
+    int rc = ibv_destroy_cq(r_cq);
+    if (rc != 0)
+        return rdx_fail("DestroyCQ", "ibv_destroy_cq", rc);
+    rdx_drop(env, "cq", &a->cq);
+    return 0;
+}
+
+static int rdx_exec_DestroyCompChannel(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DestroyCompChannel *a = args;
+    struct ibv_comp_channel *r_channel = rdx_res(env, &a->channel, "channel");
+    if (!r_channel)
+        return rdx_skip("DestroyCompChannel", "channel", &a->channel);
+    int rc = ibv_destroy_comp_channel(r_channel);
+    if (rc != 0)
+        return rdx_fail("DestroyCompChannel", "ibv_destroy_comp_channel", rc);
+    rdx_drop(env, "channel", &a->channel);
+    return 0;
+}
+
+static int rdx_exec_DestroyFlow(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DestroyFlow *a = args;
+    struct ibv_flow *r_flow = rdx_res(env, &a->flow, "flow");
+    if (!r_flow)
+        return rdx_skip("DestroyFlow", "flow", &a->flow);
+    int rc = ibv_destroy_flow(r_flow);
+    if (rc != 0)
+        return rdx_fail("DestroyFlow", "ibv_destroy_flow", rc);
+    rdx_drop(env, "flow", &a->flow);
+    return 0;
+}
+
+static int rdx_exec_DestroyQP(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DestroyQP *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("DestroyQP", "qp", &a->qp);
+    int rc = ibv_destroy_qp(r_qp);
+    if (rc != 0)
+        return rdx_fail("DestroyQP", "ibv_destroy_qp", rc);
+    rdx_drop(env, "qp", &a->qp);
+    return 0;
+}
+
+static int rdx_exec_DestroySRQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DestroySRQ *a = args;
+    struct ibv_srq *r_srq = rdx_res(env, &a->srq, "srq");
+    if (!r_srq)
+        return rdx_skip("DestroySRQ", "srq", &a->srq);
+    int rc = ibv_destroy_srq(r_srq);
+    if (rc != 0)
+        return rdx_fail("DestroySRQ", "ibv_destroy_srq", rc);
+    rdx_drop(env, "srq", &a->srq);
+    return 0;
+}
+
+static int rdx_exec_DestroyWQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DestroyWQ *a = args;
+    struct ibv_wq *r_wq = rdx_res(env, &a->wq, "wq");
+    if (!r_wq)
+        return rdx_skip("DestroyWQ", "wq", &a->wq);
+    int rc = ibv_destroy_wq(r_wq);
+    if (rc != 0)
+        return rdx_fail("DestroyWQ", "ibv_destroy_wq", rc);
+    rdx_drop(env, "wq", &a->wq);
+    return 0;
+}
+
+static int rdx_exec_DetachMcast(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_DetachMcast *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("DetachMcast", "qp", &a->qp);
+    union ibv_gid g_gid;
+    rdx_gid(&a->gid, &g_gid);
+    int rc = ibv_detach_mcast(r_qp, &g_gid, rdx_int(env, &a->lid, 0));
+    if (rc != 0)
+        return rdx_fail("DetachMcast", "ibv_detach_mcast", rc);
+    return 0;
+}
+
+static int rdx_exec_ForkInit(const void *args, ResourceEnv *env)
+{
+    (void)args;
+    (void)env;
+    int rc = ibv_fork_init();
+    if (rc != 0)
+        return rdx_fail("ForkInit", "ibv_fork_init", rc);
+    return 0;
+}
+
+static int rdx_exec_FreeDM(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_FreeDM *a = args;
+    struct ibv_dm *r_dm = rdx_res(env, &a->dm, "dm");
+    if (!r_dm)
+        return rdx_skip("FreeDM", "dm", &a->dm);
+    int rc = ibv_free_dm(r_dm);
+    if (rc != 0)
+        return rdx_fail("FreeDM", "ibv_free_dm", rc);
+    rdx_drop(env, "dm", &a->dm);
+    return 0;
+}
+
+static int rdx_exec_FreeDeviceList(const void *args, ResourceEnv *env)
+{
+    (void)args;
+    (void)env;
+    (void)rdx_free_device_list();
+    return 0;
+}
+
+static int rdx_exec_GetDeviceGUID(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_GetDeviceGUID *a = args;
+    struct ibv_device *d_device = rdx_device(env, &a->device);
+    if (!d_device)
+        return rdx_skip("GetDeviceGUID", "device", &a->device);
+    (void)ibv_get_device_guid(d_device);
+    return 0;
+}
+
+static int rdx_exec_GetDeviceIndex(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_GetDeviceIndex *a = args;
+    struct ibv_device *d_device_name = rdx_device(env, &a->device_name);
+    if (!d_device_name)
+        return rdx_skip("GetDeviceIndex", "device_name", &a->device_name);
+    int rc = (int)ibv_get_device_index(d_device_name);
+    if (rc < 0)
+        return rdx_fail("GetDeviceIndex", "ibv_get_device_index", rc);
+    return 0;
+}
+
+static int rdx_exec_GetDeviceList(const void *args, ResourceEnv *env)
+{
+    (void)args;
+    (void)env;
+    if (!rdx_get_device_list())
+        return rdx_fail("GetDeviceList", "rdx_get_device_list", 0);
+    return 0;
+}
+
+static int rdx_exec_GetDeviceName(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_GetDeviceName *a = args;
+    struct ibv_device *d_device = rdx_device(env, &a->device);
+    if (!d_device)
+        return rdx_skip("GetDeviceName", "device", &a->device);
+    if (!ibv_get_device_name(d_device))
+        return rdx_fail("GetDeviceName", "ibv_get_device_name", 0);
+    return 0;
+}
+
+static int rdx_exec_GetPKeyIndex(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_GetPKeyIndex *a = args;
+    if (!env->ctx)
+        return rdx_skip("GetPKeyIndex", "ctx", NULL);
+    int rc = (int)ibv_get_pkey_index(env->ctx, rdx_int(env, &a->port_num, 1), rdx_int(env, &a->pkey, 0));
+    if (rc < 0)
+        return rdx_fail("GetPKeyIndex", "ibv_get_pkey_index", rc);
+    return 0;
+}
+
+static int rdx_exec_GetSRQNum(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_GetSRQNum *a = args;
+    struct ibv_srq *r_srq = rdx_res(env, &a->srq, "srq");
+    if (!r_srq)
+        return rdx_skip("GetSRQNum", "srq", &a->srq);
+    uint32_t srq_num = 0;
+    int rc = ibv_get_srq_num(r_srq, &srq_num);
+    if (rc != 0)
+        return rdx_fail("GetSRQNum", "ibv_get_srq_num", rc);
+    return 0;
+}
+
+static int rdx_exec_ImportDM(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ImportDM *a = args;
+    if (!env->ctx)
+        return rdx_skip("ImportDM", "ctx", NULL);
+    struct ibv_dm *obj = ibv_import_dm(env->ctx, rdx_int(env, &a->dm_handle, 0));
+    if (!obj)
+        return rdx_fail("ImportDM", "ibv_import_dm", 0);
+    rdx_put(env, "dm", &a->dm, obj);
+    return 0;
+}
+
+static int rdx_exec_ImportMR(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ImportMR *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("ImportMR", "pd", &a->pd);
+    struct ibv_mr *obj = ibv_import_mr(r_pd, rdx_int(env, &a->mr_handle, 0));
+    if (!obj)
+        return rdx_fail("ImportMR", "ibv_import_mr", 0);
+    rdx_put(env, "mr", &a->mr, obj);
+    return 0;
+}
+
+static int rdx_exec_ImportPD(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ImportPD *a = args;
+    if (!env->ctx)
+        return rdx_skip("ImportPD", "ctx", NULL);
+    struct ibv_pd *obj = ibv_import_pd(env->ctx, rdx_int(env, &a->pd_handle, 0));
+    if (!obj)
+        return rdx_fail("ImportPD", "ibv_import_pd", 0);
+    rdx_put(env, "pd", &a->pd, obj);
+    return 0;
+}
+
+static int rdx_exec_MemcpyFromDM(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_MemcpyFromDM *a = args;
+    void *b_host = rdx_buf(env, &a->host, rdx_int(env, &a->length, 0));
+    if (!b_host)
+        return rdx_skip("MemcpyFromDM", "host", &a->host);
+    struct ibv_dm *r_dm = rdx_res(env, &a->dm, "dm");
+    if (!r_dm)
+        return rdx_skip("MemcpyFromDM", "dm", &a->dm);
+    int rc = ibv_memcpy_from_dm(b_host, r_dm, rdx_int(env, &a->dm_offset, 0), rdx_int(env, &a->length, 0));
+    if (rc != 0)
+        return rdx_fail("MemcpyFromDM", "ibv_memcpy_from_dm", rc);
+    return 0;
+}
+
+static int rdx_exec_MemcpyToDM(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_MemcpyToDM *a = args;
+    struct ibv_dm *r_dm = rdx_res(env, &a->dm, "dm");
+    if (!r_dm)
+        return rdx_skip("MemcpyToDM", "dm", &a->dm);
+    void *b_host = rdx_buf(env, &a->host, rdx_int(env, &a->length, 0));
+    if (!b_host)
+        return rdx_skip("MemcpyToDM", "host", &a->host);
+    int rc = ibv_memcpy_to_dm(r_dm, rdx_int(env, &a->dm_offset, 0), b_host, rdx_int(env, &a->length, 0));
+    if (rc != 0)
+        return rdx_fail("MemcpyToDM", "ibv_memcpy_to_dm", rc);
+    return 0;
+}
+
+static int rdx_exec_ModifyCQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ModifyCQ *a = args;
+    struct ibv_cq *r_cq = rdx_res(env, &a->cq, "cq");
+    if (!r_cq)
+        return rdx_skip("ModifyCQ", "cq", &a->cq);
+    struct ibv_modify_cq_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("ModifyCQ", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvModifyCQAttr(env, &a->attr_obj, at_attr_obj);
+    int rc = ibv_modify_cq(r_cq, at_attr_obj);
+    if (rc != 0)
+        return rdx_fail("ModifyCQ", "ibv_modify_cq", rc);
+    return 0;
+}
+
+static int rdx_exec_ModifyQP(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ModifyQP *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("ModifyQP", "qp", &a->qp);
+    struct ibv_qp_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("ModifyQP", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvQPAttr(env, &a->attr_obj, at_attr_obj);
+    int attr_mask = (int)rdx_int(env, &a->attr_mask, 0);
+    server_fill_qp_attr_from_remote(env, rdx_str(&a->qp), at_attr_obj, &attr_mask,
+                                    at_attr_obj->qp_state);
+    int rc = ibv_modify_qp(r_qp, at_attr_obj, attr_mask);
+    if (rc != 0)
+        return rdx_fail("ModifyQP", "ibv_modify_qp", rc);
+    return 0;
+}
+
+static int rdx_exec_ModifyQPRateLimit(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ModifyQPRateLimit *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("ModifyQPRateLimit", "qp", &a->qp);
+    struct ibv_qp_rate_limit_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("ModifyQPRateLimit", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvQPRateLimitAttr(env, &a->attr_obj, at_attr_obj);
+    int rc = ibv_modify_qp_rate_limit(r_qp, at_attr_obj);
+    if (rc != 0)
+        return rdx_fail("ModifyQPRateLimit", "ibv_modify_qp_rate_limit", rc);
+    return 0;
+}
+
+static int rdx_exec_ModifySRQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ModifySRQ *a = args;
+    struct ibv_srq *r_srq = rdx_res(env, &a->srq, "srq");
+    if (!r_srq)
+        return rdx_skip("ModifySRQ", "srq", &a->srq);
+    struct ibv_srq_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("ModifySRQ", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvSrqAttr(env, &a->attr_obj, at_attr_obj);
+    int rc = ibv_modify_srq(r_srq, at_attr_obj, rdx_int(env, &a->attr_mask, 0));
+    if (rc != 0)
+        return rdx_fail("ModifySRQ", "ibv_modify_srq", rc);
+    return 0;
+}
+
+static int rdx_exec_ModifyWQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ModifyWQ *a = args;
+    struct ibv_wq *r_wq = rdx_res(env, &a->wq, "wq");
+    if (!r_wq)
+        return rdx_skip("ModifyWQ", "wq", &a->wq);
+    struct ibv_wq_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("ModifyWQ", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvWQAttr(env, &a->attr_obj, at_attr_obj);
+    int rc = ibv_modify_wq(r_wq, at_attr_obj);
+    if (rc != 0)
+        return rdx_fail("ModifyWQ", "ibv_modify_wq", rc);
+    return 0;
+}
+
+static int rdx_exec_OpenDevice(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_OpenDevice *a = args;
+    struct ibv_device *d_device = rdx_device(env, &a->device);
+    if (!d_device)
+        return rdx_skip("OpenDevice", "device", &a->device);
+    struct ibv_context *obj = ibv_open_device(d_device);
+    if (!obj)
+        return rdx_fail("OpenDevice", "ibv_open_device", 0);
+    rdx_put(env, "context", &a->device, obj);
+    return 0;
+}
+
+static int rdx_exec_OpenQP(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_OpenQP *a = args;
+    if (!env->ctx)
+        return rdx_skip("OpenQP", "ctx", NULL);
+    struct ibv_qp_open_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("OpenQP", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvQPOpenAttr(env, &a->attr_obj, at_attr_obj);
+    struct ibv_qp *obj = ibv_open_qp(env->ctx, at_attr_obj);
+    if (!obj)
+        return rdx_fail("OpenQP", "ibv_open_qp", 0);
+    rdx_put(env, "qp", &a->qp, obj);
+    return 0;
+}
+
+static int rdx_exec_OpenXRCD(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_OpenXRCD *a = args;
+    if (!env->ctx)
+        return rdx_skip("OpenXRCD", "ctx", NULL);
+    struct ibv_xrcd_init_attr *at_attr_obj = rdx_scratch(sizeof(*at_attr_obj));
+    if (!at_attr_obj)
+        return rdx_fail("OpenXRCD", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvXRCDInitAttr(env, &a->attr_obj, at_attr_obj);
+    struct ibv_xrcd *obj = ibv_open_xrcd(env->ctx, at_attr_obj);
+    if (!obj)
+        return rdx_fail("OpenXRCD", "ibv_open_xrcd", 0);
+    rdx_put(env, "xrcd", &a->xrcd, obj);
+    return 0;
+}
+
+static int rdx_exec_PollCQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_PollCQ *a = args;
+    struct ibv_cq *r_cq = rdx_res(env, &a->cq, "cq");
+    if (!r_cq)
+        return rdx_skip("PollCQ", "cq", &a->cq);
+    int rc = (int)ibv_poll_cq(r_cq, 1, rdx_last_wc());
+    if (rc < 0)
+        return rdx_fail("PollCQ", "ibv_poll_cq", rc);
+    return 0;
+}
+
+static int rdx_exec_PostRecv(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_PostRecv *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("PostRecv", "qp", &a->qp);
+    struct ibv_recv_wr *at_wr_obj = rdx_scratch(sizeof(*at_wr_obj));
+    if (!at_wr_obj)
+        return rdx_fail("PostRecv", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvRecvWR(env, &a->wr_obj, at_wr_obj);
+    struct ibv_recv_wr *bad_wr = NULL;
+    int rc = ibv_post_recv(r_qp, at_wr_obj, &bad_wr);
+    if (rc != 0)
+        return rdx_fail("PostRecv", "ibv_post_recv", rc);
+    return 0;
+}
+
+static int rdx_exec_PostSRQRecv(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_PostSRQRecv *a = args;
+    struct ibv_srq *r_srq = rdx_res(env, &a->srq, "srq");
+    if (!r_srq)
+        return rdx_skip("PostSRQRecv", "srq", &a->srq);
+    struct ibv_recv_wr *at_wr_obj = rdx_scratch(sizeof(*at_wr_obj));
+    if (!at_wr_obj)
+        return rdx_fail("PostSRQRecv", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvRecvWR(env, &a->wr_obj, at_wr_obj);
+    struct ibv_recv_wr *bad_wr = NULL;
+    int rc = ibv_post_srq_recv(r_srq, at_wr_obj, &bad_wr);
+    if (rc != 0)
+        return rdx_fail("PostSRQRecv", "ibv_post_srq_recv", rc);
+    return 0;
+}
+
+static int rdx_exec_PostSend(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_PostSend *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("PostSend", "qp", &a->qp);
+    struct ibv_send_wr *at_wr_obj = rdx_scratch(sizeof(*at_wr_obj));
+    if (!at_wr_obj)
+        return rdx_fail("PostSend", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvSendWR(env, &a->wr_obj, at_wr_obj);
+    struct ibv_send_wr *bad_wr = NULL;
+    int rc = ibv_post_send(r_qp, at_wr_obj, &bad_wr);
+    if (rc != 0)
+        return rdx_fail("PostSend", "ibv_post_send", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryDeviceAttr(const void *args, ResourceEnv *env)
+{
+    (void)args;
+    if (!env->ctx)
+        return rdx_skip("QueryDeviceAttr", "ctx", NULL);
+    struct ibv_device_attr dev_attr;
+    int rc = ibv_query_device(env->ctx, &dev_attr);
+    if (rc != 0)
+        return rdx_fail("QueryDeviceAttr", "ibv_query_device", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryDeviceEx(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QueryDeviceEx *a = args;
+    if (!env->ctx)
+        return rdx_skip("QueryDeviceEx", "ctx", NULL);
+    struct ibv_query_device_ex_input input = {.comp_mask = (uint32_t)rdx_int(env, &a->comp_mask, 0)};
+    struct ibv_device_attr_ex attr_ex;
+    int rc = ibv_query_device_ex(env->ctx, &input, &attr_ex);
+    if (rc != 0)
+        return rdx_fail("QueryDeviceEx", "ibv_query_device_ex", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryECE(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QueryECE *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("QueryECE", "qp", &a->qp);
+    struct ibv_ece ece;
+    int rc = ibv_query_ece(r_qp, &ece);
+    if (rc != 0)
+        return rdx_fail("QueryECE", "ibv_query_ece", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryGID(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QueryGID *a = args;
+    if (!env->ctx)
+        return rdx_skip("QueryGID", "ctx", NULL);
+    union ibv_gid gid;
+    int rc = ibv_query_gid(env->ctx, rdx_int(env, &a->port_num, 1), rdx_int(env, &a->index, 0), &gid);
+    if (rc != 0)
+        return rdx_fail("QueryGID", "ibv_query_gid", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryGIDEx(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QueryGIDEx *a = args;
+    if (!env->ctx)
+        return rdx_skip("QueryGIDEx", "ctx", NULL);
+    struct ibv_gid_entry entry;
+    int rc = ibv_query_gid_ex(env->ctx, rdx_int(env, &a->port_num, 1), rdx_int(env, &a->gid_index, 0), &entry, rdx_int(env, &a->flags, 0));
+    if (rc != 0)
+        return rdx_fail("QueryGIDEx", "ibv_query_gid_ex", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryGIDTable(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QueryGIDTable *a = args;
+    if (!env->ctx)
+        return rdx_skip("QueryGIDTable", "ctx", NULL);
+    size_t max_entries = rdx_count(rdx_int(env, &a->max_entries, 0));
+    struct ibv_gid_entry *entries = rdx_scratch(sizeof(*entries) * (max_entries ? max_entries : 1));
+    if (!entries)
+        return rdx_fail("QueryGIDTable", "rdx_scratch", ENOMEM);
+    int rc = (int)ibv_query_gid_table(env->ctx, entries, max_entries, 0);
+    if (rc < 0)
+        return rdx_fail("QueryGIDTable", "ibv_query_gid_table", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryPKey(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QueryPKey *a = args;
+    if (!env->ctx)
+        return rdx_skip("QueryPKey", "ctx", NULL);
+    __be16 pkey;
+    int rc = ibv_query_pkey(env->ctx, rdx_int(env, &a->port_num, 1), rdx_int(env, &a->index, 0), &pkey);
+    if (rc != 0)
+        return rdx_fail("QueryPKey", "ibv_query_pkey", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryPortAttr(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QueryPortAttr *a = args;
+    if (!env->ctx)
+        return rdx_skip("QueryPortAttr", "ctx", NULL);
+    struct ibv_port_attr port_attr;
+    int rc = ibv_query_port(env->ctx, rdx_int(env, &a->port_num, 1), &port_attr);
+    if (rc != 0)
+        return rdx_fail("QueryPortAttr", "ibv_query_port", rc);
+    return 0;
+}
+
+static int rdx_exec_QueryQP(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QueryQP *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("QueryQP", "qp", &a->qp);
+    struct ibv_qp_attr attr;
+    struct ibv_qp_init_attr init_attr;
+    int rc = ibv_query_qp(r_qp, &attr, rdx_int(env, &a->attr_mask, 0), &init_attr);
+    if (rc != 0)
+        return rdx_fail("QueryQP", "ibv_query_qp", rc);
+    return 0;
+}
+
+static int rdx_exec_QuerySRQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_QuerySRQ *a = args;
+    struct ibv_srq *r_srq = rdx_res(env, &a->srq, "srq");
+    if (!r_srq)
+        return rdx_skip("QuerySRQ", "srq", &a->srq);
+    struct ibv_srq_attr attr;
+    int rc = ibv_query_srq(r_srq, &attr);
+    if (rc != 0)
+        return rdx_fail("QuerySRQ", "ibv_query_srq", rc);
+    return 0;
+}
+
+static int rdx_exec_ReRegMR(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ReRegMR *a = args;
+    struct ibv_mr *r_mr = rdx_res(env, &a->mr, "mr");
+    if (!r_mr)
+        return rdx_skip("ReRegMR", "mr", &a->mr);
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    void *b_addr = rdx_buf(env, &a->addr, rdx_int(env, &a->length, 0));
+    int rc = ibv_rereg_mr(r_mr, rdx_int(env, &a->flags, 0), r_pd, b_addr, rdx_int(env, &a->length, 0), rdx_int(env, &a->access, 0));
+    if (rc != 0)
+        return rdx_fail("ReRegMR", "ibv_rereg_mr", rc);
+    return 0;
+}
+
+static int rdx_exec_RegDmaBufMR(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_RegDmaBufMR *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("RegDmaBufMR", "pd", &a->pd);
+    struct ibv_mr *obj = ibv_reg_dmabuf_mr(r_pd, rdx_int(env, &a->offset, 0), rdx_int(env, &a->length, 0), rdx_int(env, &a->iova, 0), rdx_int(env, &a->fd, 0), rdx_int(env, &a->access, 0));
+    if (!obj)
+        return rdx_fail("RegDmaBufMR", "ibv_reg_dmabuf_mr", 0);
+    rdx_put(env, "mr", &a->mr, obj);
+    return 0;
+}
+
+static int rdx_exec_RegMR(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_RegMR *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("RegMR", "pd", &a->pd);
+    void *b_addr = rdx_buf(env, &a->addr, rdx_int(env, &a->length, 0));
+    if (!b_addr)
+        return rdx_skip("RegMR", "addr", &a->addr);
+    struct ibv_mr *obj = ibv_reg_mr(r_pd, b_addr, rdx_int(env, &a->length, 0), rdx_int(env, &a->access, 0));
+    if (!obj)
+        return rdx_fail("RegMR", "ibv_reg_mr", 0);
+    rdx_put(env, "mr", &a->mr, obj);
+    return 0;
+}
+
+static int rdx_exec_RegMRIova(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_RegMRIova *a = args;
+    struct ibv_pd *r_pd = rdx_res(env, &a->pd, "pd");
+    if (!r_pd)
+        return rdx_skip("RegMRIova", "pd", &a->pd);
+    void *b_buf = rdx_buf(env, &a->buf, rdx_int(env, &a->length, 0));
+    if (!b_buf)
+        return rdx_skip("RegMRIova", "buf", &a->buf);
+    struct ibv_mr *obj = ibv_reg_mr_iova(r_pd, b_buf, rdx_int(env, &a->length, 0), rdx_int(env, &a->iova, 0), rdx_int(env, &a->access, 0));
+    if (!obj)
+        return rdx_fail("RegMRIova", "ibv_reg_mr_iova", 0);
+    rdx_put(env, "mr", &a->mr, obj);
+    return 0;
+}
+
+static int rdx_exec_ReqNotifyCQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ReqNotifyCQ *a = args;
+    struct ibv_cq *r_cq = rdx_res(env, &a->cq, "cq");
+    if (!r_cq)
+        return rdx_skip("ReqNotifyCQ", "cq", &a->cq);
+    int rc = ibv_req_notify_cq(r_cq, rdx_int(env, &a->solicited_only, 0));
+    if (rc != 0)
+        return rdx_fail("ReqNotifyCQ", "ibv_req_notify_cq", rc);
+    return 0;
+}
+
+static int rdx_exec_ResizeCQ(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_ResizeCQ *a = args;
+    struct ibv_cq *r_cq = rdx_res(env, &a->cq, "cq");
+    if (!r_cq)
+        return rdx_skip("ResizeCQ", "cq", &a->cq);
+    int rc = ibv_resize_cq(r_cq, rdx_int(env, &a->cqe, 0));
+    if (rc != 0)
+        return rdx_fail("ResizeCQ", "ibv_resize_cq", rc);
+    return 0;
+}
+
+static int rdx_exec_SetECE(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_SetECE *a = args;
+    struct ibv_qp *r_qp = rdx_res(env, &a->qp, "qp");
+    if (!r_qp)
+        return rdx_skip("SetECE", "qp", &a->qp);
+    struct ibv_ece *at_ece_obj = rdx_scratch(sizeof(*at_ece_obj));
+    if (!at_ece_obj)
+        return rdx_fail("SetECE", "rdx_scratch", ENOMEM);
+    rdx_fill_IbvECE(env, &a->ece_obj, at_ece_obj);
+    int rc = ibv_set_ece(r_qp, at_ece_obj);
+    if (rc != 0)
+        return rdx_fail("SetECE", "ibv_set_ece", rc);
+    return 0;
+}
+
+static int rdx_exec_WRComplete(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_WRComplete *a = args;
+    struct ibv_qp_ex *r_qp_ex = rdx_res(env, &a->qp_ex, "qp_ex");
+    if (!r_qp_ex)
+        return rdx_skip("WRComplete", "qp_ex", &a->qp_ex);
+    int rc = ibv_wr_complete(r_qp_ex);
+    if (rc != 0)
+        return rdx_fail("WRComplete", "ibv_wr_complete", rc);
+    return 0;
+}
+
+static int rdx_exec_WrStart(const void *args, ResourceEnv *env)
+{
+    const RdxArgs_WrStart *a = args;
+    struct ibv_qp_ex *r_qp_ex = rdx_res(env, &a->qp_ex, "qp_ex");
+    if (!r_qp_ex)
+        return rdx_skip("WrStart", "qp_ex", &a->qp_ex);
+    (void)ibv_wr_start(r_qp_ex);
+    return 0;
+}
+
+const RdxVerbHandler g_rdx_handlers[RDX_VERB_COUNT] = {
+    [RDX_VERB_AbortWR] = rdx_exec_AbortWR,
+    [RDX_VERB_AckCQEvents] = rdx_exec_AckCQEvents,
+    [RDX_VERB_AdviseMR] = rdx_exec_AdviseMR,
+    [RDX_VERB_AllocDM] = rdx_exec_AllocDM,
+    [RDX_VERB_AllocMW] = rdx_exec_AllocMW,
+    [RDX_VERB_AllocNullMR] = rdx_exec_AllocNullMR,
+    [RDX_VERB_AllocPD] = rdx_exec_AllocPD,
+    [RDX_VERB_AllocParentDomain] = rdx_exec_AllocParentDomain,
+    [RDX_VERB_AllocTD] = rdx_exec_AllocTD,
+    [RDX_VERB_AttachMcast] = rdx_exec_AttachMcast,
+    [RDX_VERB_BindMW] = rdx_exec_BindMW,
+    [RDX_VERB_CloseDevice] = rdx_exec_CloseDevice,
+    [RDX_VERB_CloseXRCD] = rdx_exec_CloseXRCD,
+    [RDX_VERB_CreateAH] = rdx_exec_CreateAH,
+    [RDX_VERB_CreateAHFromWC] = rdx_exec_CreateAHFromWC,
+    [RDX_VERB_CreateCQ] = rdx_exec_CreateCQ,
+    [RDX_VERB_CreateCQEx] = rdx_exec_CreateCQEx,
+    [RDX_VERB_CreateCompChannel] = rdx_exec_CreateCompChannel,
+    [RDX_VERB_CreateFlow] = rdx_exec_CreateFlow,
+    [RDX_VERB_CreateQP] = rdx_exec_CreateQP,
+    [RDX_VERB_CreateQPEx] = rdx_exec_CreateQPEx,
+    [RDX_VERB_CreateSRQ] = rdx_exec_CreateSRQ,
+    [RDX_VERB_CreateSRQEx] = rdx_exec_CreateSRQEx,
+    [RDX_VERB_CreateWQ] = rdx_exec_CreateWQ,
+    [RDX_VERB_DeallocMW] = rdx_exec_DeallocMW,
+    [RDX_VERB_DeallocPD] = rdx_exec_DeallocPD,
+    [RDX_VERB_DeallocTD] = rdx_exec_DeallocTD,
+    [RDX_VERB_DeregMR] = rdx_exec_DeregMR,
+    [RDX_VERB_DestroyAH] = rdx_exec_DestroyAH,
+    [RDX_VERB_DestroyCQ] = rdx_exec_DestroyCQ,
+    [RDX_VERB_DestroyCompChannel] = rdx_exec_DestroyCompChannel,
+    [RDX_VERB_DestroyFlow] = rdx_exec_DestroyFlow,
+    [RDX_VERB_DestroyQP] = rdx_exec_DestroyQP,
+    [RDX_VERB_DestroySRQ] = rdx_exec_DestroySRQ,
+    [RDX_VERB_DestroyWQ] = rdx_exec_DestroyWQ,
+    [RDX_VERB_DetachMcast] = rdx_exec_DetachMcast,
+    [RDX_VERB_ForkInit] = rdx_exec_ForkInit,
+    [RDX_VERB_FreeDM] = rdx_exec_FreeDM,
+    [RDX_VERB_FreeDeviceList] = rdx_exec_FreeDeviceList,
+    [RDX_VERB_GetDeviceGUID] = rdx_exec_GetDeviceGUID,
+    [RDX_VERB_GetDeviceIndex] = rdx_exec_GetDeviceIndex,
+    [RDX_VERB_GetDeviceList] = rdx_exec_GetDeviceList,
+    [RDX_VERB_GetDeviceName] = rdx_exec_GetDeviceName,
+    [RDX_VERB_GetPKeyIndex] = rdx_exec_GetPKeyIndex,
+    [RDX_VERB_GetSRQNum] = rdx_exec_GetSRQNum,
+    [RDX_VERB_ImportDM] = rdx_exec_ImportDM,
+    [RDX_VERB_ImportMR] = rdx_exec_ImportMR,
+    [RDX_VERB_ImportPD] = rdx_exec_ImportPD,
+    [RDX_VERB_MemcpyFromDM] = rdx_exec_MemcpyFromDM,
+    [RDX_VERB_MemcpyToDM] = rdx_exec_MemcpyToDM,
+    [RDX_VERB_ModifyCQ] = rdx_exec_ModifyCQ,
+    [RDX_VERB_ModifyQP] = rdx_exec_ModifyQP,
+    [RDX_VERB_ModifyQPRateLimit] = rdx_exec_ModifyQPRateLimit,
+    [RDX_VERB_ModifySRQ] = rdx_exec_ModifySRQ,
+    [RDX_VERB_ModifyWQ] = rdx_exec_ModifyWQ,
+    [RDX_VERB_OpenDevice] = rdx_exec_OpenDevice,
+    [RDX_VERB_OpenQP] = rdx_exec_OpenQP,
+    [RDX_VERB_OpenXRCD] = rdx_exec_OpenXRCD,
+    [RDX_VERB_PollCQ] = rdx_exec_PollCQ,
+    [RDX_VERB_PostRecv] = rdx_exec_PostRecv,
+    [RDX_VERB_PostSRQRecv] = rdx_exec_PostSRQRecv,
+    [RDX_VERB_PostSend] = rdx_exec_PostSend,
+    [RDX_VERB_QueryDeviceAttr] = rdx_exec_QueryDeviceAttr,
+    [RDX_VERB_QueryDeviceEx] = rdx_exec_QueryDeviceEx,
+    [RDX_VERB_QueryECE] = rdx_exec_QueryECE,
+    [RDX_VERB_QueryGID] = rdx_exec_QueryGID,
+    [RDX_VERB_QueryGIDEx] = rdx_exec_QueryGIDEx,
+    [RDX_VERB_QueryGIDTable] = rdx_exec_QueryGIDTable,
+    [RDX_VERB_QueryPKey] = rdx_exec_QueryPKey,
+    [RDX_VERB_QueryPortAttr] = rdx_exec_QueryPortAttr,
+    [RDX_VERB_QueryQP] = rdx_exec_QueryQP,
+    [RDX_VERB_QuerySRQ] = rdx_exec_QuerySRQ,
+    [RDX_VERB_ReRegMR] = rdx_exec_ReRegMR,
+    [RDX_VERB_RegDmaBufMR] = rdx_exec_RegDmaBufMR,
+    [RDX_VERB_RegMR] = rdx_exec_RegMR,
+    [RDX_VERB_RegMRIova] = rdx_exec_RegMRIova,
+    [RDX_VERB_ReqNotifyCQ] = rdx_exec_ReqNotifyCQ,
+    [RDX_VERB_ResizeCQ] = rdx_exec_ResizeCQ,
+    [RDX_VERB_SetECE] = rdx_exec_SetECE,
+    [RDX_VERB_WRComplete] = rdx_exec_WRComplete,
+    [RDX_VERB_WrStart] = rdx_exec_WrStart,
+};
+
+/* 手写的 handler（读 program JSON），没有的为 NULL，走上面生成的 */
+const VerbHandler g_rdx_json_handlers[RDX_VERB_COUNT] = {
+    [RDX_VERB_AbortWR] = NULL,
+    [RDX_VERB_AckCQEvents] = NULL,
+    [RDX_VERB_AdviseMR] = NULL,
+    [RDX_VERB_AllocDM] = handle_AllocDM,
+    [RDX_VERB_AllocMW] = handle_AllocMW,
+    [RDX_VERB_AllocNullMR] = handle_AllocNullMR,
+    [RDX_VERB_AllocPD] = handle_AllocPD,
+    [RDX_VERB_AllocParentDomain] = NULL,
+    [RDX_VERB_AllocTD] = handle_AllocTD,
+    [RDX_VERB_AttachMcast] = NULL,
+    [RDX_VERB_BindMW] = handle_BindMW,
+    [RDX_VERB_CloseDevice] = NULL,
+    [RDX_VERB_CloseXRCD] = NULL,
+    [RDX_VERB_CreateAH] = NULL,
+    [RDX_VERB_CreateAHFromWC] = NULL,
+    [RDX_VERB_CreateCQ] = handle_CreateCQ,
+    [RDX_VERB_CreateCQEx] = handle_CreateCQEx,
+    [RDX_VERB_CreateCompChannel] = NULL,
+    [RDX_VERB_CreateFlow] = handle_CreateFlow,
+    [RDX_VERB_CreateQP] = handle_CreateQP,
+    [RDX_VERB_CreateQPEx] = handle_CreateQPEx,
+    [RDX_VERB_CreateSRQ] = handle_CreateSRQ,
+    [RDX_VERB_CreateSRQEx] = NULL,
+    [RDX_VERB_CreateWQ] = NULL,
+    [RDX_VERB_DeallocMW] = handle_DeallocMW,
+    [RDX_VERB_DeallocPD] = handle_DeallocPD,
+    [RDX_VERB_DeallocTD] = NULL,
+    [RDX_VERB_DeregMR] = handle_DeregMR,
+    [RDX_VERB_DestroyAH] = NULL,
+    [RDX_VERB_DestroyCQ] = handle_DestroyCQ,
+    [RDX_VERB_DestroyCompChannel] = NULL,
+    [RDX_VERB_DestroyFlow] = NULL,
+    [RDX_VERB_DestroyQP] = handle_DestroyQP,
+    [RDX_VERB_DestroySRQ] = handle_DestroySRQ,
+    [RDX_VERB_DestroyWQ] = NULL,
+    [RDX_VERB_DetachMcast] = NULL,
+    [RDX_VERB_ForkInit] = NULL,
+    [RDX_VERB_FreeDM] = handle_FreeDM,
+    [RDX_VERB_FreeDeviceList] = NULL,
+    [RDX_VERB_GetDeviceGUID] = NULL,
+    [RDX_VERB_GetDeviceIndex] = NULL,
+    [RDX_VERB_GetDeviceList] = NULL,
+    [RDX_VERB_GetDeviceName] = NULL,
+    [RDX_VERB_GetPKeyIndex] = NULL,
+    [RDX_VERB_GetSRQNum] = NULL,
+    [RDX_VERB_ImportDM] = NULL,
+    [RDX_VERB_ImportMR] = NULL,
+    [RDX_VERB_ImportPD] = NULL,
+    [RDX_VERB_MemcpyFromDM] = NULL,
+    [RDX_VERB_MemcpyToDM] = NULL,
+    [RDX_VERB_ModifyCQ] = handle_ModifyCQ,
+    [RDX_VERB_ModifyQP] = handle_ModifyQP,
+    [RDX_VERB_ModifyQPRateLimit] = NULL,
+    [RDX_VERB_ModifySRQ] = handle_ModifySRQ,
+    [RDX_VERB_ModifyWQ] = NULL,
+    [RDX_VERB_OpenDevice] = NULL,
+    [RDX_VERB_OpenQP] = NULL,
+    [RDX_VERB_OpenXRCD] = NULL,
+    [RDX_VERB_PollCQ] = handle_PollCQ,
+    [RDX_VERB_PostRecv] = handle_PostRecv,
+    [RDX_VERB_PostSRQRecv] = NULL,
+    [RDX_VERB_PostSend] = handle_PostSend,
+    [RDX_VERB_QueryDeviceAttr] = NULL,
+    [RDX_VERB_QueryDeviceEx] = NULL,
+    [RDX_VERB_QueryECE] = NULL,
+    [RDX_VERB_QueryGID] = NULL,
+    [RDX_VERB_QueryGIDEx] = NULL,
+    [RDX_VERB_QueryGIDTable] = NULL,
+    [RDX_VERB_QueryPKey] = NULL,
+    [RDX_VERB_QueryPortAttr] = NULL,
+    [RDX_VERB_QueryQP] = NULL,
+    [RDX_VERB_QuerySRQ] = NULL,
+    [RDX_VERB_ReRegMR] = NULL,
+    [RDX_VERB_RegDmaBufMR] = NULL,
+    [RDX_VERB_RegMR] = handle_RegMR,
+    [RDX_VERB_RegMRIova] = NULL,
+    [RDX_VERB_ReqNotifyCQ] = NULL,
+    [RDX_VERB_ResizeCQ] = NULL,
+    [RDX_VERB_SetECE] = NULL,
+    [RDX_VERB_WRComplete] = NULL,
+    [RDX_VERB_WrStart] = NULL,
+};
+
+static int cmp_verb_name(const void *key, const void *elem)
+{
+    return strcmp((const char *)key, ((const RdxClassSchema *)elem)->name);
+}
+
+int rdx_verb_id(const char *name)
+{
+    if (!name)
+        return -1;
+    const RdxClassSchema *hit =
+        bsearch(name, g_rdx_classes, RDX_VERB_COUNT, sizeof(g_rdx_classes[0]), cmp_verb_name);
+    return hit ? (int)(hit - g_rdx_classes) : -1;
+}
+
+static int cmp_const_name(const void *key, const void *elem)
+{
+    return strcmp((const char *)key, ((const RdxConst *)elem)->name);
+}
+
+int rdx_const(const char *name, int64_t *out)
+{
+    const RdxConst *hit = name ? bsearch(name, g_rdx_consts, RDX_CONST_COUNT, sizeof(g_rdx_consts[0]),
+                                         cmp_const_name)
+                               : NULL;
+    if (!hit)
+        return -1;
+    *out = hit->value;
+    return 0;
+}
@@ -0,0 +1,1028 @@
+/* Auto-generated by lib/exec_schema.py from VerbCall / Attr EXPORT_FIELDS; do not edit manually. */
+#pragma once
+#include <stddef.h>
+#include <stdint.h>
+#include "program_bin.h"
+#include "verb_args.h"
+#include "verb_dispatch.h"
+
+#define RDX_SCHEMA_HASH 0x0da725c7u
+#define RDX_BIN_VERSION 1
+#define RDX_VERB_COUNT 81
+#define RDX_CLASS_COUNT 117
+#define RDX_VALUE_TYPE_COUNT 11
+#define RDX_CONST_COUNT 126
+
+/* 值编码的 tag */
+enum
+{
+    RDX_TAG_NULL = 0,
+    RDX_TAG_FALSE = 1,
+    RDX_TAG_TRUE = 2,
+    RDX_TAG_INT = 3,
+    RDX_TAG_FLOAT = 4,
+    RDX_TAG_STR = 5,
+    RDX_TAG_LIST = 6,
+    RDX_TAG_OBJ = 7,
+    RDX_TAG_TYPED = 8,
+    RDX_TAG_SCHEMA = 9,
+};
+
+/* 类编号：[0, RDX_VERB_COUNT) 为 verb id，其后为 attr */
+enum
+{
+    RDX_VERB_AbortWR = 0,
+    RDX_VERB_AckCQEvents = 1,
+    RDX_VERB_AdviseMR = 2,
+    RDX_VERB_AllocDM = 3,
+    RDX_VERB_AllocMW = 4,
+    RDX_VERB_AllocNullMR = 5,
+    RDX_VERB_AllocPD = 6,
+    RDX_VERB_AllocParentDomain = 7,
+    RDX_VERB_AllocTD = 8,
+    RDX_VERB_AttachMcast = 9,
+    RDX_VERB_BindMW = 10,
+    RDX_VERB_CloseDevice = 11,
+    RDX_VERB_CloseXRCD = 12,
+    RDX_VERB_CreateAH = 13,
+    RDX_VERB_CreateAHFromWC = 14,
+    RDX_VERB_CreateCQ = 15,
+    RDX_VERB_CreateCQEx = 16,
+    RDX_VERB_CreateCompChannel = 17,
+    RDX_VERB_CreateFlow = 18,
+    RDX_VERB_CreateQP = 19,
+    RDX_VERB_CreateQPEx = 20,
+    RDX_VERB_CreateSRQ = 21,
+    RDX_VERB_CreateSRQEx = 22,
+    RDX_VERB_CreateWQ = 23,
+    RDX_VERB_DeallocMW = 24,
+    RDX_VERB_DeallocPD = 25,
+    RDX_VERB_DeallocTD = 26,
+    RDX_VERB_DeregMR = 27,
+    RDX_VERB_DestroyAH = 28,
+    RDX_VERB_DestroyCQ = 29,
+    RDX_VERB_DestroyCompChannel = 30,
+    RDX_VERB_DestroyFlow = 31,
+    RDX_VERB_DestroyQP = 32,
+    RDX_VERB_DestroySRQ = 33,
+    RDX_VERB_DestroyWQ = 34,
+    RDX_VERB_DetachMcast = 35,
+    RDX_VERB_ForkInit = 36,
+    RDX_VERB_FreeDM = 37,
+    RDX_VERB_FreeDeviceList = 38,
+    RDX_VERB_GetDeviceGUID = 39,
+    RDX_VERB_GetDeviceIndex = 40,
+    RDX_VERB_GetDeviceList = 41,
+    RDX_VERB_GetDeviceName = 42,
+    RDX_VERB_GetPKeyIndex = 43,
+    RDX_VERB_GetSRQNum = 44,
+    RDX_VERB_ImportDM = 45,
+    RDX_VERB_ImportMR = 46,
+    RDX_VERB_ImportPD = 47,
+    RDX_VERB_MemcpyFromDM = 48,
+    RDX_VERB_MemcpyToDM = 49,
+    RDX_VERB_ModifyCQ = 50,
+    RDX_VERB_ModifyQP = 51,
+    RDX_VERB_ModifyQPRateLimit = 52,
+    RDX_VERB_ModifySRQ = 53,
+    RDX_VERB_ModifyWQ = 54,
+    RDX_VERB_OpenDevice = 55,
+    RDX_VERB_OpenQP = 56,
+    RDX_VERB_OpenXRCD = 57,
+    RDX_VERB_PollCQ = 58,
+    RDX_VERB_PostRecv = 59,
+    RDX_VERB_PostSRQRecv = 60,
+    RDX_VERB_PostSend = 61,
+    RDX_VERB_QueryDeviceAttr = 62,
+    RDX_VERB_QueryDeviceEx = 63,
+    RDX_VERB_QueryECE = 64,
+    RDX_VERB_QueryGID = 65,
+    RDX_VERB_QueryGIDEx = 66,
+    RDX_VERB_QueryGIDTable = 67,
+    RDX_VERB_QueryPKey = 68,
+    RDX_VERB_QueryPortAttr = 69,
+    RDX_VERB_QueryQP = 70,
+    RDX_VERB_QuerySRQ = 71,
+    RDX_VERB_ReRegMR = 72,
+    RDX_VERB_RegDmaBufMR = 73,
+    RDX_VERB_RegMR = 74,
+    RDX_VERB_RegMRIova = 75,
+    RDX_VERB_ReqNotifyCQ = 76,
+    RDX_VERB_ResizeCQ = 77,
+    RDX_VERB_SetECE = 78,
+    RDX_VERB_WRComplete = 79,
+    RDX_VERB_WrStart = 80,
+    RDX_ATTR_IbvAHAttr = 81,
+    RDX_ATTR_IbvAllocDmAttr = 82,
+    RDX_ATTR_IbvAtomicInfo = 83,
+    RDX_ATTR_IbvBindMwInfo = 84,
+    RDX_ATTR_IbvCQInitAttrEx = 85,
+    RDX_ATTR_IbvECE = 86,
+    RDX_ATTR_IbvFlowAttr = 87,
+    RDX_ATTR_IbvGID = 88,
+    RDX_ATTR_IbvGlobalRoute = 89,
+    RDX_ATTR_IbvModerateCQ = 90,
+    RDX_ATTR_IbvModifyCQAttr = 91,
+    RDX_ATTR_IbvMwBind = 92,
+    RDX_ATTR_IbvMwBindInfo = 93,
+    RDX_ATTR_IbvParentDomainInitAttr = 94,
+    RDX_ATTR_IbvQPAttr = 95,
+    RDX_ATTR_IbvQPCap = 96,
+    RDX_ATTR_IbvQPInitAttr = 97,
+    RDX_ATTR_IbvQPInitAttrEx = 98,
+    RDX_ATTR_IbvQPOpenAttr = 99,
+    RDX_ATTR_IbvQPRateLimitAttr = 100,
+    RDX_ATTR_IbvRdmaInfo = 101,
+    RDX_ATTR_IbvRecvWR = 102,
+    RDX_ATTR_IbvRxHashConf = 103,
+    RDX_ATTR_IbvSendWR = 104,
+    RDX_ATTR_IbvSge = 105,
+    RDX_ATTR_IbvSrqAttr = 106,
+    RDX_ATTR_IbvSrqInitAttr = 107,
+    RDX_ATTR_IbvSrqInitAttrEx = 108,
+    RDX_ATTR_IbvTMCap = 109,
+    RDX_ATTR_IbvTdInitAttr = 110,
+    RDX_ATTR_IbvTsoInfo = 111,
+    RDX_ATTR_IbvUdInfo = 112,
+    RDX_ATTR_IbvWQAttr = 113,
+    RDX_ATTR_IbvWQInitAttr = 114,
+    RDX_ATTR_IbvXRCDInitAttr = 115,
+    RDX_ATTR_IbvXrcInfo = 116,
+};
+
+/* 每个类的参数：成员与 EXPORT_FIELDS 一一对应，程序里没给出的字段 set == 0 */
+typedef struct
+{
+    RdxArg qp_ex;
+} RdxArgs_AbortWR;
+
+typedef struct
+{
+    RdxArg cq;
+    RdxArg nevents;
+} RdxArgs_AckCQEvents;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg advice;
+    RdxArg flags;
+    RdxArg sg_list;
+    RdxArg num_sge;
+} RdxArgs_AdviseMR;
+
+typedef struct
+{
+    RdxArg dm;
+    RdxArg attr_obj;
+} RdxArgs_AllocDM;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg mw;
+    RdxArg mw_type;
+} RdxArgs_AllocMW;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg mr;
+} RdxArgs_AllocNullMR;
+
+typedef struct
+{
+    RdxArg pd;
+} RdxArgs_AllocPD;
+
+typedef struct
+{
+    RdxArg context;
+    RdxArg pd;
+    RdxArg parent_pd;
+    RdxArg attr_obj;
+} RdxArgs_AllocParentDomain;
+
+typedef struct
+{
+    RdxArg td;
+    RdxArg attr_obj;
+} RdxArgs_AllocTD;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg gid;
+    RdxArg lid;
+} RdxArgs_AttachMcast;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg mw;
+    RdxArg mw_bind_obj;
+} RdxArgs_BindMW;
+
+typedef struct
+{
+    char unused;
+} RdxArgs_CloseDevice;
+
+typedef struct
+{
+    RdxArg xrcd;
+} RdxArgs_CloseXRCD;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg ah;
+    RdxArg attr_obj;
+} RdxArgs_CreateAH;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg wc;
+    RdxArg grh;
+    RdxArg port_num;
+    RdxArg ah;
+} RdxArgs_CreateAHFromWC;
+
+typedef struct
+{
+    RdxArg cqe;
+    RdxArg cq_context;
+    RdxArg channel;
+    RdxArg comp_vector;
+    RdxArg cq;
+} RdxArgs_CreateCQ;
+
+typedef struct
+{
+    RdxArg cq_ex;
+    RdxArg cq_attr_obj;
+} RdxArgs_CreateCQEx;
+
+typedef struct
+{
+    RdxArg channel;
+} RdxArgs_CreateCompChannel;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg flow;
+    RdxArg flow_attr_obj;
+} RdxArgs_CreateFlow;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg qp;
+    RdxArg init_attr_obj;
+    RdxArg remote_qp;
+} RdxArgs_CreateQP;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg qp_attr_obj;
+} RdxArgs_CreateQPEx;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg srq;
+    RdxArg srq_init_obj;
+} RdxArgs_CreateSRQ;
+
+typedef struct
+{
+    RdxArg srq;
+    RdxArg srq_attr_obj;
+} RdxArgs_CreateSRQEx;
+
+typedef struct
+{
+    RdxArg wq;
+    RdxArg wq_attr_obj;
+} RdxArgs_CreateWQ;
+
+typedef struct
+{
+    RdxArg mw;
+} RdxArgs_DeallocMW;
+
+typedef struct
+{
+    RdxArg pd;
+} RdxArgs_DeallocPD;
+
+typedef struct
+{
+    RdxArg td;
+} RdxArgs_DeallocTD;
+
+typedef struct
+{
+    RdxArg mr;
+} RdxArgs_DeregMR;
+
+typedef struct
+{
+    RdxArg ah;
+} RdxArgs_DestroyAH;
+
+typedef struct
+{
+    RdxArg cq;
+} RdxArgs_DestroyCQ;
+
+typedef struct
+{
+    RdxArg channel;
+} RdxArgs_DestroyCompChannel;
+
+typedef struct
+{
+    RdxArg flow;
+} RdxArgs_DestroyFlow;
+
+typedef struct
+{
+    RdxArg qp;
+} RdxArgs_DestroyQP;
+
+typedef struct
+{
+    RdxArg srq;
+} RdxArgs_DestroySRQ;
+
+typedef struct
+{
+    RdxArg wq;
+} RdxArgs_DestroyWQ;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg gid;
+    RdxArg lid;
+} RdxArgs_DetachMcast;
+
+typedef struct
+{
+    char unused;
+} RdxArgs_ForkInit;
+
+typedef struct
+{
+    RdxArg dm;
+} RdxArgs_FreeDM;
+
+typedef struct
+{
+    char unused;
+} RdxArgs_FreeDeviceList;
+
+typedef struct
+{
+    RdxArg device;
+    RdxArg output;
+} RdxArgs_GetDeviceGUID;
+
+typedef struct
+{
+    RdxArg device_name;
+    RdxArg output;
+} RdxArgs_GetDeviceIndex;
+
+typedef struct
+{
+    char unused;
+} RdxArgs_GetDeviceList;
+
+typedef struct
+{
+    RdxArg device;
+    RdxArg output;
+} RdxArgs_GetDeviceName;
+
+typedef struct
+{
+    RdxArg port_num;
+    RdxArg pkey;
+    RdxArg output;
+} RdxArgs_GetPKeyIndex;
+
+typedef struct
+{
+    RdxArg srq;
+} RdxArgs_GetSRQNum;
+
+typedef struct
+{
+    RdxArg dm_handle;
+    RdxArg dm;
+} RdxArgs_ImportDM;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg mr_handle;
+    RdxArg mr;
+} RdxArgs_ImportMR;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg pd_handle;
+} RdxArgs_ImportPD;
+
+typedef struct
+{
+    RdxArg host;
+    RdxArg dm;
+    RdxArg dm_offset;
+    RdxArg length;
+} RdxArgs_MemcpyFromDM;
+
+typedef struct
+{
+    RdxArg dm;
+    RdxArg dm_offset;
+    RdxArg host;
+    RdxArg length;
+} RdxArgs_MemcpyToDM;
+
+typedef struct
+{
+    RdxArg cq;
+    RdxArg attr_obj;
+} RdxArgs_ModifyCQ;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg attr_obj;
+    RdxArg attr_mask;
+} RdxArgs_ModifyQP;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg attr_obj;
+} RdxArgs_ModifyQPRateLimit;
+
+typedef struct
+{
+    RdxArg srq;
+    RdxArg attr_obj;
+    RdxArg attr_mask;
+} RdxArgs_ModifySRQ;
+
+typedef struct
+{
+    RdxArg wq;
+    RdxArg attr_obj;
+} RdxArgs_ModifyWQ;
+
+typedef struct
+{
+    RdxArg device;
+} RdxArgs_OpenDevice;
+
+typedef struct
+{
+    RdxArg ctx_var;
+    RdxArg qp;
+    RdxArg attr_var;
+    RdxArg attr_obj;
+} RdxArgs_OpenQP;
+
+typedef struct
+{
+    RdxArg ctx_var;
+    RdxArg xrcd;
+    RdxArg attr_var;
+    RdxArg attr_obj;
+} RdxArgs_OpenXRCD;
+
+typedef struct
+{
+    RdxArg cq;
+} RdxArgs_PollCQ;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg wr_obj;
+    RdxArg wr_var;
+    RdxArg bad_wr_var;
+} RdxArgs_PostRecv;
+
+typedef struct
+{
+    RdxArg srq;
+    RdxArg wr_obj;
+    RdxArg wr_var;
+    RdxArg bad_wr_var;
+} RdxArgs_PostSRQRecv;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg wr_obj;
+} RdxArgs_PostSend;
+
+typedef struct
+{
+    RdxArg output;
+} RdxArgs_QueryDeviceAttr;
+
+typedef struct
+{
+    RdxArg ctx_var;
+    RdxArg attr_var;
+    RdxArg comp_mask;
+    RdxArg input_var;
+} RdxArgs_QueryDeviceEx;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg output;
+} RdxArgs_QueryECE;
+
+typedef struct
+{
+    RdxArg port_num;
+    RdxArg index;
+} RdxArgs_QueryGID;
+
+typedef struct
+{
+    RdxArg port_num;
+    RdxArg gid_index;
+    RdxArg flags;
+    RdxArg output;
+} RdxArgs_QueryGIDEx;
+
+typedef struct
+{
+    RdxArg max_entries;
+    RdxArg output;
+} RdxArgs_QueryGIDTable;
+
+typedef struct
+{
+    RdxArg port_num;
+    RdxArg index;
+    RdxArg pkey;
+} RdxArgs_QueryPKey;
+
+typedef struct
+{
+    RdxArg port_num;
+    RdxArg port_attr;
+} RdxArgs_QueryPortAttr;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg attr_mask;
+} RdxArgs_QueryQP;
+
+typedef struct
+{
+    RdxArg srq;
+} RdxArgs_QuerySRQ;
+
+typedef struct
+{
+    RdxArg mr;
+    RdxArg flags;
+    RdxArg pd;
+    RdxArg addr;
+    RdxArg length;
+    RdxArg access;
+} RdxArgs_ReRegMR;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg mr;
+    RdxArg offset;
+    RdxArg length;
+    RdxArg iova;
+    RdxArg fd;
+    RdxArg access;
+} RdxArgs_RegDmaBufMR;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg mr;
+    RdxArg addr;
+    RdxArg length;
+    RdxArg access;
+} RdxArgs_RegMR;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg mr;
+    RdxArg buf;
+    RdxArg length;
+    RdxArg iova;
+    RdxArg access;
+} RdxArgs_RegMRIova;
+
+typedef struct
+{
+    RdxArg cq;
+    RdxArg solicited_only;
+} RdxArgs_ReqNotifyCQ;
+
+typedef struct
+{
+    RdxArg cq;
+    RdxArg cqe;
+} RdxArgs_ResizeCQ;
+
+typedef struct
+{
+    RdxArg qp;
+    RdxArg ece_obj;
+    RdxArg ece_var;
+} RdxArgs_SetECE;
+
+typedef struct
+{
+    RdxArg qp_ex;
+} RdxArgs_WRComplete;
+
+typedef struct
+{
+    RdxArg qp_ex;
+} RdxArgs_WrStart;
+
+typedef struct
+{
+    RdxArg grh;
+    RdxArg dlid;
+    RdxArg sl;
+    RdxArg src_path_bits;
+    RdxArg static_rate;
+    RdxArg is_global;
+    RdxArg port_num;
+} RdxArgs_IbvAHAttr;
+
+typedef struct
+{
+    RdxArg length;
+    RdxArg log_align_req;
+    RdxArg comp_mask;
+} RdxArgs_IbvAllocDmAttr;
+
+typedef struct
+{
+    RdxArg remote_addr;
+    RdxArg compare_add;
+    RdxArg swap;
+    RdxArg rkey;
+} RdxArgs_IbvAtomicInfo;
+
+typedef struct
+{
+    RdxArg mw;
+    RdxArg rkey;
+    RdxArg bind_info;
+} RdxArgs_IbvBindMwInfo;
+
+typedef struct
+{
+    RdxArg cqe;
+    RdxArg cq_context;
+    RdxArg channel;
+    RdxArg comp_vector;
+    RdxArg wc_flags;
+    RdxArg comp_mask;
+    RdxArg flags;
+    RdxArg parent_domain;
+} RdxArgs_IbvCQInitAttrEx;
+
+typedef struct
+{
+    RdxArg vendor_id;
+    RdxArg options;
+    RdxArg comp_mask;
+} RdxArgs_IbvECE;
+
+typedef struct
+{
+    RdxArg comp_mask;
+    RdxArg type;
+    RdxArg size;
+    RdxArg priority;
+    RdxArg num_of_specs;
+    RdxArg port;
+    RdxArg flags;
+} RdxArgs_IbvFlowAttr;
+
+typedef struct
+{
+    RdxArg raw;
+    RdxArg src_var;
+} RdxArgs_IbvGID;
+
+typedef struct
+{
+    RdxArg dgid;
+    RdxArg flow_label;
+    RdxArg sgid_index;
+    RdxArg hop_limit;
+    RdxArg traffic_class;
+} RdxArgs_IbvGlobalRoute;
+
+typedef struct
+{
+    RdxArg cq_count;
+    RdxArg cq_period;
+} RdxArgs_IbvModerateCQ;
+
+typedef struct
+{
+    RdxArg attr_mask;
+    RdxArg moderate;
+} RdxArgs_IbvModifyCQAttr;
+
+typedef struct
+{
+    RdxArg wr_id;
+    RdxArg send_flags;
+    RdxArg bind_info;
+} RdxArgs_IbvMwBind;
+
+typedef struct
+{
+    RdxArg mr;
+    RdxArg addr;
+    RdxArg length;
+    RdxArg mw_access_flags;
+} RdxArgs_IbvMwBindInfo;
+
+typedef struct
+{
+    RdxArg pd;
+    RdxArg td;
+    RdxArg comp_mask;
+    RdxArg alloc;
+    RdxArg free;
+    RdxArg pd_context;
+} RdxArgs_IbvParentDomainInitAttr;
+
+typedef struct
+{
+    RdxArg qp_state;
+    RdxArg cur_qp_state;
+    RdxArg path_mtu;
+    RdxArg path_mig_state;
+    RdxArg qkey;
+    RdxArg rq_psn;
+    RdxArg sq_psn;
+    RdxArg dest_qp_num;
+    RdxArg qp_access_flags;
+    RdxArg cap;
+    RdxArg ah_attr;
+    RdxArg alt_ah_attr;
+    RdxArg pkey_index;
+    RdxArg alt_pkey_index;
+    RdxArg en_sqd_async_notify;
+    RdxArg sq_draining;
+    RdxArg max_rd_atomic;
+    RdxArg max_dest_rd_atomic;
+    RdxArg min_rnr_timer;
+    RdxArg port_num;
+    RdxArg timeout;
+    RdxArg retry_cnt;
+    RdxArg rnr_retry;
+    RdxArg alt_port_num;
+    RdxArg alt_timeout;
+    RdxArg rate_limit;
+} RdxArgs_IbvQPAttr;
+
+typedef struct
+{
+    RdxArg max_send_wr;
+    RdxArg max_recv_wr;
+    RdxArg max_send_sge;
+    RdxArg max_recv_sge;
+    RdxArg max_inline_data;
+} RdxArgs_IbvQPCap;
+
+typedef struct
+{
+    RdxArg qp_context;
+    RdxArg send_cq;
+    RdxArg recv_cq;
+    RdxArg srq;
+    RdxArg cap;
+    RdxArg qp_type;
+    RdxArg sq_sig_all;
+} RdxArgs_IbvQPInitAttr;
+
+typedef struct
+{
+    RdxArg qp_context;
+    RdxArg send_cq;
+    RdxArg recv_cq;
+    RdxArg srq;
+    RdxArg cap;
+    RdxArg qp_type;
+    RdxArg sq_sig_all;
+    RdxArg comp_mask;
+    RdxArg pd;
+    RdxArg xrcd;
+    RdxArg create_flags;
+    RdxArg max_tso_header;
+    RdxArg rwq_ind_tbl;
+    RdxArg rx_hash_conf;
+    RdxArg source_qpn;
+    RdxArg send_ops_flags;
+} RdxArgs_IbvQPInitAttrEx;
+
+typedef struct
+{
+    RdxArg comp_mask;
+    RdxArg qp_num;
+    RdxArg xrcd;
+    RdxArg qp_context;
+    RdxArg qp_type;
+} RdxArgs_IbvQPOpenAttr;
+
+typedef struct
+{
+    RdxArg rate_limit;
+    RdxArg max_burst_sz;
+    RdxArg typical_pkt_sz;
+    RdxArg comp_mask;
+} RdxArgs_IbvQPRateLimitAttr;
+
+typedef struct
+{
+    RdxArg remote_addr;
+    RdxArg rkey;
+} RdxArgs_IbvRdmaInfo;
+
+typedef struct
+{
+    RdxArg wr_id;
+    RdxArg next;
+    RdxArg sg_list;
+    RdxArg num_sge;
+} RdxArgs_IbvRecvWR;
+
+typedef struct
+{
+    RdxArg rx_hash_function;
+    RdxArg rx_hash_key_len;
+    RdxArg rx_hash_key;
+    RdxArg rx_hash_fields_mask;
+} RdxArgs_IbvRxHashConf;
+
+typedef struct
+{
+    RdxArg wr_id;
+    RdxArg next;
+    RdxArg sg_list;
+    RdxArg num_sge;
+    RdxArg opcode;
+    RdxArg send_flags;
+    RdxArg imm_data;
+    RdxArg invalidate_rkey;
+    RdxArg rdma;
+    RdxArg atomic;
+    RdxArg ud;
+    RdxArg xrc;
+    RdxArg bind_mw;
+    RdxArg tso;
+} RdxArgs_IbvSendWR;
+
+typedef struct
+{
+    RdxArg addr;
+    RdxArg length;
+    RdxArg lkey;
+} RdxArgs_IbvSge;
+
+typedef struct
+{
+    RdxArg max_wr;
+    RdxArg max_sge;
+    RdxArg srq_limit;
+} RdxArgs_IbvSrqAttr;
+
+typedef struct
+{
+    RdxArg srq_context;
+    RdxArg attr;
+} RdxArgs_IbvSrqInitAttr;
+
+typedef struct
+{
+    RdxArg srq_context;
+    RdxArg attr;
+    RdxArg comp_mask;
+    RdxArg srq_type;
+    RdxArg pd;
+    RdxArg xrcd;
+    RdxArg cq;
+    RdxArg tm_cap;
+} RdxArgs_IbvSrqInitAttrEx;
+
+typedef struct
+{
+    RdxArg max_num_tags;
+    RdxArg max_ops;
+} RdxArgs_IbvTMCap;
+
+typedef struct
+{
+    RdxArg comp_mask;
+} RdxArgs_IbvTdInitAttr;
+
+typedef struct
+{
+    RdxArg hdr;
+    RdxArg hdr_sz;
+    RdxArg mss;
+} RdxArgs_IbvTsoInfo;
+
+typedef struct
+{
+    RdxArg ah;
+    RdxArg remote_qpn;
+    RdxArg remote_qkey;
+} RdxArgs_IbvUdInfo;
+
+typedef struct
+{
+    RdxArg attr_mask;
+    RdxArg wq_state;
+    RdxArg curr_wq_state;
+    RdxArg flags;
+    RdxArg flags_mask;
+} RdxArgs_IbvWQAttr;
+
+typedef struct
+{
+    RdxArg wq_context;
+    RdxArg wq_type;
+    RdxArg max_wr;
+    RdxArg max_sge;
+    RdxArg pd;
+    RdxArg cq;
+    RdxArg comp_mask;
+    RdxArg create_flags;
+} RdxArgs_IbvWQInitAttr;
+
+typedef struct
+{
+    RdxArg comp_mask;
+    RdxArg fd;
+    RdxArg oflags;
+} RdxArgs_IbvXRCDInitAttr;
+
+typedef struct
+{
+    char unused;
+} RdxArgs_IbvXrcInfo;
+
+typedef struct
+{
+    const char *name;
+    uint8_t nfields;
+    const char *const *fields; // EXPORT_FIELDS 顺序
+    size_t args_size;          // sizeof(RdxArgs_<name>)
+    int (*decode)(RdxReader *r, void *args);
+    int (*from_json)(RdxArena *ar, const cJSON *obj, void *args);
+} RdxClassSchema;
+
+typedef struct
+{
+    const char *name;
+    int64_t value;
+} RdxConst;
+
+extern const RdxClassSchema g_rdx_classes[RDX_CLASS_COUNT];
+extern const char *const g_rdx_value_types[RDX_VALUE_TYPE_COUNT];
+extern const RdxConst g_rdx_consts[RDX_CONST_COUNT];
+extern const RdxVerbHandler g_rdx_handlers[RDX_VERB_COUNT];
+extern const VerbHandler g_rdx_json_handlers[RDX_VERB_COUNT];
+
+// verb 名 -> verb id（二分查找），未知返回 -1
+int rdx_verb_id(const char *name);
+// EnumValue / FlagValue 里的常量名 -> 值，找到返回 0
+int rdx_const(const char *name, int64_t *out);
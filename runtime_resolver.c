@@ -8,8 +8,16 @@
 #include <ctype.h>
 #include <cjson/cJSON.h>
 #include <arpa/inet.h>
+#include "view_shm.h"
 static cJSON *g_root = NULL;
 
+// RDMA_FUZZ_VIEW_SHM=1 且 <path>.shm 可用时，视图来自 coordinator 写的二进制快照（见 view_shm.h），
+// 查找走哈希表，不解析 JSON；否则照旧用 cJSON。
+static RrShmMap g_shm = {-1, NULL, 0, {0}};
+static RrShmSnap g_snap;
+static int g_use_shm = 0;
+static char g_view_path[512];
+
 int parse_gid_str(const char *s, union ibv_gid *out)
 {
     // 尝试 inet_pton(AF_INET6)
@@ -78,9 +86,50 @@ static char *rr_slurp(const char *path, long *out_sz)
 //     free(text);
 // }
 
+static void rr_release_view(void)
+{
+    if (g_root)
+    {
+        cJSON_Delete(g_root);
+        g_root = NULL;
+    }
+    rr_shm_snap_free(&g_snap);
+    g_use_shm = 0;
+}
+
+// 从 <path>.shm 拿一份快照；成功返回 0。映射跨多次加载保留，只有路径变了才重新打开
+static int rr_load_shm(const char *path)
+{
+    const char *on = getenv("RDMA_FUZZ_VIEW_SHM");
+    if (!on || strcmp(on, "1") != 0)
+        return -1;
+    char shm_path[512];
+    if (snprintf(shm_path, sizeof(shm_path), "%s.shm", path) >= (int)sizeof(shm_path))
+        return -1;
+    if (g_shm.base && strcmp(g_shm.path, shm_path) != 0)
+        rr_shm_close(&g_shm);
+    if (!g_shm.base && rr_shm_open(&g_shm, shm_path) != 0)
+        return -1;
+    RrShmSnap snap;
+    if (rr_shm_snapshot(&g_shm, &snap) != 0)
+    {
+        rr_shm_close(&g_shm);
+        return -1;
+    }
+    rr_release_view();
+    g_snap = snap;
+    g_use_shm = 1;
+    strncpy(g_view_path, path, sizeof(g_view_path) - 1);
+    g_view_path[sizeof(g_view_path) - 1] = 0;
+    return 0;
+}
+
 // 替换 rr_load_json_or_die()：解析成功后先删旧树再换新树
 void rr_load_json_or_die(const char *path)
 {
+    if (rr_load_shm(path) == 0)
+        return;
+
     long sz = 0;
     char *text = rr_slurp(path, &sz);
     if (!text)
@@ -101,7 +150,7 @@ void rr_load_json_or_die(const char *path)
     free(text);
 
     // 关键：先删旧树，再切换
-    rr_free();
+    rr_release_view();
     g_root = new_root;
 }
 
@@ -260,14 +309,41 @@ static cJSON *rr_walk_path(const char *key)
     return cur;
 }
 
+// shm 模式的查找：键规范化成 coordinator 写入的形式（"QP.[0]" -> "QP[0]"）后探测一次
+static const RrShmEntry *rr_shm_lookup(const char *key)
+{
+    char norm[512];
+    size_t j = 0;
+    for (const char *p = key; *p && j < sizeof(norm) - 1; ++p)
+    {
+        if (p[0] == '.' && p[1] == '[')
+            continue;
+        norm[j++] = *p;
+    }
+    norm[j] = 0;
+    return rr_shm_find(&g_snap, norm);
+}
+
 int rr_has(const char *key)
 {
+    if (g_use_shm)
+        return rr_shm_lookup(key) != NULL;
     cJSON *n = rr_walk_path(key);
     return n != NULL;
 }
 
 uint32_t rr_u32(const char *key)
 {
+    if (g_use_shm)
+    {
+        const RrShmEntry *e = rr_shm_lookup(key);
+        if (!e || e->type != RR_SHM_NUM)
+        {
+            fprintf(stderr, "[rr] u32 missing: %s\n", key);
+            exit(3);
+        }
+        return (uint32_t)e->num;
+    }
     cJSON *n = rr_walk_path(key);
     if (!n || !cJSON_IsNumber(n))
     {
@@ -279,6 +355,16 @@ uint32_t rr_u32(const char *key)
 
 uint64_t rr_u64(const char *key)
 {
+    if (g_use_shm)
+    {
+        const RrShmEntry *e = rr_shm_lookup(key);
+        if (!e || e->type != RR_SHM_NUM)
+        {
+            fprintf(stderr, "[rr] u64 missing: %s\n", key);
+            exit(3);
+        }
+        return (uint64_t)e->num;
+    }
     cJSON *n = rr_walk_path(key);
     if (!n || !cJSON_IsNumber(n))
     {
@@ -291,6 +377,17 @@ uint64_t rr_u64(const char *key)
 
 const char *rr_str(const char *key)
 {
+    if (g_use_shm)
+    {
+        const RrShmEntry *e = rr_shm_lookup(key);
+        const char *s = e ? rr_shm_str(&g_snap, e) : NULL;
+        if (!s)
+        {
+            fprintf(stderr, "[rr] str missing: %s\n", key);
+            exit(3);
+        }
+        return s;
+    }
     cJSON *n = rr_walk_path(key);
     if (!n || !cJSON_IsString(n))
     {
@@ -302,6 +399,14 @@ const char *rr_str(const char *key)
 
 void rr_dump(void)
 {
+    if (g_use_shm)
+    {
+        // 快照里没有原始 JSON，直接打印同一版视图文件
+        char *text = rr_slurp(g_view_path, NULL);
+        fprintf(stderr, "[rr] shm view (%u entries):\n%s\n", g_snap.n_entries, text ? text : "(unreadable)");
+        free(text);
+        return;
+    }
     if (!g_root)
     {
         fprintf(stderr, "[rr] not loaded\n");
@@ -367,8 +472,48 @@ static cJSON *rr_field_in_id(const char *arr_key, const char *id, const char *fi
     return fv;
 }
 
+// shm 模式：直接查别名键 "arr_key{id}.field"；查不到再区分是数组/id/字段缺失，报错与 cJSON 路径一致
+static const RrShmEntry *rr_shm_by_id(const char *arr_key, const char *id, const char *field, int must)
+{
+    char key[512];
+    int n = snprintf(key, sizeof(key), "%s{%s}", arr_key, id);
+    if (n < 0 || n >= (int)sizeof(key))
+        n = (int)sizeof(key) - 1;
+    snprintf(key + n, sizeof(key) - (size_t)n, ".%s", field);
+    const RrShmEntry *e = rr_shm_lookup(key);
+    if (e)
+        return e;
+    const RrShmEntry *arr = rr_shm_lookup(arr_key);
+    if (!arr || arr->type != RR_SHM_ARR)
+    {
+        fprintf(stderr, "[rr] not an array: %s\n", arr_key);
+        exit(3);
+    }
+    if (!must)
+        return NULL;
+    key[n] = 0;
+    if (!rr_shm_lookup(key))
+        fprintf(stderr, "[rr] id not found in %s: %s\n", arr_key, id);
+    else
+        fprintf(stderr, "[rr] field not found: %s[%s].%s\n", arr_key, id, field);
+    exit(3);
+}
+
+static const RrShmEntry *rr_shm_num_by_id(const char *arr_key, const char *id, const char *field)
+{
+    const RrShmEntry *e = rr_shm_by_id(arr_key, id, field, 1);
+    if (e->type != RR_SHM_NUM)
+    {
+        fprintf(stderr, "[rr] not number: %s[%s].%s\n", arr_key, id, field);
+        exit(3);
+    }
+    return e;
+}
+
 uint32_t rr_u32_by_id(const char *arr_key, const char *id, const char *field)
 {
+    if (g_use_shm)
+        return (uint32_t)rr_shm_num_by_id(arr_key, id, field)->num;
     cJSON *v = rr_field_in_id(arr_key, id, field);
     if (!cJSON_IsNumber(v))
     {
@@ -380,6 +525,8 @@ uint32_t rr_u32_by_id(const char *arr_key, const char *id, const char *field)
 
 uint64_t rr_u64_by_id(const char *arr_key, const char *id, const char *field)
 {
+    if (g_use_shm)
+        return (uint64_t)rr_shm_num_by_id(arr_key, id, field)->num;
     cJSON *v = rr_field_in_id(arr_key, id, field);
     if (!cJSON_IsNumber(v))
     {
@@ -391,6 +538,16 @@ uint64_t rr_u64_by_id(const char *arr_key, const char *id, const char *field)
 
 const char *rr_str_by_id(const char *arr_key, const char *id, const char *field)
 {
+    if (g_use_shm)
+    {
+        const char *s = rr_shm_str(&g_snap, rr_shm_by_id(arr_key, id, field, 1));
+        if (!s)
+        {
+            fprintf(stderr, "[rr] not string: %s[%s].%s\n", arr_key, id, field);
+            exit(3);
+        }
+        return s;
+    }
     cJSON *v = rr_field_in_id(arr_key, id, field);
     if (!cJSON_IsString(v))
     {
@@ -403,6 +560,8 @@ const char *rr_str_by_id(const char *arr_key, const char *id, const char *field)
 // runtime_resolver.c 追加实现
 int rr_has_by_id(const char *arr_key, const char *id, const char *field)
 {
+    if (g_use_shm)
+        return rr_shm_by_id(arr_key, id, field, 0) != NULL;
     cJSON *arr = rr_array_node_from_key(arr_key);
     cJSON *obj = rr_obj_by_id(arr, id);
     if (!obj)
@@ -452,9 +611,6 @@ const char *rr_try_str(const char *key, const char *default_val)
 
 void rr_free(void)
 {
-    if (g_root)
-    {
-        cJSON_Delete(g_root);
-        g_root = NULL;
-    }
+    rr_release_view();
+    rr_shm_close(&g_shm);
 }
\ No newline at end of file
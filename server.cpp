@@ -290,6 +290,7 @@ struct ServerState
 {
     vector<QPWithBufferPool> pool;
     vector<PairSlot> pairs;
+    uint32_t session = 0; // 常驻模式下每次 client 运行一个 session（见 coordinator.py --session-file）
 };
 
 struct RemoteQP
@@ -465,10 +466,30 @@ static void unclaim_slot(ServerState &S, int slot)
     // Optionally: modify_qp_to_init(S.pool[slot].qp, IB_PORT);
 }
 
+// 新 session：配过对的 QP 走 RESET -> INIT 回收（丢弃残留 WR），PD / CQ / MR / QP 本身都复用
+static void recycle_slots(ServerState &S, uint8_t port_num)
+{
+    int n = 0;
+    for (int i = 0; i < (int)S.pairs.size(); ++i)
+    {
+        if (!S.pairs[i].in_use)
+            continue;
+        unclaim_slot(S, i);
+        ibv_qp_attr a;
+        memset(&a, 0, sizeof(a));
+        a.qp_state = IBV_QPS_RESET;
+        if (ibv_modify_qp(S.pool[i].qp, &a, IBV_QP_STATE) || modify_qp_to_init(S.pool[i].qp, port_num))
+            fprintf(stderr, "[srv] failed to recycle slot %d: %s\n", i, strerror(errno));
+        ++n;
+    }
+    fprintf(stdout, "[srv] session %u: recycled %d slots\n", S.session, n);
+}
+
 // export local view (including pairs with BOTH_RTS when paired)
 static void dump_server_update(const char *path, const ServerState &S, uint16_t lid, const uint8_t gid[16], uint8_t port_num)
 {
     cJSON *root = cJSON_CreateObject();
+    cJSON_AddNumberToObject(root, "session", S.session);
     cJSON *local = cJSON_AddObjectToObject(root, "local");
     cJSON *arr_qp = cJSON_AddArrayToObject(local, "QP");
     cJSON *arr_mr = cJSON_AddArrayToObject(local, "MR");
@@ -542,6 +563,23 @@ static void dump_server_update(const char *path, const ServerState &S, uint16_t
     rename(tmp, path);
 }
 
+// -------------------- readiness --------------------
+// 运行器通过 RDMA_FUZZ_READY_FD 传入一个管道写端：QP 池建好、第一次 server_update.json 写出后
+// 写一行 "READY server <pid>" 并关闭，运行器据此立即启动 client，不再固定 sleep。
+static void signal_ready()
+{
+    const char *s = getenv("RDMA_FUZZ_READY_FD");
+    if (!s || !*s)
+        return;
+    int fd = atoi(s);
+    if (fd >= 0)
+    {
+        dprintf(fd, "READY server %d\n", (int)getpid());
+        close(fd);
+    }
+    unsetenv("RDMA_FUZZ_READY_FD");
+}
+
 // -------------------- main --------------------
 int main(int argc, char **argv)
 {
@@ -573,6 +611,7 @@ int main(int argc, char **argv)
     (void)ibv_query_gid(ctx, IB_PORT, 3, &my_gid);
 
     ServerState S;
+    S.session = rr_try_u32("session", 0);
     S.pool.resize(QP_POOL_SIZE);
     S.pairs.resize(QP_POOL_SIZE);
     for (int i = 0; i < QP_POOL_SIZE; ++i)
@@ -585,12 +624,23 @@ int main(int argc, char **argv)
     }
 
     uint64_t last_dump = 0;
+    bool announced = false;
     fprintf(stdout, "[srv] pairing loop...\n");
     std::unordered_set<string> paired;
     for (;;)
     {
         // reload on FS event
-        reloader.pump_and_reload(BUNDLE_ENV);
+        if (reloader.pump_and_reload(BUNDLE_ENV))
+        {
+            uint32_t session = rr_try_u32("session", 0);
+            if (session != S.session)
+            {
+                S.session = session;
+                recycle_slots(S, IB_PORT);
+                paired.clear();
+                last_dump = 0; // 立即导出，coordinator 据此确认 server 已进入新 session
+            }
+        }
 
         auto remote_pairs = snapshot_remote_pairs();
         auto remote_qps = snapshot_remote_qps();
@@ -665,6 +715,11 @@ int main(int argc, char **argv)
             dump_server_update("server_update.json", S, port_attr.lid, my_gid.raw, IB_PORT);
             // printf("[srv] dump server_update.json\n");
             last_dump = now_ms();
+            if (!announced)
+            {
+                signal_ready();
+                announced = true;
+            }
         }
         usleep(TICK_INTERVAL_MS * 1000);
     }
@@ -0,0 +1,36 @@
+import contextlib
+import copy
+import importlib
+import io
+import random
+
+import pytest
+
+from lib import fuzz_mutate
+
+
+@pytest.fixture
+def initial_verbs():
+    """fuzz_test.INITIAL_VERBS 的一份深拷贝，测试里可以随便改。"""
+    return copy.deepcopy(importlib.import_module("fuzz_test").INITIAL_VERBS)
+
+
+@pytest.fixture
+def mutation_rounds(initial_verbs):
+    """
+    mutation_rounds(seed, rounds)：从 initial_verbs 开始原地连续变异，每轮之后产出同一个列表；
+    变异抛异常的轮次保持原样（和 fuzz 循环一样），变异器的输出不打到测试的 stdout。
+    """
+
+    def rounds_of(seed: int, rounds: int):
+        verbs = initial_verbs
+        mutator = fuzz_mutate.ContractAwareMutator(random.Random(seed))
+        for _ in range(rounds):
+            with contextlib.redirect_stdout(io.StringIO()):
+                try:
+                    mutator.mutate(verbs)
+                except Exception:
+                    pass
+            yield verbs
+
+    return rounds_of
@@ -0,0 +1,21 @@
+#include <stdio.h>
+static int classify(int x)
+{
+    if (x < 0)
+        return -1;
+    if (x == 0)
+        return 0;
+    return 1;
+}
+int never_called(int y)
+{
+    return y * 2;
+}
+int main(int argc, char **argv)
+{
+    int s = 0;
+    for (int i = -2; i < argc + 2; ++i)
+        s += classify(i);
+    printf("%d\n", s);
+    return 0;
+}
@@ -0,0 +1,51 @@
+import os
+import time
+
+from lib.build_cache import BuildCache
+
+
+def test_key_covers_source_runtime_and_flags(tmp_path):
+    cache = BuildCache(tmp_path / "cache")
+    src, rt = tmp_path / "client.cpp", tmp_path / "pair_runtime.cpp"
+    src.write_text("int main(){}\n")
+    rt.write_text("// runtime v1\n")
+    k = cache.key_for(src, ["SAN=asan"], [rt])
+    assert k == cache.key_for(src, ["SAN=asan"], [rt])
+    assert k != cache.key_for(src, ["SAN="], [rt])
+    rt.write_text("// runtime v2\n")
+    k2 = cache.key_for(src, ["SAN=asan"], [rt])
+    assert k2 != k
+    src.write_text("int main(){return 1;}\n")
+    assert cache.key_for(src, ["SAN=asan"], [rt]) != k2
+
+
+def test_hit_restores_executable_binary(tmp_path):
+    cache = BuildCache(tmp_path / "cache")
+    binary = tmp_path / "client"
+    binary.write_bytes(b"\x7fELF-client")
+    binary.chmod(0o755)
+    dest = tmp_path / "build" / "asan" / "client"
+
+    assert not cache.fetch("ab" * 32, dest)
+    cache.put("ab" * 32, binary)
+    assert cache.fetch("ab" * 32, dest)
+    assert dest.read_bytes() == b"\x7fELF-client" and os.access(dest, os.X_OK)
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_lru_eviction_is_bounded_by_disk_size(tmp_path):
+    cache = BuildCache(tmp_path / "cache", max_bytes=2500)
+    blob = tmp_path / "bin"
+    blob.write_bytes(b"x" * 1000)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    now = time.time()
+    cache.put(keys[0], blob)
+    cache.put(keys[1], blob)
+    # keys[0] 比 keys[1] 旧，但刚被用过
+    os.utime(cache.entry(keys[0]), (now - 100, now - 100))
+    os.utime(cache.entry(keys[1]), (now - 50, now - 50))
+    assert cache.fetch(keys[0], tmp_path / "out")
+    cache.put(keys[2], blob)
+    assert cache.total_bytes() <= 2500
+    assert cache.entry(keys[0]).exists() and cache.entry(keys[2]).exists()
+    assert not cache.entry(keys[1]).exists()
@@ -0,0 +1,105 @@
+import importlib
+import sys
+
+from lib.capture import META, STDERR, STDOUT, MergedCapture, iter_records, split_view
+from lib.exec_schema import build_schema
+from lib.runexec import extract_sem_signature
+
+# 模拟 client：stdout 打 verb 标记，最后 stderr 出 ASan 报告；两个流交替写时留一点间隔，
+# 合并流的顺序就是到达顺序
+FAKE_CLIENT = r"""#!{python}
+import sys, time
+for i in range(3):
+    print(f"[{{i}}] CreateQP start.", flush=True)
+    time.sleep(0.02)
+    print(f"warn {{i}}", file=sys.stderr, flush=True)
+    time.sleep(0.02)
+print("[1] CreateQP start.", flush=True)
+print("[3] PostSend start.", flush=True)
+sys.stdout.write("no newline at exit")
+sys.stdout.flush()
+print("==1==ERROR: AddressSanitizer: heap-use-after-free", file=sys.stderr, flush=True)
+print("SUMMARY: AddressSanitizer: heap-use-after-free /src/pair_runtime.cpp:42 in post_send", file=sys.stderr)
+sys.exit(1)
+"""
+
+
+def test_client_capture_merges_streams_in_order(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    ar = importlib.import_module("lib.auto_run")
+    from lib.runexec import parse_crash_site_text
+
+    client = tmp_path / "client"
+    client.write_text(FAKE_CLIENT.format(python=sys.executable))
+    client.chmod(0o755)
+    cc = ar.ClientCapture("000007", mode="merged")
+    proc = cc.start(env={}, client_bin=str(client))
+    assert proc.wait() == 1
+    cc.thread.join(5)
+
+    records = list(iter_records(cc.log_path))
+    assert [seq for seq, _, _ in records] == list(range(1, len(records) + 1))
+    assert [(t, line) for _, t, line in records][:4] == [
+        (STDOUT, "[0] CreateQP start."),
+        (STDERR, "warn 0"),
+        (STDOUT, "[1] CreateQP start."),
+        (STDERR, "warn 1"),
+    ]
+    assert records[-1][1] == STDERR and records[-1][2].startswith("SUMMARY: AddressSanitizer")
+    assert (STDOUT, "no newline at exit") in [(t, line) for _, t, line in records]
+
+    assert cc.markers.sem_signature == {"CreateQP", "PostSend"}
+    assert parse_crash_site_text(cc.markers.asan_text()) == "bt#pair_runtime.cpp:42 in post_send"
+    # tmp 视图按需生成，和原来的纯文本格式一致
+    assert cc.view_path("stderr").read_text().splitlines()[:3] == ["warn 0", "warn 1", "warn 2"]
+    assert cc.log_path.parent == cc.run_dir and not (cc.run_dir / "000007_client.stdout.log").exists()
+
+
+def test_capture_cap_keeps_head_tail_and_markers(tmp_path):
+    cap = MergedCapture(tmp_path / "x.log", max_bytes=200, tail_bytes=100)
+    for i in range(1000):
+        cap.feed(STDOUT, f"[{i}] Verb{i % 7} start.\n".encode())
+    cap.feed(STDERR, b"ERROR: AddressSanitizer: SEGV\npartial")
+    cap.close()
+
+    records = list(iter_records(tmp_path / "x.log"))
+    assert tmp_path.joinpath("x.log").stat().st_size <= 200 + 100 + 64
+    assert records[0] == (1, STDOUT, "[0] Verb0 start.")
+    marker = [r for r in records if r[1] == META]
+    assert len(marker) == 1 and "truncated" in marker[0][2]
+    assert [seq for seq, _, _ in records] == sorted(seq for seq, _, _ in records)
+    assert records[-2:] == [(1001, STDERR, "ERROR: AddressSanitizer: SEGV"), (1002, STDERR, "partial")]
+    # 截断不影响边读边解析的标记
+    assert cap.sem_signature == {f"Verb{i}" for i in range(7)}
+    assert cap.asan_lines == ["ERROR: AddressSanitizer: SEGV", "partial"]
+    assert split_view(tmp_path / "x.log", STDERR, tmp_path / "err.log").read_text() == (
+        "ERROR: AddressSanitizer: SEGV\npartial\n"
+    )
+
+
+def test_bare_carriage_return_stays_inside_its_record(tmp_path):
+    cap = MergedCapture(tmp_path / "x.log")
+    cap.feed(STDOUT, b"progress 10%\rprogress 20%\ndone\n")
+    cap.close()
+
+    assert list(iter_records(tmp_path / "x.log")) == [(1, STDOUT, "progress 10%\rprogress 20%"), (2, STDOUT, "done")]
+    out = split_view(tmp_path / "x.log", STDOUT, tmp_path / "out.log")
+    assert out.read_bytes() == b"progress 10%\rprogress 20%\ndone\n"
+
+
+def test_verb_outcome_markers_stream_into_signature(tmp_path):
+    schema = build_schema()
+    qp, mr = schema.class_id["CreateQP"], schema.class_id["RegMR"]
+    out = f"@b 1 {qp}\n@e 1 0 0\n@b 2 {mr}\n@e 2 2 22\n@b 3 -1 RdmaListen\n@e 3 1 0\n@b 4 {qp}\n"
+    cap = MergedCapture(tmp_path / "x.log")
+    # 标记行被拆在两次读里也照样解析
+    cap.feed(STDOUT, out[:15].encode())
+    cap.feed(STDOUT, out[15:].encode())
+    cap.close()
+    assert cap.outcomes.as_list() == [[1, qp, 0, 0], [2, mr, 2, 22], [3, -1, 1, 0], [4, qp, None, 0]]
+    assert cap.sem_signature == {"CreateQP:ok", "RegMR:fail:EINVAL", "RdmaListen:skip", "CreateQP:abort"}
+
+    # fork-server / lines 模式事后扫日志，结果一样；旧横幅也还认
+    log = tmp_path / "out.log"
+    log.write_text(out + "[5] AllocPD start.\n")
+    assert extract_sem_signature(str(log)) == cap.sem_signature | {"AllocPD"}
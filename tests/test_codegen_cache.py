@@ -0,0 +1,93 @@
+import contextlib
+import copy
+import io
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from lib.capture import VerbOutcomes
+from lib.codegen_cache import CodegenCache, escape_c_string
+from lib.codegen_context import CodeGenContext
+from lib.debug_dump import summarize_verb
+from lib.exec_schema import build_schema
+from lib.renderer import apply_program
+from lib.verbs import QueryGID
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _reference(verbs):
+    verbs, ctx = apply_program(verbs, gid_index=3)
+    body = ""
+    for i, v in enumerate(verbs):
+        body += f'    printf("[{i + 1}] {escape_c_string(summarize_verb(v, deep=True, max_items=1000))} start.\\n");\n'
+        body += v.generate_c(ctx)
+        body += f'    printf("[{i + 1}] done.\\n");\n\n'
+    return body, ctx.generate_variable_definitions_all()
+
+
+def _cached(cache, verbs):
+    verbs, ctx = apply_program(verbs, gid_index=3)
+    return cache.render_body(verbs, ctx, banners="text"), ctx.generate_variable_definitions_all()
+
+
+def test_cached_render_matches_uncached_across_mutations(mutation_rounds):
+    cache = CodegenCache()
+    for verbs in mutation_rounds(3, 8):
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert _cached(cache, copy.deepcopy(verbs)) == _reference(copy.deepcopy(verbs))
+    assert cache.hits > cache.misses
+
+
+def test_unchanged_program_is_fully_served_from_cache(initial_verbs):
+    verbs = initial_verbs
+    cache = CodegenCache()
+    with contextlib.redirect_stdout(io.StringIO()):
+        first = _cached(cache, copy.deepcopy(verbs))
+        misses = cache.misses
+        second = _cached(cache, copy.deepcopy(verbs))
+    assert first == second
+    assert cache.misses == misses
+
+
+def test_default_banners_are_numeric_outcome_markers(initial_verbs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        verbs, ctx = apply_program([], gid_index=3)
+        body = CodegenCache().render_body(verbs, ctx)
+    cid = build_schema().class_id
+    assert body.startswith(f"    RR_VERB_BEGIN(1, {cid['GetDeviceList']});\n")
+    assert f"    RR_VERB_END({len(verbs)}, rr_rc);\n" in body and "start." not in body
+
+    # 结果码由失败分支显式设置（在 fprintf 之前，errno 还没被改），不再靠 stderr 上的输出猜
+    with contextlib.redirect_stdout(io.StringIO()):
+        verbs, ctx = apply_program(initial_verbs)
+        lines = [ln.strip() for ln in CodegenCache().render_body(verbs, ctx).splitlines() if ln.strip()]
+    failures = [i for i, ln in enumerate(lines) if ln.startswith("fprintf(stderr") and "ail" in ln]
+    assert failures and all(lines[i - 1] == "RR_SET_FAIL();" for i in failures)
+
+
+@pytest.mark.skipif(shutil.which("g++") is None, reason="needs g++")
+def test_failure_that_returns_from_main_still_ends_the_verb(tmp_path):
+    verbs = [QueryGID(index=3)]
+    ctx = CodeGenContext()
+    for v in verbs:
+        v.apply(ctx)
+    body = CodegenCache().render_body(verbs, ctx)
+    assert "return -1;" not in body
+    src = tmp_path / "client.cpp"
+    src.write_text(
+        '#include "client_prelude.h"\n'
+        "#define ibv_query_gid(...) (errno = EINVAL, -1)\n"
+        "int main(void)\n{\n"
+        f"    struct ibv_context *{ctx.ib_ctx} = NULL;\n    union ibv_gid gid;\n{body}    return 0;\n}}\n"
+    )
+    exe = tmp_path / "client"
+    subprocess.run(["g++", "-std=c++17", "-I", str(ROOT), str(src), "-o", str(exe)], check=True)
+    out = subprocess.run([str(exe)], capture_output=True, text=True).stdout
+
+    outcomes = VerbOutcomes()
+    for line in out.splitlines():
+        outcomes.feed(line)
+    assert outcomes.signature() == {"QueryGID:fail:EINVAL"}
@@ -0,0 +1,54 @@
+import json
+import os
+import time
+
+from lib.coordinator import Coordinator
+
+
+def _write(path, obj):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(obj, f)
+    os.replace(tmp, path)
+
+
+def _paths(tmp_path):
+    return [str(tmp_path / f"{k}.json") for k in ("server_update", "client_update", "server_view", "client_view")]
+
+
+def test_event_driven_update_reaches_views_quickly(tmp_path):
+    su, cu, sv, cv = _paths(tmp_path)
+    coord = Coordinator(su, cu, sv, cv).start_thread()
+    try:
+        assert json.load(open(cv))["_coordinator"]["remote_qp_count"] == 0
+        t0 = time.monotonic()
+        _write(su, {"local": {"QP": [{"id": "srv0", "qpn": 7}], "pairs": [{"id": "p0", "state": "BOTH_RTS"}]}})
+        while json.load(open(cv))["_coordinator"]["remote_qp_count"] == 0:
+            assert time.monotonic() - t0 < 2
+            time.sleep(0.0005)
+        # 远小于原来 100ms 的轮询周期
+        assert time.monotonic() - t0 < 0.05
+        assert json.load(open(sv))["pairs"][0]["epoch"] == 1
+    finally:
+        coord.stop()
+    assert not coord.alive()
+
+
+def test_views_written_only_when_content_changes(tmp_path):
+    su, cu, sv, cv = _paths(tmp_path)
+    _write(cu, {"local": {"QP": [{"id": "cli0", "qpn": 1}]}, "pairs": [{"id": "p0", "state": "CLAIMED"}]})
+    coord = Coordinator(su, cu, sv, cv)
+    assert coord.round()
+    before = os.stat(cv).st_mtime_ns, os.stat(sv).st_mtime_ns
+    time.sleep(0.01)
+    # 内容没变（只有 generated_at_ms 不同）：不重写
+    _write(cu, {"local": {"QP": [{"id": "cli0", "qpn": 1}]}, "pairs": [{"id": "p0", "state": "CLAIMED"}]})
+    assert not coord.round()
+    assert (os.stat(cv).st_mtime_ns, os.stat(sv).st_mtime_ns) == before
+    assert coord.stats["writes"] == 2 and coord.stats["unchanged"] == 2
+
+    _write(cu, {"local": {"QP": [{"id": "cli0", "qpn": 1}]}, "pairs": [{"id": "p0", "state": "READY"}]})
+    assert coord.round()
+    assert json.load(open(sv))["pairs"][0] == {
+        "id": "p0", "cli_id": "", "srv_id": "", "state": "READY", "epoch": 2, "ts": 0,
+    }
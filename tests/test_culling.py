@@ -0,0 +1,59 @@
+import random
+import sqlite3
+
+import numpy as np
+
+from lib.corpus import Corpus
+from lib.culling import cull, greedy_cover
+from lib.fingerprint import pack_ids
+
+
+def _ids(*xs):
+    return np.array(xs, dtype=np.int64)
+
+
+def test_greedy_cover_is_complete_and_prefers_cheap_seeds():
+    seeds = {"big": _ids(0, 1, 2, 3, 4, 5), "a": _ids(0, 1, 2), "b": _ids(3, 4, 5), "dup": _ids(1, 2), "empty": _ids()}
+    assert greedy_cover(seeds) == ["big"]
+    # big 慢得多：两个便宜的种子合起来覆盖同样的边
+    assert greedy_cover(seeds, {"big": 10.0}) == ["a", "b"]
+    assert greedy_cover({}) == []
+
+    rng = np.random.default_rng(1)
+    many = {f"s{i}": np.unique(rng.integers(0, 2000, size=50)) for i in range(200)}
+    chosen = greedy_cover(many)
+    assert len(chosen) < len(many)
+    union = np.unique(np.concatenate(list(many.values())))
+    assert np.array_equal(np.unique(np.concatenate([many[s] for s in chosen])), union)
+
+
+def test_cull_marks_favoured_and_scheduler_prefers_them(tmp_path, monkeypatch):
+    corpus = Corpus(str(tmp_path))
+    corpus.db.executemany("INSERT INTO seeds(id, score) VALUES (?, ?)", [("fast", 0.1), ("slow", 0.1), ("stale", 50.0)])
+    corpus.set_seed_coverage("fast", 3, pack_ids(_ids(0, 1, 2)), runtime_ms=10, length=4)
+    corpus.set_seed_coverage("slow", 3, pack_ids(_ids(0, 1, 2)), runtime_ms=900, length=4)
+    corpus.set_seed_coverage("stale", 2, pack_ids(_ids(1, 2)), runtime_ms=10, length=8)
+    corpus.set_seed_coverage("gone", 1, pack_ids(_ids(7)))  # 不在 seeds 表里
+
+    res = cull(corpus)
+    assert res.favoured == ["fast"] and (res.seeds, res.edges) == (3, 3)
+    assert corpus.favoured_seeds() == ["fast"]
+    # favoured 种子总在候选池里，哪怕 score 最低
+    assert list(corpus.top_scores(limit=2)) == ["fast", "stale"]
+    monkeypatch.setattr(Corpus, "FAVOURED_PROB", 1.0)
+    random.seed(0)
+    assert {corpus.pick_for_fuzz() for _ in range(20)} == {"fast"}
+
+
+def test_old_database_gets_new_columns(tmp_path):
+    db = sqlite3.connect(str(tmp_path / Corpus.DB_NAME))
+    db.execute("CREATE TABLE seeds (id TEXT PRIMARY KEY, score REAL DEFAULT 0.0)")
+    db.execute("CREATE TABLE seed_cov (seed_id TEXT PRIMARY KEY, edges INTEGER, bitmap BLOB)")
+    db.execute("INSERT INTO seeds(id) VALUES ('old')")
+    db.commit()
+    db.close()
+
+    corpus = Corpus(str(tmp_path))
+    corpus.set_seed_coverage("old", 1, pack_ids(_ids(5)), runtime_ms=3, length=2)
+    assert [(sid, rt, n) for sid, _, rt, n in corpus.iter_seed_coverage()] == [("old", 3, 2)]
+    assert cull(corpus).favoured == ["old"]
@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+import pytest
+
+from lib.corpus import Corpus
+from lib.distill import StubRunner, distill
+from lib.fingerprint import pack_ids, unpack_ids
+from lib.verbs import FreeDeviceList, GetDeviceList, OpenDevice, QueryDeviceAttr, QueryGID, QueryPortAttr
+
+
+def _prog(*tail):
+    return [GetDeviceList("dev_list"), OpenDevice("dev_list"), FreeDeviceList(), *tail]
+
+
+def _ids(*xs):
+    return np.array(xs, dtype=np.int64)
+
+
+def test_distill_from_stored_coverage_keeps_edges_and_crash_buckets(tmp_path):
+    src = Corpus(str(tmp_path / "src"))
+    big = src.add(_prog(QueryDeviceAttr(), QueryPortAttr()))
+    small = src.add(_prog())
+    crasher = src.add(_prog(QueryGID(index=3)))
+    unknown = src.add(_prog(QueryGID(index=1)))
+    src.set_seed_coverage(big, 4, pack_ids(_ids(0, 1, 2, 3)), runtime_ms=10, length=5)
+    src.set_seed_coverage(small, 2, pack_ids(_ids(0, 1)), runtime_ms=10, length=3)
+    src.set_seed_coverage(crasher, 2, pack_ids(_ids(1, 2)), runtime_ms=10, length=4)
+    rep = {
+        "bucket": "asan:heap-use-after-free:abc",
+        "source": "asan",
+        "bug_type": "heap-use-after-free",
+        "site": "x",
+        "frames": ["f"],
+    }
+    src.record_crash(crasher, rep, "000007")
+    src.save_coverage_state(b"[]", b"\x01\x01\x01\x01")
+
+    res = distill(str(tmp_path / "src"), str(tmp_path / "out"))
+    # small 被 big 覆盖；crasher 的边也被覆盖了，但它是崩溃桶唯一的复现者；没有覆盖记录的原样保留
+    assert res.kept == [big, crasher, unknown]
+    assert (res.seeds, res.edges, res.buckets, res.unknown) == (4, 4, 1, [unknown])
+
+    out = Corpus(str(tmp_path / "out"))
+    assert sorted(out.favoured_seeds()) == sorted(res.kept)
+    assert np.array_equal(unpack_ids(out.get_seed_coverage(big)), _ids(0, 1, 2, 3))
+    assert [(r["seed_id"], r["run_index"]) for r in out.crash_seeds(rep["bucket"])] == [(crasher, "000007")]
+    assert out.load_coverage_state() == src.load_coverage_state()
+    assert out.load_verbs(crasher) is not None
+
+    with pytest.raises(FileExistsError):
+        distill(str(tmp_path / "src"), str(tmp_path / "out"))
+
+
+def test_dry_rerun_with_stub_runner(tmp_path):
+    src = Corpus(str(tmp_path / "src"))
+    short = src.add(_prog())
+    longer = src.add(_prog(QueryDeviceAttr()))
+    other = src.add(_prog(QueryPortAttr()))
+    unreadable = src.add(_prog(QueryGID(index=2)))
+    os.remove(src._seed_paths(unreadable)["prog"])
+
+    res = distill(str(tmp_path / "src"), str(tmp_path / "out"), runner=StubRunner(), jobs=4)
+    # 假覆盖只看 verb 类名和相邻对：short 的边 longer / other 都有
+    assert sorted(res.kept) == sorted([longer, other]) and short not in res.kept
+    assert res.failed == [unreadable] and res.unknown == []
+    assert res.edges == len(StubRunner().run(_prog(QueryDeviceAttr()))["coverage_edges"]) + 2
+
+    out = Corpus(str(tmp_path / "out"))
+    space_blob, _ = out.load_coverage_state()
+    assert space_blob and all(unpack_ids(out.get_seed_coverage(s)).size for s in res.kept)
@@ -0,0 +1,54 @@
+import contextlib
+import io
+import json
+
+import pytest
+
+from lib import exec_schema
+from lib.exec_schema import build_schema, decode_program, encode_program, find_handlers
+from lib.json_utils import export_verbs_to_program_json
+from lib.verb_registry import all_classes
+
+
+def test_binary_program_decodes_to_program_json(mutation_rounds):
+    for verbs in mutation_rounds(5, 15):
+        with contextlib.redirect_stdout(io.StringIO()):
+            text = export_verbs_to_program_json(verbs, trace_id="t1", extra_meta={"port_num": 1}, pretty=False)
+            blob = encode_program(verbs, trace_id="t1", extra_meta={"port_num": 1})
+            # 键顺序也一致：decode_program 的结果与直接解析 JSON 相同
+            assert json.dumps(decode_program(blob)) == json.dumps(json.loads(text))
+            assert len(blob) * 3 < len(text)
+
+
+def test_generated_tables_are_up_to_date():
+    schema = build_schema()
+    names = [n for n, _ in schema.classes[: schema.verb_count]]
+    assert names == sorted(names)  # rdx_verb_id 二分查找依赖
+    assert exec_schema.write_c(check=True), "run: python -m lib.exec_schema"
+    # 每个 C handler 都对应一个 Python verb
+    assert set(find_handlers()) <= set(names)
+
+
+def test_cm_plugins_do_not_change_the_schema():
+    all_classes()  # 导入 lib/cm 下的插件
+    schema = build_schema()
+    assert "RdmaConnParam" not in schema.class_id
+    assert exec_schema.write_c(check=True)
+
+def test_every_verb_has_a_generated_handler():
+    schema = build_schema()
+    names = [n for n, _ in schema.classes[: schema.verb_count]]
+    assert sorted(set(names) - set(exec_schema.VERB_CALLS)) == []
+    _, source = exec_schema.generate_c(schema)
+    table = source.split("g_rdx_handlers[RDX_VERB_COUNT] = {", 1)[1].split("};", 1)[0]
+    assert "NULL" not in table
+    assert table.count("rdx_exec_") == len(names)
+
+
+def test_schema_mismatch_and_truncation_are_rejected(initial_verbs):
+    blob = bytearray(encode_program(initial_verbs))
+    with pytest.raises(ValueError):
+        decode_program(bytes(blob[:-3]))
+    blob[5] ^= 0xFF
+    with pytest.raises(ValueError, match="schema mismatch"):
+        decode_program(bytes(blob))
@@ -0,0 +1,49 @@
+import numpy as np
+
+from lib.corpus import Corpus
+from lib.fingerprint import FingerprintManager, classify_counts, pack_ids, unpack_ids
+from lib.gcov_reader import CoverageSample, EdgeSpace
+
+
+def _sample(space, counts):
+    base = space.intern("obj", 1, 2, len(counts), "fn")
+    return CoverageSample(np.arange(base, base + len(counts)), np.array(counts, dtype=np.uint64))
+
+
+def test_classify_counts_afl_buckets():
+    counts = np.array([0, 1, 2, 3, 4, 7, 8, 15, 16, 31, 32, 127, 128, 1 << 40], dtype=np.uint64)
+    assert classify_counts(counts).tolist() == [0, 1, 2, 4, 8, 8, 16, 16, 32, 32, 64, 64, 128, 128]
+
+
+def test_new_edges_and_new_buckets():
+    space = EdgeSpace()
+    fp = FingerprintManager(space)
+    assert fp.update_coverage(_sample(space, [1, 0, 5, 0])) == 2
+    assert fp.last_covered.tolist() == [0, 2]
+    # 同样的边、同样的桶：没有新东西
+    assert fp.update_coverage(_sample(space, [1, 0, 6, 0])) == 0 and fp.last_new_buckets == 0
+    # 新的边 + 已有边的新桶
+    assert fp.update_coverage(_sample(space, [200, 0, 5, 1])) == 1 and fp.last_new_buckets == 2
+    # 字符串边各 intern 一次，和 gcov 的边在同一个编号空间
+    assert fp.diff({"f.c:1", "f.c:2"}, {"CreateQP"}) == (2, 1)
+    assert fp.diff(["f.c:1"], {"CreateQP"}) == (0, 0)
+    assert space.names(fp.last_covered) == ["f.c:1"]
+
+
+def test_state_round_trips_through_corpus(tmp_path):
+    space = EdgeSpace()
+    fp = FingerprintManager(space)
+    fp.update_coverage(_sample(space, [1, 0, 3]))
+    fp.update_coverage({"k.c:9"})
+    corpus = Corpus(str(tmp_path))
+    corpus.save_coverage_state(*fp.state())
+    corpus.set_seed_coverage("s1", 1, pack_ids(fp.last_covered))
+
+    again = FingerprintManager(EdgeSpace())
+    assert again.load_state(*Corpus(str(tmp_path)).load_coverage_state())
+    assert again.update_coverage({"k.c:9"}) == 0
+    assert again.update_coverage(_sample(again.space, [2, 1, 3])) == 1
+    assert unpack_ids(corpus.get_seed_coverage("s1")).tolist() == [3]
+    assert unpack_ids(pack_ids(np.zeros(0, dtype=np.int64))).tolist() == []
+    # 已经分配过编号的进程不恢复
+    assert not again.load_state(*corpus.load_coverage_state())
@@ -0,0 +1,117 @@
+import importlib
+import json
+import os
+import sys
+import textwrap
+
+import pytest
+
+from lib.forkserver import ForkServerRunner
+
+# 说 rdma_exec --fork-server 协议的桩程序：每个请求 fork 一次，按 meta.mode 模拟正常 / ASan / 信号 / 超时 / 自身崩溃
+STUB = textwrap.dedent(
+    r'''
+    import json, os, signal, sys, time
+
+    inp, out = sys.stdin.buffer, sys.stdout.buffer
+    out.write(b"READY %d\n" % os.getpid()); out.flush()
+    while True:
+        line = inp.readline()
+        if not line or line.startswith(b"QUIT"):
+            break
+        _, rid, n, timeout_ms, out_path, err_path = line.decode().split()
+        prog = json.loads(inp.read(int(n)))
+        mode = prog["meta"].get("mode", "ok")
+        if mode == "die":
+            os._exit(3)
+        t0 = time.monotonic()
+        pid = os.fork()
+        if pid == 0:
+            with open(out_path, "w") as o, open(err_path, "w") as e:
+                for i, v in enumerate(prog["program"]):
+                    o.write("[%d] %s start.\n" % (i + 1, v["verb"]))
+                o.flush()
+                if mode == "asan":
+                    e.write("==1==ERROR: AddressSanitizer: heap-use-after-free\n"
+                            "SUMMARY: AddressSanitizer: heap-use-after-free /src/verbs.c:42 in ibv_destroy_qp\n")
+                    e.flush()
+                    os._exit(1)
+                if mode == "segv":
+                    os.kill(os.getpid(), signal.SIGSEGV)
+                if mode == "hang":
+                    time.sleep(30)
+            os._exit(0)
+        timed_out = 0
+        while True:
+            r, status = os.waitpid(pid, os.WNOHANG)
+            if r == pid:
+                break
+            if (time.monotonic() - t0) * 1000 > int(timeout_ms):
+                os.kill(pid, signal.SIGKILL)
+                _, status = os.waitpid(pid, 0)
+                timed_out = 1
+                break
+            time.sleep(0.001)
+        code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+        sig = os.WTERMSIG(status) if os.WIFSIGNALED(status) else 0
+        us = int((time.monotonic() - t0) * 1e6)
+        out.write(("DONE %s %d %d %d %d\n" % (rid, code, sig, us, timed_out)).encode()); out.flush()
+    '''
+)
+
+
+def _program(mode, verbs=("AllocPD", "CreateCQ")):
+    return json.dumps({"version": 1, "meta": {"mode": mode}, "program": [{"verb": v} for v in verbs]})
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stub = tmp_path / "stub_exec.py"
+    stub.write_text(STUB)
+    r = ForkServerRunner(
+        argv=[sys.executable, str(stub)],
+        workdir=tmp_path / "fs",
+        timeout_ms=500,
+        coverage_fn=lambda: {"f.c:1"},
+        dmesg_fn=lambda: "",
+    )
+    with r:
+        yield r
+
+
+def test_results_match_build_and_run_shape(runner):
+    ok = runner.run(_program("ok"))
+    assert set(ok) >= {"outcome", "runtime_ms", "coverage_edges", "sem_signature", "crash_site", "dmesg_new"}
+    assert ok["outcome"] == "ok" and ok["crash_site"] is None
+    assert ok["sem_signature"] == {"AllocPD", "CreateCQ"}
+    assert ok["coverage_edges"] == {"f.c:1"}
+
+    asan = runner.run(_program("asan"))
+    assert asan["outcome"] == "crash"
+    assert asan["crash_site"] == "bt#verbs.c:42 in ibv_destroy_qp"
+
+    segv = runner.run(_program("segv"))
+    assert segv["outcome"] == "crash" and segv["crash_site"] == "sig#SIGSEGV"
+
+    hang = runner.run(_program("hang"))
+    assert hang["outcome"] == "error" and "timeout" in hang["detail"]
+
+    # 一个 fork-server 进程服务了全部用例
+    assert runner.restarts == 0 and runner.alive()
+
+
+def test_restarts_after_server_death(runner):
+    pid = runner.server_pid
+    dead = runner.run(_program("die"))
+    assert dead["outcome"] == "error"
+    assert runner.restarts == 1 and runner.server_pid != pid
+    assert runner.run(_program("ok"))["outcome"] == "ok"
+
+
+def test_run_exports_verbs_to_program_json(runner):
+    verbs = importlib.import_module("fuzz_test").INITIAL_VERBS
+    raw = runner.run(verbs, tag="seed1")
+    assert raw["outcome"] == "ok"
+    assert raw["sem_signature"] == {v.to_dict()["verb"] for v in verbs}
+    assert os.path.exists(runner.workdir / "seed1.fs.stdout.log")
@@ -0,0 +1,69 @@
+import json
+import os
+import random
+import shutil
+from pathlib import Path
+
+from lib import gcov_llm_callback as cb
+from lib.gcov_reader import EdgeSpace, GcovSource
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "gcov"
+
+
+def _coverage_json(path, counts):
+    funcs = {name: {"execution_count": c, "start_line": 1} for name, c in counts.items()}
+    path.write_text(json.dumps({"sources": {"/src/a.c": {"": {"functions": funcs, "lines": {}}}}}))
+
+
+def test_index_matches_file_based_helpers(tmp_path):
+    lst = tmp_path / "user.txt"
+    lst.write_text("ibv_post_send\nibv_destroy_qp\nmlx5_poll_cq\nnot_in_build\n")
+    cov = tmp_path / "user_coverage.json"
+    _coverage_json(cov, {"ibv_post_send": 0, "ibv_destroy_qp": 3, "mlx5_poll_cq": 0, "helper": 0})
+
+    index = cb.UncoveredFunctionIndex(str(lst), str(cov))
+    paths = dict(user_coverage_path=str(cov), kernel_coverage_path=None, user_list_path=str(lst))
+    assert index.count() == cb.get_uncovered_function_count("user", **paths) == 2
+    assert index.all() == cb.get_all_uncovered_functions("user", **paths) == ["ibv_post_send", "mlx5_poll_cq"]
+    assert index.pick(ranked=True) == "ibv_post_send"
+    assert index.pick(rng=random.Random(1)) in {"ibv_post_send", "mlx5_poll_cq"}
+
+    # 增量：新覆盖的函数移出，覆盖过的不会因为之后某次计数为 0 回来
+    assert index.update({"ibv_post_send": 2, "not_in_build": 0, "helper": 5}) == 1
+    assert index.update({"ibv_post_send": 0, "ibv_destroy_qp": 0}) == 0
+    assert index.all() == ["mlx5_poll_cq", "not_in_build"]
+    assert index.pick(ranked=True) == "mlx5_poll_cq"
+    index.update({"mlx5_poll_cq": 1, "not_in_build": 1})
+    assert index.count() == 0 and index.pick() is None and index.pick(ranked=True) is None
+
+
+def test_index_rebuilds_from_json_only_when_not_fed(tmp_path):
+    lst = tmp_path / "kernel.txt"
+    lst.write_text("rxe_post_send\nib_create_qp\n")
+    cov = tmp_path / "kernel_coverage.json"
+    _coverage_json(cov, {"rxe_post_send": 0, "ib_create_qp": 0})
+    index = cb.UncoveredFunctionIndex(str(lst), str(cov))
+    assert index.count() == 2
+    # fastcov 模式：JSON 改了就重建
+    _coverage_json(cov, {"rxe_post_send": 1, "ib_create_qp": 0})
+    os.utime(cov, ns=(1, 1))
+    assert index.count() == 1
+    # native 模式：喂过增量之后不再读 JSON
+    index.update({"ib_create_qp": 4})
+    _coverage_json(cov, {"rxe_post_send": 0, "ib_create_qp": 0})
+    assert index.count() == 0
+
+
+def test_gcov_source_feeds_changed_functions(tmp_path):
+    shutil.copy(FIXTURES / "sample.gcda", tmp_path / "sample.gcda")
+    shutil.copy(FIXTURES / "sample.gcno", tmp_path / "sample.gcno")
+    lst = tmp_path / "user.txt"
+    lst.write_text("classify\nnever_called\nmain\n")
+    src = GcovSource([str(tmp_path / "*.gcda")], space=EdgeSpace())
+    index = cb.UncoveredFunctionIndex(str(lst))
+
+    src.read()
+    assert index.update({fn: c for (_, fn), c in src.changed_function_counts().items()}) == 2
+    assert index.all() == ["never_called"]
+    src.read()
+    assert src.changed_function_counts() == {}
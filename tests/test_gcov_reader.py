@@ -0,0 +1,168 @@
+import json
+import os
+import shutil
+import struct
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from lib.gcov_reader import EdgeSpace, GcovSource, gcov_major, parse_gcda, parse_gcno
+
+# gcc 12.2 --coverage -O0 编译 sample.c，不带参数跑一次
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "gcov"
+MAIN, NEVER, CLASSIFY = 108032747, 1661851531, 705013252
+
+
+def test_parse_fixture_gcda_and_gcno():
+    gcda = parse_gcda((FIXTURES / "sample.gcda").read_bytes())
+    assert gcov_major(gcda.version) == 12
+    assert [k[0] for k in gcda.keys] == [MAIN, NEVER, CLASSIFY]
+    assert gcda.offsets.tolist() == [0, 4, 5, 8]
+    # never_called 的计数是负长度的全零记录
+    assert gcda.counts.dtype == np.uint64 and gcda.counts.tolist() == [1, 5, 5, 1, 0, 5, 2, 1]
+
+    funcs = parse_gcno((FIXTURES / "sample.gcno").read_bytes())
+    assert {k: (f.name, f.lineno) for k, f in funcs.items()} == {
+        MAIN: ("main", 14),
+        NEVER: ("never_called", 10),
+        CLASSIFY: ("classify", 2),
+    }
+    assert all(os.path.basename(f.source) == "sample.c" for f in funcs.values())
+
+
+def _word_record(tag, words):
+    return struct.pack("<II", tag, len(words)) + b"".join(struct.pack("<I", w) for w in words)
+
+
+def test_parse_pre_gcc12_word_lengths():
+    # GCC 9 格式：记录长度按 4 字节字计，没有 checksum 字段
+    data = struct.pack("<III", 0x67636461, int.from_bytes(b"A93*", "big"), 7)
+    data += _word_record(0x01000000, [11, 0, 22])
+    data += _word_record(0x01A10000, [3, 0, 0, 1])  # 3, 1<<32
+    data += _word_record(0x01000000, [12, 0, 23])
+    data += _word_record(0x01A10000, [0, 0])
+    data += _word_record(0xA1000000, [1, 2])
+    gcda = parse_gcda(data)
+    assert gcov_major(gcda.version) == 9
+    assert gcda.keys == [(11, 0, 22), (12, 0, 23)]
+    assert gcda.counts.tolist() == [3, 1 << 32, 0]
+
+
+def test_source_reads_only_changed_files_and_exports_summary(tmp_path):
+    for name in ("sample.gcda", "sample.gcno"):
+        shutil.copy(FIXTURES / name, tmp_path / name)
+    other = tmp_path / "sub"
+    other.mkdir()
+    shutil.copy(FIXTURES / "sample.gcda", other / "copy.gcda")  # 没有 gcno：不过滤，函数名用 fn<ident>
+
+    space = EdgeSpace()
+    src = GcovSource([str(tmp_path / "*.gcda"), str(tmp_path / "sub" / "*.gcda")], space=space)
+    first = src.read()
+    assert src.stats["parsed"] == 2 and len(first.ids) == 16 and space.size == 16
+    covered = set(space.names(first.covered()))
+    assert f"{tmp_path}/sample:classify#1" in covered and f"{tmp_path}/sample:never_called#0" not in covered
+    assert f"{tmp_path}/sub/copy:fn{MAIN}#0" in covered
+
+    src.read()
+    assert src.stats["parsed"] == 2 and src.stats["cached"] == 2
+
+    # 把 never_called 的全零记录改成计数 7（同样长度）：只重读这一个文件，编号不变
+    data = bytearray((FIXTURES / "sample.gcda").read_bytes())
+    rec = struct.pack("<II", 0x01A10000, 0xFFFFFFF8)
+    i = data.index(rec)
+    patched = bytes(data[:i]) + struct.pack("<IIQ", 0x01A10000, 8, 7) + bytes(data[i + 8 :])
+    (tmp_path / "sample.gcda").write_bytes(patched)
+    second = src.read()
+    assert src.stats["parsed"] == 3 and space.size == 16
+    assert sorted(second.ids.tolist()) == sorted(first.ids.tolist())
+    assert f"{tmp_path}/sample:never_called#0" in space.names(second.covered())
+
+    out = tmp_path / "user_coverage.json"
+    assert src.export_function_summary(str(out))
+    fns = next(iter(json.loads(out.read_text())["sources"].values()))[""]["functions"]
+    assert fns["never_called"] == {"execution_count": 7, "start_line": 10}
+    assert fns["main"]["execution_count"] > 0
+    # 执行过的函数集合没变就不重写
+    assert not src.export_function_summary(str(out))
+
+
+def test_source_include_exclude_by_gcno_source(tmp_path):
+    shutil.copy(FIXTURES / "sample.gcda", tmp_path / "sample.gcda")
+    shutil.copy(FIXTURES / "sample.gcno", tmp_path / "sample.gcno")
+    source_dir = os.path.dirname(next(iter(parse_gcno((FIXTURES / "sample.gcno").read_bytes()).values())).source)
+    assert len(GcovSource([str(tmp_path / "*.gcda")], include=[source_dir], space=EdgeSpace()).read().ids) == 8
+    assert len(GcovSource([str(tmp_path / "*.gcda")], exclude=[source_dir], space=EdgeSpace()).read().ids) == 0
+
+
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="needs gcc")
+def test_reset_gives_per_run_counts(tmp_path):
+    src = tmp_path / "sample.c"
+    shutil.copy(FIXTURES / "sample.c", src)
+    exe = tmp_path / "sample"
+    subprocess.run(["gcc", "--coverage", "-O0", "-o", str(exe), str(src)], cwd=tmp_path, check=True)
+    cov = GcovSource([str(tmp_path / "*.gcda")], space=EdgeSpace())
+
+    def run(*args):
+        subprocess.run([str(exe), *args], cwd=tmp_path, check=True, capture_output=True)
+        return cov.read()
+
+    run()
+    total = run("x").counts.sum()  # 不清零时是两次运行的累加
+    assert cov.reset() == 1 and not list(tmp_path.glob("*.gcda"))
+    assert cov.read().ids.size == 0
+    one = run("x")
+    assert 0 < one.counts.sum() < total
+    cov.reset()
+    assert run().counts.sum() == total - one.counts.sum()
+
+    # 未覆盖函数的统计跨 reset 累计
+    counts = cov.function_counts()
+    assert counts[(str(src), "main")] > 0 and counts[(str(src), "never_called")] == 0
+
+
+def test_parallel_shards_match_serial_read(tmp_path):
+    for d in ("core", "rxe", "mlx5"):
+        (tmp_path / d).mkdir()
+        for name in ("sample.gcda", "sample.gcno"):
+            shutil.copy(FIXTURES / name, tmp_path / d / name)
+    pattern = [str(tmp_path / "*" / "*.gcda")]
+
+    def collect(workers):
+        space = EdgeSpace()
+        src = GcovSource(pattern, space=space, workers=workers)
+        sample = src.read()
+        return src, sorted(zip(space.names(sample.ids), sample.counts.tolist()))
+
+    par, got = collect(3)
+    assert got == collect(1)[1] and len(got) == 24
+    assert par.stats["shards"] == 3 and par.stats["parsed"] == 3
+    par.read()
+    assert par.stats["cached"] == 3
+
+
+def test_async_collection_waits_before_reset(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    from lib import runexec
+
+    release = threading.Event()
+    order = []
+
+    def slow_feed_back():
+        release.wait(5)
+        order.append("collected")
+        return {"f.c:1"}
+
+    monkeypatch.setattr(runexec, "feed_back", slow_feed_back)
+    monkeypatch.setattr(runexec, "COVERAGE_RESET", False)
+    fut = runexec.collect_coverage_async()
+    assert not fut.done()
+    threading.Timer(0.05, release.set).start()
+    t0 = time.perf_counter()
+    runexec.reset_coverage()
+    order.append("reset")
+    assert order == ["collected", "reset"] and time.perf_counter() - t0 >= 0.04
+    assert fut.result() == {"f.c:1"}
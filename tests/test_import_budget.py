@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import importtime_budget
+from importtime_budget import HEAVY_MODULES, ROOT, measure, parse_importtime
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   lib.value\n"
+        "import time:      3000 |      35049 | lib.verbs\n"
+    )
+    assert parse_importtime(stderr) == {"lib.value": 120, "lib.verbs": 35049}
+
+
+def test_entry_points_stay_within_budget():
+    for mod in ("lib.verbs", "my_fuzz_test"):
+        ms, heavy = measure(mod, repeat=2)
+        assert heavy == [], f"{mod} imports {heavy} at start-up"
+        assert ms <= importtime_budget.BUDGETS_MS[mod]
+
+
+def test_registry_resolves_lazily():
+    code = (
+        "import sys\n"
+        "from lib.verb_registry import get_class\n"
+        "assert get_class('AllocPD').__module__ == 'lib.verbs'\n"
+        "assert get_class('CreateSRQEx').__module__ == 'lib.verbs'\n"
+        "assert not [m for m in sys.modules if m.startswith('lib.cm.')]\n"
+        "assert get_class('RdmaConnect').__module__ == 'lib.cm.rdma_connect'\n"
+        f"assert not [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
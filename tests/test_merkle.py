@@ -0,0 +1,79 @@
+import contextlib
+import copy
+import io
+import random
+
+from lib import fuzz_mutate, merkle
+from lib.corpus import Corpus
+from lib.merkle import node_hash, program_hash
+from lib.verb_registry import from_dict, to_state
+from lib.value import IntValue, ListValue
+
+
+def test_cached_hash_matches_fresh_hash_across_mutations(initial_verbs):
+    verbs = initial_verbs
+    mutator = fuzz_mutate.ContractAwareMutator(random.Random(11))
+    seen = set()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(20):
+            # 与 fuzz 循环一样：deepcopy（带着缓存的哈希）后再变异副本
+            parent, parent_hash = verbs, program_hash(verbs)
+            verbs = copy.deepcopy(parent)
+            try:
+                mutator.mutate(verbs)
+            except Exception:
+                pass
+            h = program_hash(verbs)
+            # from_dict 从状态重建，没有任何缓存
+            assert h == program_hash(from_dict(to_state(verbs)))
+            assert program_hash(parent) == parent_hash
+            seen.add(h)
+    assert len(seen) > 1
+
+
+def test_assignment_and_list_mutation_invalidate_ancestors(initial_verbs):
+    verbs = initial_verbs
+    before = program_hash(verbs)
+    target = next(v for v in verbs if any(isinstance(x, IntValue) for x in vars(v).values()))
+    name, iv = next((k, x) for k, x in vars(target).items() if isinstance(x, IntValue))
+    old = iv.value
+    iv.value = old + 1
+    assert program_hash(verbs) != before
+    iv.value = old
+    assert program_hash(verbs) == before
+
+    # ListValue 的 append/pop/交换是原地修改
+    lv = ListValue([IntValue(1)], factory=lambda: IntValue(2))
+    rng = random.Random(0)
+    for _ in range(10):
+        node_hash(lv)
+        lv.mutate(rng=rng)
+        assert node_hash(lv) == node_hash(copy.deepcopy(lv))
+
+
+def test_child_differing_by_one_verb_rehashes_only_that_verb(monkeypatch, initial_verbs):
+    verbs = initial_verbs
+    program_hash(verbs)
+    encoded = []
+    orig = merkle._encode
+    monkeypatch.setattr(merkle, "_encode", lambda obj: encoded.append(obj) or orig(obj))
+
+    assert "_mhash" in vars(copy.deepcopy(verbs[0]))
+    assert "_mhash" not in verbs[0].__getstate__()
+    program_hash(verbs)
+    assert encoded == []
+
+    verbs[-1] = copy.deepcopy(verbs[-1])
+    program_hash(verbs)
+    touched = {id(o) for o in encoded}
+    assert all(id(v) not in touched for v in verbs[:-1])
+
+
+def test_corpus_ids_use_program_hash(tmp_path, initial_verbs):
+    verbs = initial_verbs
+    corpus = Corpus(str(tmp_path / "corpus"))
+    sid = corpus.add(verbs)
+    assert sid == program_hash(verbs) == Corpus.program_id(corpus.load_verbs(sid))
+    assert corpus.has_seed(sid) and not corpus.has_run(sid)
+    corpus.record_run(sid, {"outcome": "ok"})
+    assert corpus.has_run(sid)
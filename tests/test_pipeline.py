@@ -0,0 +1,102 @@
+import threading
+import time
+
+from lib.pipeline import BuildCancelled, PipelinedExecutor
+
+
+def _sleep_build(delay, log=None):
+    def build(job):
+        if job.payload == "bad":
+            raise RuntimeError("compile error")
+        end = time.monotonic() + delay
+        while time.monotonic() < end:
+            if job.cancelled:
+                if log is not None:
+                    log.append(job.key)
+                raise BuildCancelled(job.key)
+            time.sleep(0.005)
+        return f"/bin/{job.key}"
+
+    return build
+
+
+def _sleep_run(delay):
+    def run(job):
+        time.sleep(delay)
+        return {"outcome": "ok", "bin": job.bin_path}
+
+    return run
+
+
+def test_build_overlaps_run():
+    n, build_s, run_s = 6, 0.1, 0.1
+    with PipelinedExecutor(_sleep_build(build_s), _sleep_run(run_s), workers=2, lookahead=3) as pipe:
+        t0 = time.monotonic()
+        done = []
+        submitted = 0
+        while len(done) < n:
+            while submitted < n and pipe.has_capacity():
+                pipe.submit(f"c{submitted}", submitted)
+                submitted += 1
+            job, res = pipe.run_next()
+            assert res == {"outcome": "ok", "bin": f"/bin/{job.key}"}
+            done.append(job.key)
+        elapsed = time.monotonic() - t0
+    assert done == [f"c{i}" for i in range(n)]
+    # 串行需要 n * (build + run) = 1.2s
+    assert elapsed < 0.8 * n * (build_s + run_s)
+
+
+def test_priority_cancel_and_failed_build():
+    cancelled = []
+    gate = threading.Event()
+
+    def build(job):
+        gate.wait(2)
+        return _sleep_build(0.3, cancelled)(job)
+
+    with PipelinedExecutor(build, _sleep_run(0), workers=1, lookahead=8) as pipe:
+        pipe.submit("slow", "x", priority=1.0)
+        pipe.submit("queued", "y", priority=0.5)
+        pipe.submit("bad", "bad", priority=0.1)
+        pipe.submit("best", "z", priority=0.2)
+        gate.set()
+        time.sleep(0.05)
+        # slow 正在编译、queued 还在排队：都被取消
+        assert pipe.reprioritize({"bad": 0.1, "best": 0.9}, cancel_missing=True) == ["slow", "queued"]
+        job, res = pipe.run_next(timeout=5)
+        assert job.key == "best"
+        job, res = pipe.run_next(timeout=5)
+        assert job.key == "bad" and res["outcome"] == "error" and "compile error" in res["detail"]
+        assert pipe.run_next(timeout=0.1) is None
+    assert cancelled == ["slow"]
+    assert pipe.stats["cancelled"] == 2 and pipe.stats["failed"] == 1 and pipe.stats["run"] == 1
+
+
+def test_failed_and_cancelled_jobs_are_cleaned_up():
+    cleaned = []
+    gate = threading.Event()
+
+    def build(job):
+        gate.wait(2)
+        return _sleep_build(0.3)(job)
+
+    def cleanup(job):
+        cleaned.append(job.key)
+
+    with PipelinedExecutor(build, _sleep_run(0), workers=1, lookahead=8, cleanup_fn=cleanup) as pipe:
+        pipe.submit("building", "x", priority=1.0)
+        pipe.submit("queued", "y", priority=0.5)
+        pipe.submit("bad", "bad", priority=0.1)
+        pipe.submit("ok", "z", priority=0.0)
+        gate.set()
+        time.sleep(0.05)
+        assert pipe.cancel("queued") and cleaned == ["queued"]
+        # 正在编译的等编译线程退出后才清理
+        assert pipe.cancel("building")
+        job, res = pipe.run_next(timeout=5)
+        assert job.key == "bad" and res["outcome"] == "error"
+        job, res = pipe.run_next(timeout=5)
+        assert job.key == "ok"
+    # 运行过的交给 run_fn 清理
+    assert sorted(cleaned) == ["bad", "building", "queued"]
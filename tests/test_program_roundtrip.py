@@ -0,0 +1,99 @@
+import contextlib
+import copy
+import importlib
+import io
+import json
+import pkgutil
+import random
+from pathlib import Path
+
+import pytest
+
+from lib import fuzz_mutate
+from lib.json_utils import iter_programs_jsonl, append_program_jsonl, verbs_to_program_obj, program_obj_to_verbs
+from lib.renderer import apply_program
+from lib.verb_registry import all_classes, from_dict, to_state
+
+SCAFFOLD_DIR = Path(__file__).resolve().parent.parent / "lib" / "scaffolds"
+
+
+def _gen_c(verbs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        verbs, ctx = apply_program(verbs, gid_index=3)
+        return "".join(v.generate_c(ctx) for v in verbs)
+
+
+def _assert_roundtrip(verbs):
+    verbs = copy.deepcopy(verbs)
+    state = json.loads(json.dumps(to_state(verbs)))
+    back = from_dict(state)
+    assert to_state(back) == state
+    assert _gen_c(back) == _gen_c(copy.deepcopy(verbs))
+
+
+def _initial_programs(monkeypatch, tmp_path):
+    # my_fuzz_test 间接导入 auto_run，会在当前目录建 ./repo
+    monkeypatch.chdir(tmp_path)
+    progs = {}
+    for name in ("my_fuzz_test", "fuzz_test"):
+        try:
+            progs[name] = importlib.import_module(name).INITIAL_VERBS
+        except ImportError:
+            continue
+    return progs
+
+
+def _scaffold_programs():
+    verbs = importlib.import_module("fuzz_test").INITIAL_VERBS
+    snap, _ = fuzz_mutate._make_snapshot(verbs, len(verbs))
+    for modinfo in pkgutil.iter_modules([str(SCAFFOLD_DIR)]):
+        mod = importlib.import_module(f"lib.scaffolds.{modinfo.name}")
+        for seed in range(3):
+            ret = mod.build(snap, snap, random.Random(seed))
+            if ret:
+                yield f"{modinfo.name}[{seed}]", ret[0]
+
+
+def test_registry_covers_verbs_attrs_and_cm_plugins():
+    classes = all_classes()
+    for name in ("AllocPD", "ModifyQP", "PostSend", "IbvQPAttr", "IbvSge", "OptionalValue", "RdmaConnect"):
+        assert name in classes
+
+
+def test_initial_verbs_roundtrip(monkeypatch, tmp_path):
+    progs = _initial_programs(monkeypatch, tmp_path)
+    assert progs
+    for verbs in progs.values():
+        _assert_roundtrip(verbs)
+
+
+def test_every_scaffold_roundtrip():
+    names = []
+    for name, verbs in _scaffold_programs():
+        _assert_roundtrip(verbs)
+        names.append(name)
+    assert len({n.split("[")[0] for n in names}) >= 10
+
+
+def test_mutated_program_roundtrip_and_remutate(initial_verbs):
+    verbs = initial_verbs
+    mutator = fuzz_mutate.ContractAwareMutator(random.Random(7))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(5):
+            mutator.mutate(verbs)
+    _assert_roundtrip(verbs)
+
+    back = program_obj_to_verbs(json.loads(json.dumps(verbs_to_program_obj(verbs))))
+    with contextlib.redirect_stdout(io.StringIO()):
+        fuzz_mutate.ContractAwareMutator(random.Random(8)).mutate(back)
+
+
+def test_jsonl_streaming(tmp_path):
+    path = tmp_path / "seeds.jsonl"
+    progs = [verbs for _, verbs in _scaffold_programs()][:4]
+    for i, verbs in enumerate(progs):
+        append_program_jsonl(verbs, str(path), seed=i)
+    loaded = list(iter_programs_jsonl(str(path)))
+    assert [m["seed"] for m, _ in loaded] == list(range(len(progs)))
+    for (_, back), verbs in zip(loaded, progs):
+        assert _gen_c(back) == _gen_c(copy.deepcopy(verbs))
@@ -0,0 +1,118 @@
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _auto_run(monkeypatch, tmp_path):
+    # auto_run 导入时在当前目录建 ./repo
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("lib.auto_run")
+
+
+def test_coordinator_signals_ready_after_first_views(monkeypatch, tmp_path):
+    ar = _auto_run(monkeypatch, tmp_path)
+    files = {k: str(tmp_path / f"{k}.json") for k in ("server_update", "client_update", "server_view", "client_view")}
+    cmd = [sys.executable, str(ROOT / "coordinator.py")]
+    for k, v in files.items():
+        cmd += ["--" + k.replace("_", "-"), v]
+
+    t0 = time.monotonic()
+    proc, ready = ar.start_with_ready(cmd, "coordinator", timeout=10)
+    try:
+        assert ready and time.monotonic() - t0 < 5
+        assert Path(files["client_view"]).exists() and Path(files["server_view"]).exists()
+        assert not ar.wait_for_view(files["client_view"], timeout=0.05)
+        # server 写出 QP 后，coordinator 合并进 client 视图
+        Path(files["server_update"]).write_text(json.dumps({"local": {"QP": [{"id": "srv0"}]}}))
+        assert ar.wait_for_view(files["client_view"], timeout=5)
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_not_ready_when_process_exits_or_stays_silent(monkeypatch, tmp_path):
+    ar = _auto_run(monkeypatch, tmp_path)
+    t0 = time.monotonic()
+    proc, ready = ar.start_with_ready([sys.executable, "-c", "import sys; sys.exit(2)"], "dead", timeout=10)
+    assert not ready and proc.wait() == 2 and time.monotonic() - t0 < 5
+
+    proc, ready = ar.start_with_ready([sys.executable, "-c", "import time; time.sleep(5)"], "silent", timeout=0.2)
+    try:
+        assert not ready
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+# 常驻 server 的桩：就绪握手，之后每 20ms 把视图里的 session 回显到 server_update.json
+STUB_SERVER = r'''
+import json, os, sys, time
+view, update = os.environ["RDMA_FUZZ_RUNTIME"], sys.argv[1]
+def dump(session):
+    tmp = update + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"session": session, "local": {"QP": [{"id": "srv0", "qpn": 7}], "pairs": [
+            {"id": "p0", "srv_id": "srv0", "state": "BOTH_RTS"}]}}, f)
+    os.replace(tmp, update)
+dump(0)
+fd = int(os.environ.pop("RDMA_FUZZ_READY_FD"))
+os.write(fd, b"READY server %d\n" % os.getpid()); os.close(fd)
+while True:
+    try:
+        dump(json.load(open(view)).get("session", 0))
+    except (OSError, ValueError):
+        pass
+    time.sleep(0.02)
+'''
+
+
+@pytest.mark.parametrize("inproc", [False, True])
+def test_persistent_peers_bump_session_and_epochs(monkeypatch, tmp_path, inproc):
+    ar = _auto_run(monkeypatch, tmp_path)
+    monkeypatch.setattr(ar, "INPROC_COORD", inproc)
+    files = {k: str(tmp_path / f"{k}.json") for k in ("server_update", "client_update", "server_view", "client_view")}
+    coord = [sys.executable, str(ROOT / "coordinator.py")]
+    for k, v in files.items():
+        coord += ["--" + k.replace("_", "-"), v]
+    stub = tmp_path / "stub_server.py"
+    stub.write_text(STUB_SERVER)
+    monkeypatch.setattr(ar, "COORDINATOR_CMD", coord)
+    monkeypatch.setattr(ar, "SERVER_BIN", str(stub))
+    monkeypatch.setattr(ar, "SERVER_VIEW", files["server_view"])
+    monkeypatch.setattr(ar, "CLIENT_VIEW", files["client_view"])
+    monkeypatch.setattr(ar, "start_with_ready", _python_launcher(ar.start_with_ready, files["server_update"]))
+
+    peers = ar.PersistentPeers(session_file=str(tmp_path / "session.json"))
+    try:
+        assert peers.begin_session() == 1
+        pids = (getattr(peers.coord_proc, "pid", None), peers.server_proc.pid)
+        view = json.loads(Path(files["client_view"]).read_text())
+        assert view["session"] == 1 and view["_coordinator"]["remote_session"] == 1
+        epoch = {p["id"]: p["epoch"] for p in view["pairs"]}["p0"]
+
+        assert peers.begin_session() == 2
+        assert (getattr(peers.coord_proc, "pid", None), peers.server_proc.pid) == pids  # 没有重启
+        view = json.loads(Path(files["client_view"]).read_text())
+        assert view["session"] == 2 and {p["id"]: p["epoch"] for p in view["pairs"]}["p0"] > epoch
+
+        peers.server_proc.kill()
+        peers.server_proc.wait()
+        assert peers.begin_session() == 3 and peers.alive()
+    finally:
+        peers.close()
+
+
+def _python_launcher(start_with_ready, update_path):
+    # SERVER_BIN 是 python 桩脚本：换成 python 解释器启动，并把 server_update.json 路径传过去
+    def launch(cmd, name, env=None, timeout=10):
+        if cmd[0].endswith(".py") and name == "server":
+            cmd = [sys.executable, cmd[0], update_path]
+        return start_with_ready(cmd, name, env=env, timeout=timeout)
+
+    return launch
@@ -0,0 +1,48 @@
+import contextlib
+import copy
+import io
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+from lib.renderer import DEFAULT_KNOBS, TEMPLATE_DIR, ClientRenderer, apply_program
+
+
+def _jinja_reference(verbs, **knobs):
+    full, ctx = apply_program(copy.deepcopy(verbs))
+    body = "".join(v.generate_c(ctx) for v in full)
+    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)), trim_blocks=True, lstrip_blocks=True)
+    tpl = env.get_template("client.cpp.j2")
+    prolog_extra = ctx.generate_variable_definitions_all()
+    return tpl.render(**{**DEFAULT_KNOBS, **knobs}, verbs_region=body, prolog_extra=prolog_extra)
+
+
+def test_render_matches_fresh_jinja_environment(initial_verbs):
+    renderer = ClientRenderer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for length in (1000, 16):
+            full, ctx = apply_program(copy.deepcopy(initial_verbs))
+            assert renderer.render(full, ctx, length=length) == _jinja_reference(initial_verbs, length=length)
+    assert "PR_QP  qps[16];" in renderer.segments(length=16)[1]
+
+
+def test_render_to_and_render_many(tmp_path, initial_verbs):
+    renderer = ClientRenderer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = _jinja_reference(initial_verbs)
+        full, ctx = apply_program(copy.deepcopy(initial_verbs))
+        buf = io.StringIO()
+        renderer.render_to(buf, full, ctx)
+        assert buf.getvalue() == expected
+
+        paths = [tmp_path / "a.cpp", tmp_path / "b.cpp"]
+        progs = [copy.deepcopy(initial_verbs) for _ in paths]
+        assert renderer.render_many(progs, out_paths=paths) == paths
+        assert renderer.render_many([copy.deepcopy(initial_verbs)]) == [expected]
+    assert all(p.read_text() == expected for p in paths)
+
+
+def test_template_without_slots_is_rejected(tmp_path):
+    (tmp_path / "bad.cpp.j2").write_text("int main(){ {{ verbs_region }} }\n")
+    with pytest.raises(ValueError):
+        ClientRenderer(template_dir=tmp_path, template_name="bad.cpp.j2").segments()
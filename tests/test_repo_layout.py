@@ -0,0 +1,75 @@
+import multiprocessing
+import runpy
+import zipfile
+from pathlib import Path
+
+from lib.repo_layout import RunIdAllocator, find_run_dir, iter_run_dirs, run_dir, seed_dir
+
+
+def _allocate(root, n, out):
+    ids = RunIdAllocator(root)
+    out.extend([ids.next() for _ in range(n)])
+
+
+def test_allocator_seeds_from_both_layouts_and_is_process_safe(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "000041_client.cpp").write_text("")
+    (root / "000099_seed.log").write_text("")  # 别的编号空间，不算
+    d = run_dir("000057", root)
+    (d / "000057_client.cpp").write_text("")
+    assert d == root / "000" / "000057"
+
+    ids = RunIdAllocator(root)
+    assert ids.current() is None
+    assert ids.next() == "000058" and ids.current() == "000058"
+    # 之后只读计数器，不再扫目录
+    (root / "000500_client.cpp").write_text("")
+    assert ids.next() == "000059"
+
+    with multiprocessing.Manager() as m:
+        out = m.list()
+        procs = [multiprocessing.Process(target=_allocate, args=(root, 50, out)) for _ in range(4)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        got = sorted(out)
+    assert got == [f"{n:06d}" for n in range(60, 260)]
+
+
+def test_seed_logs_do_not_share_run_directories(tmp_path):
+    root = tmp_path / "repo"
+    assert seed_dir("000007", root) == root / "seeds" / "000" / "000007"
+    assert seed_dir("000007", root, layout="flat") == root
+    (seed_dir("000030", root) / "000030_seed.log").write_text("")
+    (run_dir("000012", root) / "000012_seed.log").write_text("")  # 老布局
+    ids = RunIdAllocator(root, "seed", "_seed.log", scan=(root, root / "seeds"))
+    assert ids.next() == "000031"
+    # 运行目录里看不到种子日志的目录
+    assert list(iter_run_dirs(root)) == [root, root / "000" / "000012"]
+
+
+def test_layouts_are_readable_and_collect_crashes_handles_both(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    root = Path("repo")
+    assert run_dir("000003", root, layout="flat") == root
+    (root / "000003_client.stderr.log").write_text("ERROR: AddressSanitizer: SEGV\n")
+    (root / "000003_client.cpp").write_text("")
+    d = run_dir("001234", root)
+    (d / "001234_client.log").write_text("1 E ERROR: AddressSanitizer: heap-use-after-free\n")
+    (d / "001234_seed.log").write_text("")
+    (d / "001234_compile.log").write_text("")
+    other = run_dir("001235", root)
+    (other / "001235_client.log").write_text("1 O fine\n")
+    (root / "build_cache" / "ab").mkdir(parents=True)
+
+    assert list(iter_run_dirs(root)) == [root, root / "001" / "001234", root / "001" / "001235"]
+    assert find_run_dir("001234", root) == d and find_run_dir("000003", root) == root
+
+    runpy.run_path(str(Path(__file__).resolve().parents[1] / "collect_crashes.py"), run_name="__main__")
+    with zipfile.ZipFile("collect.zip") as z:
+        names = sorted(z.namelist())
+    assert names == sorted(
+        ["000003_client.stderr.log", "000003_client.cpp", "001234_client.log", "001234_seed.log", "001234_compile.log"]
+    )
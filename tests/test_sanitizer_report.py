@@ -0,0 +1,92 @@
+from lib.capture import STDERR, MergedCapture
+from lib.corpus import Corpus
+from lib.runexec import parse_crash_site_text
+from lib.sanitizer_report import parse_report_text
+
+ASAN = """\
+==4242==ERROR: AddressSanitizer: heap-use-after-free on address 0x602000000010 at pc 0x4c8b4a bp 0x7ffd sp 0x7ffc
+READ of size 4 at 0x602000000010 thread T0
+    #0 0x4c8b4a in __asan_memcpy (/usr/lib/x86_64-linux-gnu/libasan.so.8+0xbd1a4) (BuildId: 1a2b)
+    #1 0x4c8c10 in pr_post_send /src/pair_runtime.cpp:{line}:5
+    #2 0x4c8d20 in main /src/client.cpp:100
+    #3 0x7f0000 in __libc_start_main (/lib/x86_64-linux-gnu/libc.so.6+0x21bf6)
+
+0x602000000010 is located 0 bytes inside of 4-byte region [0x602000000010,0x602000000014)
+freed by thread T0 here:
+    #0 0x1 in free (/usr/lib/x86_64-linux-gnu/libasan.so.8+0xd7b58)
+    #1 0x2 in pr_destroy /src/pair_runtime.cpp:80
+SUMMARY: AddressSanitizer: heap-use-after-free /src/pair_runtime.cpp:{line} in pr_post_send
+==4242==ABORTING
+"""
+
+# journalctl -o short-iso 的行前缀
+JOURNAL = "2025-01-01T00:00:00+0000 host kernel: "
+DMESG = """\
+[  101.000001] ==================================================================
+[  101.000002] BUG: KASAN: slab-use-after-free in rxe_post_send+0x{off}/0x2000 [rdma_rxe]
+[  101.000003] Write of size 8 at addr ffff888012345678 by task client/1234
+[  101.000004] Call Trace:
+[  101.000005]  <TASK>
+[  101.000006]  dump_stack_lvl+0x48/0x70
+[  101.000007]  print_report+0xd2/0x670
+[  101.000008]  ? rxe_post_send+0x{off}/0x2000 [rdma_rxe]
+[  101.000009]  kasan_report+0xd7/0x120
+[  101.000010]  rxe_post_send+0x{off}/0x2000 [rdma_rxe]
+[  101.000011]  ib_uverbs_post_send+0x11/0x22 [ib_uverbs]
+[  101.000012]  </TASK>
+[  101.000013] Allocated by task 1234:
+[  101.000014]  kmalloc_trace+0x1/0x2
+[  101.000015] ==================================================================
+{j}WARNING: CPU: 1 PID: 99 at drivers/infiniband/core/verbs.c:1234 ib_dealloc_pd_user+0x60/0x80 [ib_core]
+{j}Call Trace:
+{j} <TASK>
+{j} ? __warn+0x81/0x130
+{j} ib_dealloc_pd_user+0x60/0x80 [ib_core]
+{j} </TASK>
+{j}BUG: kernel NULL pointer dereference, address: 0000000000000008
+{j}#PF: supervisor read access in kernel mode
+{j}Oops: 0000 [#1] SMP NOPTI
+{j}RIP: 0010:mlx5_ib_post_send+0x12/0x40 [mlx5_ib]
+"""
+
+
+def test_asan_report_fields_and_stable_hash(tmp_path):
+    (rep,) = parse_report_text(ASAN.format(line=42))
+    assert (rep.source, rep.bug_type, rep.access, rep.size) == ("asan", "heap-use-after-free", "READ", 4)
+    # sanitizer 自己的帧、libc 启动帧、free 的第二个栈都不算
+    assert [str(f) for f in rep.top_frames()] == ["pr_post_send pair_runtime.cpp:42", "main client.cpp:100"]
+    assert rep.site == parse_crash_site_text(ASAN.format(line=42)) == "bt#pair_runtime.cpp:42 in pr_post_send"
+    # 行号变了（重新编译）还是同一个桶
+    assert parse_report_text(ASAN.format(line=57))[0].bucket == rep.bucket
+
+    # 捕获线程边读边解析，结果一样；没有 SUMMARY 的半份报告在 close 时也算
+    cap = MergedCapture(tmp_path / "x.log")
+    cap.feed(STDERR, ASAN.format(line=42).encode())
+    cap.feed(STDERR, b"==7==ERROR: AddressSanitizer: SEGV on unknown address 0x000000000000\n")
+    cap.close()
+    assert cap.reports[0].bucket == rep.bucket and cap.reports[1].bug_type == "SEGV"
+
+
+def test_kernel_reports_from_dmesg_and_journal():
+    kasan, warn, bug = parse_report_text(DMESG.format(off="1234", j=JOURNAL))
+    assert (kasan.source, kasan.bug_type, kasan.access, kasan.size) == ("kasan", "slab-use-after-free", "WRITE", 8)
+    assert [str(f) for f in kasan.top_frames()] == ["rxe_post_send [rdma_rxe]", "ib_uverbs_post_send [ib_uverbs]"]
+    assert kasan.site == "kasan#rxe_post_send"
+    assert parse_report_text(DMESG.format(off="99", j=JOURNAL))[0].bucket == kasan.bucket
+    assert (warn.source, warn.site) == ("warn", "warn#ib_dealloc_pd_user")
+    # Oops 行属于前面那份 BUG 报告；没有 Call Trace 时用 RIP
+    assert (bug.bug_type, bug.access, bug.site) == ("null-ptr-deref", "READ", "bug#mlx5_ib_post_send")
+
+
+def test_corpus_crash_bucket_index(tmp_path):
+    corpus = Corpus(str(tmp_path))
+    rep = parse_report_text(ASAN.format(line=42))[0].to_dict()
+    corpus.db.execute("INSERT INTO seeds(id) VALUES ('s1'), ('s2')")
+    assert corpus.record_crash("s1", rep, "000001")
+    assert not corpus.record_crash("s2", rep, "000002")
+    assert corpus.has_crash_bucket(rep["bucket"])
+    (bucket,) = corpus.crash_buckets()
+    assert (bucket["hits"], bucket["first_seed"], bucket["frames"]) == (2, "s1", rep["frames"])
+    assert [r["run_index"] for r in corpus.crash_seeds(rep["bucket"])] == ["000001", "000002"]
+    row = corpus.db.execute("SELECT crash_kind, crash_site FROM seeds WHERE id='s2'").fetchone()
+    assert row == ("asan:heap-use-after-free", "bt#pair_runtime.cpp:42 in pr_post_send")
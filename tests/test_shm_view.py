@@ -0,0 +1,149 @@
+import json
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from lib.coordinator import Coordinator
+from lib.shm_view import (
+    MIN_CAPACITY,
+    T_ARR,
+    T_BOOL,
+    T_NULL,
+    T_NUM,
+    T_OBJ,
+    T_STR,
+    ShmViewWriter,
+    encode,
+    lookup,
+    shm_path,
+    snapshot,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+VIEW = {
+    "session": 3,
+    "remote": {
+        "QP": [{"id": "srv0", "qpn": 17, "gid": "fe80::1"}, {"id": "srv1", "qpn": 18}],
+        "ids": {"QP": ["srv0", "srv1"]},
+    },
+    "pairs": [{"id": "p0", "state": "READY", "epoch": 2, "ok": True, "note": None}],
+}
+
+
+def test_encode_lookup_paths_and_id_aliases():
+    data = encode(VIEW)
+    assert lookup(data, "session") == (T_NUM, 3.0)
+    assert lookup(data, "remote.QP[1].qpn") == (T_NUM, 18.0)
+    assert lookup(data, "remote.QP{srv1}.qpn") == (T_NUM, 18.0)
+    assert lookup(data, "remote.QP{srv0}.gid") == (T_STR, "fe80::1")
+    assert lookup(data, "remote.ids.QP[1]") == (T_STR, "srv1")
+    assert lookup(data, "remote.QP") == (T_ARR, 2)
+    assert lookup(data, "remote.QP{srv0}") == (T_OBJ, 3)
+    assert lookup(data, "pairs{p0}.ok") == (T_BOOL, True)
+    assert lookup(data, "pairs[0].note") == (T_NULL, None)
+    assert lookup(data, "remote.QP{srv2}.qpn") is None
+    assert lookup(data, "remote.QP[2]") is None
+
+
+def test_writer_rewrites_in_place_and_moves_when_growing(tmp_path):
+    path = str(tmp_path / "view.json.shm")
+    w = ShmViewWriter(path)
+    try:
+        w.write(VIEW)
+        ino = Path(path).stat().st_ino
+        w.write({**VIEW, "session": 4})
+        assert Path(path).stat().st_ino == ino and w.seq == 2
+        assert lookup(snapshot(path), "session") == (T_NUM, 4.0)
+
+        old = open(path, "rb")
+        big = {"blob": ["x" * 64] * (MIN_CAPACITY // 64)}
+        w.write(big)
+        assert Path(path).stat().st_ino != ino
+        # 旧文件被标记 moved，读者据此重新打开
+        assert old.read(36)[32:36] == b"\x01\x00\x00\x00"
+        old.close()
+        assert lookup(snapshot(path), "blob") == (T_ARR, MIN_CAPACITY // 64)
+    finally:
+        w.close()
+
+
+C_READER = r"""
+#include <stdio.h>
+#include "view_shm.h"
+int main(int argc, char **argv)
+{
+    RrShmMap m;
+    if (rr_shm_open(&m, argv[1]) != 0)
+        return 2;
+    long n = atol(argv[2]), torn = 0, moved = 0;
+    for (long i = 0; i < n || (!moved && i < 1000 * n); ++i)
+    {
+        uint8_t *base = m.base;
+        RrShmSnap s;
+        if (rr_shm_snapshot(&m, &s) != 0)
+            return 3;
+        moved += m.base != base;
+        const RrShmEntry *a = rr_shm_find(&s, "remote.QP{srv0}.qpn");
+        const RrShmEntry *b = rr_shm_find(&s, "pairs[0].epoch");
+        if (!a || !b || a->num != b->num)
+            ++torn;
+        rr_shm_snap_free(&s);
+    }
+    RrShmSnap s;
+    rr_shm_snapshot(&m, &s);
+    printf("%ld %ld %s\n", torn, moved, rr_shm_str(&s, rr_shm_find(&s, "remote.QP{srv0}.gid")));
+    return 0;
+}
+"""
+
+
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="needs gcc")
+def test_c_reader_sees_consistent_snapshots_while_writing(tmp_path):
+    src = tmp_path / "reader.c"
+    src.write_text(C_READER)
+    exe = tmp_path / "reader"
+    subprocess.run(["gcc", "-O2", "-I", str(ROOT), str(src), "-o", str(exe)], check=True)
+
+    path = str(tmp_path / "client_view.json.shm")
+    w = ShmViewWriter(path)
+    w.write(VIEW)
+    stop = threading.Event()
+
+    def churn():
+        i = 0
+        while not stop.is_set():
+            i += 1
+            view = json.loads(json.dumps(VIEW))
+            view["remote"]["QP"][0]["qpn"] = view["pairs"][0]["epoch"] = i
+            if i == 200:  # 中途换成更大的文件
+                view["pad"] = ["y" * 64] * (MIN_CAPACITY // 64)
+            w.write(view)
+
+    t = threading.Thread(target=churn)
+    t.start()
+    try:
+        out = subprocess.run([str(exe), path, "20000"], capture_output=True, text=True, timeout=60)
+    finally:
+        stop.set()
+        t.join()
+        w.close()
+    assert out.returncode == 0, out.stderr
+    torn, moved, gid = out.stdout.split()
+    assert torn == "0" and moved != "0" and gid == "fe80::1"
+
+
+def test_coordinator_writes_shm_next_to_json_view(tmp_path):
+    files = {k: str(tmp_path / f"{k}.json") for k in ("server_update", "client_update", "server_view", "client_view")}
+    Path(files["server_update"]).write_text(json.dumps({"local": {"QP": [{"id": "srv0", "qpn": 9}]}}))
+    coord = Coordinator(*files.values(), shm=True)
+    coord.round()
+    coord._close_shm()
+    view = json.loads(Path(files["client_view"]).read_text())
+    data = snapshot(shm_path(files["client_view"]))
+    assert lookup(data, "remote.QP{srv0}.qpn") == (T_NUM, 9.0)
+    assert lookup(data, "remote.ids.QP[0]") == (T_STR, "srv0")
+    assert lookup(data, "_coordinator.remote_qp_count") == (T_NUM, float(view["_coordinator"]["remote_qp_count"]))
@@ -0,0 +1,225 @@
+// view_shm.h
+// 视图的二进制 mmap 格式（写端：lib/shm_view.py，由 coordinator 在写 JSON 视图之前写 <view>.shm）。
+// runtime_resolver 在 RDMA_FUZZ_VIEW_SHM=1 时用它代替 cJSON 解析：
+//   - 加载 = 在 seqlock 保护下把映射区 memcpy 成私有快照，不做任何解析
+//   - 查找 = 对规范化路径做一次开放寻址哈希探测，O(1)
+//     路径键："local.QP[0].qpn"；按 id 的别名键："remote.QP{srv0}.qpn"
+// header-only（全是 static 函数），只依赖 libc，方便单独测试。
+//
+// 文件布局（小端）：
+//   header 64B: magic "RDXV" | u32 version | u64 seq | u64 capacity | u64 data_len | u32 moved | 保留
+//   payload:    u32 n_entries | u32 n_slots | u32 entries_off | u32 slots_off | u32 pool_off | u32 pool_len
+//               entries[n_entries] 24B: u32 key_off | u32 key_len | u32 type | u32 aux | f64 num
+//               slots[n_slots] 8B:      u32 entry_idx+1（0 为空）| u32 hash
+//               pool: NUL 结尾的键和字符串
+// seq 为奇数表示写端正在写；moved=1 表示文件已被更大的新文件替换，需要重新打开。
+#pragma once
+
+#include <fcntl.h>
+#include <sched.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#define RR_SHM_MAGIC "RDXV"
+#define RR_SHM_VERSION 1u
+#define RR_SHM_HEADER 64u
+
+enum
+{
+    RR_SHM_NULL = 0,
+    RR_SHM_NUM = 1,
+    RR_SHM_STR = 2,
+    RR_SHM_BOOL = 3,
+    RR_SHM_OBJ = 4,
+    RR_SHM_ARR = 5,
+};
+
+typedef struct
+{
+    uint32_t key_off, key_len, type, aux; // aux: STR 为字符串在 pool 中的偏移；OBJ/ARR 为子元素个数；BOOL 为 0/1
+    double num;
+} RrShmEntry;
+
+typedef struct
+{
+    int fd;
+    uint8_t *base;
+    size_t size;
+    char path[512];
+} RrShmMap;
+
+typedef struct
+{
+    uint8_t *data; // 私有快照（payload）
+    uint32_t n_entries, n_slots;
+    const RrShmEntry *entries;
+    const uint32_t *slots;
+    const char *pool;
+    uint32_t pool_len;
+} RrShmSnap;
+
+// 标准 CRC-32（与 Python zlib.crc32 相同）
+static inline uint32_t rr_shm_hash(const char *s, size_t n)
+{
+    static uint32_t table[256];
+    static int ready = 0;
+    if (!ready)
+    {
+        for (uint32_t i = 0; i < 256; ++i)
+        {
+            uint32_t c = i;
+            for (int k = 0; k < 8; ++k)
+                c = (c & 1u) ? 0xEDB88320u ^ (c >> 1) : c >> 1;
+            table[i] = c;
+        }
+        ready = 1;
+    }
+    uint32_t h = 0xFFFFFFFFu;
+    for (size_t i = 0; i < n; ++i)
+        h = table[(h ^ (uint8_t)s[i]) & 0xFFu] ^ (h >> 8);
+    return h ^ 0xFFFFFFFFu;
+}
+
+static inline void rr_shm_close(RrShmMap *m)
+{
+    if (m->base)
+        munmap(m->base, m->size);
+    if (m->fd >= 0)
+        close(m->fd);
+    m->base = NULL;
+    m->fd = -1;
+    m->size = 0;
+}
+
+static inline int rr_shm_open(RrShmMap *m, const char *path)
+{
+    m->fd = -1;
+    m->base = NULL;
+    m->size = 0;
+    if (strlen(path) >= sizeof(m->path))
+        return -1;
+    strcpy(m->path, path);
+    m->fd = open(path, O_RDONLY | O_CLOEXEC);
+    if (m->fd < 0)
+        return -1;
+    struct stat st;
+    if (fstat(m->fd, &st) != 0 || st.st_size < (off_t)RR_SHM_HEADER)
+    {
+        rr_shm_close(m);
+        return -1;
+    }
+    void *p = mmap(NULL, (size_t)st.st_size, PROT_READ, MAP_SHARED, m->fd, 0);
+    if (p == MAP_FAILED)
+    {
+        rr_shm_close(m);
+        return -1;
+    }
+    m->base = (uint8_t *)p;
+    m->size = (size_t)st.st_size;
+    if (memcmp(m->base, RR_SHM_MAGIC, 4) != 0 || *(const uint32_t *)(m->base + 4) != RR_SHM_VERSION)
+    {
+        rr_shm_close(m);
+        return -1;
+    }
+    return 0;
+}
+
+static inline void rr_shm_snap_free(RrShmSnap *s)
+{
+    free(s->data);
+    memset(s, 0, sizeof(*s));
+}
+
+static inline int rr_shm_snap_bind(RrShmSnap *s, uint64_t len)
+{
+    if (len < 24)
+        return -1;
+    const uint32_t *h = (const uint32_t *)s->data;
+    s->n_entries = h[0];
+    s->n_slots = h[1];
+    uint32_t eoff = h[2], soff = h[3], poff = h[4];
+    s->pool_len = h[5];
+    if ((uint64_t)eoff + (uint64_t)s->n_entries * sizeof(RrShmEntry) > len ||
+        (uint64_t)soff + (uint64_t)s->n_slots * 8u > len || (uint64_t)poff + s->pool_len > len ||
+        (s->n_slots & (s->n_slots - 1)) != 0 || s->n_slots == 0)
+        return -1;
+    s->entries = (const RrShmEntry *)(s->data + eoff);
+    s->slots = (const uint32_t *)(s->data + soff);
+    s->pool = (const char *)(s->data + poff);
+    return 0;
+}
+
+// seqlock 读：拷贝一份一致的 payload。返回 0 成功；-1 失败（格式错误 / 写端一直不结束）。
+static inline int rr_shm_snapshot(RrShmMap *m, RrShmSnap *out)
+{
+    memset(out, 0, sizeof(*out));
+    for (int attempt = 0; attempt < 100000; ++attempt)
+    {
+        if (__atomic_load_n((const uint32_t *)(m->base + 32), __ATOMIC_ACQUIRE))
+        {
+            // 写端换了更大的文件
+            char path[512];
+            strcpy(path, m->path);
+            rr_shm_close(m);
+            if (rr_shm_open(m, path) != 0)
+                return -1;
+            continue;
+        }
+        const uint64_t *seqp = (const uint64_t *)(m->base + 8);
+        uint64_t s1 = __atomic_load_n(seqp, __ATOMIC_ACQUIRE);
+        if (s1 & 1u)
+        {
+            sched_yield();
+            continue;
+        }
+        uint64_t len = __atomic_load_n((const uint64_t *)(m->base + 24), __ATOMIC_RELAXED);
+        if (len > m->size - RR_SHM_HEADER)
+            return -1;
+        uint8_t *buf = (uint8_t *)realloc(out->data, len ? len : 1);
+        if (!buf)
+            return -1;
+        out->data = buf;
+        memcpy(buf, m->base + RR_SHM_HEADER, len);
+        __atomic_thread_fence(__ATOMIC_ACQUIRE);
+        if (__atomic_load_n(seqp, __ATOMIC_RELAXED) != s1)
+            continue;
+        if (rr_shm_snap_bind(out, len) != 0)
+        {
+            rr_shm_snap_free(out);
+            return -1;
+        }
+        return 0;
+    }
+    rr_shm_snap_free(out);
+    return -1;
+}
+
+static inline const RrShmEntry *rr_shm_find(const RrShmSnap *s, const char *key)
+{
+    if (!s->data)
+        return NULL;
+    size_t n = strlen(key);
+    uint32_t h = rr_shm_hash(key, n);
+    uint32_t mask = s->n_slots - 1;
+    for (uint32_t i = h & mask, probes = 0; probes < s->n_slots; i = (i + 1) & mask, ++probes)
+    {
+        uint32_t idx = s->slots[2 * i];
+        if (idx == 0)
+            return NULL;
+        if (s->slots[2 * i + 1] != h || idx > s->n_entries)
+            continue;
+        const RrShmEntry *e = &s->entries[idx - 1];
+        if (e->key_len == n && e->key_off + n < s->pool_len && memcmp(s->pool + e->key_off, key, n) == 0)
+            return e;
+    }
+    return NULL;
+}
+
+static inline const char *rr_shm_str(const RrShmSnap *s, const RrShmEntry *e)
+{
+    return (e->type == RR_SHM_STR && e->aux < s->pool_len) ? s->pool + e->aux : NULL;
+}